@@ -247,6 +247,7 @@ mod tests {
             max_size,
             min_disk_free: DiskFreeThreshold::Percent(10),
             max_age,
+            max_memory: 0,
             origins: CacheConfigOrigins {
                 cache_root: ConfigOrigin::Default,
                 max_size: max_size_origin,
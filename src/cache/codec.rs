@@ -0,0 +1,110 @@
+use std::io;
+
+use http_cache::HttpResponse;
+
+// Marks stored bodies that are zstd frames. Entries without it (including everything written
+// before compression existed) are read back unchanged.
+const BODY_ENCODING_HEADER: &str = "x-biomcp-cache-encoding";
+const ZSTD_ENCODING: &str = "zstd";
+// Bodies below this size gain little and cost a frame header.
+const MIN_COMPRESS_BYTES: usize = 1024;
+const ZSTD_LEVEL: i32 = 3;
+
+/// Swaps `response.body` for its zstd encoding and tags the response with the format marker.
+///
+/// Returns the original body when it was replaced, or `None` when the body is small, already
+/// encoded, or does not shrink.
+pub(crate) fn compress_body(response: &mut HttpResponse) -> Option<Vec<u8>> {
+    if response.body.len() < MIN_COMPRESS_BYTES
+        || response.headers.contains_key(BODY_ENCODING_HEADER)
+    {
+        return None;
+    }
+    let compressed = zstd::bulk::compress(&response.body, ZSTD_LEVEL).ok()?;
+    if compressed.len() >= response.body.len() {
+        return None;
+    }
+    response
+        .headers
+        .insert(BODY_ENCODING_HEADER.to_string(), ZSTD_ENCODING.to_string());
+    Some(std::mem::replace(&mut response.body, compressed))
+}
+
+/// Undoes `compress_body` with the body it returned, without decoding again.
+pub(crate) fn restore_body(response: &mut HttpResponse, body: Vec<u8>) {
+    response.headers.remove(BODY_ENCODING_HEADER);
+    response.body = body;
+}
+
+/// Decodes a body read from disk in place; unmarked bodies are left untouched.
+pub(crate) fn decompress_body(response: &mut HttpResponse) -> io::Result<()> {
+    match response
+        .headers
+        .get(BODY_ENCODING_HEADER)
+        .map(String::as_str)
+    {
+        None => Ok(()),
+        Some(ZSTD_ENCODING) => {
+            response.body = zstd::stream::decode_all(response.body.as_slice())?;
+            response.headers.remove(BODY_ENCODING_HEADER);
+            Ok(())
+        }
+        Some(other) => Err(io::Error::new(
+            io::ErrorKind::InvalidData,
+            format!("unknown cached body encoding {other:?}"),
+        )),
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::collections::HashMap;
+
+    use http_cache::{HttpResponse, HttpVersion};
+
+    use super::{BODY_ENCODING_HEADER, compress_body, decompress_body, restore_body};
+
+    fn response(body: Vec<u8>) -> HttpResponse {
+        HttpResponse {
+            body,
+            headers: HashMap::new(),
+            status: 200,
+            url: reqwest::Url::parse("https://example.test/resource").expect("url"),
+            version: HttpVersion::Http11,
+        }
+    }
+
+    #[test]
+    fn compressed_body_round_trips_through_marker() {
+        let json = br#"{"hits":[{"symbol":"BRAF","name":"B-Raf proto-oncogene"}]}"#.repeat(200);
+        let mut stored = response(json.clone());
+
+        let original = compress_body(&mut stored).expect("repetitive JSON should compress");
+        assert_eq!(original, json);
+        assert!(stored.body.len() * 5 < json.len());
+        assert_eq!(
+            stored.headers.get(BODY_ENCODING_HEADER).map(String::as_str),
+            Some("zstd")
+        );
+
+        let mut read_back = stored.clone();
+        decompress_body(&mut read_back).expect("decode");
+        assert_eq!(read_back.body, json);
+        assert!(read_back.headers.is_empty());
+
+        restore_body(&mut stored, original);
+        assert_eq!(stored.body, json);
+        assert!(stored.headers.is_empty());
+    }
+
+    #[test]
+    fn small_and_legacy_bodies_are_stored_and_read_raw() {
+        let mut small = response(b"{}".to_vec());
+        assert!(compress_body(&mut small).is_none());
+        assert_eq!(small.body, b"{}");
+
+        let mut legacy = response(b"uncompressed entry".to_vec());
+        decompress_body(&mut legacy).expect("unmarked body");
+        assert_eq!(legacy.body, b"uncompressed entry");
+    }
+}
@@ -1,3 +1,4 @@
+use std::collections::BTreeMap;
 use std::path::PathBuf;
 use std::str::FromStr;
 use std::time::Duration;
@@ -9,6 +10,7 @@ use crate::error::BioMcpError;
 
 const DEFAULT_MAX_SIZE: u64 = 10_000_000_000;
 const DEFAULT_MAX_AGE_SECS: u64 = 86_400;
+const DEFAULT_MAX_MEMORY: u64 = 64 * 1024 * 1024;
 const DEFAULT_MIN_DISK_FREE: DiskFreeThreshold = DiskFreeThreshold::Percent(10);
 
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
@@ -58,6 +60,8 @@ pub(crate) struct ResolvedCacheConfig {
     pub(crate) max_size: u64,
     pub(crate) min_disk_free: DiskFreeThreshold,
     pub(crate) max_age: Duration,
+    /// Byte budget for the in-memory (L1) response tier; 0 disables it.
+    pub(crate) max_memory: u64,
     pub(crate) origins: CacheConfigOrigins,
 }
 
@@ -68,6 +72,81 @@ pub(crate) type CacheConfig = ResolvedCacheConfig;
 struct CacheToml {
     #[serde(default)]
     cache: CacheTomlSection,
+    #[serde(default)]
+    rate_limit: BTreeMap<String, RateLimitOverride>,
+}
+
+/// One `[rate_limit.<policy-key>]` table from `cache.toml`.
+///
+/// Keys match `RateLimitPolicy` keys (`pubtator`, `opentargets`, ...) plus `default` for hosts
+/// without a dedicated policy. Unset fields keep the built-in policy value.
+#[derive(Debug, Clone, Copy, Default, Deserialize, PartialEq, Eq)]
+#[serde(deny_unknown_fields)]
+pub(crate) struct RateLimitOverride {
+    pub(crate) interval_ms: Option<u64>,
+    pub(crate) burst: Option<u32>,
+    pub(crate) max_in_flight: Option<usize>,
+}
+
+impl RateLimitOverride {
+    /// Layers `other` on top of `self`, field by field.
+    pub(crate) fn merged_with(self, other: Self) -> Self {
+        Self {
+            interval_ms: other.interval_ms.or(self.interval_ms),
+            burst: other.burst.or(self.burst),
+            max_in_flight: other.max_in_flight.or(self.max_in_flight),
+        }
+    }
+
+    fn validate(&self) -> Result<(), &'static str> {
+        if self.burst == Some(0) {
+            return Err("burst must be greater than 0");
+        }
+        if self.max_in_flight == Some(0) {
+            return Err("max_in_flight must be greater than 0");
+        }
+        Ok(())
+    }
+}
+
+/// One `[cache.sources.<key>]` table from `cache.toml`.
+///
+/// Keys are `RateLimitPolicy` keys (`kegg`, `civic`, ...), quoted URL prefixes such as
+/// `"https://clinicaltrials.gov/api/v2"`, or `default` for every other source.
+#[derive(Debug, Clone, Copy, Default, Deserialize, PartialEq, Eq)]
+#[serde(deny_unknown_fields)]
+pub(crate) struct CacheSourcePolicy {
+    /// Freshness lifetime stored with successful responses, replacing upstream cache headers.
+    pub(crate) ttl_secs: Option<u64>,
+    /// How long past expiry a cached response may still be served without revalidation.
+    pub(crate) max_stale_secs: Option<u64>,
+    /// Oldest cached response, by age, that stale-while-revalidate mode answers with while it
+    /// refreshes in the background.
+    pub(crate) stale_ceiling_secs: Option<u64>,
+    /// Freshness lifetime of cached not-found and empty-result answers.
+    pub(crate) negative_ttl_secs: Option<u64>,
+}
+
+impl CacheSourcePolicy {
+    /// Layers `other` on top of `self`, field by field.
+    pub(crate) fn merged_with(self, other: Self) -> Self {
+        Self {
+            ttl_secs: other.ttl_secs.or(self.ttl_secs),
+            max_stale_secs: other.max_stale_secs.or(self.max_stale_secs),
+            stale_ceiling_secs: other.stale_ceiling_secs.or(self.stale_ceiling_secs),
+            negative_ttl_secs: other.negative_ttl_secs.or(self.negative_ttl_secs),
+        }
+    }
+
+    fn validate(&self) -> Result<(), &'static str> {
+        if self.ttl_secs == Some(0) {
+            return Err("ttl_secs must be greater than 0");
+        }
+        if self.stale_ceiling_secs == Some(0) {
+            return Err("stale_ceiling_secs must be greater than 0");
+        }
+        Ok(())
+    }
 }
 
 #[derive(Debug, Deserialize, Default)]
@@ -77,6 +156,9 @@ struct CacheTomlSection {
     max_size: Option<u64>,
     min_disk_free: Option<String>,
     max_age_secs: Option<u64>,
+    max_memory: Option<u64>,
+    #[serde(default)]
+    sources: BTreeMap<String, CacheSourcePolicy>,
 }
 
 pub(crate) fn resolve_cache_config() -> Result<CacheConfig, BioMcpError> {
@@ -141,8 +223,13 @@ fn resolve_cache_config_with_source(
                 max_size: toml_max_size,
                 min_disk_free: toml_min_disk_free,
                 max_age_secs: toml_max_age_secs,
+                max_memory: toml_max_memory,
+                sources,
             },
+        rate_limit,
     } = parse_cache_toml(toml_content, config_path)?;
+    validate_rate_limit_overrides(&rate_limit, config_path)?;
+    validate_cache_source_policies(&sources, config_path)?;
 
     let (cache_root, cache_root_origin) = if let Some(dir) = normalize_env_value(env_dir) {
         (PathBuf::from(dir), ConfigOrigin::Env)
@@ -186,6 +273,7 @@ fn resolve_cache_config_with_source(
         max_size,
         min_disk_free,
         max_age: Duration::from_secs(max_age_secs),
+        max_memory: toml_max_memory.unwrap_or(DEFAULT_MAX_MEMORY),
         origins: CacheConfigOrigins {
             cache_root: cache_root_origin,
             max_size: max_size_origin,
@@ -195,6 +283,70 @@ fn resolve_cache_config_with_source(
     })
 }
 
+/// Reads the `[rate_limit.*]` tables from `cache.toml`.
+pub(crate) fn resolve_rate_limit_overrides()
+-> Result<BTreeMap<String, RateLimitOverride>, BioMcpError> {
+    let config_path = config_file_path();
+    let toml_content = match config_path.as_deref() {
+        Some(path) => read_cache_toml(path)?,
+        None => None,
+    };
+    rate_limit_overrides_from_toml(toml_content.as_deref(), config_path.as_deref())
+}
+
+fn rate_limit_overrides_from_toml(
+    toml_content: Option<&str>,
+    config_path: Option<&std::path::Path>,
+) -> Result<BTreeMap<String, RateLimitOverride>, BioMcpError> {
+    let parsed = parse_cache_toml(toml_content, config_path)?;
+    validate_rate_limit_overrides(&parsed.rate_limit, config_path)?;
+    Ok(parsed.rate_limit)
+}
+
+fn validate_rate_limit_overrides(
+    overrides: &BTreeMap<String, RateLimitOverride>,
+    config_path: Option<&std::path::Path>,
+) -> Result<(), BioMcpError> {
+    for (key, value) in overrides {
+        value.validate().map_err(|message| {
+            invalid_config(config_path, format!("[rate_limit.{key}] {message}"))
+        })?;
+    }
+    Ok(())
+}
+
+/// Reads the `[cache.sources.*]` tables from `cache.toml`.
+pub(crate) fn resolve_cache_source_policies()
+-> Result<BTreeMap<String, CacheSourcePolicy>, BioMcpError> {
+    let config_path = config_file_path();
+    let toml_content = match config_path.as_deref() {
+        Some(path) => read_cache_toml(path)?,
+        None => None,
+    };
+    cache_source_policies_from_toml(toml_content.as_deref(), config_path.as_deref())
+}
+
+fn cache_source_policies_from_toml(
+    toml_content: Option<&str>,
+    config_path: Option<&std::path::Path>,
+) -> Result<BTreeMap<String, CacheSourcePolicy>, BioMcpError> {
+    let parsed = parse_cache_toml(toml_content, config_path)?;
+    validate_cache_source_policies(&parsed.cache.sources, config_path)?;
+    Ok(parsed.cache.sources)
+}
+
+fn validate_cache_source_policies(
+    policies: &BTreeMap<String, CacheSourcePolicy>,
+    config_path: Option<&std::path::Path>,
+) -> Result<(), BioMcpError> {
+    for (key, value) in policies {
+        value.validate().map_err(|message| {
+            invalid_config(config_path, format!("[cache.sources.{key}] {message}"))
+        })?;
+    }
+    Ok(())
+}
+
 fn read_cache_toml(path: &std::path::Path) -> Result<Option<String>, BioMcpError> {
     match std::fs::read_to_string(path) {
         Ok(content) => Ok(Some(content)),
@@ -351,9 +503,10 @@ fn config_source_label(config_path: Option<&std::path::Path>) -> String {
 #[cfg(test)]
 mod tests {
     use super::{
-        CacheConfig, CacheConfigOrigins, ConfigOrigin, DEFAULT_MAX_AGE_SECS, DEFAULT_MAX_SIZE,
-        DEFAULT_MIN_DISK_FREE, DiskFreeThreshold, default_cache_root, resolve_cache_config,
-        resolve_cache_config_from_parts,
+        CacheConfig, CacheConfigOrigins, CacheSourcePolicy, ConfigOrigin, DEFAULT_MAX_AGE_SECS,
+        DEFAULT_MAX_MEMORY, DEFAULT_MAX_SIZE, DEFAULT_MIN_DISK_FREE, DiskFreeThreshold,
+        RateLimitOverride, cache_source_policies_from_toml, default_cache_root,
+        rate_limit_overrides_from_toml, resolve_cache_config, resolve_cache_config_from_parts,
     };
     use crate::error::BioMcpError;
     use std::path::{Path, PathBuf};
@@ -427,6 +580,7 @@ mod tests {
             max_size: DEFAULT_MAX_SIZE,
             min_disk_free: DEFAULT_MIN_DISK_FREE,
             max_age: Duration::from_secs(DEFAULT_MAX_AGE_SECS),
+            max_memory: DEFAULT_MAX_MEMORY,
             origins: CacheConfigOrigins {
                 cache_root: ConfigOrigin::Default,
                 max_size: ConfigOrigin::Default,
@@ -521,6 +675,32 @@ mod tests {
         assert_eq!(config.origins.max_age, ConfigOrigin::File);
     }
 
+    #[test]
+    fn toml_max_memory_overrides_default_and_zero_disables_l1() {
+        let default =
+            resolve_cache_config_from_parts(None, None, None, PathBuf::from("/tmp/default-cache"))
+                .expect("ok");
+        assert_eq!(default.max_memory, DEFAULT_MAX_MEMORY);
+
+        let config = resolve_cache_config_from_parts(
+            None,
+            None,
+            Some("[cache]\nmax_memory = 1048576\n"),
+            PathBuf::from("/tmp/default-cache"),
+        )
+        .expect("ok");
+        assert_eq!(config.max_memory, 1_048_576);
+
+        let disabled = resolve_cache_config_from_parts(
+            None,
+            None,
+            Some("[cache]\nmax_memory = 0\n"),
+            PathBuf::from("/tmp/default-cache"),
+        )
+        .expect("ok");
+        assert_eq!(disabled.max_memory, 0);
+    }
+
     #[test]
     fn origins_track_mixed_precedence_without_max_age_env_override() {
         let config = resolve_cache_config_from_parts(
@@ -912,4 +1092,116 @@ mod tests {
         assert!(bytes.is_violated(499, 1_000));
         assert_eq!(bytes.display(), "500 B");
     }
+
+    #[test]
+    fn toml_rate_limit_tables_parse_per_policy_overrides() {
+        let overrides = rate_limit_overrides_from_toml(
+            Some(
+                "[cache]\nmax_size = 42\n\n[rate_limit.opentargets]\ninterval_ms = 100\nburst = 10\nmax_in_flight = 4\n",
+            ),
+            None,
+        )
+        .expect("rate limit tables should parse");
+        assert_eq!(
+            overrides.get("opentargets"),
+            Some(&RateLimitOverride {
+                interval_ms: Some(100),
+                burst: Some(10),
+                max_in_flight: Some(4),
+            })
+        );
+
+        let config = resolve_cache_config_from_parts(
+            None,
+            None,
+            Some("[rate_limit.kegg]\nburst = 2\n"),
+            PathBuf::from("/tmp/default"),
+        )
+        .expect("cache config should accept rate limit tables");
+        assert_eq!(config.max_size, DEFAULT_MAX_SIZE);
+    }
+
+    #[test]
+    fn toml_zero_rate_limit_burst_returns_error() {
+        let err = resolve_cache_config_from_parts(
+            None,
+            None,
+            Some("[rate_limit.civic]\nburst = 0\n"),
+            PathBuf::from("/tmp/default"),
+        )
+        .expect_err("zero burst should fail");
+        assert_invalid_argument_contains(err, &["[rate_limit.civic]", "burst"]);
+    }
+
+    #[test]
+    fn rate_limit_override_merge_prefers_later_fields() {
+        let file = RateLimitOverride {
+            interval_ms: Some(500),
+            burst: Some(2),
+            max_in_flight: None,
+        };
+        let env = RateLimitOverride {
+            interval_ms: Some(100),
+            burst: None,
+            max_in_flight: Some(4),
+        };
+        assert_eq!(
+            file.merged_with(env),
+            RateLimitOverride {
+                interval_ms: Some(100),
+                burst: Some(2),
+                max_in_flight: Some(4),
+            }
+        );
+    }
+
+    #[test]
+    fn toml_cache_source_tables_accept_policy_keys_and_url_prefixes() {
+        let policies = cache_source_policies_from_toml(
+            Some(
+                "[cache.sources.kegg]\nttl_secs = 1209600\nstale_ceiling_secs = 604800\n\n[cache.sources.\"https://clinicaltrials.gov/api/v2\"]\nttl_secs = 300\nmax_stale_secs = 0\nstale_ceiling_secs = 3600\n",
+            ),
+            None,
+        )
+        .expect("cache source tables should parse");
+        assert_eq!(
+            policies.get("kegg"),
+            Some(&CacheSourcePolicy {
+                ttl_secs: Some(1_209_600),
+                max_stale_secs: None,
+                stale_ceiling_secs: Some(604_800),
+                negative_ttl_secs: None,
+            })
+        );
+        assert_eq!(
+            policies
+                .get("https://clinicaltrials.gov/api/v2")
+                .and_then(|policy| policy.stale_ceiling_secs),
+            Some(3_600)
+        );
+    }
+
+    #[test]
+    fn toml_zero_stale_ceiling_returns_error() {
+        let err = resolve_cache_config_from_parts(
+            None,
+            None,
+            Some("[cache.sources.default]\nstale_ceiling_secs = 0\n"),
+            PathBuf::from("/tmp/default"),
+        )
+        .expect_err("zero stale ceiling should fail");
+        assert_invalid_argument_contains(err, &["[cache.sources.default]", "stale_ceiling_secs"]);
+    }
+
+    #[test]
+    fn toml_zero_source_ttl_returns_error() {
+        let err = resolve_cache_config_from_parts(
+            None,
+            None,
+            Some("[cache.sources.hpo]\nttl_secs = 0\n"),
+            PathBuf::from("/tmp/default"),
+        )
+        .expect_err("zero ttl should fail");
+        assert_invalid_argument_contains(err, &["[cache.sources.hpo]", "ttl_secs"]);
+    }
 }
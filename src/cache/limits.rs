@@ -172,6 +172,7 @@ mod tests {
             max_size,
             min_disk_free,
             max_age: Duration::from_secs(86_400),
+            max_memory: 0,
             origins: CacheConfigOrigins {
                 cache_root: ConfigOrigin::Default,
                 max_size: ConfigOrigin::Default,
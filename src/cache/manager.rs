@@ -1,21 +1,30 @@
-use std::fs;
-use std::io;
+use std::fs::{self, File, OpenOptions};
+use std::io::{self, Read, Seek, SeekFrom, Write};
 use std::path::{Path, PathBuf};
 use std::sync::Arc;
 use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
 use std::time::{SystemTime, UNIX_EPOCH};
 
 use async_trait::async_trait;
+use fs2::FileExt;
 use http_cache::{CacheManager, HttpResponse};
 use http_cache_reqwest::CACacheManager;
 use http_cache_semantics::CachePolicy;
 use tracing::warn;
 
+use super::codec::{compress_body, decompress_body, restore_body};
+use super::memory::MemoryTier;
+use super::stats::{CacheTier, flush_lookup_stats, record_lookup, register_lookup_stats_root};
 use super::{
     CleanOptions, FilesystemSpace, ResolvedCacheConfig, evaluate_cache_limits, execute_cache_clean,
     inspect_filesystem_space, snapshot_cache, summarize_cache_usage,
 };
 use crate::error::BioMcpError;
+use crate::profiling::profile_span;
+
+// Persisted approximate byte count of the content tree, so startup never walks the cache. Every
+// process sharing the cache root adds its own puts to it under an exclusive lock.
+const SIZE_LEDGER_FILE: &str = "size-ledger";
 
 type EstimateCacheBytesFn = dyn Fn(&Path) -> io::Result<u64> + Send + Sync;
 type InspectSpaceFn = dyn Fn(&Path) -> Result<FilesystemSpace, BioMcpError> + Send + Sync;
@@ -29,16 +38,24 @@ struct ManagerServices {
     schedule_eviction: Arc<ScheduleEvictionFn>,
 }
 
+#[derive(Clone)]
 pub(crate) struct SizeAwareCacheManager {
     inner: CACacheManager,
+    // L1 tier in front of the cacache disk tier; `None` when `max_memory` is 0.
+    memory: Option<Arc<MemoryTier>>,
     config: ResolvedCacheConfig,
     approx_bytes: Arc<AtomicU64>,
+    // Bytes this process has put since its last ledger merge.
+    unmerged_bytes: Arc<AtomicU64>,
+    // Set while a ledger merge is queued; puts that land meanwhile ride on that merge.
+    ledger_write_queued: Arc<AtomicBool>,
     eviction_running: Arc<AtomicBool>,
     services: ManagerServices,
 }
 
 impl SizeAwareCacheManager {
     pub(crate) fn new(path: PathBuf, config: ResolvedCacheConfig) -> Self {
+        register_lookup_stats_root(&config.cache_root);
         Self::build_with_services(path, config, default_services())
     }
 
@@ -74,25 +91,196 @@ impl SizeAwareCacheManager {
         config: ResolvedCacheConfig,
         services: ManagerServices,
     ) -> Self {
-        let approx_bytes = match (services.estimate_cache_bytes)(&path) {
-            Ok(bytes) => bytes,
-            Err(err) => {
-                warn!(
-                    cache_path = %path.display(),
-                    "fast cache size estimate failed; seeding size tracker to 0: {err}"
-                );
-                0
-            }
-        };
+        let ledger_bytes = read_size_ledger(&path);
+        let approx_bytes = Arc::new(AtomicU64::new(ledger_bytes.unwrap_or(0)));
+        if ledger_bytes.is_none() {
+            seed_size_ledger(
+                path.clone(),
+                Arc::clone(&approx_bytes),
+                Arc::clone(&services.estimate_cache_bytes),
+            );
+        }
 
         Self {
             inner: CACacheManager { path },
+            memory: MemoryTier::new(config.max_memory).map(Arc::new),
             config,
-            approx_bytes: Arc::new(AtomicU64::new(approx_bytes)),
+            approx_bytes,
+            unmerged_bytes: Arc::new(AtomicU64::new(0)),
+            ledger_write_queued: Arc::new(AtomicBool::new(false)),
             eviction_running: Arc::new(AtomicBool::new(false)),
             services,
         }
     }
+
+    /// Queues a ledger merge on the blocking pool. At most one merge is queued at a time and it
+    /// adds every put made before it runs, so a burst of puts costs one file write. The merged
+    /// total also carries other processes' puts, and becomes this process's estimate.
+    fn schedule_ledger_persist(&self) {
+        if self.ledger_write_queued.swap(true, Ordering::AcqRel) {
+            return;
+        }
+        let cache_path = self.inner.path.clone();
+        let approx_bytes = Arc::clone(&self.approx_bytes);
+        let unmerged = Arc::clone(&self.unmerged_bytes);
+        let queued = Arc::clone(&self.ledger_write_queued);
+        let write = move || {
+            queued.store(false, Ordering::Release);
+            let delta = unmerged.swap(0, Ordering::Relaxed);
+            match merge_size_ledger(&cache_path, delta) {
+                Ok(Some(total)) => approx_bytes.store(
+                    total.saturating_add(unmerged.load(Ordering::Relaxed)),
+                    Ordering::Relaxed,
+                ),
+                // The ledger is still being seeded; keep the delta for the next merge.
+                Ok(None) => {
+                    unmerged.fetch_add(delta, Ordering::Relaxed);
+                }
+                Err(err) => {
+                    unmerged.fetch_add(delta, Ordering::Relaxed);
+                    warn!(
+                        cache_path = %cache_path.display(),
+                        "failed to merge cache size ledger: {err}"
+                    );
+                }
+            }
+        };
+        match tokio::runtime::Handle::try_current() {
+            Ok(handle) => {
+                handle.spawn_blocking(write);
+            }
+            Err(_) => write(),
+        }
+    }
+}
+
+impl SizeAwareCacheManager {
+    /// Looks up `cache_key` in L1, then on disk, without counting the lookup or copying a disk
+    /// hit into L1. Used by middleware that inspects an entry before the cache layer runs.
+    pub(crate) async fn peek(
+        &self,
+        cache_key: &str,
+    ) -> http_cache::Result<Option<(HttpResponse, CachePolicy)>> {
+        if let Some(memory) = &self.memory
+            && let Some(hit) = memory.get(cache_key)
+        {
+            return Ok(Some(hit));
+        }
+        self.read_disk(cache_key).await
+    }
+
+    /// Reads an entry from the cacache tier and decodes a compressed body. An entry whose body
+    /// cannot be decoded reads as a miss, so the next response overwrites it.
+    async fn read_disk(
+        &self,
+        cache_key: &str,
+    ) -> http_cache::Result<Option<(HttpResponse, CachePolicy)>> {
+        let Some((mut response, policy)) = self.inner.get(cache_key).await? else {
+            return Ok(None);
+        };
+        if let Err(err) = decompress_body(&mut response) {
+            warn!(
+                cache_key,
+                cache_path = %self.inner.path.display(),
+                "cached body could not be decoded; treating entry as a miss: {err}"
+            );
+            return Ok(None);
+        }
+        Ok(Some((response, policy)))
+    }
+}
+
+fn read_size_ledger(cache_path: &Path) -> Option<u64> {
+    let mut file = File::open(cache_path.join(SIZE_LEDGER_FILE)).ok()?;
+    file.lock_shared().ok()?;
+    let mut raw = String::new();
+    let read = file.read_to_string(&mut raw);
+    let _ = FileExt::unlock(&file);
+    read.ok()?;
+    raw.trim().parse().ok()
+}
+
+/// Replaces the ledger with an absolute count, after a seed walk or an eviction resync.
+fn write_size_ledger(cache_path: &Path, bytes: u64) -> io::Result<()> {
+    let file = OpenOptions::new()
+        .read(true)
+        .write(true)
+        .create(true)
+        .truncate(false)
+        .open(cache_path.join(SIZE_LEDGER_FILE))?;
+    update_size_ledger(file, |_| bytes)
+}
+
+/// Adds `delta` bytes to the ledger and returns the new total, or `None` when there is no ledger
+/// yet: the seed walk will count those bytes, and a ledger holding only deltas would read low.
+fn merge_size_ledger(cache_path: &Path, delta: u64) -> io::Result<Option<u64>> {
+    let file = match OpenOptions::new()
+        .read(true)
+        .write(true)
+        .open(cache_path.join(SIZE_LEDGER_FILE))
+    {
+        Ok(file) => file,
+        Err(err) if err.kind() == io::ErrorKind::NotFound => return Ok(None),
+        Err(err) => return Err(err),
+    };
+    let mut total = 0;
+    update_size_ledger(file, |current| {
+        total = current.saturating_add(delta);
+        total
+    })?;
+    Ok(Some(total))
+}
+
+/// Read-modify-write of the ledger under an exclusive lock, so concurrent writers never lose each
+/// other's updates and readers never see a torn value.
+fn update_size_ledger(mut file: File, update: impl FnOnce(u64) -> u64) -> io::Result<()> {
+    file.lock_exclusive()?;
+    let result = rewrite_size_ledger(&mut file, update);
+    let _ = FileExt::unlock(&file);
+    result
+}
+
+fn rewrite_size_ledger(file: &mut File, update: impl FnOnce(u64) -> u64) -> io::Result<()> {
+    let mut raw = String::new();
+    file.read_to_string(&mut raw)?;
+    let next = update(raw.trim().parse().unwrap_or(0));
+    file.set_len(0)?;
+    file.seek(SeekFrom::Start(0))?;
+    file.write_all(next.to_string().as_bytes())
+}
+
+fn persist_size_ledger(cache_path: &Path, bytes: u64) {
+    if let Err(err) = write_size_ledger(cache_path, bytes) {
+        warn!(
+            cache_path = %cache_path.display(),
+            "failed to persist cache size ledger: {err}"
+        );
+    }
+}
+
+/// Builds the missing size ledger with one tree walk, off the request path when a runtime exists.
+fn seed_size_ledger(
+    cache_path: PathBuf,
+    approx_bytes: Arc<AtomicU64>,
+    estimate_cache_bytes: Arc<EstimateCacheBytesFn>,
+) {
+    let seed = move || match estimate_cache_bytes(&cache_path) {
+        Ok(bytes) => {
+            // Puts that landed during the walk already counted themselves; keep the larger view.
+            let previous = approx_bytes.fetch_max(bytes, Ordering::Relaxed);
+            persist_size_ledger(&cache_path, previous.max(bytes));
+        }
+        Err(err) => warn!(
+            cache_path = %cache_path.display(),
+            "cache size estimate failed; size tracker starts at 0: {err}"
+        ),
+    };
+    match tokio::runtime::Handle::try_current() {
+        Ok(handle) => {
+            handle.spawn_blocking(seed);
+        }
+        Err(_) => seed(),
+    }
 }
 
 #[async_trait]
@@ -101,21 +289,56 @@ impl CacheManager for SizeAwareCacheManager {
         &self,
         cache_key: &str,
     ) -> http_cache::Result<Option<(HttpResponse, CachePolicy)>> {
-        self.inner.get(cache_key).await
+        let span = profile_span!("cache", op = "get", tier = tracing::field::Empty);
+        if let Some(memory) = &self.memory
+            && let Some(hit) = memory.get(cache_key)
+        {
+            note_lookup(CacheTier::Memory);
+            span.record("tier", "memory");
+            return Ok(Some(hit));
+        }
+
+        let found = self.read_disk(cache_key).await?;
+        match &found {
+            Some((response, policy)) => {
+                if let Some(memory) = &self.memory {
+                    memory.insert(cache_key, response, policy);
+                }
+                note_lookup(CacheTier::Disk);
+                span.record("tier", "disk");
+            }
+            None => {
+                note_lookup(CacheTier::Miss);
+                span.record("tier", "miss");
+            }
+        }
+        Ok(found)
     }
 
     async fn put(
         &self,
         cache_key: String,
-        res: HttpResponse,
+        mut res: HttpResponse,
         policy: CachePolicy,
     ) -> http_cache::Result<HttpResponse> {
-        let response = self.inner.put(cache_key.clone(), res, policy).await?;
+        let _span = profile_span!("cache", op = "put");
+        let memory_policy = self.memory.as_ref().map(|_| policy.clone());
+        // Bodies are stored zstd-compressed; callers and L1 always see the original bytes.
+        let raw_body = compress_body(&mut res);
+        let mut response = self.inner.put(cache_key.clone(), res, policy).await?;
+        if let Some(body) = raw_body {
+            restore_body(&mut response, body);
+        }
+        if let (Some(memory), Some(policy)) = (&self.memory, memory_policy) {
+            memory.insert(&cache_key, &response, &policy);
+        }
 
         match cacache::metadata(&self.inner.path, &cache_key).await {
             Ok(Some(metadata)) => {
                 self.approx_bytes
                     .fetch_add(metadata.size as u64, Ordering::Relaxed);
+                self.unmerged_bytes
+                    .fetch_add(metadata.size as u64, Ordering::Relaxed);
             }
             Ok(None) => warn!(
                 cache_key,
@@ -130,6 +353,7 @@ impl CacheManager for SizeAwareCacheManager {
         }
 
         let approx_bytes = self.approx_bytes.load(Ordering::Relaxed);
+        self.schedule_ledger_persist();
         let below_min_disk_free = match (self.services.inspect_space)(&self.config.cache_root) {
             Ok(space) => self
                 .config
@@ -162,10 +386,19 @@ impl CacheManager for SizeAwareCacheManager {
     }
 
     async fn delete(&self, cache_key: &str) -> http_cache::Result<()> {
+        if let Some(memory) = &self.memory {
+            memory.remove(cache_key);
+        }
         self.inner.delete(cache_key).await
     }
 }
 
+fn note_lookup(tier: CacheTier) {
+    if record_lookup(tier) {
+        tokio::task::spawn_blocking(flush_lookup_stats);
+    }
+}
+
 fn default_services() -> ManagerServices {
     ManagerServices {
         estimate_cache_bytes: Arc::new(estimate_cache_bytes_fast),
@@ -293,6 +526,7 @@ where
 
     if !evaluation.over_max_size && !evaluation.below_min_disk_free {
         approx_bytes.store(evaluation.usage.referenced_blob_bytes, Ordering::Relaxed);
+        persist_size_ledger(cache_path, evaluation.usage.referenced_blob_bytes);
         return Ok(());
     }
 
@@ -319,6 +553,7 @@ where
         snapshotter(cache_path).map_err(|err| BioMcpError::Io(io::Error::other(err)))?;
     let usage_after = summarize_cache_usage(&snapshot_after);
     approx_bytes.store(usage_after.referenced_blob_bytes, Ordering::Relaxed);
+    persist_size_ledger(cache_path, usage_after.referenced_blob_bytes);
 
     let space_after = inspect_space(&config.cache_root)?;
     if config
@@ -352,7 +587,8 @@ mod tests {
     use http_cache_semantics::CachePolicy;
 
     use super::{
-        FilesystemSpace, SizeAwareCacheManager, estimate_cache_bytes_fast, run_eviction_cycle_with,
+        FilesystemSpace, SizeAwareCacheManager, estimate_cache_bytes_fast, merge_size_ledger,
+        read_size_ledger, run_eviction_cycle_with, write_size_ledger,
     };
     use crate::cache::{
         CacheConfigOrigins, ConfigOrigin, DiskFreeThreshold, ResolvedCacheConfig, snapshot_cache,
@@ -417,6 +653,7 @@ mod tests {
             max_size,
             min_disk_free,
             max_age: Duration::from_secs(86_400),
+            max_memory: 0,
             origins: CacheConfigOrigins {
                 cache_root: ConfigOrigin::Default,
                 max_size: ConfigOrigin::Default,
@@ -670,7 +907,36 @@ mod tests {
     }
 
     #[tokio::test(flavor = "current_thread")]
-    async fn new_manager_seeds_approximate_bytes_from_fast_estimate() {
+    async fn new_manager_reads_size_ledger_without_walking_cache() {
+        let root = TempDirGuard::new("ledger-startup");
+        fs::create_dir_all(root.http_dir()).expect("http dir");
+        write_size_ledger(&root.http_dir(), 8).expect("ledger");
+        let walks = Arc::new(AtomicUsize::new(0));
+        let manager = SizeAwareCacheManager::new_with_services(
+            root.http_dir(),
+            test_config(root.cache_root(), 100, DiskFreeThreshold::Percent(10)),
+            {
+                let walks = Arc::clone(&walks);
+                move |_| {
+                    walks.fetch_add(1, Ordering::SeqCst);
+                    Ok(0)
+                }
+            },
+            |_| {
+                Ok(FilesystemSpace {
+                    available_bytes: 90,
+                    total_bytes: 100,
+                })
+            },
+            |_, _, _, _| {},
+        );
+
+        assert_eq!(manager.approx_bytes.load(Ordering::Relaxed), 8);
+        assert_eq!(walks.load(Ordering::SeqCst), 0);
+    }
+
+    #[tokio::test(flavor = "current_thread")]
+    async fn missing_size_ledger_is_seeded_in_background() {
         let root = TempDirGuard::new("seed-estimate");
         let content_root = root
             .http_dir()
@@ -686,13 +952,196 @@ mod tests {
             test_config(root.cache_root(), 100, DiskFreeThreshold::Percent(10)),
         );
 
+        let deadline = std::time::Instant::now() + Duration::from_secs(5);
+        while read_size_ledger(&root.http_dir()).is_none() {
+            assert!(
+                std::time::Instant::now() < deadline,
+                "ledger was not seeded"
+            );
+            tokio::time::sleep(Duration::from_millis(10)).await;
+        }
         assert_eq!(manager.approx_bytes.load(Ordering::Relaxed), 8);
+        assert_eq!(read_size_ledger(&root.http_dir()), Some(8));
+    }
+
+    #[test]
+    fn concurrent_ledger_merges_keep_every_writers_bytes() {
+        let root = TempDirGuard::new("ledger-concurrent");
+        fs::create_dir_all(root.http_dir()).expect("http dir");
+        assert_eq!(
+            merge_size_ledger(&root.http_dir(), 5).expect("merge"),
+            None,
+            "an unseeded ledger is left for the seed walk"
+        );
+        write_size_ledger(&root.http_dir(), 100).expect("seed");
+        // Each thread stands in for a process sharing the cache root.
+        std::thread::scope(|scope| {
+            for _ in 0..16 {
+                let dir = root.http_dir();
+                scope.spawn(move || {
+                    for _ in 0..20 {
+                        merge_size_ledger(&dir, 3).expect("ledger merge");
+                    }
+                });
+            }
+        });
+        assert_eq!(read_size_ledger(&root.http_dir()), Some(100 + 16 * 20 * 3));
+    }
+
+    #[tokio::test(flavor = "current_thread")]
+    async fn put_merges_into_the_shared_ledger_and_adopts_its_total() {
+        let root = TempDirGuard::new("ledger-shared");
+        fs::create_dir_all(root.http_dir()).expect("http dir");
+        write_size_ledger(&root.http_dir(), 8).expect("ledger");
+        let manager = SizeAwareCacheManager::new_with_services(
+            root.http_dir(),
+            test_config(
+                root.cache_root(),
+                u64::MAX / 2,
+                DiskFreeThreshold::Percent(0),
+            ),
+            |_| panic!("ledger present; startup must not walk the cache"),
+            |_| {
+                Ok(FilesystemSpace {
+                    available_bytes: 90,
+                    total_bytes: 100,
+                })
+            },
+            |_, _, _, _| {},
+        );
+        // Another process sharing the cache root records its own puts meanwhile.
+        merge_size_ledger(&root.http_dir(), 1_000).expect("other process");
+
+        manager
+            .put("shared".into(), test_http_response(b"x"), test_policy())
+            .await
+            .expect("put");
+        // The queued merge runs on the blocking pool.
+        for _ in 0..200 {
+            if read_size_ledger(&root.http_dir()) != Some(1_008) {
+                break;
+            }
+            tokio::time::sleep(Duration::from_millis(5)).await;
+        }
+
+        let merged = read_size_ledger(&root.http_dir()).expect("ledger");
+        assert!(
+            merged > 1_008,
+            "the put's bytes are added to the shared total"
+        );
+        assert_eq!(manager.approx_bytes.load(Ordering::Relaxed), merged);
+    }
+
+    #[tokio::test(flavor = "current_thread")]
+    async fn memory_tier_serves_hits_without_touching_disk() {
+        let root = TempDirGuard::new("memory-tier");
+        let mut config = test_config(
+            root.cache_root(),
+            u64::MAX / 2,
+            DiskFreeThreshold::Percent(0),
+        );
+        config.max_memory = 1024 * 1024;
+        let manager = SizeAwareCacheManager::new_with_services(
+            root.http_dir(),
+            config,
+            |_| Ok(0),
+            |_| {
+                Ok(FilesystemSpace {
+                    available_bytes: 90,
+                    total_bytes: 100,
+                })
+            },
+            |_, _, _, _| {},
+        );
+
+        manager
+            .put(
+                "GET:https://example.test/cache-key".into(),
+                test_http_response(b"cached"),
+                test_policy(),
+            )
+            .await
+            .expect("put");
+        cacache::remove(root.http_dir(), "GET:https://example.test/cache-key")
+            .await
+            .expect("remove disk entry");
+
+        let (response, _) = manager
+            .get("GET:https://example.test/cache-key")
+            .await
+            .expect("get")
+            .expect("L1 hit after disk removal");
+        assert_eq!(response.body, b"cached");
+
+        manager
+            .delete("GET:https://example.test/cache-key")
+            .await
+            .expect("delete");
+        assert!(
+            manager
+                .get("GET:https://example.test/cache-key")
+                .await
+                .expect("get after delete")
+                .is_none()
+        );
+    }
+
+    #[tokio::test(flavor = "current_thread")]
+    async fn disk_tier_stores_compressed_bodies_and_counts_stored_bytes() {
+        let root = TempDirGuard::new("compressed-body");
+        let manager = SizeAwareCacheManager::new_with_services(
+            root.http_dir(),
+            test_config(
+                root.cache_root(),
+                u64::MAX / 2,
+                DiskFreeThreshold::Percent(0),
+            ),
+            |_| Ok(0),
+            |_| {
+                Ok(FilesystemSpace {
+                    available_bytes: 90,
+                    total_bytes: 100,
+                })
+            },
+            |_, _, _, _| {},
+        );
+        let body = br#"{"studies":[{"protocolSection":{"status":"RECRUITING"}}]}"#.repeat(500);
+
+        let returned = manager
+            .put(
+                "GET:https://example.test/cache-key".into(),
+                test_http_response(&body),
+                test_policy(),
+            )
+            .await
+            .expect("put");
+        assert_eq!(returned.body, body);
+
+        let stored = cacache::metadata(root.http_dir(), "GET:https://example.test/cache-key")
+            .await
+            .expect("metadata")
+            .expect("entry");
+        assert!(stored.size < body.len() / 5);
+        assert_eq!(
+            manager.approx_bytes.load(Ordering::Relaxed),
+            stored.size as u64
+        );
+
+        let (response, _) = manager
+            .get("GET:https://example.test/cache-key")
+            .await
+            .expect("get")
+            .expect("disk hit");
+        assert_eq!(response.body, body);
+        assert_eq!(response.headers.len(), 1);
     }
 
     #[tokio::test(flavor = "current_thread")]
     async fn put_schedules_eviction_for_preexisting_oversized_cache_with_ample_disk() {
         let root = TempDirGuard::new("schedule-oversized");
         let scheduled = Arc::new(AtomicUsize::new(0));
+        fs::create_dir_all(root.http_dir()).expect("http dir");
+        write_size_ledger(&root.http_dir(), 2).expect("ledger");
         let manager = SizeAwareCacheManager::new_with_services(
             root.http_dir(),
             test_config(root.cache_root(), 1, DiskFreeThreshold::Percent(10)),
@@ -757,6 +1206,8 @@ mod tests {
     async fn put_debounces_duplicate_eviction_scheduling() {
         let root = TempDirGuard::new("schedule-debounce");
         let scheduled = Arc::new(AtomicUsize::new(0));
+        fs::create_dir_all(root.http_dir()).expect("http dir");
+        write_size_ledger(&root.http_dir(), 2).expect("ledger");
         let manager = SizeAwareCacheManager::new_with_services(
             root.http_dir(),
             test_config(root.cache_root(), 1, DiskFreeThreshold::Percent(10)),
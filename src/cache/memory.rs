@@ -0,0 +1,197 @@
+use std::collections::{BTreeMap, HashMap};
+use std::sync::{Mutex, PoisonError};
+
+use http_cache::HttpResponse;
+use http_cache_semantics::CachePolicy;
+
+// Rough per-entry bookkeeping cost (key copies, map nodes, policy) on top of body and headers.
+const ENTRY_OVERHEAD_BYTES: u64 = 512;
+// Entries larger than this fraction of the tier would evict too much to be worth admitting.
+const MAX_ENTRY_FRACTION: u64 = 8;
+
+struct MemoryEntry {
+    response: HttpResponse,
+    policy: CachePolicy,
+    bytes: u64,
+    last_used: u64,
+}
+
+#[derive(Default)]
+struct MemoryState {
+    entries: HashMap<String, MemoryEntry>,
+    // Recency order: access tick -> key. The smallest tick is the eviction candidate.
+    recency: BTreeMap<u64, String>,
+    used_bytes: u64,
+    tick: u64,
+}
+
+impl MemoryState {
+    fn next_tick(&mut self) -> u64 {
+        self.tick = self.tick.wrapping_add(1);
+        self.tick
+    }
+
+    fn remove(&mut self, key: &str) -> Option<MemoryEntry> {
+        let entry = self.entries.remove(key)?;
+        self.recency.remove(&entry.last_used);
+        self.used_bytes = self.used_bytes.saturating_sub(entry.bytes);
+        Some(entry)
+    }
+}
+
+/// Bounded in-memory (L1) tier of the HTTP cache with byte-size-aware LRU eviction.
+pub(crate) struct MemoryTier {
+    capacity_bytes: u64,
+    state: Mutex<MemoryState>,
+}
+
+impl MemoryTier {
+    /// Returns `None` when `capacity_bytes` is 0, which disables the tier.
+    pub(crate) fn new(capacity_bytes: u64) -> Option<Self> {
+        (capacity_bytes > 0).then(|| Self {
+            capacity_bytes,
+            state: Mutex::new(MemoryState::default()),
+        })
+    }
+
+    pub(crate) fn get(&self, key: &str) -> Option<(HttpResponse, CachePolicy)> {
+        let mut guard = self.state.lock().unwrap_or_else(PoisonError::into_inner);
+        let state = &mut *guard;
+        let tick = state.next_tick();
+        let entry = state.entries.get_mut(key)?;
+        let previous = std::mem::replace(&mut entry.last_used, tick);
+        let hit = (entry.response.clone(), entry.policy.clone());
+        state.recency.remove(&previous);
+        state.recency.insert(tick, key.to_string());
+        Some(hit)
+    }
+
+    pub(crate) fn insert(&self, key: &str, response: &HttpResponse, policy: &CachePolicy) {
+        let bytes = entry_bytes(key, response);
+        let mut state = self.state.lock().unwrap_or_else(PoisonError::into_inner);
+        state.remove(key);
+        if bytes > self.capacity_bytes / MAX_ENTRY_FRACTION {
+            return;
+        }
+        while state.used_bytes + bytes > self.capacity_bytes {
+            let Some((_, oldest)) = state.recency.pop_first() else {
+                break;
+            };
+            if let Some(evicted) = state.entries.remove(&oldest) {
+                state.used_bytes = state.used_bytes.saturating_sub(evicted.bytes);
+            }
+        }
+        let tick = state.next_tick();
+        state.recency.insert(tick, key.to_string());
+        state.used_bytes += bytes;
+        state.entries.insert(
+            key.to_string(),
+            MemoryEntry {
+                response: response.clone(),
+                policy: policy.clone(),
+                bytes,
+                last_used: tick,
+            },
+        );
+    }
+
+    pub(crate) fn remove(&self, key: &str) {
+        self.state
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .remove(key);
+    }
+
+    #[cfg(test)]
+    fn used_bytes(&self) -> u64 {
+        self.state
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .used_bytes
+    }
+}
+
+fn entry_bytes(key: &str, response: &HttpResponse) -> u64 {
+    let headers: usize = response
+        .headers
+        .iter()
+        .map(|(name, value)| name.len() + value.len())
+        .sum();
+    (key.len() + response.url.as_str().len() + response.body.len() + headers) as u64
+        + ENTRY_OVERHEAD_BYTES
+}
+
+#[cfg(test)]
+mod tests {
+    use std::collections::HashMap;
+
+    use http::{Request, Response};
+    use http_cache::{HttpResponse, HttpVersion};
+    use http_cache_semantics::CachePolicy;
+
+    use super::{ENTRY_OVERHEAD_BYTES, MemoryTier, entry_bytes};
+
+    fn response(body_len: usize) -> (HttpResponse, CachePolicy) {
+        let request = Request::builder()
+            .method("GET")
+            .uri("https://example.test/resource")
+            .body(())
+            .expect("request");
+        let response = Response::builder()
+            .status(200)
+            .header("cache-control", "max-age=60")
+            .body(())
+            .expect("response");
+        (
+            HttpResponse {
+                body: vec![b'x'; body_len],
+                headers: HashMap::new(),
+                status: 200,
+                url: reqwest::Url::parse("https://example.test/resource").expect("url"),
+                version: HttpVersion::Http11,
+            },
+            CachePolicy::new(&request, &response),
+        )
+    }
+
+    #[test]
+    fn zero_capacity_disables_memory_tier() {
+        assert!(MemoryTier::new(0).is_none());
+    }
+
+    #[test]
+    fn memory_tier_evicts_least_recently_used_by_bytes() {
+        let (res, policy) = response(1_000);
+        let entry = entry_bytes("a", &res);
+        let tier = MemoryTier::new(entry * 8 * 2 + ENTRY_OVERHEAD_BYTES).expect("tier");
+        for key in ["a", "b"] {
+            tier.insert(key, &res, &policy);
+        }
+        // Touch "a" so "b" becomes the eviction candidate.
+        assert!(tier.get("a").is_some());
+        for key in [
+            "c", "d", "e", "f", "g", "h", "i", "j", "k", "l", "m", "n", "o", "p", "q",
+        ] {
+            tier.insert(key, &res, &policy);
+            assert!(tier.used_bytes() <= entry * 8 * 2 + ENTRY_OVERHEAD_BYTES);
+        }
+        assert!(tier.get("b").is_none());
+        assert!(tier.get("q").is_some());
+    }
+
+    #[test]
+    fn memory_tier_skips_oversized_entries_and_supports_removal() {
+        let (small, policy) = response(10);
+        let (large, _) = response(100_000);
+        let tier = MemoryTier::new(64 * 1024).expect("tier");
+
+        tier.insert("large", &large, &policy);
+        assert!(tier.get("large").is_none());
+
+        tier.insert("small", &small, &policy);
+        assert_eq!(tier.get("small").map(|(res, _)| res.body.len()), Some(10));
+        tier.remove("small");
+        assert!(tier.get("small").is_none());
+        assert_eq!(tier.used_bytes(), 0);
+    }
+}
@@ -1,10 +1,13 @@
 mod clean;
 mod clear;
+mod codec;
 mod config;
 mod limits;
 mod manager;
+mod memory;
 pub(crate) mod migration;
 mod planner;
+mod stats;
 
 #[allow(unused_imports)]
 pub(crate) use clean::{CleanOptions, CleanReport, execute_cache_clean};
@@ -12,8 +15,9 @@ pub(crate) use clean::{CleanOptions, CleanReport, execute_cache_clean};
 pub(crate) use clear::{ClearReport, execute_cache_clear};
 #[allow(unused_imports)]
 pub(crate) use config::{
-    CacheConfig, CacheConfigOrigins, ConfigOrigin, DiskFreeThreshold, ResolvedCacheConfig,
-    resolve_cache_config,
+    CacheConfig, CacheConfigOrigins, CacheSourcePolicy, ConfigOrigin, DiskFreeThreshold,
+    RateLimitOverride, ResolvedCacheConfig, resolve_cache_config, resolve_cache_source_policies,
+    resolve_rate_limit_overrides,
 };
 #[allow(unused_imports)]
 pub(crate) use limits::{
@@ -27,3 +31,8 @@ pub(crate) use planner::{
     CacheBlob, CacheCleanupPlan, CacheEntry, CachePlannerError, CacheSnapshot, plan_age_cleanup,
     plan_composite_cleanup, plan_orphan_gc, plan_size_lru, snapshot_cache,
 };
+#[allow(unused_imports)]
+pub(crate) use stats::{
+    CacheLookupStats, flush_lookup_stats, process_lookup_stats, read_lookup_stats,
+    record_normalized_hit,
+};
@@ -0,0 +1,237 @@
+use std::fs::OpenOptions;
+use std::io::{self, Read, Seek, SeekFrom, Write};
+use std::path::{Path, PathBuf};
+use std::sync::OnceLock;
+use std::sync::atomic::{AtomicU64, Ordering};
+
+use fs2::FileExt;
+use serde::{Deserialize, Serialize};
+use tracing::warn;
+
+const LOOKUP_STATS_FILE: &str = "lookup-stats.json";
+// Long-running servers persist counters every this many lookups; CLI runs flush on exit.
+const FLUSH_EVERY_LOOKUPS: u64 = 64;
+
+/// Which cache tier answered a lookup.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub(crate) enum CacheTier {
+    Memory,
+    Disk,
+    Miss,
+}
+
+/// Cumulative HTTP cache lookup counters for one cache root.
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq, Serialize, Deserialize)]
+pub(crate) struct CacheLookupStats {
+    pub(crate) l1_hits: u64,
+    pub(crate) l2_hits: u64,
+    pub(crate) misses: u64,
+    /// Hits served under a key that cache-key normalization rewrote (sorted query, stripped
+    /// credentials, folded case); part of `l1_hits`/`l2_hits`, not additional lookups.
+    #[serde(default)]
+    pub(crate) normalized_hits: u64,
+}
+
+impl CacheLookupStats {
+    pub(crate) fn lookups(&self) -> u64 {
+        self.l1_hits
+            .saturating_add(self.l2_hits)
+            .saturating_add(self.misses)
+    }
+
+    /// Share of all lookups answered by the in-memory tier.
+    pub(crate) fn l1_hit_rate(&self) -> Option<f64> {
+        ratio(self.l1_hits, self.lookups())
+    }
+
+    /// Share of all lookups answered by the disk tier after an L1 miss.
+    pub(crate) fn l2_hit_rate(&self) -> Option<f64> {
+        ratio(self.l2_hits, self.lookups())
+    }
+
+    fn merged_with(self, other: Self) -> Self {
+        Self {
+            l1_hits: self.l1_hits.saturating_add(other.l1_hits),
+            l2_hits: self.l2_hits.saturating_add(other.l2_hits),
+            misses: self.misses.saturating_add(other.misses),
+            normalized_hits: self.normalized_hits.saturating_add(other.normalized_hits),
+        }
+    }
+}
+
+fn ratio(part: u64, total: u64) -> Option<f64> {
+    (total > 0).then(|| part as f64 / total as f64)
+}
+
+static PENDING_L1_HITS: AtomicU64 = AtomicU64::new(0);
+static PENDING_L2_HITS: AtomicU64 = AtomicU64::new(0);
+static PENDING_MISSES: AtomicU64 = AtomicU64::new(0);
+static PENDING_NORMALIZED_HITS: AtomicU64 = AtomicU64::new(0);
+static PENDING_LOOKUPS: AtomicU64 = AtomicU64::new(0);
+// Never reset by flushes; served live by `serve-http`'s `/metrics`.
+static PROCESS_L1_HITS: AtomicU64 = AtomicU64::new(0);
+static PROCESS_L2_HITS: AtomicU64 = AtomicU64::new(0);
+static PROCESS_MISSES: AtomicU64 = AtomicU64::new(0);
+static PROCESS_NORMALIZED_HITS: AtomicU64 = AtomicU64::new(0);
+static STATS_ROOT: OnceLock<PathBuf> = OnceLock::new();
+
+/// Sets the cache root whose `lookup-stats.json` receives this process's counters.
+pub(crate) fn register_lookup_stats_root(cache_root: &Path) {
+    let _ = STATS_ROOT.set(cache_root.to_path_buf());
+}
+
+/// Records one lookup and returns `true` when enough lookups are pending to flush.
+pub(crate) fn record_lookup(tier: CacheTier) -> bool {
+    let (counter, process_counter) = match tier {
+        CacheTier::Memory => (&PENDING_L1_HITS, &PROCESS_L1_HITS),
+        CacheTier::Disk => (&PENDING_L2_HITS, &PROCESS_L2_HITS),
+        CacheTier::Miss => (&PENDING_MISSES, &PROCESS_MISSES),
+    };
+    counter.fetch_add(1, Ordering::Relaxed);
+    process_counter.fetch_add(1, Ordering::Relaxed);
+    PENDING_LOOKUPS.fetch_add(1, Ordering::Relaxed) + 1 >= FLUSH_EVERY_LOOKUPS
+}
+
+/// Records that a cache hit was only possible because of key normalization. Flushed with the
+/// next lookup batch.
+pub(crate) fn record_normalized_hit() {
+    PENDING_NORMALIZED_HITS.fetch_add(1, Ordering::Relaxed);
+    PROCESS_NORMALIZED_HITS.fetch_add(1, Ordering::Relaxed);
+}
+
+/// Lookups made by this process since it started, independent of persisted totals.
+pub(crate) fn process_lookup_stats() -> CacheLookupStats {
+    CacheLookupStats {
+        l1_hits: PROCESS_L1_HITS.load(Ordering::Relaxed),
+        l2_hits: PROCESS_L2_HITS.load(Ordering::Relaxed),
+        misses: PROCESS_MISSES.load(Ordering::Relaxed),
+        normalized_hits: PROCESS_NORMALIZED_HITS.load(Ordering::Relaxed),
+    }
+}
+
+fn take_pending() -> CacheLookupStats {
+    PENDING_LOOKUPS.store(0, Ordering::Relaxed);
+    CacheLookupStats {
+        l1_hits: PENDING_L1_HITS.swap(0, Ordering::Relaxed),
+        l2_hits: PENDING_L2_HITS.swap(0, Ordering::Relaxed),
+        misses: PENDING_MISSES.swap(0, Ordering::Relaxed),
+        normalized_hits: PENDING_NORMALIZED_HITS.swap(0, Ordering::Relaxed),
+    }
+}
+
+fn restore_pending(stats: CacheLookupStats) {
+    PENDING_L1_HITS.fetch_add(stats.l1_hits, Ordering::Relaxed);
+    PENDING_L2_HITS.fetch_add(stats.l2_hits, Ordering::Relaxed);
+    PENDING_MISSES.fetch_add(stats.misses, Ordering::Relaxed);
+    PENDING_NORMALIZED_HITS.fetch_add(stats.normalized_hits, Ordering::Relaxed);
+}
+
+/// Adds this process's pending counters to the persisted totals. Failures are logged and the
+/// counters are kept for the next flush.
+pub(crate) fn flush_lookup_stats() {
+    let Some(root) = STATS_ROOT.get() else {
+        return;
+    };
+    let pending = take_pending();
+    if pending.lookups() == 0 {
+        return;
+    }
+    if let Err(err) = merge_lookup_stats(&root.join(LOOKUP_STATS_FILE), pending) {
+        warn!(
+            cache_root = %root.display(),
+            "failed to persist cache lookup stats: {err}"
+        );
+        restore_pending(pending);
+    }
+}
+
+fn merge_lookup_stats(path: &Path, delta: CacheLookupStats) -> io::Result<()> {
+    let mut file = OpenOptions::new()
+        .read(true)
+        .write(true)
+        .create(true)
+        .truncate(false)
+        .open(path)?;
+    file.lock_exclusive()?;
+    let result = rewrite_lookup_stats(&mut file, delta);
+    let _ = FileExt::unlock(&file);
+    result
+}
+
+fn rewrite_lookup_stats(file: &mut std::fs::File, delta: CacheLookupStats) -> io::Result<()> {
+    let mut raw = String::new();
+    file.read_to_string(&mut raw)?;
+    let current = serde_json::from_str::<CacheLookupStats>(&raw).unwrap_or_default();
+    let merged = serde_json::to_vec(&current.merged_with(delta)).map_err(io::Error::other)?;
+    file.set_len(0)?;
+    file.seek(SeekFrom::Start(0))?;
+    file.write_all(&merged)
+}
+
+/// Reads the persisted lookup counters for `cache_root`; missing or unreadable files read as 0.
+pub(crate) fn read_lookup_stats(cache_root: &Path) -> CacheLookupStats {
+    std::fs::read_to_string(cache_root.join(LOOKUP_STATS_FILE))
+        .ok()
+        .and_then(|raw| serde_json::from_str(&raw).ok())
+        .unwrap_or_default()
+}
+
+#[cfg(test)]
+mod tests {
+    use std::path::PathBuf;
+    use std::time::{SystemTime, UNIX_EPOCH};
+
+    use super::{CacheLookupStats, LOOKUP_STATS_FILE, merge_lookup_stats, read_lookup_stats};
+
+    struct TempDirGuard {
+        path: PathBuf,
+    }
+
+    impl TempDirGuard {
+        fn new(label: &str) -> Self {
+            let suffix = SystemTime::now()
+                .duration_since(UNIX_EPOCH)
+                .unwrap_or_default()
+                .as_nanos();
+            let path = std::env::temp_dir().join(format!(
+                "biomcp-cache-stats-{label}-{}-{suffix}",
+                std::process::id()
+            ));
+            std::fs::create_dir_all(&path).expect("create temp dir");
+            Self { path }
+        }
+    }
+
+    impl Drop for TempDirGuard {
+        fn drop(&mut self) {
+            let _ = std::fs::remove_dir_all(&self.path);
+        }
+    }
+
+    #[test]
+    fn lookup_stats_accumulate_across_flushes() {
+        let dir = TempDirGuard::new("accumulate");
+        assert_eq!(read_lookup_stats(&dir.path), CacheLookupStats::default());
+
+        let path = dir.path.join(LOOKUP_STATS_FILE);
+        let delta = CacheLookupStats {
+            l1_hits: 3,
+            l2_hits: 1,
+            misses: 4,
+            normalized_hits: 2,
+        };
+        merge_lookup_stats(&path, delta).expect("first merge");
+        merge_lookup_stats(&path, delta).expect("second merge");
+
+        let stats = read_lookup_stats(&dir.path);
+        assert_eq!(stats.lookups(), 16);
+        assert_eq!(stats.l1_hit_rate(), Some(0.375));
+        assert_eq!(stats.l2_hit_rate(), Some(0.125));
+        assert_eq!(stats.normalized_hits, 4);
+    }
+
+    #[test]
+    fn empty_lookup_stats_have_no_hit_rate() {
+        assert_eq!(CacheLookupStats::default().l1_hit_rate(), None);
+    }
+}
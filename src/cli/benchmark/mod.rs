@@ -41,6 +41,10 @@ pub enum BenchmarkCommand {
         /// Max allowed fail-fast latency for contract checks (default: 1500ms)
         #[arg(long, default_value = "1500")]
         max_fail_fast_ms: u64,
+
+        /// Replay upstream responses from this fixture directory instead of live APIs
+        #[arg(long, value_name = "FIXTURES")]
+        offline: Option<PathBuf>,
     },
 
     /// Run benchmark suite and persist as baseline JSON
@@ -53,9 +57,24 @@ pub enum BenchmarkCommand {
         #[arg(long)]
         iterations: Option<u32>,
 
-        /// Output path (default: benchmarks/v<CARGO_PKG_VERSION>.json)
+        /// Output path (default: benchmarks/v<CARGO_PKG_VERSION>.json, or
+        /// benchmarks/offline/v<CARGO_PKG_VERSION>.json with --offline)
         #[arg(long)]
         output: Option<PathBuf>,
+
+        /// Replay upstream responses from this fixture directory instead of live APIs
+        #[arg(long, value_name = "FIXTURES")]
+        offline: Option<PathBuf>,
+    },
+
+    /// Record the upstream responses of each case as fixtures for --offline runs
+    RecordFixtures {
+        /// Fixture directory to write
+        output: PathBuf,
+
+        /// Record only the smaller core benchmark subset
+        #[arg(long)]
+        quick: bool,
     },
 
     /// Score a PI JSONL agent session for BioMCP usage and coverage
@@ -84,6 +103,7 @@ pub async fn run(command: BenchmarkCommand, json_output: bool) -> anyhow::Result
             latency_threshold_pct,
             size_threshold_pct,
             max_fail_fast_ms,
+            offline,
         } => {
             let opts = run::RunOptions {
                 quick,
@@ -94,6 +114,7 @@ pub async fn run(command: BenchmarkCommand, json_output: bool) -> anyhow::Result
                 latency_threshold_pct,
                 size_threshold_pct,
                 max_fail_fast_ms,
+                offline,
             };
             run::run_benchmark(opts, json_output).await
         }
@@ -101,14 +122,20 @@ pub async fn run(command: BenchmarkCommand, json_output: bool) -> anyhow::Result
             quick,
             iterations,
             output,
+            offline,
         } => {
             let opts = run::SaveBaselineOptions {
                 quick,
                 iterations,
                 output,
+                offline,
             };
             run::save_baseline(opts, json_output).await
         }
+        BenchmarkCommand::RecordFixtures { output, quick } => {
+            let opts = run::RecordFixturesOptions { quick, output };
+            run::record_fixtures(opts, json_output).await
+        }
         BenchmarkCommand::ScoreSession {
             session,
             expected,
@@ -17,7 +17,7 @@ use super::types::{
     BenchmarkTransientFailure,
 };
 
-const SUITE_VERSION: &str = "2026-02-17";
+const SUITE_VERSION: &str = "2026-10-18";
 const DEFAULT_LATENCY_THRESHOLD_PCT: f64 = 20.0;
 const DEFAULT_SIZE_THRESHOLD_PCT: f64 = 10.0;
 const DEFAULT_MAX_FAIL_FAST_MS: u64 = 1500;
@@ -25,6 +25,8 @@ const DEFAULT_FULL_ITERATIONS: u32 = 3;
 const DEFAULT_QUICK_ITERATIONS: u32 = 2;
 const DEFAULT_FULL_TIMEOUT_MS: u64 = 45_000;
 const DEFAULT_QUICK_TIMEOUT_MS: u64 = 20_000;
+const CASSETTE_ENV: &str = "BIOMCP_CASSETTE";
+const OFFLINE_BASELINE_DIR: &str = "offline";
 
 #[derive(Debug, Clone)]
 pub struct RunOptions {
@@ -36,6 +38,7 @@ pub struct RunOptions {
     pub latency_threshold_pct: f64,
     pub size_threshold_pct: f64,
     pub max_fail_fast_ms: u64,
+    pub offline: Option<PathBuf>,
 }
 
 impl Default for RunOptions {
@@ -49,6 +52,7 @@ impl Default for RunOptions {
             latency_threshold_pct: DEFAULT_LATENCY_THRESHOLD_PCT,
             size_threshold_pct: DEFAULT_SIZE_THRESHOLD_PCT,
             max_fail_fast_ms: DEFAULT_MAX_FAIL_FAST_MS,
+            offline: None,
         }
     }
 }
@@ -58,6 +62,7 @@ pub struct SaveBaselineOptions {
     pub quick: bool,
     pub iterations: Option<u32>,
     pub output: Option<PathBuf>,
+    pub offline: Option<PathBuf>,
 }
 
 impl Default for SaveBaselineOptions {
@@ -66,10 +71,17 @@ impl Default for SaveBaselineOptions {
             quick: false,
             iterations: None,
             output: None,
+            offline: None,
         }
     }
 }
 
+#[derive(Debug, Clone)]
+pub struct RecordFixturesOptions {
+    pub quick: bool,
+    pub output: PathBuf,
+}
+
 #[derive(Debug, Clone, Copy)]
 struct RegressionThresholds {
     latency_pct: f64,
@@ -119,6 +131,33 @@ const FULL_SUITE: &[CaseSpec] = &[
         args: &["search", "article", "-g", "BRAF", "--limit", "5"],
         tags: &["core"],
     },
+    CaseSpec {
+        id: "search_article_braf_offset_1000_limit_25",
+        kind: BenchmarkCaseKind::Success,
+        args: &[
+            "search", "article", "-g", "BRAF", "--offset", "1000", "--limit", "25",
+        ],
+        tags: &["extended"],
+    },
+    CaseSpec {
+        id: "search_article_braf_melanoma_resistance_offset_1000_limit_25",
+        kind: BenchmarkCaseKind::Success,
+        args: &[
+            "search",
+            "article",
+            "-g",
+            "BRAF",
+            "-d",
+            "melanoma",
+            "-k",
+            "acquired resistance",
+            "--offset",
+            "1000",
+            "--limit",
+            "25",
+        ],
+        tags: &["extended"],
+    },
     CaseSpec {
         id: "get_drug_imatinib",
         kind: BenchmarkCaseKind::Success,
@@ -185,6 +224,12 @@ const FULL_SUITE: &[CaseSpec] = &[
         ],
         tags: &["contract"],
     },
+    CaseSpec {
+        id: "startup_warm_cache_get_gene_braf",
+        kind: BenchmarkCaseKind::Success,
+        args: &["get", "gene", "BRAF"],
+        tags: &["core", "startup"],
+    },
 ];
 
 pub async fn run_benchmark(opts: RunOptions, json_output: bool) -> anyhow::Result<String> {
@@ -196,18 +241,27 @@ pub async fn run_benchmark(opts: RunOptions, json_output: bool) -> anyhow::Resul
     let iterations = opts.iterations.unwrap_or_else(|| default_iterations(mode));
     let timeout_ms = default_timeout(mode);
 
-    let mut report =
-        collect_report(mode, iterations, timeout_ms, opts.max_fail_fast_ms, None).await?;
+    let fixtures = opts.offline.as_deref();
+    let mut report = collect_report(
+        mode,
+        iterations,
+        timeout_ms,
+        opts.max_fail_fast_ms,
+        None,
+        fixtures,
+    )
+    .await?;
 
     let baseline_path = if let Some(explicit) = opts.baseline.as_ref() {
         Some(explicit.clone())
     } else {
-        discover_latest_baseline_path()
+        discover_latest_baseline_path(fixtures.is_some())
     };
 
     if let Some(path) = baseline_path {
         if path.exists() {
             let baseline = load_baseline(&path)?;
+            check_baseline_upstreams(&report, &baseline, &path)?;
             compare_against_baseline(
                 &mut report,
                 &baseline,
@@ -256,10 +310,19 @@ pub async fn save_baseline(opts: SaveBaselineOptions, json_output: bool) -> anyh
     let iterations = opts.iterations.unwrap_or_else(|| default_iterations(mode));
     let timeout_ms = default_timeout(mode);
 
-    let report =
-        collect_report(mode, iterations, timeout_ms, DEFAULT_MAX_FAIL_FAST_MS, None).await?;
-
-    let output_path = opts.output.unwrap_or_else(default_baseline_path);
+    let report = collect_report(
+        mode,
+        iterations,
+        timeout_ms,
+        DEFAULT_MAX_FAIL_FAST_MS,
+        None,
+        opts.offline.as_deref(),
+    )
+    .await?;
+
+    let output_path = opts
+        .output
+        .unwrap_or_else(|| default_baseline_path(report.offline));
     if let Some(parent) = output_path.parent() {
         fs::create_dir_all(parent).with_context(|| {
             format!(
@@ -301,6 +364,85 @@ pub async fn save_baseline(opts: SaveBaselineOptions, json_output: bool) -> anyh
     ))
 }
 
+/// Runs each success case once against live upstreams and records its markdown and JSON runs
+/// as `BIOMCP_CASSETTE` fixtures. Contract cases fail before any request and need none.
+pub async fn record_fixtures(
+    opts: RecordFixturesOptions,
+    json_output: bool,
+) -> anyhow::Result<String> {
+    let mode = if opts.quick {
+        BenchmarkMode::Quick
+    } else {
+        BenchmarkMode::Full
+    };
+    let timeout_ms = default_timeout(mode);
+    fs::create_dir_all(&opts.output).with_context(|| {
+        format!(
+            "failed to create fixture directory {}",
+            opts.output.to_string_lossy()
+        )
+    })?;
+
+    let cache_root = create_temp_cache_root()?;
+    let _cache_guard = TempDirGuard::new(cache_root.clone());
+    let exe = std::env::current_exe().context("failed to resolve biomcp executable path")?;
+
+    let mut recorded = Vec::new();
+    let mut failures = Vec::new();
+    for case in select_suite(mode) {
+        if case.kind != BenchmarkCaseKind::Success {
+            continue;
+        }
+        let case_cache_root = cache_root.join(case.id);
+        for as_json in [false, true] {
+            reset_case_cache(&case_cache_root)?;
+            let fixture = fixture_path(&opts.output, case.id, as_json);
+            let cassette = format!("record:{}", fixture.display());
+            let exec = execute_case_command(
+                &exe,
+                case.args,
+                as_json,
+                &case_cache_root,
+                timeout_ms,
+                Some(&cassette),
+            )
+            .await?;
+            if exec.exit_code == 0 && !exec.timed_out {
+                recorded.push(fixture.display().to_string());
+            } else {
+                failures.push(format!("{}: {}", case.id, exec.stderr_excerpt));
+            }
+        }
+    }
+
+    if !failures.is_empty() {
+        return Err(anyhow!(
+            "failed to record benchmark fixtures ({}):\n{}",
+            failures.len(),
+            failures.join("\n")
+        ));
+    }
+
+    if json_output {
+        #[derive(serde::Serialize)]
+        struct RecordFixturesResponse {
+            path: String,
+            fixtures: Vec<String>,
+        }
+
+        return Ok(crate::render::json::to_pretty(&RecordFixturesResponse {
+            path: opts.output.display().to_string(),
+            fixtures: recorded,
+        })?);
+    }
+
+    Ok(format!(
+        "Recorded {} benchmark fixtures in {}",
+        recorded.len(),
+        opts.output.display()
+    ))
+}
+
 fn build_summary(report: &BenchmarkRunReport) -> BenchmarkSummary {
     let total_cases = report.commands.len();
     let ok_cases = report
@@ -330,9 +472,13 @@ async fn collect_report(
     timeout_ms: u64,
     max_fail_fast_ms: u64,
     baseline_path: Option<String>,
+    fixtures: Option<&Path>,
 ) -> anyhow::Result<BenchmarkRunReport> {
     let suite = select_suite(mode);
     let suite_hash = compute_suite_hash(&suite);
+    if let Some(fixtures) = fixtures {
+        check_fixtures(&suite, fixtures)?;
+    }
 
     let cache_root = create_temp_cache_root()?;
     let _cache_guard = TempDirGuard::new(cache_root.clone());
@@ -344,7 +490,15 @@ async fn collect_report(
         let case_cache_root = cache_root.join(case.id);
         let report = match case.kind {
             BenchmarkCaseKind::Success => {
-                run_success_case(case, iterations, timeout_ms, &exe, &case_cache_root).await?
+                run_success_case(
+                    case,
+                    iterations,
+                    timeout_ms,
+                    &exe,
+                    &case_cache_root,
+                    fixtures,
+                )
+                .await?
             }
             BenchmarkCaseKind::ContractFailure => {
                 run_contract_case(case, iterations, max_fail_fast_ms, &exe, &case_cache_root)
@@ -368,6 +522,7 @@ async fn collect_report(
             hostname: std::env::var("HOSTNAME").ok(),
         },
         mode,
+        offline: fixtures.is_some(),
         iterations,
         baseline_path,
         commands,
@@ -392,7 +547,13 @@ async fn run_success_case(
     timeout_ms: u64,
     exe: &Path,
     case_cache_root: &Path,
+    fixtures: Option<&Path>,
 ) -> anyhow::Result<BenchmarkCommandReport> {
+    let replay = |as_json: bool| {
+        fixtures.map(|dir| format!("replay:{}", fixture_path(dir, case.id, as_json).display()))
+    };
+    let markdown_cassette = replay(false);
+    let json_cassette = replay(true);
     let mut cold_samples = Vec::with_capacity(iterations as usize);
     let mut warm_samples = Vec::with_capacity(iterations as usize);
     let mut markdown_bytes = Vec::with_capacity(iterations as usize);
@@ -406,7 +567,15 @@ async fn run_success_case(
     for _ in 0..iterations {
         reset_case_cache(case_cache_root)?;
 
-        let cold = execute_case_command(exe, case.args, false, case_cache_root, timeout_ms).await?;
+        let cold = execute_case_command(
+            exe,
+            case.args,
+            false,
+            case_cache_root,
+            timeout_ms,
+            markdown_cassette.as_deref(),
+        )
+        .await?;
         if cold.exit_code == 0 && !cold.timed_out {
             cold_samples.push(cold.latency_ms);
             markdown_bytes.push(cold.stdout_bytes);
@@ -419,7 +588,15 @@ async fn run_success_case(
             );
         }
 
-        let warm = execute_case_command(exe, case.args, false, case_cache_root, timeout_ms).await?;
+        let warm = execute_case_command(
+            exe,
+            case.args,
+            false,
+            case_cache_root,
+            timeout_ms,
+            markdown_cassette.as_deref(),
+        )
+        .await?;
         if warm.exit_code == 0 && !warm.timed_out {
             warm_samples.push(warm.latency_ms);
         } else {
@@ -431,7 +608,15 @@ async fn run_success_case(
             );
         }
 
-        let json = execute_case_command(exe, case.args, true, case_cache_root, timeout_ms).await?;
+        let json = execute_case_command(
+            exe,
+            case.args,
+            true,
+            case_cache_root,
+            timeout_ms,
+            json_cassette.as_deref(),
+        )
+        .await?;
         last_exit_code = Some(json.exit_code);
         if json.exit_code == 0 && !json.timed_out {
             json_bytes.push(json.stdout_bytes);
@@ -485,7 +670,8 @@ async fn run_contract_case(
 
     for _ in 0..iterations {
         reset_case_cache(case_cache_root)?;
-        let exec = execute_case_command(exe, case.args, false, case_cache_root, timeout_ms).await?;
+        let exec =
+            execute_case_command(exe, case.args, false, case_cache_root, timeout_ms, None).await?;
         latencies.push(exec.latency_ms);
         exit_codes.push(exec.exit_code);
         if exec.exit_code == 0 {
@@ -549,6 +735,7 @@ async fn execute_case_command(
     as_json: bool,
     cache_home: &Path,
     timeout_ms: u64,
+    cassette: Option<&str>,
 ) -> anyhow::Result<CommandExecution> {
     let mut cmd = tokio::process::Command::new(exe);
     cmd.kill_on_drop(true)
@@ -557,6 +744,11 @@ async fn execute_case_command(
         .stderr(Stdio::piped())
         .env("XDG_CACHE_HOME", cache_home)
         .args(build_child_args(args, as_json));
+    // Never let a cassette from the caller's environment leak into a live run.
+    match cassette {
+        Some(cassette) => cmd.env(CASSETTE_ENV, cassette),
+        None => cmd.env_remove(CASSETTE_ENV),
+    };
 
     let start = tokio::time::Instant::now();
     let output = tokio::time::timeout(Duration::from_millis(timeout_ms), cmd.output()).await;
@@ -584,6 +776,24 @@ async fn execute_case_command(
     }
 }
 
+/// Rejects a baseline taken against the other kind of upstream. Live latencies include network
+/// time that offline runs never pay, so comparing the two only reports noise.
+fn check_baseline_upstreams(
+    report: &BenchmarkRunReport,
+    baseline: &BenchmarkRunReport,
+    path: &Path,
+) -> anyhow::Result<()> {
+    if report.offline == baseline.offline {
+        return Ok(());
+    }
+    Err(anyhow!(
+        "baseline {} was recorded against {} upstreams, but this run uses {} upstreams",
+        path.display(),
+        upstreams_label(baseline.offline),
+        upstreams_label(report.offline),
+    ))
+}
+
 fn compare_against_baseline(
     report: &mut BenchmarkRunReport,
     baseline: &BenchmarkRunReport,
@@ -839,8 +1049,9 @@ fn render_human_report(report: &BenchmarkRunReport) -> String {
     let mut out = String::new();
     out.push_str("# BioMCP Benchmark Report\n\n");
     out.push_str(&format!(
-        "- Mode: {}\n- Iterations: {}\n- Suite version: {}\n- Suite hash: {}\n- Generated: {}\n",
+        "- Mode: {}\n- Upstreams: {}\n- Iterations: {}\n- Suite version: {}\n- Suite hash: {}\n- Generated: {}\n",
         mode_label(report.mode),
+        upstreams_label(report.offline),
         report.iterations,
         report.suite_version,
         report.suite_hash,
@@ -916,6 +1127,10 @@ fn mode_label(mode: BenchmarkMode) -> &'static str {
     }
 }
 
+fn upstreams_label(offline: bool) -> &'static str {
+    if offline { "offline" } else { "live" }
+}
+
 fn kind_label(kind: BenchmarkCaseKind) -> &'static str {
     match kind {
         BenchmarkCaseKind::Success => "success",
@@ -997,13 +1212,21 @@ fn default_iterations(mode: BenchmarkMode) -> u32 {
     }
 }
 
-fn default_baseline_path() -> PathBuf {
-    PathBuf::from("benchmarks").join(format!("v{}.json", env!("CARGO_PKG_VERSION")))
+fn baseline_dir(offline: bool) -> PathBuf {
+    let dir = PathBuf::from("benchmarks");
+    if offline {
+        dir.join(OFFLINE_BASELINE_DIR)
+    } else {
+        dir
+    }
 }
 
-fn discover_latest_baseline_path() -> Option<PathBuf> {
-    let dir = Path::new("benchmarks");
-    let entries = fs::read_dir(dir).ok()?;
+fn default_baseline_path(offline: bool) -> PathBuf {
+    baseline_dir(offline).join(format!("v{}.json", env!("CARGO_PKG_VERSION")))
+}
+
+fn discover_latest_baseline_path(offline: bool) -> Option<PathBuf> {
+    let entries = fs::read_dir(baseline_dir(offline)).ok()?;
     let mut candidates = Vec::new();
 
     for entry in entries.flatten() {
@@ -1031,6 +1254,30 @@ fn load_baseline(path: &Path) -> anyhow::Result<BenchmarkRunReport> {
     Ok(report)
 }
 
+/// Fixture cassette for one case; markdown and `--json` runs may issue different requests.
+fn fixture_path(fixtures: &Path, case_id: &str, as_json: bool) -> PathBuf {
+    let suffix = if as_json { ".json" } else { "" };
+    fixtures.join(format!("{case_id}{suffix}.cassette"))
+}
+
+fn check_fixtures(suite: &[CaseSpec], fixtures: &Path) -> anyhow::Result<()> {
+    let missing = suite
+        .iter()
+        .filter(|case| case.kind == BenchmarkCaseKind::Success)
+        .flat_map(|case| [false, true].map(|as_json| fixture_path(fixtures, case.id, as_json)))
+        .filter(|path| !path.is_file())
+        .map(|path| path.display().to_string())
+        .collect::<Vec<_>>();
+    if missing.is_empty() {
+        return Ok(());
+    }
+    Err(anyhow!(
+        "missing offline benchmark fixtures (run `biomcp benchmark record-fixtures {}`):\n{}",
+        fixtures.display(),
+        missing.join("\n")
+    ))
+}
+
 fn select_suite(mode: BenchmarkMode) -> Vec<CaseSpec> {
     match mode {
         BenchmarkMode::Full => FULL_SUITE.to_vec(),
@@ -1198,6 +1445,7 @@ mod tests {
                 hostname: None,
             },
             mode: BenchmarkMode::Full,
+            offline: false,
             iterations: 3,
             baseline_path: None,
             commands,
@@ -1338,7 +1586,7 @@ mod tests {
 
         let cwd = std::env::current_dir().expect("cwd");
         std::env::set_current_dir(&root).expect("set cwd");
-        let selected = discover_latest_baseline_path();
+        let selected = discover_latest_baseline_path(false);
         std::env::set_current_dir(cwd).expect("restore cwd");
 
         fs::remove_dir_all(&root).expect("cleanup");
@@ -1349,4 +1597,51 @@ mod tests {
             .and_then(|name| name.to_str());
         assert_eq!(selected_name, Some("v0.3.0.json"));
     }
+
+    #[test]
+    fn offline_and_live_baselines_are_not_compared() {
+        let live = report(vec![success_case("case", 900.0, 1200.0, 1000, 1500)]);
+        let mut offline = report(vec![success_case("case", 90.0, 120.0, 1000, 1500)]);
+        offline.offline = true;
+
+        let err = check_baseline_upstreams(&offline, &live, Path::new("benchmarks/v0.3.0.json"))
+            .expect_err("mode mismatch");
+        assert!(err.to_string().contains("recorded against live upstreams"));
+        assert!(check_baseline_upstreams(&live, &live, Path::new("v0.3.0.json")).is_ok());
+        assert_eq!(
+            default_baseline_path(true).parent(),
+            Some(Path::new("benchmarks/offline"))
+        );
+
+        let legacy = serde_json::to_value(&live).expect("serialize");
+        let mut legacy = legacy.as_object().expect("object").clone();
+        legacy.remove("offline");
+        let parsed: BenchmarkRunReport =
+            serde_json::from_value(serde_json::Value::Object(legacy)).expect("legacy baseline");
+        assert!(!parsed.offline);
+    }
+
+    #[test]
+    fn offline_run_requires_fixtures_for_every_success_case() {
+        let root = std::env::temp_dir().join(format!(
+            "biomcp-benchmark-fixtures-{}",
+            SystemTime::now()
+                .duration_since(UNIX_EPOCH)
+                .expect("time")
+                .as_nanos()
+        ));
+        let _guard = TempDirGuard::new(root.clone());
+        fs::create_dir_all(&root).expect("mkdir");
+        let suite = select_suite(BenchmarkMode::Quick);
+
+        let err = check_fixtures(&suite, &root).expect_err("fixtures missing");
+        assert!(err.to_string().contains("get_gene_braf.json.cassette"));
+
+        for case in &suite {
+            for as_json in [false, true] {
+                fs::write(fixture_path(&root, case.id, as_json), b"").expect("write");
+            }
+        }
+        assert!(check_fixtures(&suite, &root).is_ok());
+    }
 }
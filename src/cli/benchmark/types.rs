@@ -83,6 +83,10 @@ pub struct BenchmarkRunReport {
     pub generated_at: String,
     pub environment: BenchmarkEnvironment,
     pub mode: BenchmarkMode,
+    /// Upstream responses were replayed from fixtures rather than fetched live. Offline and live
+    /// reports are never compared with each other.
+    #[serde(default)]
+    pub offline: bool,
     pub iterations: u32,
     pub baseline_path: Option<String>,
     pub commands: Vec<BenchmarkCommandReport>,
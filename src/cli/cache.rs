@@ -185,7 +185,85 @@ impl From<crate::cache::ConfigOrigin> for CacheStatsOrigin {
     }
 }
 
+/// Cumulative lookups per HTTP cache tier, persisted across runs under the cache root.
+#[derive(Debug, Clone, Default, PartialEq, serde::Serialize)]
+pub(crate) struct CacheStatsLookups {
+    pub(crate) l1_hits: u64,
+    pub(crate) l2_hits: u64,
+    pub(crate) misses: u64,
+    pub(crate) l1_hit_rate: Option<f64>,
+    pub(crate) l2_hit_rate: Option<f64>,
+    pub(crate) normalized_hits: u64,
+}
+
+impl From<crate::cache::CacheLookupStats> for CacheStatsLookups {
+    fn from(value: crate::cache::CacheLookupStats) -> Self {
+        Self {
+            l1_hits: value.l1_hits,
+            l2_hits: value.l2_hits,
+            misses: value.misses,
+            l1_hit_rate: value.l1_hit_rate(),
+            l2_hit_rate: value.l2_hit_rate(),
+            normalized_hits: value.normalized_hits,
+        }
+    }
+}
+
+/// One `[cache.sources.<key>]` policy from `cache.toml`.
 #[derive(Debug, Clone, PartialEq, Eq, serde::Serialize)]
+pub(crate) struct CacheStatsSourcePolicy {
+    pub(crate) source: String,
+    pub(crate) ttl_secs: Option<u64>,
+    pub(crate) max_stale_secs: Option<u64>,
+    pub(crate) stale_ceiling_secs: Option<u64>,
+    pub(crate) negative_ttl_secs: Option<u64>,
+}
+
+impl CacheStatsSourcePolicy {
+    fn display(&self) -> String {
+        let parts = [
+            self.ttl_secs.map(|secs| format!("ttl {secs} s")),
+            self.max_stale_secs
+                .map(|secs| format!("max-stale {secs} s")),
+            self.stale_ceiling_secs
+                .map(|secs| format!("stale ceiling {secs} s")),
+            self.negative_ttl_secs
+                .map(|secs| format!("negative ttl {secs} s")),
+        ]
+        .into_iter()
+        .flatten()
+        .collect::<Vec<_>>();
+        if parts.is_empty() {
+            "inherits default".to_string()
+        } else {
+            parts.join(", ")
+        }
+    }
+}
+
+fn source_policy_rows(
+    policies: std::collections::BTreeMap<String, crate::cache::CacheSourcePolicy>,
+) -> Vec<CacheStatsSourcePolicy> {
+    policies
+        .into_iter()
+        .map(|(source, policy)| CacheStatsSourcePolicy {
+            source,
+            ttl_secs: policy.ttl_secs,
+            max_stale_secs: policy.max_stale_secs,
+            stale_ceiling_secs: policy.stale_ceiling_secs,
+            negative_ttl_secs: policy.negative_ttl_secs,
+        })
+        .collect()
+}
+
+fn hit_rate_display(hits: u64, rate: Option<f64>, lookups: u64) -> String {
+    match rate {
+        Some(rate) => format!("{:.1}% ({hits}/{lookups})", rate * 100.0),
+        None => "n/a".to_string(),
+    }
+}
+
+#[derive(Debug, Clone, PartialEq, serde::Serialize)]
 pub(crate) struct CacheStatsReport {
     pub(crate) path: String,
     pub(crate) blob_bytes: u64,
@@ -199,6 +277,10 @@ pub(crate) struct CacheStatsReport {
     pub(crate) min_disk_free_origin: CacheStatsOrigin,
     pub(crate) max_age_secs: u64,
     pub(crate) max_age_origin: CacheStatsOrigin,
+    pub(crate) max_memory_bytes: u64,
+    pub(crate) lookups: CacheStatsLookups,
+    #[serde(skip_serializing_if = "Vec::is_empty")]
+    pub(crate) source_policies: Vec<CacheStatsSourcePolicy>,
 }
 
 impl CacheStatsReport {
@@ -207,6 +289,7 @@ impl CacheStatsReport {
             Some(range) => format!("{} .. {}", range.oldest_ms, range.newest_ms),
             None => "none".to_string(),
         };
+        let lookups = self.lookups.l1_hits + self.lookups.l2_hits + self.lookups.misses;
         [
             format!("| Path | {} |", self.path),
             format!("| Blob bytes | {} |", self.blob_bytes),
@@ -229,8 +312,25 @@ impl CacheStatsReport {
                 self.max_age_secs,
                 self.max_age_origin.as_str()
             ),
-            String::new(), // trailing newline
+            format!("| Max memory (L1) | {} bytes |", self.max_memory_bytes),
+            format!(
+                "| L1 hit rate | {} |",
+                hit_rate_display(self.lookups.l1_hits, self.lookups.l1_hit_rate, lookups)
+            ),
+            format!(
+                "| L2 hit rate | {} |",
+                hit_rate_display(self.lookups.l2_hits, self.lookups.l2_hit_rate, lookups)
+            ),
+            format!("| Normalized-key hits | {} |", self.lookups.normalized_hits),
         ]
+        .into_iter()
+        .chain(
+            self.source_policies.iter().map(|policy| {
+                format!("| Source policy {} | {} |", policy.source, policy.display())
+            }),
+        )
+        .chain([String::new()]) // trailing newline
+        .collect::<Vec<_>>()
         .join("\n")
     }
 }
@@ -277,22 +377,31 @@ pub(crate) fn build_cache_stats_report(
         min_disk_free_origin: CacheStatsOrigin::from(config.origins.min_disk_free),
         max_age_secs: config.max_age.as_secs(),
         max_age_origin: CacheStatsOrigin::from(config.origins.max_age),
+        max_memory_bytes: config.max_memory,
+        lookups: CacheStatsLookups::default(),
+        source_policies: Vec::new(),
     })
 }
 
 pub(crate) fn collect_cache_stats_report() -> Result<CacheStatsReport, BioMcpError> {
     collect_cache_stats_report_with(
         crate::cache::resolve_cache_config,
+        crate::cache::resolve_cache_source_policies,
         crate::cache::snapshot_cache,
     )
 }
 
-fn collect_cache_stats_report_with<R, S>(
+fn collect_cache_stats_report_with<R, P, S>(
     resolve_config: R,
+    resolve_source_policies: P,
     snapshotter: S,
 ) -> Result<CacheStatsReport, BioMcpError>
 where
     R: FnOnce() -> Result<crate::cache::ResolvedCacheConfig, BioMcpError>,
+    P: FnOnce() -> Result<
+        std::collections::BTreeMap<String, crate::cache::CacheSourcePolicy>,
+        BioMcpError,
+    >,
     S: FnOnce(
         &std::path::Path,
     ) -> Result<crate::cache::CacheSnapshot, crate::cache::CachePlannerError>,
@@ -301,7 +410,10 @@ where
     let http_path = config.cache_root.join("http");
     let snapshot =
         snapshotter(&http_path).map_err(|err| BioMcpError::Io(std::io::Error::other(err)))?;
-    build_cache_stats_report(&snapshot, &config)
+    let mut report = build_cache_stats_report(&snapshot, &config)?;
+    report.lookups = crate::cache::read_lookup_stats(&config.cache_root).into();
+    report.source_policies = source_policy_rows(resolve_source_policies()?);
+    Ok(report)
 }
 
 #[cfg(test)]
@@ -315,8 +427,9 @@ mod tests {
     use tokio::sync::MutexGuard;
 
     use super::{
-        CacheStatsAgeRange, CacheStatsOrigin, CacheStatsReport, build_cache_stats_report,
-        collect_cache_stats_report_with, render_path,
+        CacheStatsAgeRange, CacheStatsLookups, CacheStatsOrigin, CacheStatsReport,
+        CacheStatsSourcePolicy, build_cache_stats_report, collect_cache_stats_report_with,
+        render_path,
     };
     use crate::cache::{
         CacheBlob, CacheConfigOrigins, CacheEntry, CacheSnapshot, ConfigOrigin, DiskFreeThreshold,
@@ -589,6 +702,7 @@ mod tests {
             max_size,
             min_disk_free: DiskFreeThreshold::Percent(10),
             max_age: Duration::from_secs(max_age_secs),
+            max_memory: 0,
             origins,
         }
     }
@@ -625,6 +739,9 @@ mod tests {
                 min_disk_free_origin: CacheStatsOrigin::Default,
                 max_age_secs: 86_400,
                 max_age_origin: CacheStatsOrigin::Default,
+                max_memory_bytes: 0,
+                lookups: CacheStatsLookups::default(),
+                source_policies: Vec::new(),
             }
         );
 
@@ -759,6 +876,31 @@ mod tests {
             min_disk_free_origin: CacheStatsOrigin::Default,
             max_age_secs: 7_200,
             max_age_origin: CacheStatsOrigin::File,
+            max_memory_bytes: 67_108_864,
+            lookups: CacheStatsLookups {
+                l1_hits: 3,
+                l2_hits: 1,
+                misses: 4,
+                l1_hit_rate: Some(0.375),
+                l2_hit_rate: Some(0.125),
+                normalized_hits: 2,
+            },
+            source_policies: vec![
+                CacheStatsSourcePolicy {
+                    source: "default".into(),
+                    ttl_secs: None,
+                    max_stale_secs: None,
+                    stale_ceiling_secs: None,
+                    negative_ttl_secs: None,
+                },
+                CacheStatsSourcePolicy {
+                    source: "kegg".into(),
+                    ttl_secs: Some(1_209_600),
+                    max_stale_secs: Some(86_400),
+                    stale_ceiling_secs: None,
+                    negative_ttl_secs: Some(60),
+                },
+            ],
         };
 
         assert_eq!(
@@ -773,6 +915,12 @@ mod tests {
 | Max size | 5000 bytes (env) |
 | Min disk free | 10% (default) |
 | Max age | 7200 s (file) |
+| Max memory (L1) | 67108864 bytes |
+| L1 hit rate | 37.5% (3/8) |
+| L2 hit rate | 12.5% (1/8) |
+| Normalized-key hits | 2 |
+| Source policy default | inherits default |
+| Source policy kegg | ttl 1209600 s, max-stale 86400 s, negative ttl 60 s |
 "
         );
     }
@@ -795,6 +943,15 @@ mod tests {
 
         let report = collect_cache_stats_report_with(
             || Ok(config),
+            || {
+                Ok(std::collections::BTreeMap::from([(
+                    "https://clinicaltrials.gov/api/v2".to_string(),
+                    crate::cache::CacheSourcePolicy {
+                        ttl_secs: Some(300),
+                        ..crate::cache::CacheSourcePolicy::default()
+                    },
+                )]))
+            },
             |path: &Path| {
                 calls.set(calls.get() + 1);
                 *seen_path.borrow_mut() = Some(path.to_path_buf());
@@ -813,5 +970,7 @@ mod tests {
             Some(&PathBuf::from("/tmp/resolved-cache/http"))
         );
         assert_eq!(report.path, "/tmp/resolved-cache/http");
+        assert_eq!(report.source_policies.len(), 1);
+        assert_eq!(report.source_policies[0].ttl_secs, Some(300));
     }
 }
@@ -18,6 +18,33 @@ pub struct HealthRow {
     pub key_configured: Option<bool>,
 }
 
+/// Configured and current effective request rate for one rate-limit policy.
+#[derive(Debug, Clone, serde::Serialize)]
+pub struct RateLimitRow {
+    pub source: String,
+    pub configured_interval_ms: u64,
+    pub effective_interval_ms: u64,
+    pub effective_requests_per_sec: f64,
+    pub throttled: bool,
+}
+
+/// In-process request coalescing counters.
+#[derive(Debug, Clone, serde::Serialize)]
+pub struct CoalescingRow {
+    pub upstream_fetches: u64,
+    pub coalesced_requests: u64,
+}
+
+/// Circuit-breaker state for one upstream source with recent failures.
+#[derive(Debug, Clone, serde::Serialize)]
+pub struct CircuitBreakerRow {
+    pub source: String,
+    pub state: String,
+    pub consecutive_failures: u32,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub retry_in_secs: Option<u64>,
+}
+
 #[derive(Debug, Clone, serde::Serialize)]
 pub struct HealthReport {
     pub healthy: usize,
@@ -25,6 +52,12 @@ pub struct HealthReport {
     pub excluded: usize,
     pub total: usize,
     pub rows: Vec<HealthRow>,
+    #[serde(skip_serializing_if = "Vec::is_empty")]
+    pub rate_limits: Vec<RateLimitRow>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub coalescing: Option<CoalescingRow>,
+    #[serde(skip_serializing_if = "Vec::is_empty")]
+    pub circuit_breakers: Vec<CircuitBreakerRow>,
 }
 
 impl HealthReport {
@@ -68,6 +101,19 @@ impl HealthReport {
             out.push_str(&format!(", {} warning", self.warning));
         }
         out.push('\n');
+
+        let tripped = self
+            .circuit_breakers
+            .iter()
+            .filter(|row| row.state != "closed")
+            .map(|row| match row.retry_in_secs {
+                Some(secs) => format!("{} ({}, retry in {secs}s)", row.source, row.state),
+                None => format!("{} ({})", row.source, row.state),
+            })
+            .collect::<Vec<_>>();
+        if !tripped.is_empty() {
+            out.push_str(&format!("Circuit breakers: {}\n", tripped.join(", ")));
+        }
         out
     }
 }
@@ -1081,9 +1127,48 @@ fn report_from_outcomes(outcomes: Vec<ProbeOutcome>) -> HealthReport {
         excluded,
         total: rows.len(),
         rows,
+        rate_limits: Vec::new(),
+        coalescing: None,
+        circuit_breakers: Vec::new(),
     }
 }
 
+fn rate_limit_rows(
+    snapshot: Vec<crate::sources::rate_limit::RateLimitSnapshot>,
+) -> Vec<RateLimitRow> {
+    snapshot
+        .into_iter()
+        .map(|entry| {
+            let effective_secs = entry.effective_interval.as_secs_f64();
+            RateLimitRow {
+                source: entry.key.to_string(),
+                configured_interval_ms: entry.configured_interval.as_millis() as u64,
+                effective_interval_ms: entry.effective_interval.as_millis() as u64,
+                effective_requests_per_sec: if effective_secs > 0.0 {
+                    ((1.0 / effective_secs) * 100.0).round() / 100.0
+                } else {
+                    f64::INFINITY
+                },
+                throttled: entry.effective_interval > entry.configured_interval,
+            }
+        })
+        .collect()
+}
+
+fn circuit_breaker_rows(
+    snapshot: Vec<crate::sources::circuit_breaker::CircuitSnapshot>,
+) -> Vec<CircuitBreakerRow> {
+    snapshot
+        .into_iter()
+        .map(|entry| CircuitBreakerRow {
+            source: entry.source,
+            state: entry.state.as_str().to_string(),
+            consecutive_failures: entry.consecutive_failures,
+            retry_in_secs: entry.retry_in.map(|left| left.as_secs().max(1)),
+        })
+        .collect()
+}
+
 /// Runs connectivity checks for configured upstream APIs and local EMA/cache readiness.
 ///
 /// # Errors
@@ -1104,7 +1189,16 @@ pub async fn check(apis_only: bool) -> Result<HealthReport, BioMcpError> {
         outcomes.push(check_cache_limits().await);
     }
 
-    Ok(report_from_outcomes(outcomes))
+    let mut report = report_from_outcomes(outcomes);
+    report.rate_limits = rate_limit_rows(crate::sources::rate_limit::global_limiter().snapshot());
+    let coalescing = crate::sources::coalesce::stats();
+    report.coalescing = Some(CoalescingRow {
+        upstream_fetches: coalescing.upstream_fetches,
+        coalesced_requests: coalescing.coalesced_requests,
+    });
+    report.circuit_breakers =
+        circuit_breaker_rows(crate::sources::circuit_breaker::global_breakers().snapshot());
+    Ok(report)
 }
 
 fn check_cache_limits_with<R, S, I>(
@@ -1205,8 +1299,8 @@ mod tests {
     use wiremock::{Mock, MockServer, ResponseTemplate};
 
     use super::{
-        EMA_LOCAL_DATA_AFFECTS, HealthReport, HealthRow, ProbeClass, ProbeKind, ProbeOutcome,
-        SourceDescriptor, affects_for_api, check_cache_dir, check_cache_limits_with,
+        CircuitBreakerRow, EMA_LOCAL_DATA_AFFECTS, HealthReport, HealthRow, ProbeClass, ProbeKind,
+        ProbeOutcome, SourceDescriptor, affects_for_api, check_cache_dir, check_cache_limits_with,
         ema_local_data_outcome, health_sources, probe_cache_dir, probe_source,
         report_from_outcomes,
     };
@@ -1389,6 +1483,7 @@ mod tests {
             max_size,
             min_disk_free,
             max_age: Duration::from_secs(86_400),
+            max_memory: 0,
             origins: CacheConfigOrigins {
                 cache_root: ConfigOrigin::Default,
                 max_size: ConfigOrigin::Default,
@@ -1421,6 +1516,9 @@ mod tests {
                     key_configured: None,
                 },
             ],
+            rate_limits: Vec::new(),
+            coalescing: None,
+            circuit_breakers: Vec::new(),
         };
         let md = report.to_markdown();
         assert!(md.contains("| API | Status | Latency | Affects |"));
@@ -1450,12 +1548,45 @@ mod tests {
                     key_configured: None,
                 },
             ],
+            rate_limits: Vec::new(),
+            coalescing: None,
+            circuit_breakers: Vec::new(),
         };
         let md = report.to_markdown();
         assert!(md.contains("| API | Status | Latency |"));
         assert!(!md.contains("| API | Status | Latency | Affects |"));
     }
 
+    #[test]
+    fn markdown_lists_tripped_circuit_breakers_only() {
+        let report = HealthReport {
+            healthy: 0,
+            warning: 0,
+            excluded: 0,
+            total: 0,
+            rows: Vec::new(),
+            rate_limits: Vec::new(),
+            coalescing: None,
+            circuit_breakers: vec![
+                CircuitBreakerRow {
+                    source: "civic".into(),
+                    state: "open".into(),
+                    consecutive_failures: 3,
+                    retry_in_secs: Some(25),
+                },
+                CircuitBreakerRow {
+                    source: "kegg".into(),
+                    state: "closed".into(),
+                    consecutive_failures: 1,
+                    retry_in_secs: None,
+                },
+            ],
+        };
+        let md = report.to_markdown();
+        assert!(md.contains("Circuit breakers: civic (open, retry in 25s)\n"));
+        assert!(!md.contains("kegg"));
+    }
+
     #[test]
     fn markdown_decorates_keyed_success_rows_without_changing_status() {
         let report = HealthReport {
@@ -1470,6 +1601,9 @@ mod tests {
                 affects: None,
                 key_configured: Some(true),
             }],
+            rate_limits: Vec::new(),
+            coalescing: None,
+            circuit_breakers: Vec::new(),
         };
 
         assert_eq!(report.rows[0].status, "ok");
@@ -1491,6 +1625,9 @@ mod tests {
                 affects: Some("variant oncokb command and variant evidence section".into()),
                 key_configured: Some(true),
             }],
+            rate_limits: Vec::new(),
+            coalescing: None,
+            circuit_breakers: Vec::new(),
         };
 
         assert_eq!(report.rows[0].status, "error");
@@ -1806,6 +1943,9 @@ mod tests {
                     key_configured: None,
                 },
             ],
+            rate_limits: Vec::new(),
+            coalescing: None,
+            circuit_breakers: Vec::new(),
         };
 
         assert!(report.all_healthy());
@@ -1850,6 +1990,9 @@ mod tests {
                     key_configured: None,
                 },
             ],
+            rate_limits: Vec::new(),
+            coalescing: None,
+            circuit_breakers: Vec::new(),
         };
 
         let md = report.to_markdown();
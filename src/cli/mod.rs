@@ -4,6 +4,7 @@ use std::collections::HashSet;
 use std::io::IsTerminal;
 use std::path::{Path, PathBuf};
 
+use anyhow::Context;
 use clap::{Args, CommandFactory, FromArgMatches, Parser, Subcommand, ValueEnum};
 use futures::{StreamExt, future::try_join_all};
 use tracing::{debug, warn};
@@ -11,6 +12,7 @@ use tracing::{debug, warn};
 use crate::cli::debug_plan::{DebugPlan, DebugPlanLeg};
 use crate::entities::drug::DrugRegion;
 
+pub mod benchmark;
 pub mod cache;
 pub mod chart;
 pub mod debug_plan;
@@ -39,6 +41,14 @@ pub struct Cli {
     /// Disable HTTP caching (always fetch fresh data)
     #[arg(long, global = true)]
     pub no_cache: bool,
+
+    /// Append phase durations and upstream calls (cache, bytes, ms) to the output
+    #[arg(long, global = true)]
+    pub timings: bool,
+
+    /// Write a Chrome trace-event file (Perfetto, chrome://tracing) of the command's spans
+    #[arg(long, global = true, value_name = "PATH")]
+    pub profile_out: Option<PathBuf>,
 }
 
 #[derive(Debug, Clone, Copy, PartialEq, Eq, ValueEnum)]
@@ -144,34 +154,36 @@ pub enum DrugRegionArg {
 const DRUG_SEARCH_EMA_STRUCTURED_FILTER_ERROR: &str = "EMA region search currently supports name/alias lookups only; use --region us for structured MyChem filters.";
 const RUNTIME_HELP_SUBCOMMANDS: [&str; 4] = ["mcp", "serve", "serve-http", "serve-sse"];
 
+const RUNTIME_HIDDEN_GLOBALS: [&str; 4] = ["json", "no_cache", "timings", "profile_out"];
+
 fn hide_runtime_help_globals(
     command: clap::Command,
     subcommand_name: &'static str,
-    json_arg: &clap::Arg,
-    no_cache_arg: &clap::Arg,
+    hidden_args: &[clap::Arg],
 ) -> clap::Command {
     command.mut_subcommand(subcommand_name, |runtime| {
-        runtime.arg(json_arg.clone()).arg(no_cache_arg.clone())
+        hidden_args
+            .iter()
+            .fold(runtime, |runtime, arg| runtime.arg(arg.clone()))
     })
 }
 
 pub fn build_cli() -> clap::Command {
     let mut command = Cli::command();
-    let json_arg = command
-        .get_arguments()
-        .find(|arg| arg.get_id() == "json")
-        .cloned()
-        .expect("json arg should exist")
-        .hide(true);
-    let no_cache_arg = command
-        .get_arguments()
-        .find(|arg| arg.get_id() == "no_cache")
-        .cloned()
-        .expect("no_cache arg should exist")
-        .hide(true);
+    let hidden_args = RUNTIME_HIDDEN_GLOBALS
+        .iter()
+        .map(|id| {
+            command
+                .get_arguments()
+                .find(|arg| arg.get_id() == id)
+                .cloned()
+                .unwrap_or_else(|| panic!("{id} arg should exist"))
+                .hide(true)
+        })
+        .collect::<Vec<_>>();
 
     for subcommand_name in RUNTIME_HELP_SUBCOMMANDS {
-        command = hide_runtime_help_globals(command, subcommand_name, &json_arg, &no_cache_arg);
+        command = hide_runtime_help_globals(command, subcommand_name, &hidden_args);
     }
     command
 }
@@ -431,7 +443,7 @@ EXAMPLES:
     Serve,
     #[command(
         about = "Run the MCP Streamable HTTP server at /mcp",
-        long_about = "Run the MCP Streamable HTTP server at /mcp.\n\nThis is the canonical remote/server deployment mode.\nHealth routes: GET /health, GET /readyz, GET /."
+        long_about = "Run the MCP Streamable HTTP server at /mcp.\n\nThis is the canonical remote/server deployment mode.\nHealth routes: GET /health, GET /readyz, GET /.\nMetrics: GET /metrics (Prometheus text format)."
     )]
     ServeHttp {
         /// Host address to bind
@@ -521,6 +533,12 @@ See also: biomcp list discover")]
         #[arg(long)]
         verbose: bool,
     },
+    /// Run the latency and output-size benchmark suite (developer tool; CLI-only)
+    #[command(hide = true)]
+    Benchmark {
+        #[command(subcommand)]
+        cmd: benchmark::BenchmarkCommand,
+    },
 }
 
 #[derive(Subcommand, Debug, Clone, Copy, PartialEq, Eq)]
@@ -814,6 +832,9 @@ See also: biomcp list article")]
         /// Skip the first N results
         #[arg(long, default_value = "0")]
         offset: usize,
+        /// Continue from the next_page_token of a previous Europe PMC search (--source europepmc, --sort date|citations)
+        #[arg(long)]
+        cursor: Option<String>,
         /// Include the executed search planner output in markdown or JSON output
         #[arg(long = "debug-plan")]
         debug_plan: bool,
@@ -2252,6 +2273,13 @@ fn rewrite_mcp_chart_args(
             "--terminal" => {
                 i += 1;
             }
+            "--timings" => {
+                // The report belongs in the text pass; it would corrupt the SVG.
+                if pass == McpChartPass::Text {
+                    rewritten.push(token.clone());
+                }
+                i += 1;
+            }
             "--output" => {
                 if pass == McpChartPass::Svg {
                     return Err(mcp_output_flag_error());
@@ -3346,6 +3374,23 @@ fn pagination_footer_cursor(meta: &PaginationMeta) -> String {
     )
 }
 
+/// Footer for a Europe PMC cursor walk. A resumed page has no absolute position, so it reports
+/// only its own size; the continuation is always `--cursor`.
+fn article_cursor_footer(meta: &PaginationMeta, resumed: bool) -> String {
+    let mut footer = if resumed {
+        match meta.total {
+            Some(total) => format!("Showing {} more of {total} results.", meta.returned),
+            None => format!("Showing {} more results.", meta.returned),
+        }
+    } else {
+        pagination_footer_offset(meta)
+    };
+    if let Some(token) = meta.next_page_token.as_deref() {
+        footer.push_str(&format!(" Continue with --cursor {token}."));
+    }
+    footer
+}
+
 fn paged_fetch_limit(
     limit: usize,
     offset: usize,
@@ -5732,6 +5777,7 @@ pub async fn run(cli: Cli) -> anyhow::Result<String> {
                     source,
                     limit,
                     offset,
+                    cursor,
                     debug_plan,
                 } => {
                     let disease = normalize_cli_tokens(disease);
@@ -5791,12 +5837,27 @@ pub async fn run(cli: Cli) -> anyhow::Result<String> {
                         offset,
                     );
 
-                    let page =
-                        crate::entities::article::search_page(&filters, limit, offset, source_filter)
-                            .await?;
+                    let page = crate::entities::article::search_page_with_cursor(
+                        &filters,
+                        limit,
+                        offset,
+                        source_filter,
+                        cursor.as_deref(),
+                    )
+                    .await?;
                     let results = page.results;
-                    let pagination =
-                        PaginationMeta::offset(offset, limit, results.len(), page.total);
+                    let cursor_paged = cursor.is_some() || page.next_page_token.is_some();
+                    let pagination = if cursor_paged {
+                        PaginationMeta::cursor(
+                            offset,
+                            limit,
+                            results.len(),
+                            page.total,
+                            page.next_page_token,
+                        )
+                    } else {
+                        PaginationMeta::offset(offset, limit, results.len(), page.total)
+                    };
                     let semantic_scholar_enabled =
                         crate::entities::article::semantic_scholar_search_enabled(
                             &filters,
@@ -5827,7 +5888,11 @@ pub async fn run(cli: Cli) -> anyhow::Result<String> {
                             pagination,
                         )
                     } else {
-                        let footer = pagination_footer_offset(&pagination);
+                        let footer = if cursor_paged {
+                            article_cursor_footer(&pagination, cursor.is_some())
+                        } else {
+                            pagination_footer_offset(&pagination)
+                        };
                         Ok(crate::render::markdown::article_search_markdown_with_footer_and_context(
                             &query,
                             &results,
@@ -6742,6 +6807,7 @@ pub async fn run(cli: Cli) -> anyhow::Result<String> {
                 anyhow::bail!("MCP/serve commands should not go through CLI run()")
             }
             Commands::Version { verbose } => Ok(version_output(verbose)),
+            Commands::Benchmark { cmd } => crate::cli::benchmark::run(cmd, cli.json).await,
         }
     })
     .await
@@ -6940,14 +7006,45 @@ async fn run_outcome_inner(
                 command,
                 json: cli.json,
                 no_cache: cli.no_cache,
+                timings: false,
+                profile_out: None,
             })
             .await?,
         )),
     }
 }
 
+/// Runs one command under a profiling collection when `--timings` or `--profile-out` asks for
+/// one. The trace is written even when the command fails.
+async fn run_outcome_timed(
+    cli: Cli,
+    alias_suggestions_as_json: bool,
+) -> anyhow::Result<CommandOutcome> {
+    let timings = cli.timings;
+    let profile_out = cli.profile_out.clone();
+    if !timings && profile_out.is_none() {
+        return run_outcome_inner(cli, alias_suggestions_as_json).await;
+    }
+    let (outcome, spans, total) =
+        crate::profiling::collect(Box::pin(run_outcome_inner(cli, alias_suggestions_as_json)))
+            .await;
+    if let Some(path) = profile_out {
+        crate::profiling::chrome::write_trace(&path, &spans)
+            .with_context(|| format!("failed to write profile {}", path.display()))?;
+    }
+    let mut outcome = outcome?;
+    if timings {
+        let report = crate::profiling::timings::TimingReport::from_spans(&spans, total);
+        outcome.text = report.attach_to(&outcome.text);
+    }
+    Ok(outcome)
+}
+
 pub async fn run_outcome(cli: Cli) -> anyhow::Result<CommandOutcome> {
-    run_outcome_inner(cli, false).await
+    let outcome = run_outcome_timed(cli, false).await;
+    let _ = tokio::task::spawn_blocking(crate::cache::flush_lookup_stats).await;
+    let _ = tokio::task::spawn_blocking(crate::sources::cassette::flush).await;
+    outcome
 }
 
 /// Main CLI execution - called by the MCP `biomcp` tool.
@@ -6977,7 +7074,7 @@ pub async fn execute_mcp(mut args: Vec<String>) -> anyhow::Result<CliOutput> {
 
     let cli = Cli::try_parse_from(args.clone())?;
     if !is_charted_mcp_study_command(&cli)? {
-        let outcome = Box::pin(run_outcome_inner(cli, true)).await?;
+        let outcome = Box::pin(run_outcome_timed(cli, true)).await?;
         return Ok(CliOutput {
             text: outcome.text,
             svg: None,
@@ -7264,6 +7361,7 @@ mod tests {
                 },
             json,
             no_cache,
+            ..
         } = cli
         else {
             panic!("expected get drug command");
@@ -7296,6 +7394,7 @@ mod tests {
                 },
             json,
             no_cache,
+            ..
         } = cli
         else {
             panic!("expected get drug command");
@@ -7336,6 +7435,7 @@ mod tests {
                 },
             json,
             no_cache,
+            ..
         } = cli
         else {
             panic!("expected get drug command");
@@ -7349,6 +7449,41 @@ mod tests {
         assert!(!no_cache);
     }
 
+    #[test]
+    fn timings_flag_parses_after_command_arguments() {
+        let cli = Cli::try_parse_from(["biomcp", "get", "drug", "imatinib", "--timings"])
+            .expect("get drug --timings should parse");
+
+        assert!(cli.timings);
+        assert!(!cli.json);
+    }
+
+    #[test]
+    fn profile_out_flag_takes_a_path_before_or_after_the_command() {
+        let cli = Cli::try_parse_from([
+            "biomcp",
+            "--profile-out",
+            "trace.json",
+            "search",
+            "all",
+            "-g",
+            "BRAF",
+        ])
+        .expect("--profile-out before the command should parse");
+        assert_eq!(cli.profile_out, Some(PathBuf::from("trace.json")));
+        assert!(!cli.timings);
+
+        let cli = Cli::try_parse_from([
+            "biomcp",
+            "get",
+            "gene",
+            "BRAF",
+            "--profile-out=/tmp/braf.json",
+        ])
+        .expect("--profile-out after the command should parse");
+        assert_eq!(cli.profile_out, Some(PathBuf::from("/tmp/braf.json")));
+    }
+
     #[test]
     fn get_drug_parses_raw_flag_with_label_section() {
         let cli = Cli::try_parse_from(["biomcp", "get", "drug", "pembrolizumab", "label", "--raw"])
@@ -7472,6 +7607,14 @@ mod tests {
                 !help.contains("--no-cache"),
                 "{subcommand_name} help should not advertise --no-cache"
             );
+            assert!(
+                !help.contains("--timings"),
+                "{subcommand_name} help should not advertise --timings"
+            );
+            assert!(
+                !help.contains("--profile-out"),
+                "{subcommand_name} help should not advertise --profile-out"
+            );
         }
     }
 
@@ -7559,6 +7702,34 @@ mod tests {
         assert!(!help.contains("serve-sse"));
     }
 
+    #[test]
+    fn benchmark_command_parses_but_stays_out_of_top_level_help() {
+        let cli = Cli::try_parse_from([
+            "biomcp",
+            "benchmark",
+            "run",
+            "--quick",
+            "--offline",
+            "benchmarks/fixtures",
+        ])
+        .expect("benchmark run should parse");
+        let Commands::Benchmark {
+            cmd: super::benchmark::BenchmarkCommand::Run { quick, offline, .. },
+        } = cli.command
+        else {
+            panic!("expected benchmark run command");
+        };
+        assert!(quick);
+        assert_eq!(offline, Some(PathBuf::from("benchmarks/fixtures")));
+
+        let mut help = Vec::new();
+        super::build_cli()
+            .write_long_help(&mut help)
+            .expect("top-level help should render");
+        let help = String::from_utf8(help).expect("help should be utf-8");
+        assert!(!help.contains("benchmark"));
+    }
+
     #[test]
     fn cache_path_command_parses() {
         Cli::try_parse_from(["biomcp", "cache", "path"]).expect("cache path should parse");
@@ -9846,6 +10017,31 @@ mod tests {
         assert!(svg.iter().any(|value| value == "--mcp-inline"));
     }
 
+    #[test]
+    fn rewrite_mcp_chart_args_keeps_timings_in_text_pass_only() {
+        let args = [
+            "biomcp",
+            "study",
+            "query",
+            "--study",
+            "demo",
+            "--gene",
+            "TP53",
+            "--type",
+            "mutations",
+            "--chart",
+            "bar",
+            "--timings",
+        ]
+        .map(str::to_string);
+
+        let text = rewrite_mcp_chart_args(&args, McpChartPass::Text).expect("text rewrite");
+        assert!(text.iter().any(|value| value == "--timings"));
+
+        let svg = rewrite_mcp_chart_args(&args, McpChartPass::Svg).expect("svg rewrite");
+        assert!(!svg.iter().any(|value| value == "--timings"));
+    }
+
     #[test]
     fn rewrite_mcp_chart_args_rejects_terminal_and_png_only_flags() {
         let cols_err = rewrite_mcp_chart_args(
@@ -4,9 +4,11 @@ use std::time::{Duration, Instant};
 use futures::future::join_all;
 use serde::Serialize;
 use serde_json::{Value, json};
+use tracing::Instrument;
 
 use crate::cli::debug_plan::{DebugPlan, DebugPlanLeg};
 use crate::error::BioMcpError;
+use crate::profiling::profile_span;
 use crate::utils::date::validate_since;
 
 const MAX_SEARCH_ALL_LIMIT: usize = 50;
@@ -332,10 +334,10 @@ pub async fn dispatch(input: &SearchAllInput) -> Result<SearchAllResults, BioMcp
     let plan = build_dispatch_plan_prepared(&prepared);
     let started = Instant::now();
 
-    let sections = join_all(
-        plan.iter()
-            .map(|spec| dispatch_section(spec.kind, &prepared)),
-    )
+    let sections = join_all(plan.iter().map(|spec| {
+        dispatch_section(spec.kind, &prepared)
+            .instrument(profile_span!("section", section = spec.kind.entity()))
+    }))
     .await;
 
     let searches_dispatched = sections.len();
@@ -864,7 +866,13 @@ fn build_dispatch_plan_prepared(input: &PreparedInput) -> Vec<DispatchSpec> {
 async fn dispatch_section(kind: SectionKind, input: &PreparedInput) -> SearchAllSection {
     let search_self = canonical_search_command(kind, input, input.limit);
     let timeout = section_timeout(kind);
-    let section_result = tokio::time::timeout(timeout, run_section(kind, input)).await;
+    // The deadline scope lets retry, rate-limit and paging loops stop early instead of
+    // scheduling work the timeout would cancel.
+    let section_result = tokio::time::timeout(
+        timeout,
+        crate::sources::with_deadline(timeout, run_section(kind, input)),
+    )
+    .await;
 
     match section_result {
         Ok(Ok(section_result)) => {
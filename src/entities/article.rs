@@ -1,19 +1,22 @@
 use std::cmp::Ordering;
-use std::collections::HashSet;
+use std::collections::{HashMap, HashSet};
+use std::future::Future;
 use std::path::PathBuf;
 
-use futures::future::try_join_all;
+use aho_corasick::AhoCorasick;
+use futures::future::{join_all, try_join_all};
 use serde::{Deserialize, Serialize};
 
 use crate::entities::SearchPage;
 use crate::error::BioMcpError;
 use crate::sources::europepmc::{
-    EuropePmcClient, EuropePmcResult, EuropePmcSearchResponse, EuropePmcSort,
+    EUROPE_PMC_CURSOR_START, EuropePmcClient, EuropePmcId, EuropePmcResult,
+    EuropePmcSearchResponse, EuropePmcSort,
 };
 use crate::sources::ncbi_idconv::NcbiIdConverterClient;
 use crate::sources::pmc_oa::PmcOaClient;
 use crate::sources::pubmed::{PubMedClient, PubMedESearchParams};
-use crate::sources::pubtator::PubTatorClient;
+use crate::sources::pubtator::{PUBTATOR_EXPORT_MAX_PMIDS, PubTatorClient};
 use crate::sources::semantic_scholar::{
     SemanticScholarCitationEdge, SemanticScholarClient, SemanticScholarPaper,
     SemanticScholarReferenceEdge,
@@ -21,7 +24,7 @@ use crate::sources::semantic_scholar::{
 use crate::transform;
 use crate::utils::date::validate_since;
 use crate::utils::download;
-use tracing::warn;
+use tracing::{Instrument, warn};
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct Article {
@@ -380,12 +383,15 @@ pub const ARTICLE_SECTION_NAMES: &[&str] = &[
 ];
 
 const MAX_SEARCH_LIMIT: usize = 50;
-pub const ARTICLE_BATCH_MAX_IDS: usize = 20;
+pub const ARTICLE_BATCH_MAX_IDS: usize = 500;
 const EUROPE_PMC_PAGE_SIZE: usize = 25;
 const PUBTATOR_PAGE_SIZE: usize = 25;
 const PUBMED_PAGE_SIZE: usize = 100;
 const MAX_PAGE_FETCHES: usize = 50;
 const WARN_PAGE_THRESHOLD: usize = 20;
+// Pages of a Europe PMC or PubTator leg requested at once after the first page. The shared
+// client's rate limiter still paces each request under the source's policy.
+const PAGE_PREFETCH_CONCURRENCY: usize = 4;
 const FEDERATED_PAGE_SIZE_CAP: usize = if EUROPE_PMC_PAGE_SIZE < PUBTATOR_PAGE_SIZE {
     EUROPE_PMC_PAGE_SIZE
 } else {
@@ -502,12 +508,15 @@ fn fulltext_cache_key(id: &str) -> String {
 }
 
 async fn render_fulltext_xml(xml: String) -> Result<String, BioMcpError> {
-    tokio::task::spawn_blocking(move || transform::article::extract_text_from_xml(&xml))
-        .await
-        .map_err(|err| BioMcpError::Api {
-            api: "article".to_string(),
-            message: format!("Full text render worker failed: {err}"),
-        })
+    let span = crate::profiling::profile_span!("blocking", task = "jats_parse");
+    tokio::task::spawn_blocking(move || {
+        span.in_scope(|| transform::article::extract_text_from_xml(&xml))
+    })
+    .await
+    .map_err(|err| BioMcpError::Api {
+        api: "article".to_string(),
+        message: format!("Full text render worker failed: {err}"),
+    })
 }
 
 fn is_semantic_scholar_paper_id(id: &str) -> bool {
@@ -1017,17 +1026,33 @@ fn min_source_local_position(source_positions: &[ArticleSourcePosition]) -> Opti
         .min()
 }
 
-fn article_rows_overlap(left: &ArticleSearchResult, right: &ArticleSearchResult) -> bool {
-    let left_pmid = normalize_row_identifier(Some(&left.pmid));
-    let right_pmid = normalize_row_identifier(Some(&right.pmid));
-    let left_pmcid = normalize_row_identifier(left.pmcid.as_deref());
-    let right_pmcid = normalize_row_identifier(right.pmcid.as_deref());
-    let left_doi = normalize_row_identifier(left.doi.as_deref());
-    let right_doi = normalize_row_identifier(right.doi.as_deref());
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
+enum ArticleIdentifierKind {
+    Pmid,
+    Pmcid,
+    Doi,
+}
 
-    left_pmid.is_some() && left_pmid == right_pmid
-        || left_pmcid.is_some() && left_pmcid == right_pmcid
-        || left_doi.is_some() && left_doi == right_doi
+/// The normalized identifiers two rows overlap on: equal PMIDs, PMCIDs or DOIs.
+fn article_row_identifiers(
+    row: &ArticleSearchResult,
+) -> impl Iterator<Item = (ArticleIdentifierKind, String)> {
+    [
+        (
+            ArticleIdentifierKind::Pmid,
+            normalize_row_identifier(Some(&row.pmid)),
+        ),
+        (
+            ArticleIdentifierKind::Pmcid,
+            normalize_row_identifier(row.pmcid.as_deref()),
+        ),
+        (
+            ArticleIdentifierKind::Doi,
+            normalize_row_identifier(row.doi.as_deref()),
+        ),
+    ]
+    .into_iter()
+    .filter_map(|(kind, value)| value.map(|value| (kind, value)))
 }
 
 fn merge_missing_string(target: &mut Option<String>, incoming: Option<String>) {
@@ -1103,33 +1128,57 @@ fn merge_article_candidate(target: &mut ArticleCandidate, incoming: ArticleCandi
     }
 }
 
+/// Merges rows that share a PMID, PMCID or DOI, transitively, keeping first-seen order.
+///
+/// Each row is matched against the identifiers its merged candidates currently carry, so a
+/// candidate that kept one DOI does not match rows carrying a DOI it dropped. `index` holds those
+/// identifiers; no two live candidates share one, because any row that would bridge two of them
+/// merges them. Merged-away candidates leave an empty slot behind, so the survivors keep their
+/// relative order without shifting the vector.
 fn merge_article_candidates(results: Vec<ArticleSearchResult>) -> Vec<ArticleCandidate> {
-    let mut merged: Vec<ArticleCandidate> = Vec::with_capacity(results.len());
+    let mut slots: Vec<Option<ArticleCandidate>> = Vec::with_capacity(results.len());
+    let mut index: HashMap<(ArticleIdentifierKind, String), usize> =
+        HashMap::with_capacity(results.len() * 2);
 
     for row in results {
         let row = article_candidate_from_row(row);
-        let matches = merged
-            .iter()
-            .enumerate()
-            .filter_map(|(idx, existing)| {
-                article_rows_overlap(&existing.row, &row.row).then_some(idx)
-            })
+        let mut matches = article_row_identifiers(&row.row)
+            .filter_map(|identifier| index.get(&identifier).copied())
             .collect::<Vec<_>>();
+        matches.sort_unstable();
+        matches.dedup();
 
-        if matches.is_empty() {
-            merged.push(row);
+        let Some(&keep_idx) = matches.first() else {
+            for identifier in article_row_identifiers(&row.row) {
+                index.insert(identifier, slots.len());
+            }
+            slots.push(Some(row));
             continue;
-        }
+        };
 
-        let keep_idx = matches[0];
-        merge_article_candidate(&mut merged[keep_idx], row);
-        for idx in matches.into_iter().skip(1).rev() {
-            let duplicate = merged.remove(idx);
-            merge_article_candidate(&mut merged[keep_idx], duplicate);
+        for candidate in matches.iter().filter_map(|&idx| slots[idx].as_ref()) {
+            for identifier in article_row_identifiers(&candidate.row) {
+                index.remove(&identifier);
+            }
+        }
+        let duplicates = matches
+            .iter()
+            .skip(1)
+            .rev()
+            .filter_map(|&idx| slots[idx].take())
+            .collect::<Vec<_>>();
+        if let Some(keep) = slots[keep_idx].as_mut() {
+            merge_article_candidate(keep, row);
+            for duplicate in duplicates {
+                merge_article_candidate(keep, duplicate);
+            }
+            for identifier in article_row_identifiers(&keep.row) {
+                index.insert(identifier, keep_idx);
+            }
         }
     }
 
-    merged
+    slots.into_iter().flatten().collect()
 }
 
 fn compare_optional_dates_desc(
@@ -1194,29 +1243,74 @@ fn build_anchor_set(filters: &ArticleSearchFilters) -> Vec<String> {
     anchors
 }
 
-fn anchor_matches_text(text: &str, anchor: &str) -> bool {
-    if anchor.is_empty() || text.is_empty() {
-        return false;
+/// The query anchors compiled into one automaton, so a title or abstract is scanned once for all
+/// of them. Phrase anchors (containing whitespace) match anywhere; single-token anchors need a
+/// non-alphanumeric neighbour on both sides, tested on the same occurrences `str::match_indices`
+/// would report. An empty anchor (say, a gene given only as markup) never matches.
+struct AnchorMatcher {
+    automaton: Option<AhoCorasick>,
+    anchor_count: usize,
+    /// `build_anchor_set` index of each automaton pattern.
+    anchor_ids: Vec<usize>,
+    phrase: Vec<bool>,
+    lens: Vec<usize>,
+}
+
+impl AnchorMatcher {
+    fn new(anchors: &[String]) -> Self {
+        let anchor_ids = anchors
+            .iter()
+            .enumerate()
+            .filter(|(_, anchor)| !anchor.is_empty())
+            .map(|(idx, _)| idx)
+            .collect::<Vec<_>>();
+        let patterns = anchor_ids
+            .iter()
+            .map(|&idx| anchors[idx].as_str())
+            .collect::<Vec<_>>();
+        let automaton = (!patterns.is_empty()).then(|| {
+            AhoCorasick::new(&patterns).expect("anchor automaton should build from query anchors")
+        });
+        Self {
+            automaton,
+            anchor_count: anchors.len(),
+            phrase: patterns
+                .iter()
+                .map(|anchor| anchor.chars().any(char::is_whitespace))
+                .collect(),
+            lens: patterns.iter().map(|anchor| anchor.len()).collect(),
+            anchor_ids,
+        }
     }
-    if anchor.chars().any(|ch| ch.is_whitespace()) {
-        return text.contains(anchor);
-    }
-
-    for (idx, _) in text.match_indices(anchor) {
-        let start_ok = text[..idx]
-            .chars()
-            .next_back()
-            .is_none_or(|ch| !ch.is_ascii_alphanumeric());
-        let end_idx = idx + anchor.len();
-        let end_ok = text[end_idx..]
-            .chars()
-            .next()
-            .is_none_or(|ch| !ch.is_ascii_alphanumeric());
-        if start_ok && end_ok {
-            return true;
+
+    /// Whether each anchor, in `build_anchor_set` order, occurs in `text`.
+    fn matches(&self, text: &str) -> Vec<bool> {
+        let mut found = vec![false; self.anchor_count];
+        let Some(automaton) = self.automaton.as_ref() else {
+            return found;
+        };
+        let bytes = text.as_bytes();
+        let mut pattern_found = vec![false; self.lens.len()];
+        // End of the last occurrence `match_indices` would have reported, per anchor: it skips
+        // occurrences overlapping the previous one.
+        let mut next_start = vec![0; self.lens.len()];
+        for hit in automaton.find_overlapping_iter(text) {
+            let pattern = hit.pattern().as_usize();
+            if pattern_found[pattern] || hit.start() < next_start[pattern] {
+                continue;
+            }
+            next_start[pattern] = hit.end();
+            let start_ok = hit.start() == 0 || !bytes[hit.start() - 1].is_ascii_alphanumeric();
+            let end_ok = bytes
+                .get(hit.end())
+                .is_none_or(|byte| !byte.is_ascii_alphanumeric());
+            pattern_found[pattern] = self.phrase[pattern] || (start_ok && end_ok);
+        }
+        for (pattern, hit) in pattern_found.into_iter().enumerate() {
+            found[self.anchor_ids[pattern]] = hit;
         }
+        found
     }
-    false
 }
 
 fn has_study_or_review_cue(row: &ArticleSearchResult) -> bool {
@@ -1282,23 +1376,18 @@ fn pubmed_rescue_metadata(
 
 fn rank_articles_by_directness(rows: &mut [ArticleCandidate], filters: &ArticleSearchFilters) {
     let anchors = build_anchor_set(filters);
+    let matcher = AnchorMatcher::new(&anchors);
 
     for row in rows.iter_mut() {
         ensure_matched_sources(&mut row.row);
-        let title_hits = anchors
-            .iter()
-            .filter(|anchor| anchor_matches_text(&row.row.normalized_title, anchor))
-            .count();
-        let abstract_hits = anchors
+        let in_title = matcher.matches(&row.row.normalized_title);
+        let in_abstract = matcher.matches(&row.row.normalized_abstract);
+        let title_hits = in_title.iter().filter(|hit| **hit).count();
+        let abstract_hits = in_abstract.iter().filter(|hit| **hit).count();
+        let combined_hits = in_title
             .iter()
-            .filter(|anchor| anchor_matches_text(&row.row.normalized_abstract, anchor))
-            .count();
-        let combined_hits = anchors
-            .iter()
-            .filter(|anchor| {
-                anchor_matches_text(&row.row.normalized_title, anchor)
-                    || anchor_matches_text(&row.row.normalized_abstract, anchor)
-            })
+            .zip(&in_abstract)
+            .filter(|(title, abstract_text)| **title || **abstract_text)
             .count();
         let anchor_count = anchors.len();
         let all_anchors_in_title = anchor_count > 0 && title_hits == anchor_count;
@@ -1626,6 +1715,11 @@ async fn search_pubmed_page(
     let mut source_position = 0usize;
     let mut fetched_pages = 0usize;
     while out.len() < limit && fetched_pages < MAX_PAGE_FETCHES {
+        // Under a caller deadline, return the pages already fetched rather than start one that
+        // cannot finish.
+        if fetched_pages > 0 && !crate::sources::deadline_allows_attempt() {
+            break;
+        }
         fetched_pages = fetched_pages.saturating_add(1);
         if fetched_pages == WARN_PAGE_THRESHOLD + 1 {
             tracing::warn!(
@@ -2014,12 +2108,7 @@ async fn resolve_article_from_pmid(
     }
 }
 
-async fn get_article_base_with_clients(
-    id: &str,
-    pubtator: &PubTatorClient,
-    europe: &EuropePmcClient,
-) -> Result<Article, BioMcpError> {
-    let id = id.trim();
+fn parse_requested_article_id(id: &str) -> Result<ArticleIdType, BioMcpError> {
     if id.is_empty() {
         return Err(BioMcpError::InvalidArgument(
             "ID is required. Example: biomcp get article 22663011".into(),
@@ -2028,8 +2117,19 @@ async fn get_article_base_with_clients(
     if id.len() > 512 {
         return Err(BioMcpError::InvalidArgument("ID is too long.".into()));
     }
-
     match parse_article_id(id) {
+        ArticleIdType::Invalid => Err(BioMcpError::InvalidArgument(INVALID_ARTICLE_ID_MSG.into())),
+        parsed => Ok(parsed),
+    }
+}
+
+async fn get_article_base_with_clients(
+    id: &str,
+    pubtator: &PubTatorClient,
+    europe: &EuropePmcClient,
+) -> Result<Article, BioMcpError> {
+    let id = id.trim();
+    match parse_requested_article_id(id)? {
         ArticleIdType::Pmid(pmid) => {
             resolve_article_from_pmid(pmid, id, id, pubtator, europe, None).await
         }
@@ -2069,6 +2169,128 @@ async fn get_article_base(id: &str) -> Result<Article, BioMcpError> {
     get_article_base_with_clients(id, &pubtator, &europe).await
 }
 
+fn europepmc_id(id: &ArticleIdType) -> Option<EuropePmcId> {
+    match id {
+        ArticleIdType::Pmid(pmid) => Some(EuropePmcId::Pmid(pmid.to_string())),
+        ArticleIdType::Pmc(pmcid) => Some(EuropePmcId::Pmcid(pmcid.clone())),
+        ArticleIdType::Doi(doi) => Some(EuropePmcId::Doi(doi.clone())),
+        ArticleIdType::Invalid => None,
+    }
+}
+
+fn europepmc_hit_for<'a>(
+    id: &ArticleIdType,
+    hits: &'a [EuropePmcResult],
+) -> Option<&'a EuropePmcResult> {
+    let same = |value: Option<&str>, wanted: &str| {
+        value.is_some_and(|value| value.trim().eq_ignore_ascii_case(wanted))
+    };
+    hits.iter().find(|hit| match id {
+        ArticleIdType::Pmid(pmid) => hit.pmid.as_deref().and_then(parse_pmid) == Some(*pmid),
+        ArticleIdType::Pmc(pmcid) => same(hit.pmcid.as_deref(), pmcid),
+        ArticleIdType::Doi(doi) => same(hit.doi.as_deref(), doi),
+        ArticleIdType::Invalid => false,
+    })
+}
+
+/// [`get_article_base`] for many IDs with batched upstream calls: Europe PMC `OR` lookups for
+/// every ID and chunked PubTator exports for every PMID, instead of one of each per ID. Articles
+/// come back in `ids` order. Unlike the single lookup, a PMID missing from the PubTator export
+/// falls back to its Europe PMC record.
+async fn get_article_bases_with_clients(
+    ids: &[String],
+    pubtator: &PubTatorClient,
+    europe: &EuropePmcClient,
+) -> Result<Vec<Article>, BioMcpError> {
+    let parsed = ids
+        .iter()
+        .map(|id| parse_requested_article_id(id.trim()))
+        .collect::<Result<Vec<_>, _>>()?;
+
+    let mut seen_lookups = HashSet::with_capacity(parsed.len());
+    let lookups = parsed
+        .iter()
+        .filter_map(europepmc_id)
+        .filter(|lookup| seen_lookups.insert(lookup.clone()))
+        .collect::<Vec<_>>();
+    let hits = match europe.search_by_ids(&lookups).await {
+        Ok(hits) => hits,
+        // PMIDs only borrow metadata from Europe PMC; DOIs and PMCIDs cannot resolve without it.
+        Err(err) if parsed.iter().all(|id| matches!(id, ArticleIdType::Pmid(_))) => {
+            warn!(?err, "Europe PMC batch lookup failed");
+            Vec::new()
+        }
+        Err(err) => return Err(err),
+    };
+
+    let mut resolved = Vec::with_capacity(parsed.len());
+    for (requested, id) in ids.iter().map(|id| id.trim()).zip(&parsed) {
+        let hint = europepmc_hit_for(id, &hits);
+        let (pmid, not_found_id) = match id {
+            ArticleIdType::Pmid(pmid) => (Some(*pmid), requested),
+            ArticleIdType::Pmc(value) | ArticleIdType::Doi(value) => {
+                let hit = hint.ok_or_else(|| article_not_found(value, requested))?;
+                (hit.pmid.as_deref().and_then(parse_pmid), value.as_str())
+            }
+            ArticleIdType::Invalid => unreachable!("invalid IDs are rejected above"),
+        };
+        resolved.push((requested, not_found_id, pmid, hint));
+    }
+
+    let mut pmids = Vec::new();
+    let mut seen_pmids = HashSet::new();
+    for pmid in resolved.iter().filter_map(|(_, _, pmid, _)| *pmid) {
+        if seen_pmids.insert(pmid) {
+            pmids.push(pmid);
+        }
+    }
+    let exports = try_join_all(
+        pmids
+            .chunks(PUBTATOR_EXPORT_MAX_PMIDS)
+            .map(|chunk| async move {
+                match pubtator.export_biocjson_batch(chunk).await {
+                    Ok(resp) => Ok(resp.documents),
+                    Err(err) if is_pubtator_lag_error(&err) => Ok(Vec::new()),
+                    Err(err) => Err(err),
+                }
+            }),
+    )
+    .await?;
+    let documents = exports
+        .iter()
+        .flatten()
+        .filter_map(|doc| doc.pmid.map(|pmid| (pmid, doc)))
+        .collect::<HashMap<_, _>>();
+
+    resolved
+        .into_iter()
+        .map(|(requested, not_found_id, pmid, hint)| {
+            let Some(pmid) = pmid else {
+                // A DOI or PMCID whose Europe PMC record has no PMID.
+                return hint
+                    .map(transform::article::from_europepmc_result)
+                    .ok_or_else(|| article_not_found(not_found_id, requested));
+            };
+            match (documents.get(&pmid), hint) {
+                (Some(doc), hint) => {
+                    let mut article = transform::article::from_pubtator_document(doc);
+                    if let Some(hit) = hint {
+                        transform::article::merge_europepmc_metadata(&mut article, hit);
+                    }
+                    article.annotations = transform::article::extract_annotations(doc);
+                    Ok(article)
+                }
+                (None, Some(hit)) => {
+                    let mut article = transform::article::from_europepmc_result(hit);
+                    article.pubtator_fallback = true;
+                    Ok(article)
+                }
+                (None, None) => Err(article_not_found(not_found_id, requested)),
+            }
+        })
+        .collect()
+}
+
 fn trimmed_opt(value: Option<&str>) -> Option<String> {
     value
         .map(str::trim)
@@ -2205,11 +2427,7 @@ pub async fn get_batch_compact(ids: &[String]) -> Result<Vec<ArticleBatchItem>,
 
     let pubtator = PubTatorClient::new()?;
     let europe = EuropePmcClient::new()?;
-    let articles = try_join_all(
-        ids.iter()
-            .map(|id| get_article_base_with_clients(id, &pubtator, &europe)),
-    )
-    .await?;
+    let articles = get_article_bases_with_clients(ids, &pubtator, &europe).await?;
 
     let mut items = ids
         .iter()
@@ -2266,6 +2484,156 @@ pub async fn search(
         .results)
 }
 
+/// Rows of one page-addressed search leg, collected in source order: the offset into the first
+/// page is skipped, repeated PMIDs are dropped, and kept rows are numbered by position.
+struct PagedLegRows {
+    limit: usize,
+    local_skip: usize,
+    hits_seen: usize,
+    out: Vec<ArticleSearchResult>,
+    seen_pmids: HashSet<String>,
+    pages: usize,
+    /// Page (counted from the first pushed) and in-page hit index of each kept row.
+    positions: Vec<(usize, usize)>,
+}
+
+impl PagedLegRows {
+    fn new(limit: usize, local_skip: usize) -> Self {
+        Self {
+            limit,
+            local_skip,
+            hits_seen: 0,
+            out: Vec::with_capacity(limit.min(10)),
+            seen_pmids: HashSet::with_capacity(limit.min(10)),
+            pages: 0,
+            positions: Vec::with_capacity(limit.min(10)),
+        }
+    }
+
+    fn is_full(&self) -> bool {
+        self.out.len() >= self.limit
+    }
+
+    fn push_page<H>(&mut self, hits: Vec<H>, to_row: &impl Fn(&H) -> Option<ArticleSearchResult>) {
+        for (idx, hit) in hits.into_iter().enumerate() {
+            if self.is_full() {
+                break;
+            }
+            if self.local_skip > 0 {
+                self.local_skip -= 1;
+                continue;
+            }
+            self.hits_seen += 1;
+            let Some(mut row) = to_row(&hit) else {
+                continue;
+            };
+            if !self.seen_pmids.insert(row.pmid.clone()) {
+                continue;
+            }
+            row.source_local_position = self.out.len();
+            self.out.push(row);
+            self.positions.push((self.pages, idx));
+        }
+        self.pages += 1;
+    }
+
+    /// Pages to request next: enough to cover the missing rows at the yield seen so far, within
+    /// the prefetch cap, the page budget and the last page the hit count allows.
+    fn next_wave(
+        &self,
+        next_page: usize,
+        page_size: usize,
+        total: Option<usize>,
+        budget: usize,
+    ) -> usize {
+        let Some(total) = total else {
+            return budget.min(1);
+        };
+        let available = total.div_ceil(page_size).saturating_sub(next_page - 1);
+        let missing = self.limit.saturating_sub(self.out.len());
+        let wanted = if self.out.is_empty() {
+            PAGE_PREFETCH_CONCURRENCY
+        } else {
+            (missing * self.hits_seen).div_ceil(self.out.len() * page_size)
+        };
+        wanted
+            .clamp(1, PAGE_PREFETCH_CONCURRENCY)
+            .min(available)
+            .min(budget)
+    }
+}
+
+/// Fetches pages of one leg from `first_page` until `leg` is full, the hits run out, or
+/// `MAX_PAGE_FETCHES` is spent, and returns the hit count from the first page. `fetch` returns a
+/// page's hit count and hits.
+///
+/// The first page is fetched alone so its hit count can bound the rest. Later pages are fetched in
+/// concurrent waves sized by [`PagedLegRows::next_wave`] and consumed in page order, so rows and
+/// positions match a sequential walk. A failed page is ignored once the leg is full, and ends the
+/// leg early once a caller deadline cannot cover another attempt.
+async fn fetch_article_leg_pages<H, F, Fut>(
+    leg: &mut PagedLegRows,
+    first_page: usize,
+    page_size: usize,
+    fetch: F,
+    to_row: impl Fn(&H) -> Option<ArticleSearchResult>,
+) -> Result<Option<usize>, BioMcpError>
+where
+    F: Fn(usize) -> Fut,
+    Fut: Future<Output = Result<(Option<usize>, Vec<H>), BioMcpError>>,
+{
+    let (total, hits) = fetch(first_page).await?;
+    if total.is_some_and(|value| leg.local_skip + (first_page - 1) * page_size >= value)
+        || hits.is_empty()
+    {
+        return Ok(total);
+    }
+    leg.push_page(hits, &to_row);
+
+    let mut next_page = first_page + 1;
+    let mut fetched_pages = 1usize;
+    while !leg.is_full() && fetched_pages < MAX_PAGE_FETCHES {
+        // Under a caller deadline, return the pages already fetched rather than start one that
+        // cannot finish.
+        if !crate::sources::deadline_allows_attempt() {
+            break;
+        }
+        let wave = leg.next_wave(
+            next_page,
+            page_size,
+            total,
+            MAX_PAGE_FETCHES - fetched_pages,
+        );
+        if wave == 0 {
+            break;
+        }
+        if fetched_pages <= WARN_PAGE_THRESHOLD && fetched_pages + wave > WARN_PAGE_THRESHOLD {
+            tracing::warn!(
+                "article search is deep (>{WARN_PAGE_THRESHOLD} page fetches); continuing up to {MAX_PAGE_FETCHES} — consider narrowing your query"
+            );
+        }
+        let pages = join_all((next_page..next_page + wave).map(&fetch)).await;
+        fetched_pages += wave;
+        next_page += wave;
+
+        for page in pages {
+            if leg.is_full() {
+                break;
+            }
+            let hits = match page {
+                Ok((_, hits)) => hits,
+                Err(_) if !crate::sources::deadline_allows_attempt() => return Ok(total),
+                Err(err) => return Err(err),
+            };
+            if hits.is_empty() {
+                return Ok(total);
+            }
+            leg.push_page(hits, &to_row);
+        }
+    }
+    Ok(total)
+}
+
 async fn search_europepmc_page(
     filters: &ArticleSearchFilters,
     limit: usize,
@@ -2276,108 +2644,210 @@ async fn search_europepmc_page(
     let europepmc_sort = filters.sort.as_europepmc_sort();
     let (normalized_date_from, normalized_date_to) = normalized_date_bounds(filters)?;
 
-    let mut out: Vec<ArticleSearchResult> = Vec::with_capacity(limit.min(10));
-    let mut seen_pmids: HashSet<String> = HashSet::with_capacity(limit.min(10));
+    let mut leg = PagedLegRows::new(limit, offset % EUROPE_PMC_PAGE_SIZE);
+    let (client, query_text) = (&europe, query.as_str());
+    let total = fetch_article_leg_pages(
+        &mut leg,
+        (offset / EUROPE_PMC_PAGE_SIZE) + 1,
+        EUROPE_PMC_PAGE_SIZE,
+        move |page| async move {
+            let resp = client
+                .search_query_with_sort(query_text, page, EUROPE_PMC_PAGE_SIZE, europepmc_sort)
+                .await?;
+            Ok((
+                resp.hit_count.map(|v| v as usize),
+                resp.result_list.map(|v| v.result).unwrap_or_default(),
+            ))
+        },
+        europepmc_leg_row(
+            filters,
+            normalized_date_from.as_deref(),
+            normalized_date_to.as_deref(),
+        ),
+    )
+    .await?;
+    if total.is_some_and(|value| offset >= value) {
+        return Ok(SearchPage::offset(Vec::new(), total));
+    }
+
+    add_retracted_example(&europe, &query, filters, &mut leg).await?;
+    Ok(SearchPage::offset(leg.out, total))
+}
+
+/// One page of a Europe PMC `cursorMark` walk, starting at `cursor` (a `next_page_token` from an
+/// earlier page) or at the first result. The returned token resumes right after the last row,
+/// so each continuation costs only the pages it returns.
+async fn search_europepmc_cursor_page(
+    filters: &ArticleSearchFilters,
+    limit: usize,
+    cursor: Option<&str>,
+) -> Result<SearchPage<ArticleSearchResult>, BioMcpError> {
+    let resumed = cursor.map(EuropePmcCursor::parse).transpose()?;
+    let start = resumed.clone().unwrap_or_else(EuropePmcCursor::start);
+    let europe = EuropePmcClient::new()?;
+    let query = build_search_query(filters)?;
+    let europepmc_sort = filters.sort.as_europepmc_sort();
+    let (normalized_date_from, normalized_date_to) = normalized_date_bounds(filters)?;
+    let to_row = europepmc_leg_row(
+        filters,
+        normalized_date_from.as_deref(),
+        normalized_date_to.as_deref(),
+    );
+
+    let mut leg = PagedLegRows::new(limit, start.skip);
+    let mut marks: Vec<String> = Vec::new();
     let mut total: Option<usize> = None;
-    let mut page: usize = (offset / EUROPE_PMC_PAGE_SIZE) + 1;
-    let mut local_skip = offset % EUROPE_PMC_PAGE_SIZE;
-    let mut source_position = 0usize;
-    let mut fetched_pages = 0usize;
-    while out.len() < limit && fetched_pages < MAX_PAGE_FETCHES {
-        fetched_pages = fetched_pages.saturating_add(1);
-        if fetched_pages == WARN_PAGE_THRESHOLD + 1 {
-            tracing::warn!(
-                "article search is deep (>{WARN_PAGE_THRESHOLD} page fetches); continuing up to {MAX_PAGE_FETCHES} — consider narrowing your query"
-            );
-        }
-        let resp = europe
-            .search_query_with_sort(&query, page, EUROPE_PMC_PAGE_SIZE, europepmc_sort)
-            .await?;
-        if total.is_none() {
-            total = resp.hit_count.map(|v| v as usize);
-            if total.is_some_and(|value| offset >= value) {
-                return Ok(SearchPage::offset(Vec::new(), total));
-            }
-        }
-        let Some(results) = resp.result_list.map(|v| v.result) else {
+    let mut next_mark = Some(start.mark.clone());
+    while !leg.is_full() && marks.len() < MAX_PAGE_FETCHES {
+        let Some(mark) = next_mark.take() else {
             break;
         };
-        if results.is_empty() {
+        if !marks.is_empty() && !crate::sources::deadline_allows_attempt() {
+            next_mark = Some(mark);
             break;
         }
+        let resp = europe
+            .search_query_with_cursor(&query, &mark, EUROPE_PMC_PAGE_SIZE, europepmc_sort)
+            .await?;
+        total = total.or(resp.hit_count.map(|v| v as usize));
+        let hits = resp.result_list.map(|v| v.result).unwrap_or_default();
+        // Past the last result Europe PMC answers with no hits and repeats the cursor mark.
+        next_mark = resp
+            .next_cursor_mark
+            .filter(|next| !hits.is_empty() && *next != mark);
+        marks.push(mark);
+        leg.push_page(hits, &to_row);
+    }
+
+    let walk_full = leg.is_full();
+    // A continuation never swaps in a retracted example: the swapped-out row is served by the
+    // next page, which would otherwise swap it out again.
+    if resumed.is_none() {
+        add_retracted_example(&europe, &query, filters, &mut leg).await?;
+    }
+    let next = if walk_full {
+        Some(match leg.positions.last() {
+            Some(&(page, idx)) => EuropePmcCursor {
+                mark: marks[page].clone(),
+                skip: idx + 1,
+            },
+            None => start,
+        })
+    } else {
+        next_mark.map(|mark| EuropePmcCursor { mark, skip: 0 })
+    };
 
-        for hit in results {
-            if local_skip > 0 {
-                local_skip -= 1;
-                continue;
-            }
+    Ok(SearchPage::cursor(
+        leg.out,
+        total,
+        next.map(|cursor| cursor.token()),
+    ))
+}
 
-            let Some(mut row) = transform::article::from_europepmc_search_result(&hit) else {
-                continue;
-            };
-            if !matches_result_filters(
-                &row,
-                filters,
-                normalized_date_from.as_deref(),
-                normalized_date_to.as_deref(),
-            ) {
-                continue;
-            }
-            if !seen_pmids.insert(row.pmid.clone()) {
-                continue;
-            }
-            row.source_local_position = source_position;
-            source_position = source_position.saturating_add(1);
-            out.push(row);
-            if out.len() >= limit {
-                break;
-            }
+/// Resume point of a Europe PMC cursor walk, passed around as `next_page_token` / `--cursor`: the
+/// `cursorMark` of the page holding the next result and how many of its hits were consumed.
+#[derive(Debug, Clone, PartialEq, Eq)]
+struct EuropePmcCursor {
+    mark: String,
+    skip: usize,
+}
+
+impl EuropePmcCursor {
+    fn start() -> Self {
+        Self {
+            mark: EUROPE_PMC_CURSOR_START.to_string(),
+            skip: 0,
         }
+    }
+
+    fn parse(token: &str) -> Result<Self, BioMcpError> {
+        token
+            .trim()
+            .split_once(':')
+            .and_then(|(skip, mark)| {
+                let skip = skip
+                    .parse::<usize>()
+                    .ok()
+                    .filter(|skip| *skip <= EUROPE_PMC_PAGE_SIZE)?;
+                (!mark.is_empty()).then(|| Self {
+                    mark: mark.to_string(),
+                    skip,
+                })
+            })
+            .ok_or_else(|| {
+                BioMcpError::InvalidArgument(
+                    "--cursor must be a next_page_token from a previous Europe PMC article search"
+                        .into(),
+                )
+            })
+    }
+
+    fn token(&self) -> String {
+        format!("{}:{}", self.skip, self.mark)
+    }
+}
 
-        page += 1;
+fn europepmc_leg_row<'a>(
+    filters: &'a ArticleSearchFilters,
+    date_from: Option<&'a str>,
+    date_to: Option<&'a str>,
+) -> impl Fn(&EuropePmcResult) -> Option<ArticleSearchResult> + 'a {
+    move |hit| {
+        transform::article::from_europepmc_search_result(hit)
+            .filter(|row| matches_result_filters(row, filters, date_from, date_to))
     }
+}
 
-    // Safety-first default: when date-sorted results contain no visible retraction marker,
-    // try adding one matched retracted publication if available.
-    if !filters.exclude_retracted
-        && filters.sort == ArticleSort::Date
-        && !out.iter().any(|row| row.is_retracted == Some(true))
+/// Safety-first default: when date-sorted results contain no visible retraction marker, try
+/// adding one matched retracted publication if available, in place of the last row when full.
+async fn add_retracted_example(
+    europe: &EuropePmcClient,
+    query: &str,
+    filters: &ArticleSearchFilters,
+    leg: &mut PagedLegRows,
+) -> Result<(), BioMcpError> {
+    if filters.exclude_retracted
+        || filters.sort != ArticleSort::Date
+        || leg.out.iter().any(|row| row.is_retracted == Some(true))
     {
-        let retracted_query = format!("({query}) AND PUB_TYPE:\"retracted publication\"");
-        if let Ok(resp) = europe
-            .search_query_with_sort(&retracted_query, 1, 10, europepmc_sort)
-            .await
-        {
-            let replacement = resp
-                .result_list
-                .map(|v| v.result)
-                .unwrap_or_default()
-                .into_iter()
-                .filter_map(|hit| transform::article::from_europepmc_search_result(&hit))
-                .find(|row| {
-                    row.is_retracted == Some(true)
-                        && !seen_pmids.contains(&row.pmid)
-                        && matches_result_filters(
-                            row,
-                            filters,
-                            normalized_date_from.as_deref(),
-                            normalized_date_to.as_deref(),
-                        )
-                });
-            if let Some(mut row) = replacement {
-                if out.len() >= limit && !out.is_empty() {
-                    out.pop();
-                }
-                if out.len() < limit {
-                    row.source_local_position = out.len();
-                    seen_pmids.insert(row.pmid.clone());
-                    out.push(row);
-                }
-            }
+        return Ok(());
+    }
+    let (normalized_date_from, normalized_date_to) = normalized_date_bounds(filters)?;
+    let retracted_query = format!("({query}) AND PUB_TYPE:\"retracted publication\"");
+    let Ok(resp) = europe
+        .search_query_with_sort(&retracted_query, 1, 10, filters.sort.as_europepmc_sort())
+        .await
+    else {
+        return Ok(());
+    };
+    let replacement = resp
+        .result_list
+        .map(|v| v.result)
+        .unwrap_or_default()
+        .into_iter()
+        .filter_map(|hit| transform::article::from_europepmc_search_result(&hit))
+        .find(|row| {
+            row.is_retracted == Some(true)
+                && !leg.seen_pmids.contains(&row.pmid)
+                && matches_result_filters(
+                    row,
+                    filters,
+                    normalized_date_from.as_deref(),
+                    normalized_date_to.as_deref(),
+                )
+        });
+    if let Some(mut row) = replacement {
+        if leg.out.len() >= leg.limit && !leg.out.is_empty() {
+            leg.out.pop();
+            leg.positions.truncate(leg.out.len());
+        }
+        if leg.out.len() < leg.limit {
+            row.source_local_position = leg.out.len();
+            leg.seen_pmids.insert(row.pmid.clone());
+            leg.out.push(row);
         }
     }
-
-    Ok(SearchPage::offset(out, total))
+    Ok(())
 }
 
 async fn search_pubtator_page(
@@ -2390,59 +2860,35 @@ async fn search_pubtator_page(
     let sort = pubtator_sort(filters.sort);
     let (normalized_date_from, normalized_date_to) = normalized_date_bounds(filters)?;
 
-    let mut out: Vec<ArticleSearchResult> = Vec::with_capacity(limit.min(10));
-    let mut seen_pmids: HashSet<String> = HashSet::with_capacity(limit.min(10));
-    let mut total: Option<usize> = None;
-    let mut page: usize = (offset / PUBTATOR_PAGE_SIZE) + 1;
-    let mut local_skip = offset % PUBTATOR_PAGE_SIZE;
-    let mut source_position = 0usize;
-    let mut fetched_pages = 0usize;
-    while out.len() < limit && fetched_pages < MAX_PAGE_FETCHES {
-        fetched_pages = fetched_pages.saturating_add(1);
-        let resp = pubtator
-            .search(&query, page, PUBTATOR_PAGE_SIZE, sort)
-            .await?;
-        if total.is_none() {
-            total = resp.count.map(|v| v as usize);
-            if total.is_some_and(|value| offset >= value) {
-                return Ok(SearchPage::offset(Vec::new(), total));
-            }
-        }
-
-        if resp.results.is_empty() {
-            break;
-        }
-
-        for hit in resp.results {
-            if local_skip > 0 {
-                local_skip -= 1;
-                continue;
-            }
-            let Some(mut row) = transform::article::from_pubtator_search_result(&hit) else {
-                continue;
-            };
-            if !matches_result_filters(
-                &row,
-                filters,
-                normalized_date_from.as_deref(),
-                normalized_date_to.as_deref(),
-            ) {
-                continue;
-            }
-            if !seen_pmids.insert(row.pmid.clone()) {
-                continue;
-            }
-            row.source_local_position = source_position;
-            source_position = source_position.saturating_add(1);
-            out.push(row);
-            if out.len() >= limit {
-                break;
-            }
-        }
-        page += 1;
+    let mut leg = PagedLegRows::new(limit, offset % PUBTATOR_PAGE_SIZE);
+    let (client, query_text) = (&pubtator, query.as_str());
+    let total = fetch_article_leg_pages(
+        &mut leg,
+        (offset / PUBTATOR_PAGE_SIZE) + 1,
+        PUBTATOR_PAGE_SIZE,
+        move |page| async move {
+            let resp = client
+                .search(query_text, page, PUBTATOR_PAGE_SIZE, sort)
+                .await?;
+            Ok((resp.count.map(|v| v as usize), resp.results))
+        },
+        |hit| {
+            transform::article::from_pubtator_search_result(hit).filter(|row| {
+                matches_result_filters(
+                    row,
+                    filters,
+                    normalized_date_from.as_deref(),
+                    normalized_date_to.as_deref(),
+                )
+            })
+        },
+    )
+    .await?;
+    if total.is_some_and(|value| offset >= value) {
+        return Ok(SearchPage::offset(Vec::new(), total));
     }
 
-    Ok(SearchPage::offset(out, total))
+    Ok(SearchPage::offset(leg.out, total))
 }
 
 fn build_semantic_scholar_query(filters: &ArticleSearchFilters) -> String {
@@ -2559,6 +3005,7 @@ fn finalize_article_candidates(
     total: Option<usize>,
     filters: &ArticleSearchFilters,
 ) -> SearchPage<ArticleSearchResult> {
+    let _span = crate::profiling::profile_span!("transform", step = "article::finalize_candidates");
     for row in rows.iter_mut() {
         ensure_matched_sources(row);
     }
@@ -2575,6 +3022,11 @@ fn finalize_article_candidates(
     SearchPage::offset(rows, total)
 }
 
+/// Profiling span for one federated search leg.
+fn leg_span(source: &'static str) -> tracing::Span {
+    crate::profiling::profile_span!("section", source)
+}
+
 async fn search_federated_page(
     filters: &ArticleSearchFilters,
     limit: usize,
@@ -2588,16 +3040,21 @@ async fn search_federated_page(
     }
     let include_pubmed = pubmed_filter_compatible(filters);
     let (pubtator_leg, europe_leg, pubmed_leg, semantic_scholar_leg) = tokio::join!(
-        search_pubtator_page(filters, fetch_count, 0),
-        search_europepmc_page(filters, fetch_count, 0),
+        search_pubtator_page(filters, fetch_count, 0).instrument(leg_span("pubtator")),
+        search_europepmc_page(filters, fetch_count, 0).instrument(leg_span("europepmc")),
         async {
             if include_pubmed {
-                Some(search_pubmed_page(filters, fetch_count, 0).await)
+                Some(
+                    search_pubmed_page(filters, fetch_count, 0)
+                        .instrument(leg_span("pubmed"))
+                        .await,
+                )
             } else {
                 None
             }
         },
         search_semantic_scholar_candidates(filters, fetch_count)
+            .instrument(leg_span("semantic_scholar"))
     );
 
     merge_federated_pages(
@@ -2687,8 +3144,8 @@ async fn search_type_capable_page(
     offset: usize,
 ) -> Result<SearchPage<ArticleSearchResult>, BioMcpError> {
     let (europe_leg, pubmed_leg) = tokio::join!(
-        search_europepmc_page(filters, fetch_count, 0),
-        search_pubmed_page(filters, fetch_count, 0),
+        search_europepmc_page(filters, fetch_count, 0).instrument(leg_span("europepmc")),
+        search_pubmed_page(filters, fetch_count, 0).instrument(leg_span("pubmed")),
     );
 
     match (europe_leg, pubmed_leg) {
@@ -2788,6 +3245,20 @@ pub async fn search_page(
     limit: usize,
     offset: usize,
     source: ArticleSourceFilter,
+) -> Result<SearchPage<ArticleSearchResult>, BioMcpError> {
+    search_page_with_cursor(filters, limit, offset, source, None).await
+}
+
+/// [`search_page`], optionally resuming a Europe PMC cursor walk from the `next_page_token` of an
+/// earlier page. Date- and citation-sorted Europe PMC searches from the first result are served by
+/// the cursor walk and return such a token. Without row filters a first page spans at most two
+/// Europe PMC result pages, so walking them in order costs little over prefetching.
+pub async fn search_page_with_cursor(
+    filters: &ArticleSearchFilters,
+    limit: usize,
+    offset: usize,
+    source: ArticleSourceFilter,
+    cursor: Option<&str>,
 ) -> Result<SearchPage<ArticleSearchResult>, BioMcpError> {
     if limit == 0 || limit > MAX_SEARCH_LIMIT {
         return Err(BioMcpError::InvalidArgument(format!(
@@ -2798,10 +3269,32 @@ pub async fn search_page(
     normalized_date_bounds(filters)?;
     validate_search_filter_values(filters)?;
     let plan = plan_backends(filters, source)?;
+    if cursor.is_some() {
+        if offset > 0 {
+            return Err(BioMcpError::InvalidArgument(
+                "--cursor cannot be used together with --offset".into(),
+            ));
+        }
+        if plan != BackendPlan::EuropeOnly {
+            return Err(BioMcpError::InvalidArgument(
+                "--cursor is only supported for --source europepmc".into(),
+            ));
+        }
+        // Relevance pages are re-ranked across the whole candidate pool, so they have no
+        // position in the Europe PMC result order to resume from.
+        if filters.sort == ArticleSort::Relevance {
+            return Err(BioMcpError::InvalidArgument(
+                "--cursor requires --sort date or --sort citations".into(),
+            ));
+        }
+    }
     if filters.sort == ArticleSort::Relevance {
         return search_relevance_page(filters, limit, offset, plan).await;
     }
     match plan {
+        BackendPlan::EuropeOnly if offset == 0 => {
+            search_europepmc_cursor_page(filters, limit, cursor).await
+        }
         BackendPlan::EuropeOnly => search_europepmc_page(filters, limit, offset).await,
         BackendPlan::PubTatorOnly => search_pubtator_page(filters, limit, offset).await,
         BackendPlan::PubMedOnly | BackendPlan::TypeCapable => {
@@ -4987,6 +5480,73 @@ mod tests {
         );
     }
 
+    #[tokio::test]
+    async fn article_bases_hydrate_with_one_lookup_and_one_export() {
+        let _guard = lock_env().await;
+        let europepmc = MockServer::start().await;
+        let pubtator = MockServer::start().await;
+        let _europepmc_base = set_env_var("BIOMCP_EUROPEPMC_BASE", Some(&europepmc.uri()));
+        let _pubtator_base = set_env_var("BIOMCP_PUBTATOR_BASE", Some(&pubtator.uri()));
+
+        Mock::given(method("GET"))
+            .and(path("/search"))
+            .and(query_param(
+                "query",
+                "(EXT_ID:22663011 AND SRC:MED) OR PMCID:PMC9984800 OR (EXT_ID:24200969 AND SRC:MED)",
+            ))
+            .respond_with(ResponseTemplate::new(200).set_body_json(serde_json::json!({
+                "hitCount": 3,
+                "resultList": {"result": [
+                    {"id": "22663011", "pmid": "22663011", "journalTitle": "NEJM"},
+                    {"id": "30000001", "pmid": "30000001", "pmcid": "PMC9984800"},
+                    {"id": "24200969", "pmid": "24200969", "title": "Not yet in PubTator"}
+                ]}
+            })))
+            .expect(1)
+            .mount(&europepmc)
+            .await;
+        Mock::given(method("GET"))
+            .and(path("/publications/export/biocjson"))
+            .and(query_param("pmids", "22663011,30000001,24200969"))
+            .respond_with(ResponseTemplate::new(200).set_body_json(serde_json::json!({
+                "PubTator3": [
+                    {"pmid": 30000001, "passages": []},
+                    {"pmid": 22663011, "passages": []}
+                ]
+            })))
+            .expect(1)
+            .mount(&pubtator)
+            .await;
+
+        let ids = ["22663011", "PMC9984800", "24200969", "22663011"]
+            .map(String::from)
+            .to_vec();
+        let articles = get_article_bases_with_clients(
+            &ids,
+            &PubTatorClient::new().unwrap(),
+            &EuropePmcClient::new().unwrap(),
+        )
+        .await
+        .expect("batch hydration");
+
+        let pmids = articles
+            .iter()
+            .map(|article| article.pmid.as_deref())
+            .collect::<Vec<_>>();
+        assert_eq!(
+            pmids,
+            vec![
+                Some("22663011"),
+                Some("30000001"),
+                Some("24200969"),
+                Some("22663011")
+            ]
+        );
+        assert_eq!(articles[0].journal.as_deref(), Some("NEJM"));
+        assert!(!articles[1].pubtator_fallback);
+        assert!(articles[2].pubtator_fallback);
+    }
+
     #[test]
     fn batch_semantic_scholar_merge_fills_fields_and_skips_none_rows_and_pmcid_only() {
         use crate::sources::semantic_scholar::{SemanticScholarPaper, SemanticScholarTldr};
@@ -5671,6 +6231,592 @@ mod tests {
         assert_eq!(merged[0].row.source_local_position, 1);
     }
 
+    // 250 hits in pages of 25; every third hit fails the filters. Later pages answer first.
+    async fn collect_fake_leg(
+        limit: usize,
+        offset: usize,
+        failing_page: Option<usize>,
+    ) -> (Result<Option<usize>, BioMcpError>, PagedLegRows, Vec<usize>) {
+        const PAGE: usize = 25;
+        let requested = std::sync::Mutex::new(Vec::new());
+        let mut leg = PagedLegRows::new(limit, offset % PAGE);
+        let result = fetch_article_leg_pages(
+            &mut leg,
+            offset / PAGE + 1,
+            PAGE,
+            |page| {
+                requested.lock().expect("lock").push(page);
+                async move {
+                    for _ in page..12 {
+                        tokio::task::yield_now().await;
+                    }
+                    if failing_page == Some(page) {
+                        return Err(BioMcpError::Api {
+                            api: "fake".into(),
+                            message: "page failed".into(),
+                        });
+                    }
+                    let hits = ((page - 1) * PAGE..(page * PAGE).min(250)).collect::<Vec<_>>();
+                    Ok((Some(250), hits))
+                }
+            },
+            |hit: &usize| (hit % 3 != 0).then(|| row(&hit.to_string(), ArticleSource::EuropePmc)),
+        )
+        .await;
+        let mut requested = requested.into_inner().expect("lock");
+        requested.sort_unstable();
+        (result, leg, requested)
+    }
+
+    #[tokio::test]
+    async fn paged_leg_prefetch_keeps_sequential_rows_and_stops_when_covered() {
+        let (result, leg, requested) = collect_fake_leg(60, 30, None).await;
+
+        assert_eq!(result.expect("leg should succeed"), Some(250));
+        let expected = (30..)
+            .filter(|hit| hit % 3 != 0)
+            .take(60)
+            .map(|hit: usize| hit.to_string())
+            .collect::<Vec<_>>();
+        let pmids = leg
+            .out
+            .iter()
+            .map(|row| row.pmid.clone())
+            .collect::<Vec<_>>();
+        assert_eq!(pmids, expected);
+        assert!(
+            leg.out
+                .iter()
+                .enumerate()
+                .all(|(idx, row)| row.source_local_position == idx)
+        );
+        // The first page yields 13 of 20 rows, so one wave of three pages covers the rest.
+        assert_eq!(requested, vec![2, 3, 4, 5]);
+    }
+
+    #[tokio::test]
+    async fn paged_leg_prefetch_fails_only_on_pages_it_still_needs() {
+        let (result, leg, _) = collect_fake_leg(60, 30, Some(5)).await;
+        assert!(result.is_err());
+        assert!(!leg.is_full());
+
+        // Rounding up asks for pages 3 and 4, but page 3 already covers the limit.
+        let (result, leg, requested) = collect_fake_leg(30, 30, Some(4)).await;
+        assert!(result.is_ok());
+        assert!(leg.is_full());
+        assert_eq!(requested, vec![2, 3, 4]);
+    }
+
+    #[test]
+    fn europepmc_cursor_token_round_trips_and_rejects_foreign_tokens() {
+        let cursor = EuropePmcCursor {
+            mark: "AoIIQJ6n2Cg3OTM2NjU5OQ==".into(),
+            skip: 7,
+        };
+        assert_eq!(cursor.token(), "7:AoIIQJ6n2Cg3OTM2NjU5OQ==");
+        assert_eq!(EuropePmcCursor::parse(&cursor.token()).unwrap(), cursor);
+        assert_eq!(
+            EuropePmcCursor::parse(" 0:* ").unwrap(),
+            EuropePmcCursor::start()
+        );
+
+        for token in ["", "*", "3:", "x:*", "26:*", "-1:*"] {
+            let err = EuropePmcCursor::parse(token).expect_err(token);
+            assert!(matches!(err, BioMcpError::InvalidArgument(_)), "{token}");
+        }
+    }
+
+    fn europepmc_cursor_hits(pmids: &[&str]) -> serde_json::Value {
+        serde_json::Value::Array(
+            pmids
+                .iter()
+                .map(|pmid| {
+                    serde_json::json!({
+                        "id": pmid,
+                        "pmid": pmid,
+                        "title": format!("Europe PMC article {pmid}"),
+                        "journalTitle": "Nature",
+                        "firstPublicationDate": "2024-01-01",
+                        "citedByCount": 25,
+                        "pubType": "journal article"
+                    })
+                })
+                .collect(),
+        )
+    }
+
+    #[tokio::test]
+    async fn europepmc_cursor_paging_resumes_where_the_last_page_ended() {
+        let _guard = lock_env().await;
+        let europepmc = MockServer::start().await;
+        let _europepmc_base = set_env_var("BIOMCP_EUROPEPMC_BASE", Some(&europepmc.uri()));
+
+        Mock::given(method("GET"))
+            .and(path("/search"))
+            .and(query_param("cursorMark", "*"))
+            .respond_with(ResponseTemplate::new(200).set_body_json(serde_json::json!({
+                "hitCount": 4,
+                "nextCursorMark": "M1",
+                "resultList": {"result": europepmc_cursor_hits(&["101", "102", "103"])}
+            })))
+            // The resumed call re-reads this page, unless the HTTP cache serves it.
+            .expect(1..=2)
+            .mount(&europepmc)
+            .await;
+        Mock::given(method("GET"))
+            .and(path("/search"))
+            .and(query_param("cursorMark", "M1"))
+            .respond_with(ResponseTemplate::new(200).set_body_json(serde_json::json!({
+                "hitCount": 4,
+                "nextCursorMark": "M2",
+                "resultList": {"result": europepmc_cursor_hits(&["104"])}
+            })))
+            .expect(1)
+            .mount(&europepmc)
+            .await;
+
+        let filters = ArticleSearchFilters {
+            keyword: Some("BRAF".into()),
+            sort: ArticleSort::Citations,
+            ..empty_filters()
+        };
+        let pmids = |page: &SearchPage<ArticleSearchResult>| {
+            page.results
+                .iter()
+                .map(|row| row.pmid.clone())
+                .collect::<Vec<_>>()
+        };
+
+        let first = search_page(&filters, 2, 0, ArticleSourceFilter::EuropePmc)
+            .await
+            .expect("first page");
+        assert_eq!(pmids(&first), vec!["101", "102"]);
+        assert_eq!(first.next_page_token.as_deref(), Some("2:*"));
+
+        let second = search_page_with_cursor(
+            &filters,
+            2,
+            0,
+            ArticleSourceFilter::EuropePmc,
+            first.next_page_token.as_deref(),
+        )
+        .await
+        .expect("resumed page");
+        assert_eq!(pmids(&second), vec!["103", "104"]);
+        assert_eq!(second.total, Some(4));
+        assert_eq!(second.next_page_token.as_deref(), Some("1:M1"));
+    }
+
+    #[tokio::test]
+    async fn europepmc_first_page_token_resumes_at_a_row_swapped_for_a_retraction() {
+        let _guard = lock_env().await;
+        let europepmc = MockServer::start().await;
+        let _europepmc_base = set_env_var("BIOMCP_EUROPEPMC_BASE", Some(&europepmc.uri()));
+
+        Mock::given(method("GET"))
+            .and(path("/search"))
+            .and(query_param("cursorMark", "*"))
+            .respond_with(ResponseTemplate::new(200).set_body_json(serde_json::json!({
+                "hitCount": 5,
+                "nextCursorMark": "M1",
+                "resultList": {"result": europepmc_cursor_hits(&["101", "102", "103"])}
+            })))
+            .expect(1..=2)
+            .mount(&europepmc)
+            .await;
+        Mock::given(method("GET"))
+            .and(path("/search"))
+            .and(query_param("cursorMark", "M1"))
+            .respond_with(ResponseTemplate::new(200).set_body_json(serde_json::json!({
+                "hitCount": 5,
+                "nextCursorMark": "M2",
+                "resultList": {"result": europepmc_cursor_hits(&["104", "105"])}
+            })))
+            .expect(1)
+            .mount(&europepmc)
+            .await;
+        // The retracted-example lookup asks for one short page by number.
+        let mut retracted = europepmc_cursor_hits(&["900"]);
+        retracted[0]["pubType"] = serde_json::json!("retracted publication");
+        Mock::given(method("GET"))
+            .and(path("/search"))
+            .and(query_param("pageSize", "10"))
+            .respond_with(ResponseTemplate::new(200).set_body_json(serde_json::json!({
+                "hitCount": 1,
+                "resultList": {"result": retracted}
+            })))
+            .expect(1)
+            .mount(&europepmc)
+            .await;
+
+        let filters = ArticleSearchFilters {
+            keyword: Some("BRAF".into()),
+            sort: ArticleSort::Date,
+            ..empty_filters()
+        };
+        let pmids = |page: &SearchPage<ArticleSearchResult>| {
+            page.results
+                .iter()
+                .map(|row| row.pmid.clone())
+                .collect::<Vec<_>>()
+        };
+
+        let first = search_page(&filters, 3, 0, ArticleSourceFilter::EuropePmc)
+            .await
+            .expect("first page");
+        assert_eq!(pmids(&first), vec!["101", "102", "900"]);
+        // 103 was swapped out for the retraction, so the next page starts with it.
+        assert_eq!(first.next_page_token.as_deref(), Some("2:*"));
+
+        let second = search_page_with_cursor(
+            &filters,
+            3,
+            0,
+            ArticleSourceFilter::EuropePmc,
+            first.next_page_token.as_deref(),
+        )
+        .await
+        .expect("resumed page");
+        assert_eq!(pmids(&second), vec!["103", "104", "105"]);
+        assert_eq!(second.next_page_token.as_deref(), Some("2:M1"));
+    }
+
+    #[tokio::test]
+    async fn cursor_is_rejected_outside_sorted_europepmc_searches() {
+        let filters = ArticleSearchFilters {
+            keyword: Some("BRAF".into()),
+            sort: ArticleSort::Date,
+            ..empty_filters()
+        };
+        let relevance = ArticleSearchFilters {
+            sort: ArticleSort::Relevance,
+            ..filters.clone()
+        };
+        let cases = [
+            (&filters, 10, ArticleSourceFilter::EuropePmc, "--offset"),
+            (
+                &filters,
+                0,
+                ArticleSourceFilter::PubTator,
+                "--source europepmc",
+            ),
+            (&relevance, 0, ArticleSourceFilter::EuropePmc, "--sort date"),
+        ];
+        for (filters, offset, source, expected) in cases {
+            let err = search_page_with_cursor(filters, 5, offset, source, Some("0:*"))
+                .await
+                .expect_err("cursor should be rejected");
+            assert!(
+                matches!(&err, BioMcpError::InvalidArgument(msg) if msg.contains(expected)),
+                "{err}"
+            );
+        }
+    }
+
+    /// The per-anchor scan `AnchorMatcher` replaced.
+    fn per_anchor_matches(text: &str, anchor: &str) -> bool {
+        if anchor.is_empty() || text.is_empty() {
+            return false;
+        }
+        if anchor.chars().any(|ch| ch.is_whitespace()) {
+            return text.contains(anchor);
+        }
+
+        for (idx, _) in text.match_indices(anchor) {
+            let start_ok = text[..idx]
+                .chars()
+                .next_back()
+                .is_none_or(|ch| !ch.is_ascii_alphanumeric());
+            let end_idx = idx + anchor.len();
+            let end_ok = text[end_idx..]
+                .chars()
+                .next()
+                .is_none_or(|ch| !ch.is_ascii_alphanumeric());
+            if start_ok && end_ok {
+                return true;
+            }
+        }
+        false
+    }
+
+    fn deep_anchor_filters() -> ArticleSearchFilters {
+        ArticleSearchFilters {
+            gene: Some("BRAF".into()),
+            disease: Some("non-small cell lung cancer".into()),
+            drug: Some("dabrafenib".into()),
+            keyword: Some("V600E aa braf/mek resistance".into()),
+            ..empty_filters()
+        }
+    }
+
+    /// `count` normalized texts of `words` words each, mixing anchor hits, near misses and
+    /// glued-together tokens.
+    fn deep_anchor_texts(count: usize, words: usize) -> Vec<String> {
+        let fragments = [
+            "braf",
+            "brafv600e",
+            "v600e",
+            "(v600e)",
+            "aaa",
+            "aa",
+            "a-aa",
+            "braf/mek",
+            "braf/meki",
+            "non small cell lung cancer",
+            "nonsmall cell",
+            "dabrafenib",
+            "dabrafenib-resistant",
+            "resistance",
+            "résistance",
+            "melanoma",
+            "in",
+            "of",
+        ];
+        (0..count)
+            .map(|i| {
+                let words = (0..words)
+                    .map(|j| fragments[(i * 7 + j * (i % 5 + 1)) % fragments.len()])
+                    .collect::<Vec<_>>();
+                let text = if i % 3 == 0 {
+                    words.concat()
+                } else {
+                    words.join(" ")
+                };
+                crate::transform::article::normalize_article_search_text(&text)
+            })
+            .collect()
+    }
+
+    #[test]
+    fn anchor_matcher_agrees_with_per_anchor_scans_on_a_deep_federated_pool() {
+        let anchors = build_anchor_set(&deep_anchor_filters());
+        let matcher = AnchorMatcher::new(&anchors);
+        for text in deep_anchor_texts(1000, 12) {
+            let expected = anchors
+                .iter()
+                .map(|anchor| per_anchor_matches(&text, anchor))
+                .collect::<Vec<_>>();
+            assert_eq!(matcher.matches(&text), expected, "{text}");
+        }
+        assert!(AnchorMatcher::new(&[]).matches("braf").is_empty());
+    }
+
+    #[test]
+    #[ignore = "timing; run with `cargo test --release -- --ignored --nocapture`"]
+    fn anchor_matcher_outpaces_per_anchor_scans_when_ranking_a_deep_federated_pool() {
+        let filters = deep_anchor_filters();
+        let anchors = build_anchor_set(&filters);
+        let titles = deep_anchor_texts(1000, 12);
+        let abstracts = deep_anchor_texts(1000, 150);
+        let candidates = titles
+            .iter()
+            .zip(&abstracts)
+            .enumerate()
+            .map(|(idx, (title, abstract_text))| {
+                let mut row = row(&idx.to_string(), ArticleSource::PubTator);
+                row.normalized_title = title.clone();
+                row.normalized_abstract = abstract_text.clone();
+                article_candidate_from_row(row)
+            })
+            .collect::<Vec<_>>();
+
+        // The (title, abstract, combined) hit counts ranking derives per row, before and after.
+        let per_anchor = best_of(10, || {
+            titles
+                .iter()
+                .zip(&abstracts)
+                .map(|(title, abstract_text)| {
+                    (
+                        anchors
+                            .iter()
+                            .filter(|anchor| per_anchor_matches(title, anchor))
+                            .count(),
+                        anchors
+                            .iter()
+                            .filter(|anchor| per_anchor_matches(abstract_text, anchor))
+                            .count(),
+                        anchors
+                            .iter()
+                            .filter(|anchor| {
+                                per_anchor_matches(title, anchor)
+                                    || per_anchor_matches(abstract_text, anchor)
+                            })
+                            .count(),
+                    )
+                })
+                .collect::<Vec<_>>()
+        });
+        let automaton = best_of(10, || {
+            let matcher = AnchorMatcher::new(&anchors);
+            titles
+                .iter()
+                .zip(&abstracts)
+                .map(|(title, abstract_text)| {
+                    let in_title = matcher.matches(title);
+                    let in_abstract = matcher.matches(abstract_text);
+                    (
+                        in_title.iter().filter(|hit| **hit).count(),
+                        in_abstract.iter().filter(|hit| **hit).count(),
+                        in_title
+                            .iter()
+                            .zip(&in_abstract)
+                            .filter(|(title, abstract_text)| **title || **abstract_text)
+                            .count(),
+                    )
+                })
+                .collect::<Vec<_>>()
+        });
+        let ranking = best_of(10, || {
+            let mut rows = candidates.clone();
+            rank_articles_by_directness(&mut rows, &filters);
+            rows
+        });
+        eprintln!(
+            "anchor hits over {} rows: automaton {automaton:?}, per-anchor {per_anchor:?} \
+             ({:.1}x); full ranking {ranking:?}",
+            candidates.len(),
+            per_anchor.as_secs_f64() / automaton.as_secs_f64()
+        );
+        assert!(
+            automaton < per_anchor,
+            "automaton {automaton:?} vs per-anchor {per_anchor:?}"
+        );
+    }
+
+    #[test]
+    fn anchor_matcher_never_matches_an_empty_anchor() {
+        let anchors = vec![String::new(), "braf".to_string()];
+        let matcher = AnchorMatcher::new(&anchors);
+        assert_eq!(matcher.matches("braf v600e"), vec![false, true]);
+        assert_eq!(matcher.matches("melanoma"), vec![false, false]);
+        assert_eq!(matcher.matches(""), vec![false, false]);
+        assert_eq!(
+            AnchorMatcher::new(&[String::new()]).matches("braf"),
+            vec![false]
+        );
+
+        // A gene given only as markup normalizes to nothing.
+        let filters = ArticleSearchFilters {
+            gene: Some("<i></i>".into()),
+            keyword: Some("braf".into()),
+            ..empty_filters()
+        };
+        let anchors = build_anchor_set(&filters);
+        let expected = anchors
+            .iter()
+            .map(|anchor| !anchor.is_empty())
+            .collect::<Vec<_>>();
+        assert_eq!(AnchorMatcher::new(&anchors).matches("braf"), expected);
+    }
+
+    /// The pairwise merge `merge_article_candidates` replaced.
+    fn pairwise_merge(results: Vec<ArticleSearchResult>) -> Vec<ArticleCandidate> {
+        let overlaps = |left: &ArticleSearchResult, right: &ArticleSearchResult| {
+            article_row_identifiers(left)
+                .any(|identifier| article_row_identifiers(right).any(|other| other == identifier))
+        };
+        let mut merged: Vec<ArticleCandidate> = Vec::new();
+        for row in results {
+            let row = article_candidate_from_row(row);
+            let matches = merged
+                .iter()
+                .enumerate()
+                .filter_map(|(idx, existing)| overlaps(&existing.row, &row.row).then_some(idx))
+                .collect::<Vec<_>>();
+            let Some(&keep_idx) = matches.first() else {
+                merged.push(row);
+                continue;
+            };
+            merge_article_candidate(&mut merged[keep_idx], row);
+            for idx in matches.into_iter().skip(1).rev() {
+                let duplicate = merged.remove(idx);
+                merge_article_candidate(&mut merged[keep_idx], duplicate);
+            }
+        }
+        merged
+    }
+
+    /// Four legs of overlapping pages, with rows that lack a PMID, link through PMCIDs or DOIs
+    /// only, or carry a DOI that disagrees with the one already merged.
+    fn deep_federated_pool() -> Vec<ArticleSearchResult> {
+        let sources = [
+            ArticleSource::PubTator,
+            ArticleSource::EuropePmc,
+            ArticleSource::PubMed,
+            ArticleSource::SemanticScholar,
+        ];
+        let mut state = 0x2545_f491_u64;
+        (0..1250)
+            .map(|idx| {
+                state = state
+                    .wrapping_mul(6_364_136_223_846_793_005)
+                    .wrapping_add(1_442_695_040_888_963_407);
+                let article = (state >> 33) % 400;
+                let shape = (state >> 20) % 5;
+                let mut row = row(&article.to_string(), sources[idx % sources.len()]);
+                row.source_local_position = idx / sources.len();
+                if shape == 0 {
+                    row.pmid.clear();
+                }
+                if shape <= 2 {
+                    row.pmcid = Some(format!("PMC{}", article + shape));
+                }
+                if shape >= 2 {
+                    row.doi = Some(format!("10.1000/{}-{}", article, shape % 2));
+                }
+                row
+            })
+            .collect()
+    }
+
+    /// Best wall-clock time of `runs` calls to `work`.
+    fn best_of<T>(runs: usize, mut work: impl FnMut() -> T) -> std::time::Duration {
+        (0..runs)
+            .map(|_| {
+                let start = std::time::Instant::now();
+                std::hint::black_box(work());
+                start.elapsed()
+            })
+            .min()
+            .expect("at least one run")
+    }
+
+    #[test]
+    fn merge_article_candidates_matches_pairwise_merge_on_a_deep_federated_pool() {
+        let rows = deep_federated_pool();
+        let snapshot = |candidates: Vec<ArticleCandidate>| {
+            candidates
+                .into_iter()
+                .map(|candidate| {
+                    (
+                        serde_json::to_value(&candidate.row).expect("row should serialize"),
+                        candidate.source_positions,
+                    )
+                })
+                .collect::<Vec<_>>()
+        };
+        let indexed = snapshot(merge_article_candidates(rows.clone()));
+        assert!(indexed.len() < rows.len());
+        assert_eq!(indexed, snapshot(pairwise_merge(rows)));
+    }
+
+    #[test]
+    #[ignore = "timing; run with `cargo test --release -- --ignored --nocapture`"]
+    fn merge_article_candidates_outpaces_pairwise_merge_on_a_deep_federated_pool() {
+        let rows = deep_federated_pool();
+        let indexed = best_of(20, || merge_article_candidates(rows.clone()));
+        let pairwise = best_of(20, || pairwise_merge(rows.clone()));
+        eprintln!(
+            "merge over {} rows: indexed {indexed:?}, pairwise {pairwise:?} ({:.1}x)",
+            rows.len(),
+            pairwise.as_secs_f64() / indexed.as_secs_f64()
+        );
+        assert!(
+            indexed < pairwise,
+            "indexed {indexed:?} vs pairwise {pairwise:?}"
+        );
+    }
+
     #[test]
     fn merge_article_candidates_keeps_min_source_local_position() {
         let mut europe = row("100", ArticleSource::EuropePmc);
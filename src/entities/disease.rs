@@ -1,14 +1,16 @@
 use std::collections::{HashMap, HashSet};
+use std::future::Future;
 use std::time::Duration;
 
 use futures::future::join_all;
 use serde::{Deserialize, Serialize};
-use tracing::warn;
+use tracing::{Instrument, warn};
 
 use crate::entities::SearchPage;
 use crate::entities::drug::{self, DrugSearchFilters};
 use crate::entities::trial::{self, TrialSearchFilters, TrialSource};
 use crate::error::BioMcpError;
+use crate::profiling::section_span;
 use crate::sources::civic::{CivicClient, CivicContext};
 use crate::sources::disgenet::{DisgenetAssociationRecord, DisgenetClient};
 use crate::sources::hpo::HpoClient;
@@ -1865,10 +1867,9 @@ async fn add_prevalence_section(disease: &mut Disease) -> Result<(), BioMcpError
     Ok(())
 }
 
-async fn add_civic_section(disease: &mut Disease) {
+async fn fetch_civic_section(disease: &Disease) -> CivicContext {
     let Some(query) = disease_query_value(disease) else {
-        disease.civic = Some(CivicContext::default());
-        return;
+        return CivicContext::default();
     };
 
     let civic_fut = async {
@@ -1877,10 +1878,10 @@ async fn add_civic_section(disease: &mut Disease) {
     };
 
     match tokio::time::timeout(OPTIONAL_ENRICHMENT_TIMEOUT, civic_fut).await {
-        Ok(Ok(context)) => disease.civic = Some(context),
+        Ok(Ok(context)) => context,
         Ok(Err(err)) => {
             warn!(query = %query, "CIViC unavailable for disease section: {err}");
-            disease.civic = Some(CivicContext::default());
+            CivicContext::default()
         }
         Err(_) => {
             warn!(
@@ -1888,7 +1889,7 @@ async fn add_civic_section(disease: &mut Disease) {
                 timeout_secs = OPTIONAL_ENRICHMENT_TIMEOUT.as_secs(),
                 "CIViC disease section timed out"
             );
-            disease.civic = Some(CivicContext::default());
+            CivicContext::default()
         }
     }
 }
@@ -1905,16 +1906,48 @@ fn map_disgenet_disease_association(row: DisgenetAssociationRecord) -> DiseaseDi
     }
 }
 
-async fn add_disgenet_section(disease: &mut Disease) -> Result<(), BioMcpError> {
-    let client = DisgenetClient::new()?;
-    let associations = client
-        .fetch_disease_associations(disease, 10)
-        .await?
-        .into_iter()
-        .map(map_disgenet_disease_association)
-        .collect();
-    disease.disgenet = Some(DiseaseDisgenet { associations });
-    Ok(())
+/// Drops the section on a timeout or a DisGeNET outage. Any other error, such as a missing API
+/// key or an unexpected response, needs the user's attention and propagates.
+async fn fetch_disgenet_section(disease: &Disease) -> Result<Option<DiseaseDisgenet>, BioMcpError> {
+    let disgenet_fut = async {
+        let client = DisgenetClient::new()?;
+        client.fetch_disease_associations(disease, 10).await
+    };
+
+    match tokio::time::timeout(OPTIONAL_ENRICHMENT_TIMEOUT, disgenet_fut).await {
+        Ok(Ok(rows)) => Ok(Some(DiseaseDisgenet {
+            associations: rows
+                .into_iter()
+                .map(map_disgenet_disease_association)
+                .collect(),
+        })),
+        Ok(Err(err @ BioMcpError::SourceUnavailable { .. })) => {
+            warn!(disease = %disease.id, "DisGeNET unavailable for disease section: {err}");
+            Ok(None)
+        }
+        Ok(Err(err)) => Err(err),
+        Err(_) => {
+            warn!(
+                disease = %disease.id,
+                timeout_secs = OPTIONAL_ENRICHMENT_TIMEOUT.as_secs(),
+                "DisGeNET disease section timed out"
+            );
+            Ok(None)
+        }
+    }
+}
+
+/// Bounds one section step by `OPTIONAL_ENRICHMENT_TIMEOUT` and reports a timeout as an API error.
+async fn with_section_deadline<F, T>(api: &str, fut: F) -> Result<T, BioMcpError>
+where
+    F: Future<Output = Result<T, BioMcpError>>,
+{
+    tokio::time::timeout(OPTIONAL_ENRICHMENT_TIMEOUT, fut)
+        .await
+        .map_err(|_| BioMcpError::Api {
+            api: api.to_string(),
+            message: format!("timed out after {}s", OPTIONAL_ENRICHMENT_TIMEOUT.as_secs()),
+        })?
 }
 
 async fn enrich_base_context(disease: &mut Disease) {
@@ -1946,53 +1979,166 @@ async fn apply_requested_sections(
     disease: &mut Disease,
     sections: DiseaseSections,
 ) -> Result<(), BioMcpError> {
-    if sections.include_genes {
-        if let Err(err) = add_monarch_gene_section(disease).await {
+    // Sections only read the base record and each one owns a disjoint set of fields, so every
+    // requested section runs concurrently against its own working copy. The only real ordering
+    // constraints live inside a section (gene augmentation after the Monarch gene list, HPO
+    // labels after Monarch phenotypes), between genes and pathways (Reactome is queried for the
+    // augmented gene list), or after the merge (`attach_opentargets_scores`).
+    let base = disease.clone();
+
+    let genes_fut = async {
+        if !sections.include_genes {
+            return None;
+        }
+        let mut working = base.clone();
+        if let Err(err) =
+            with_section_deadline("monarch", add_monarch_gene_section(&mut working)).await
+        {
             warn!("Monarch unavailable for disease genes section: {err}");
         }
-        if let Err(err) = augment_genes_with_civic(disease).await {
+        if let Err(err) =
+            with_section_deadline("civic", augment_genes_with_civic(&mut working)).await
+        {
             warn!("CIViC unavailable for disease gene augmentation: {err}");
         }
-        if let Err(err) = augment_genes_with_opentargets(disease).await {
+        if let Err(err) = augment_genes_with_opentargets(&mut working).await {
             warn!("OpenTargets unavailable for disease gene augmentation: {err}");
         }
-        attach_opentargets_scores(disease);
-    }
-    if sections.include_pathways
-        && let Err(err) = add_pathways_section(disease).await
-    {
-        warn!("Reactome unavailable for disease pathways section: {err}");
-    }
-    if sections.include_phenotypes {
-        if let Err(err) = add_monarch_phenotypes(disease).await {
+        Some(working)
+    };
+
+    let genes_then_pathways_fut = async {
+        let genes = genes_fut
+            .instrument(section_span(sections.include_genes, "genes"))
+            .await;
+        let pathways = async {
+            if !sections.include_pathways {
+                return None;
+            }
+            let mut working = genes.clone().unwrap_or_else(|| base.clone());
+            if let Err(err) =
+                with_section_deadline("reactome", add_pathways_section(&mut working)).await
+            {
+                warn!("Reactome unavailable for disease pathways section: {err}");
+            }
+            Some(working)
+        }
+        .instrument(section_span(sections.include_pathways, "pathways"))
+        .await;
+        (genes, pathways)
+    };
+
+    let phenotypes_fut = async {
+        if !sections.include_phenotypes {
+            return None;
+        }
+        let mut working = base.clone();
+        if let Err(err) =
+            with_section_deadline("monarch", add_monarch_phenotypes(&mut working)).await
+        {
             warn!("Monarch unavailable for disease phenotypes section: {err}");
         }
-        if let Err(err) = add_phenotypes_section(disease).await {
+        if let Err(err) = with_section_deadline("hpo", add_phenotypes_section(&mut working)).await {
             warn!("HPO unavailable for disease phenotypes section: {err}");
         }
+        Some(working)
+    };
+
+    let variants_fut = async {
+        if !sections.include_variants {
+            return None;
+        }
+        let mut working = base.clone();
+        if let Err(err) = with_section_deadline("civic", add_civic_variants(&mut working)).await {
+            warn!("CIViC unavailable for disease variants section: {err}");
+        }
+        Some(working)
+    };
+
+    let models_fut = async {
+        if !sections.include_models {
+            return None;
+        }
+        let mut working = base.clone();
+        if let Err(err) = with_section_deadline("monarch", add_monarch_models(&mut working)).await {
+            warn!("Monarch unavailable for disease models section: {err}");
+        }
+        Some(working)
+    };
+
+    let prevalence_fut = async {
+        if !sections.include_prevalence {
+            return None;
+        }
+        let mut working = base.clone();
+        if let Err(err) =
+            with_section_deadline("opentargets", add_prevalence_section(&mut working)).await
+        {
+            warn!("OpenTargets unavailable for disease prevalence section: {err}");
+            working.prevalence.clear();
+            working.prevalence_note = Some("No prevalence data available from OpenTargets.".into());
+        }
+        Some(working)
+    };
+
+    let civic_fut = async {
+        if !sections.include_civic {
+            return None;
+        }
+        Some(fetch_civic_section(&base).await)
+    };
+
+    let disgenet_fut = async {
+        if !sections.include_disgenet {
+            return None;
+        }
+        Some(fetch_disgenet_section(&base).await)
+    };
+
+    let ((genes, pathways), phenotypes, variants, models, prevalence, civic, disgenet) = tokio::join!(
+        genes_then_pathways_fut,
+        phenotypes_fut.instrument(section_span(sections.include_phenotypes, "phenotypes")),
+        variants_fut.instrument(section_span(sections.include_variants, "variants")),
+        models_fut.instrument(section_span(sections.include_models, "models")),
+        prevalence_fut.instrument(section_span(sections.include_prevalence, "prevalence")),
+        civic_fut.instrument(section_span(sections.include_civic, "civic")),
+        disgenet_fut.instrument(section_span(sections.include_disgenet, "disgenet")),
+    );
+
+    if let Some(working) = genes {
+        disease.associated_genes = working.associated_genes;
+        disease.gene_associations = working.gene_associations;
     }
-    if sections.include_variants
-        && let Err(err) = add_civic_variants(disease).await
-    {
-        warn!("CIViC unavailable for disease variants section: {err}");
+    if let Some(working) = pathways {
+        // The pathways section re-resolves OpenTargets genes when the base record had none.
+        if disease.associated_genes.is_empty() {
+            disease.associated_genes = working.associated_genes;
+            disease.top_gene_scores = working.top_gene_scores;
+        }
+        disease.pathways = working.pathways;
     }
-    if sections.include_models
-        && let Err(err) = add_monarch_models(disease).await
-    {
-        warn!("Monarch unavailable for disease models section: {err}");
+    if let Some(working) = phenotypes {
+        disease.phenotypes = working.phenotypes;
     }
-    if sections.include_prevalence
-        && let Err(err) = add_prevalence_section(disease).await
-    {
-        warn!("OpenTargets unavailable for disease prevalence section: {err}");
-        disease.prevalence.clear();
-        disease.prevalence_note = Some("No prevalence data available from OpenTargets.".into());
+    if let Some(working) = variants {
+        disease.variants = working.variants;
+        disease.top_variant = working.top_variant;
     }
-    if sections.include_civic {
-        add_civic_section(disease).await;
+    if let Some(working) = models {
+        disease.models = working.models;
     }
-    if sections.include_disgenet {
-        add_disgenet_section(disease).await?;
+    if let Some(working) = prevalence {
+        disease.prevalence = working.prevalence;
+        disease.prevalence_note = working.prevalence_note;
+    }
+    if let Some(context) = civic {
+        disease.civic = Some(context);
+    }
+    if let Some(result) = disgenet {
+        disease.disgenet = result?;
+    }
+    if sections.include_genes {
+        attach_opentargets_scores(disease);
     }
 
     if !sections.include_genes && !sections.include_pathways {
@@ -3680,4 +3826,63 @@ pub(crate) mod tests {
     async fn get_disease_genes_uses_ols4_label_fallback_for_sparse_mondo_identity() {
         proof_get_disease_genes_uses_ols4_label_fallback_for_sparse_mondo_identity().await;
     }
+
+    #[tokio::test]
+    async fn disgenet_section_drops_only_on_outage() {
+        let _guard = lock_env().await;
+        let server = MockServer::start().await;
+        let _base = set_env_var("BIOMCP_DISGENET_BASE", Some(&server.uri()));
+        let _key = set_env_var("DISGENET_API_KEY", Some("test-key"));
+
+        Mock::given(method("GET"))
+            .and(path("/api/v1/gda/summary"))
+            .and(query_param("disease", "UMLS_C0678222"))
+            .respond_with(ResponseTemplate::new(403).set_body_json(serde_json::json!({
+                "status": "ERROR",
+                "message": "plan does not cover this endpoint"
+            })))
+            .expect(1)
+            .mount(&server)
+            .await;
+
+        // An unresolvable disease is reported as SourceUnavailable and only drops the section.
+        let unnamed = test_disease("MONDO:0000001", "");
+        assert!(
+            fetch_disgenet_section(&unnamed)
+                .await
+                .expect("outage drops the section")
+                .is_none()
+        );
+
+        let mut disease = test_disease("MONDO:0003864", "breast cancer");
+        disease
+            .xrefs
+            .insert("umls_cui".to_string(), "C0678222".to_string());
+        let err = fetch_disgenet_section(&disease)
+            .await
+            .expect_err("a rejected request should propagate");
+        assert!(err.to_string().contains("403"), "{err}");
+
+        let _key = set_env_var("DISGENET_API_KEY", None);
+        let err = fetch_disgenet_section(&disease)
+            .await
+            .expect_err("a missing API key should propagate");
+        assert!(matches!(err, BioMcpError::ApiKeyRequired { .. }));
+    }
+
+    #[tokio::test]
+    async fn with_section_deadline_passes_through_section_result() {
+        let ok = with_section_deadline("monarch", async { Ok::<_, BioMcpError>(3) }).await;
+        assert_eq!(ok.expect("section should succeed"), 3);
+
+        let err = with_section_deadline("civic", async {
+            Err::<(), _>(BioMcpError::Api {
+                api: "civic".into(),
+                message: "HTTP 502".into(),
+            })
+        })
+        .await
+        .expect_err("section error should propagate");
+        assert!(err.to_string().contains("HTTP 502"));
+    }
 }
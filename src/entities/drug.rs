@@ -4,10 +4,11 @@ use std::time::Duration;
 
 use regex::Regex;
 use serde::{Deserialize, Serialize};
-use tracing::warn;
+use tracing::{Instrument, warn};
 
 use crate::entities::SearchPage;
 use crate::error::BioMcpError;
+use crate::profiling::profile_span;
 use crate::sources::chembl::ChemblClient;
 use crate::sources::civic::{CivicClient, CivicContext};
 use crate::sources::ema::{EmaClient, EmaDrugIdentity, EmaSyncMode};
@@ -2210,8 +2211,11 @@ async fn resolve_drug_base(
         }
     }
 
-    let selected = transform::drug::select_hits_for_name(&resp.hits, &lookup_name);
-    let mut drug = transform::drug::merge_mychem_hits(&selected, &lookup_name);
+    let mut drug = {
+        let _span = profile_span!("transform", step = "drug::merge_mychem_hits");
+        let selected = transform::drug::select_hits_for_name(&resp.hits, &lookup_name);
+        transform::drug::merge_mychem_hits(&selected, &lookup_name)
+    };
 
     let mut label_response_opt: Option<serde_json::Value> = None;
     if fetch_label_response {
@@ -2448,18 +2452,23 @@ pub async fn get_with_region(
         || section_flags.include_interactions
         || (region.includes_us() && section_flags.include_safety);
 
-    let mut resolved =
-        resolve_drug_base(name, fetch_label_response, section_flags.include_label).await?;
+    // Stages run in order; each gets a `section` span so `--profile-out` shows the sequence.
+    let mut resolved = resolve_drug_base(name, fetch_label_response, section_flags.include_label)
+        .instrument(profile_span!("section", section = "base"))
+        .await?;
     populate_common_sections(
         &mut resolved.drug,
         resolved.label_response.as_ref(),
         &section_flags,
         raw_label,
     )
+    .instrument(profile_span!("section", section = "common"))
     .await;
 
     if region.includes_us() && (!section_only || section_flags.include_safety) {
-        populate_top_adverse_event_preview(&mut resolved.drug).await;
+        populate_top_adverse_event_preview(&mut resolved.drug)
+            .instrument(profile_span!("section", section = "adverse_events"))
+            .await;
     } else {
         resolved.drug.top_adverse_events.clear();
         resolved.drug.faers_query = None;
@@ -2471,6 +2480,7 @@ pub async fn get_with_region(
             resolved.label_response.as_ref(),
             &section_flags,
         )
+        .instrument(profile_span!("section", section = "us_regional"))
         .await?;
     } else {
         resolved.drug.shortage = None;
@@ -2479,7 +2489,9 @@ pub async fn get_with_region(
     }
 
     if region.includes_eu() {
-        populate_ema_sections(&mut resolved.drug, name, &section_flags).await?;
+        populate_ema_sections(&mut resolved.drug, name, &section_flags)
+            .instrument(profile_span!("section", section = "ema"))
+            .await?;
     } else {
         resolved.drug.ema_regulatory = None;
         resolved.drug.ema_safety = None;
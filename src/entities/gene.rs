@@ -5,7 +5,7 @@ use futures::future::try_join_all;
 use serde::{Deserialize, Serialize};
 use tracing::warn;
 
-use crate::entities::SearchPage;
+use crate::entities::{SearchPage, scheduled_section};
 use crate::error::BioMcpError;
 use crate::sources::civic::{CivicClient, CivicContext};
 use crate::sources::clingen::{ClinGenClient, GeneClinGen};
@@ -20,7 +20,9 @@ use crate::sources::gnomad::{
 use crate::sources::gtex::{GeneExpression, GtexClient};
 use crate::sources::hpa::{GeneHpa, HpaClient};
 use crate::sources::mygene::MyGeneClient;
-use crate::sources::opentargets::{OpenTargetsClient, OpenTargetsTargetDruggabilityContext};
+use crate::sources::opentargets::{
+    OpenTargetsClient, OpenTargetsTargetClinicalContext, OpenTargetsTargetDruggabilityContext,
+};
 use crate::sources::quickgo::QuickGoClient;
 use crate::sources::reactome::ReactomeClient;
 use crate::sources::string::StringClient;
@@ -210,6 +212,7 @@ const GENE_SECTION_CLINGEN: &str = "clingen";
 const GENE_SECTION_CONSTRAINT: &str = "constraint";
 const GENE_SECTION_DISGENET: &str = "disgenet";
 const GENE_SECTION_ALL: &str = "all";
+const GENE_SECTION_CLINICAL_CONTEXT: &str = "clinical_context";
 
 pub const GENE_SECTION_NAMES: &[&str] = &[
     GENE_SECTION_PATHWAYS,
@@ -790,57 +793,51 @@ fn merge_pathways(
     (!out.is_empty()).then_some(out)
 }
 
-async fn add_clinical_context(gene: &mut Gene) -> Result<(), BioMcpError> {
-    let symbol = gene.symbol.trim();
+async fn fetch_clinical_context(
+    symbol: &str,
+) -> Result<Option<OpenTargetsTargetClinicalContext>, BioMcpError> {
+    let symbol = symbol.trim();
     if symbol.is_empty() {
-        return Ok(());
+        return Ok(None);
     }
 
     let context = OpenTargetsClient::new()?
         .target_clinical_context(symbol, 5)
         .await?;
-    gene.clinical_diseases = context.diseases;
-    gene.clinical_drugs = context.drugs;
-    Ok(())
+    Ok(Some(context))
 }
 
-async fn add_civic_section(gene: &mut Gene) {
-    let symbol = gene.symbol.trim();
-    if symbol.is_empty() {
-        return;
+async fn fetch_civic_section(symbol: &str) -> CivicContext {
+    let trimmed = symbol.trim();
+    if trimmed.is_empty() {
+        return CivicContext::default();
     }
 
     let civic_fut = async {
         let client = CivicClient::new()?;
-        client.by_molecular_profile(symbol, 10).await
+        client.by_molecular_profile(trimmed, 10).await
     };
 
     match tokio::time::timeout(OPTIONAL_ENRICHMENT_TIMEOUT, civic_fut).await {
-        Ok(Ok(context)) => gene.civic = Some(context),
+        Ok(Ok(context)) => context,
         Ok(Err(err)) => {
-            warn!(symbol = %gene.symbol, "CIViC unavailable for gene section: {err}");
-            gene.civic = Some(CivicContext::default());
+            warn!(symbol = %symbol, "CIViC unavailable for gene section: {err}");
+            CivicContext::default()
         }
         Err(_) => {
             warn!(
-                symbol = %gene.symbol,
+                symbol = %symbol,
                 timeout_secs = OPTIONAL_ENRICHMENT_TIMEOUT.as_secs(),
                 "CIViC gene section timed out"
             );
-            gene.civic = Some(CivicContext::default());
+            CivicContext::default()
         }
     }
 }
 
-async fn add_expression_section(gene: &mut Gene) {
-    let Some(ensembl_id) = gene
-        .ensembl_id
-        .as_deref()
-        .map(str::trim)
-        .filter(|v| !v.is_empty())
-    else {
-        gene.expression = Some(GeneExpression::default());
-        return;
+async fn fetch_expression_section(symbol: &str, ensembl_id: Option<&str>) -> GeneExpression {
+    let Some(ensembl_id) = ensembl_id.map(str::trim).filter(|v| !v.is_empty()) else {
+        return GeneExpression::default();
     };
 
     let expression_fut = async {
@@ -850,36 +847,30 @@ async fn add_expression_section(gene: &mut Gene) {
     };
 
     match tokio::time::timeout(OPTIONAL_ENRICHMENT_TIMEOUT, expression_fut).await {
-        Ok(Ok(expression)) => gene.expression = Some(expression),
+        Ok(Ok(expression)) => expression,
         Ok(Err(err)) => {
             warn!(
-                symbol = %gene.symbol,
+                symbol = %symbol,
                 ensembl_id = %ensembl_id,
                 "GTEx unavailable for gene expression section: {err}"
             );
-            gene.expression = Some(GeneExpression::default());
+            GeneExpression::default()
         }
         Err(_) => {
             warn!(
-                symbol = %gene.symbol,
+                symbol = %symbol,
                 ensembl_id = %ensembl_id,
                 timeout_secs = OPTIONAL_ENRICHMENT_TIMEOUT.as_secs(),
                 "GTEx expression section timed out"
             );
-            gene.expression = Some(GeneExpression::default());
+            GeneExpression::default()
         }
     }
 }
 
-async fn add_hpa_section(gene: &mut Gene) {
-    let Some(ensembl_id) = gene
-        .ensembl_id
-        .as_deref()
-        .map(str::trim)
-        .filter(|v| !v.is_empty())
-    else {
-        gene.hpa = Some(GeneHpa::default());
-        return;
+async fn fetch_hpa_section(symbol: &str, ensembl_id: Option<&str>) -> GeneHpa {
+    let Some(ensembl_id) = ensembl_id.map(str::trim).filter(|v| !v.is_empty()) else {
+        return GeneHpa::default();
     };
 
     let hpa_fut = async {
@@ -888,41 +879,40 @@ async fn add_hpa_section(gene: &mut Gene) {
     };
 
     match tokio::time::timeout(OPTIONAL_ENRICHMENT_TIMEOUT, hpa_fut).await {
-        Ok(Ok(hpa)) => gene.hpa = Some(hpa),
+        Ok(Ok(hpa)) => hpa,
         Ok(Err(err)) => {
             warn!(
-                symbol = %gene.symbol,
+                symbol = %symbol,
                 ensembl_id = %ensembl_id,
                 "HPA unavailable for gene section: {err}"
             );
-            gene.hpa = Some(GeneHpa::default());
+            GeneHpa::default()
         }
         Err(_) => {
             warn!(
-                symbol = %gene.symbol,
+                symbol = %symbol,
                 ensembl_id = %ensembl_id,
                 timeout_secs = OPTIONAL_ENRICHMENT_TIMEOUT.as_secs(),
                 "HPA gene section timed out"
             );
-            gene.hpa = Some(GeneHpa::default());
+            GeneHpa::default()
         }
     }
 }
 
-async fn add_druggability_section(gene: &mut Gene) {
-    let symbol = gene.symbol.trim();
-    if symbol.is_empty() {
-        gene.druggability = Some(GeneDruggability::default());
-        return;
+async fn fetch_druggability_section(symbol: &str) -> GeneDruggability {
+    let trimmed = symbol.trim();
+    if trimmed.is_empty() {
+        return GeneDruggability::default();
     }
 
     let dgidb_fut = tokio::time::timeout(OPTIONAL_ENRICHMENT_TIMEOUT, async {
         let client = DgidbClient::new()?;
-        client.gene_interactions(symbol).await
+        client.gene_interactions(trimmed).await
     });
     let opentargets_fut = tokio::time::timeout(OPTIONAL_ENRICHMENT_TIMEOUT, async {
         let client = OpenTargetsClient::new()?;
-        client.target_druggability_context(symbol).await
+        client.target_druggability_context(trimmed).await
     });
 
     let (dgidb_result, opentargets_result) = tokio::join!(dgidb_fut, opentargets_fut);
@@ -931,14 +921,14 @@ async fn add_druggability_section(gene: &mut Gene) {
         Ok(Ok(druggability)) => Ok(druggability),
         Ok(Err(err)) => {
             warn!(
-                symbol = %gene.symbol,
+                symbol = %symbol,
                 "DGIdb unavailable for gene druggability section: {err}"
             );
             Err(err)
         }
         Err(_) => {
             warn!(
-                symbol = %gene.symbol,
+                symbol = %symbol,
                 timeout_secs = OPTIONAL_ENRICHMENT_TIMEOUT.as_secs(),
                 "DGIdb gene section timed out"
             );
@@ -953,14 +943,14 @@ async fn add_druggability_section(gene: &mut Gene) {
         Ok(Ok(context)) => Ok(context),
         Ok(Err(err)) => {
             warn!(
-                symbol = %gene.symbol,
+                symbol = %symbol,
                 "OpenTargets unavailable for gene druggability section: {err}"
             );
             Err(err)
         }
         Err(_) => {
             warn!(
-                symbol = %gene.symbol,
+                symbol = %symbol,
                 timeout_secs = OPTIONAL_ENRICHMENT_TIMEOUT.as_secs(),
                 "OpenTargets gene druggability section timed out"
             );
@@ -971,7 +961,7 @@ async fn add_druggability_section(gene: &mut Gene) {
         }
     };
 
-    gene.druggability = Some(merge_druggability_results(dgidb_result, opentargets_result));
+    merge_druggability_results(dgidb_result, opentargets_result)
 }
 
 fn merge_druggability_results(
@@ -1010,17 +1000,16 @@ fn merge_druggability_results(
     merged
 }
 
-async fn add_clingen_section(gene: &mut Gene) {
-    let symbol = gene.symbol.trim();
-    if symbol.is_empty() {
-        gene.clingen = Some(GeneClinGen::default());
-        return;
+async fn fetch_clingen_section(symbol: &str) -> GeneClinGen {
+    let trimmed = symbol.trim();
+    if trimmed.is_empty() {
+        return GeneClinGen::default();
     }
 
     let clingen_fut = async {
         let client = ClinGenClient::new()?;
-        let validity = client.gene_validity(symbol).await?;
-        let (haploinsufficiency, triplosensitivity) = client.dosage_sensitivity(symbol).await?;
+        let validity = client.gene_validity(trimmed).await?;
+        let (haploinsufficiency, triplosensitivity) = client.dosage_sensitivity(trimmed).await?;
         Ok::<_, BioMcpError>(GeneClinGen {
             validity,
             haploinsufficiency,
@@ -1029,21 +1018,21 @@ async fn add_clingen_section(gene: &mut Gene) {
     };
 
     match tokio::time::timeout(OPTIONAL_ENRICHMENT_TIMEOUT, clingen_fut).await {
-        Ok(Ok(clingen)) => gene.clingen = Some(clingen),
+        Ok(Ok(clingen)) => clingen,
         Ok(Err(err)) => {
             warn!(
-                symbol = %gene.symbol,
+                symbol = %symbol,
                 "ClinGen unavailable for gene clingen section: {err}"
             );
-            gene.clingen = Some(GeneClinGen::default());
+            GeneClinGen::default()
         }
         Err(_) => {
             warn!(
-                symbol = %gene.symbol,
+                symbol = %symbol,
                 timeout_secs = OPTIONAL_ENRICHMENT_TIMEOUT.as_secs(),
                 "ClinGen gene section timed out"
             );
-            gene.clingen = Some(GeneClinGen::default());
+            GeneClinGen::default()
         }
     }
 }
@@ -1067,45 +1056,40 @@ fn gnomad_constraint_section(
     }
 }
 
-async fn add_constraint_section(gene: &mut Gene) {
-    let symbol = gene.symbol.trim();
-    if symbol.is_empty() {
-        gene.constraint = Some(gnomad_constraint_section(None, None, None, None, None));
-        return;
+async fn fetch_constraint_section(symbol: &str) -> GeneConstraint {
+    let trimmed = symbol.trim();
+    if trimmed.is_empty() {
+        return gnomad_constraint_section(None, None, None, None, None);
     }
 
     let constraint_fut = async {
         let client = GnomadClient::new()?;
-        client.gene_constraint(symbol).await
+        client.gene_constraint(trimmed).await
     };
 
     match tokio::time::timeout(OPTIONAL_ENRICHMENT_TIMEOUT, constraint_fut).await {
-        Ok(Ok(Some(constraint))) => {
-            gene.constraint = Some(gnomad_constraint_section(
-                constraint.transcript,
-                constraint.pli,
-                constraint.loeuf,
-                constraint.mis_z,
-                constraint.syn_z,
-            ));
-        }
-        Ok(Ok(None)) => {
-            gene.constraint = Some(gnomad_constraint_section(None, None, None, None, None));
-        }
+        Ok(Ok(Some(constraint))) => gnomad_constraint_section(
+            constraint.transcript,
+            constraint.pli,
+            constraint.loeuf,
+            constraint.mis_z,
+            constraint.syn_z,
+        ),
+        Ok(Ok(None)) => gnomad_constraint_section(None, None, None, None, None),
         Ok(Err(err)) => {
             warn!(
-                symbol = %gene.symbol,
+                symbol = %symbol,
                 "gnomAD unavailable for gene constraint section: {err}"
             );
-            gene.constraint = Some(gnomad_constraint_section(None, None, None, None, None));
+            gnomad_constraint_section(None, None, None, None, None)
         }
         Err(_) => {
             warn!(
-                symbol = %gene.symbol,
+                symbol = %symbol,
                 timeout_secs = OPTIONAL_ENRICHMENT_TIMEOUT.as_secs(),
                 "gnomAD gene constraint section timed out"
             );
-            gene.constraint = Some(gnomad_constraint_section(None, None, None, None, None));
+            gnomad_constraint_section(None, None, None, None, None)
         }
     }
 }
@@ -1122,16 +1106,35 @@ fn map_disgenet_gene_association(row: DisgenetAssociationRecord) -> GeneDisgenet
     }
 }
 
-async fn add_disgenet_section(gene: &mut Gene) -> Result<(), BioMcpError> {
-    let client = DisgenetClient::new()?;
-    let associations = client
-        .fetch_gene_associations(gene, 10)
-        .await?
-        .into_iter()
-        .map(map_disgenet_gene_association)
-        .collect();
-    gene.disgenet = Some(GeneDisgenet { associations });
-    Ok(())
+/// Drops the section on a timeout or a DisGeNET outage. Any other error, such as a missing API
+/// key or an unexpected response, needs the user's attention and propagates.
+async fn fetch_disgenet_section(gene: &Gene) -> Result<Option<GeneDisgenet>, BioMcpError> {
+    let disgenet_fut = async {
+        let client = DisgenetClient::new()?;
+        client.fetch_gene_associations(gene, 10).await
+    };
+
+    match tokio::time::timeout(OPTIONAL_ENRICHMENT_TIMEOUT, disgenet_fut).await {
+        Ok(Ok(rows)) => Ok(Some(GeneDisgenet {
+            associations: rows
+                .into_iter()
+                .map(map_disgenet_gene_association)
+                .collect(),
+        })),
+        Ok(Err(err @ BioMcpError::SourceUnavailable { .. })) => {
+            warn!(symbol = %gene.symbol, "DisGeNET unavailable for gene section: {err}");
+            Ok(None)
+        }
+        Ok(Err(err)) => Err(err),
+        Err(_) => {
+            warn!(
+                symbol = %gene.symbol,
+                timeout_secs = OPTIONAL_ENRICHMENT_TIMEOUT.as_secs(),
+                "DisGeNET gene section timed out"
+            );
+            Ok(None)
+        }
+    }
 }
 
 pub async fn get(symbol: &str, sections: &[String]) -> Result<Gene, BioMcpError> {
@@ -1146,38 +1149,136 @@ pub async fn get(symbol: &str, sections: &[String]) -> Result<Gene, BioMcpError>
     let client = MyGeneClient::new()?;
     let resp = client.get(symbol, false).await?;
 
-    let mut gene = transform::gene::from_mygene_get(resp);
-
-    if let Err(err) = add_clinical_context(&mut gene).await {
-        warn!("OpenTargets unavailable for gene clinical context: {err}");
-    }
-
-    if include.contains(&GeneIncludeType::Pathways) {
-        gene.pathways = match fetch_pathways_section(&gene.symbol).await {
-            Ok(v) => merge_pathways(gene.pathways.take(), v),
-            Err(err) => {
-                warn!("Reactome unavailable for gene pathways section: {err}");
-                gene.pathways
-            }
-        };
-    } else {
-        gene.pathways = None;
-    }
+    let mut gene = {
+        let _span = crate::profiling::profile_span!("transform", step = "gene::from_mygene_get");
+        transform::gene::from_mygene_get(resp)
+    };
 
+    // Every section depends only on the MyGene base record (symbol, Ensembl ID, UniProt
+    // accession), so all requested sections are scheduled against one snapshot of it and run
+    // concurrently. Results are applied below in the original section order.
+    let base = gene.clone();
+    let wants = |kind: GeneIncludeType| include.contains(&kind);
     let enrichr_sections: Vec<GeneIncludeType> = include
         .iter()
         .copied()
         .filter(|v| matches!(v, GeneIncludeType::Ontology | GeneIncludeType::Diseases))
         .collect();
 
-    if !enrichr_sections.is_empty() {
-        let (ontology, diseases) = enrich_gene(&gene.symbol, &enrichr_sections).await?;
+    let (
+        clinical,
+        pathways,
+        enrichment,
+        protein,
+        go,
+        interactions,
+        civic,
+        expression,
+        hpa,
+        druggability,
+        clingen,
+        constraint,
+        disgenet,
+    ) = tokio::join!(
+        scheduled_section(
+            true,
+            GENE_SECTION_CLINICAL_CONTEXT,
+            fetch_clinical_context(&base.symbol),
+        ),
+        scheduled_section(
+            wants(GeneIncludeType::Pathways),
+            GENE_SECTION_PATHWAYS,
+            fetch_pathways_section(&base.symbol),
+        ),
+        scheduled_section(
+            !enrichr_sections.is_empty(),
+            "enrichr",
+            enrich_gene(&base.symbol, &enrichr_sections),
+        ),
+        scheduled_section(
+            wants(GeneIncludeType::Protein),
+            GENE_SECTION_PROTEIN,
+            fetch_protein_section(base.uniprot_id.as_deref(), &base.symbol),
+        ),
+        scheduled_section(
+            wants(GeneIncludeType::Go),
+            GENE_SECTION_GO,
+            fetch_go_section(base.uniprot_id.as_deref(), &base.symbol),
+        ),
+        scheduled_section(
+            wants(GeneIncludeType::Interactions),
+            GENE_SECTION_INTERACTIONS,
+            fetch_interactions_section(&base.symbol),
+        ),
+        scheduled_section(
+            wants(GeneIncludeType::Civic),
+            GENE_SECTION_CIVIC,
+            fetch_civic_section(&base.symbol),
+        ),
+        scheduled_section(
+            wants(GeneIncludeType::Expression),
+            GENE_SECTION_EXPRESSION,
+            fetch_expression_section(&base.symbol, base.ensembl_id.as_deref()),
+        ),
+        scheduled_section(
+            wants(GeneIncludeType::Hpa),
+            GENE_SECTION_HPA,
+            fetch_hpa_section(&base.symbol, base.ensembl_id.as_deref()),
+        ),
+        scheduled_section(
+            wants(GeneIncludeType::Druggability),
+            GENE_SECTION_DRUGGABILITY,
+            fetch_druggability_section(&base.symbol),
+        ),
+        scheduled_section(
+            wants(GeneIncludeType::ClinGen),
+            GENE_SECTION_CLINGEN,
+            fetch_clingen_section(&base.symbol),
+        ),
+        scheduled_section(
+            wants(GeneIncludeType::Constraint),
+            GENE_SECTION_CONSTRAINT,
+            fetch_constraint_section(&base.symbol),
+        ),
+        scheduled_section(
+            wants(GeneIncludeType::Disgenet),
+            GENE_SECTION_DISGENET,
+            fetch_disgenet_section(&base),
+        ),
+    );
+
+    if let Some(result) = clinical {
+        match result {
+            Ok(Some(context)) => {
+                gene.clinical_diseases = context.diseases;
+                gene.clinical_drugs = context.drugs;
+            }
+            Ok(None) => {}
+            Err(err) => warn!("OpenTargets unavailable for gene clinical context: {err}"),
+        }
+    }
+
+    match pathways {
+        Some(result) => {
+            gene.pathways = match result {
+                Ok(v) => merge_pathways(gene.pathways.take(), v),
+                Err(err) => {
+                    warn!("Reactome unavailable for gene pathways section: {err}");
+                    gene.pathways
+                }
+            };
+        }
+        None => gene.pathways = None,
+    }
+
+    if let Some(result) = enrichment {
+        let (ontology, diseases) = result?;
         gene.ontology = ontology;
         gene.diseases = diseases;
     }
 
-    if include.contains(&GeneIncludeType::Protein) {
-        gene.protein = match fetch_protein_section(gene.uniprot_id.as_deref(), &gene.symbol).await {
+    if let Some(result) = protein {
+        gene.protein = match result {
             Ok(v) => v,
             Err(err) => {
                 warn!("UniProt unavailable for gene protein section: {err}");
@@ -1186,8 +1287,8 @@ pub async fn get(symbol: &str, sections: &[String]) -> Result<Gene, BioMcpError>
         };
     }
 
-    if include.contains(&GeneIncludeType::Go) {
-        gene.go = match fetch_go_section(gene.uniprot_id.as_deref(), &gene.symbol).await {
+    if let Some(result) = go {
+        gene.go = match result {
             Ok(v) => Some(v),
             Err(err) => {
                 warn!("QuickGO unavailable for gene GO section: {err}");
@@ -1196,8 +1297,8 @@ pub async fn get(symbol: &str, sections: &[String]) -> Result<Gene, BioMcpError>
         };
     }
 
-    if include.contains(&GeneIncludeType::Interactions) {
-        gene.interactions = match fetch_interactions_section(&gene.symbol).await {
+    if let Some(result) = interactions {
+        gene.interactions = match result {
             Ok(v) => Some(v),
             Err(err) => {
                 warn!("STRING unavailable for gene interactions section: {err}");
@@ -1206,32 +1307,32 @@ pub async fn get(symbol: &str, sections: &[String]) -> Result<Gene, BioMcpError>
         };
     }
 
-    if include.contains(&GeneIncludeType::Civic) {
-        add_civic_section(&mut gene).await;
+    if let Some(value) = civic {
+        gene.civic = Some(value);
     }
 
-    if include.contains(&GeneIncludeType::Expression) {
-        add_expression_section(&mut gene).await;
+    if let Some(value) = expression {
+        gene.expression = Some(value);
     }
 
-    if include.contains(&GeneIncludeType::Hpa) {
-        add_hpa_section(&mut gene).await;
+    if let Some(value) = hpa {
+        gene.hpa = Some(value);
     }
 
-    if include.contains(&GeneIncludeType::Druggability) {
-        add_druggability_section(&mut gene).await;
+    if let Some(value) = druggability {
+        gene.druggability = Some(value);
     }
 
-    if include.contains(&GeneIncludeType::ClinGen) {
-        add_clingen_section(&mut gene).await;
+    if let Some(value) = clingen {
+        gene.clingen = Some(value);
     }
 
-    if include.contains(&GeneIncludeType::Constraint) {
-        add_constraint_section(&mut gene).await;
+    if let Some(value) = constraint {
+        gene.constraint = Some(value);
     }
 
-    if include.contains(&GeneIncludeType::Disgenet) {
-        add_disgenet_section(&mut gene).await?;
+    if let Some(result) = disgenet {
+        gene.disgenet = result?;
     }
 
     Ok(gene)
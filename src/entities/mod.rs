@@ -13,6 +13,10 @@ pub(crate) mod study;
 pub(crate) mod trial;
 pub(crate) mod variant;
 
+use std::future::Future;
+
+use tracing::Instrument;
+
 #[derive(Debug, Clone)]
 pub(crate) struct SearchPage<T> {
     pub results: Vec<T>,
@@ -41,3 +45,55 @@ impl<T> SearchPage<T> {
         }
     }
 }
+
+/// Runs one section future when it was requested, inside a `section` profiling span so its wall
+/// time shows up in `--timings`.
+///
+/// Entity modules build one `scheduled_section` per optional section and drive them together with
+/// `tokio::join!`, so independent upstream fetches overlap instead of running back to back.
+pub(crate) async fn scheduled_section<F, T>(enabled: bool, section: &str, fut: F) -> Option<T>
+where
+    F: Future<Output = T>,
+{
+    if !enabled {
+        return None;
+    }
+    Some(
+        fut.instrument(crate::profiling::profile_span!("section", section))
+            .await,
+    )
+}
+
+#[cfg(test)]
+mod tests {
+    use std::time::Duration;
+
+    use super::*;
+
+    #[tokio::test]
+    async fn scheduled_section_skips_disabled_sections() {
+        let result = scheduled_section(false, "pathways", async { 1 }).await;
+        assert!(result.is_none());
+    }
+
+    #[tokio::test]
+    async fn scheduled_section_returns_the_section_value() {
+        let value = scheduled_section(true, "civic", async { 7 }).await;
+        assert_eq!(value, Some(7));
+    }
+
+    #[tokio::test]
+    async fn scheduled_sections_overlap_when_joined() {
+        // Each section waits for the other to start, so this only finishes when they overlap.
+        let barrier = tokio::sync::Barrier::new(2);
+        let joined = tokio::time::timeout(Duration::from_secs(5), async {
+            tokio::join!(
+                scheduled_section(true, "a", barrier.wait()),
+                scheduled_section(true, "b", barrier.wait()),
+            )
+        })
+        .await;
+        let (a, b) = joined.expect("joined sections should run concurrently");
+        assert!(a.is_some() && b.is_some());
+    }
+}
@@ -2,10 +2,11 @@ use std::sync::OnceLock;
 
 use regex::Regex;
 use serde::{Deserialize, Serialize};
-use tracing::warn;
+use tracing::{Instrument, warn};
 
 use crate::entities::SearchPage;
 use crate::error::BioMcpError;
+use crate::profiling::section_span;
 use crate::sources::complexportal::{ComplexPortalClient, ComplexPortalComplex};
 use crate::sources::interpro::InterProClient;
 use crate::sources::mygene::MyGeneClient;
@@ -401,7 +402,13 @@ pub async fn get_with_structure_limit(
 
     let uniprot = UniProtClient::new()?;
     let record = uniprot.get_record(&accession).await?;
-    let mut protein = transform::protein::from_uniprot_record_base(record.clone());
+    let mut protein = {
+        let _span = crate::profiling::profile_span!(
+            "transform",
+            step = "protein::from_uniprot_record_base"
+        );
+        transform::protein::from_uniprot_record_base(record.clone())
+    };
 
     if parsed_sections.include_structures {
         let structure_limit =
@@ -502,8 +509,14 @@ pub async fn get_with_structure_limit(
             .collect::<Vec<_>>())
     };
 
-    let (domains_res, interactions_res, complexes_res) =
-        tokio::join!(domains_fut, interactions_fut, complexes_fut);
+    let (domains_res, interactions_res, complexes_res) = tokio::join!(
+        domains_fut.instrument(section_span(parsed_sections.include_domains, "domains")),
+        interactions_fut.instrument(section_span(
+            parsed_sections.include_interactions,
+            "interactions"
+        )),
+        complexes_fut.instrument(section_span(parsed_sections.include_complexes, "complexes")),
+    );
 
     match domains_res {
         Ok(domains) => protein.domains = domains,
@@ -1008,7 +1008,8 @@ where
     T: Send + 'static,
     F: FnOnce() -> Result<T, BioMcpError> + Send + 'static,
 {
-    tokio::task::spawn_blocking(work)
+    let span = crate::profiling::profile_span!("blocking", task = "study_scan");
+    tokio::task::spawn_blocking(move || span.in_scope(work))
         .await
         .map_err(|err| BioMcpError::Api {
             api: "study".to_string(),
@@ -1598,7 +1598,11 @@ async fn search_page_with_ctgov_client(
         .map(str::to_string);
     let mut remaining_skip = offset;
 
-    for _ in 0..CTGOV_MAX_PAGE_FETCHES {
+    for fetched_pages in 0..CTGOV_MAX_PAGE_FETCHES {
+        // Under a caller deadline, stop at a page boundary; `page_token` still resumes there.
+        if fetched_pages > 0 && !crate::sources::deadline_allows_attempt() {
+            break;
+        }
         let resp = client
             .search(&build_ctgov_search_params(
                 filters,
@@ -1849,7 +1853,11 @@ pub async fn get(
         TrialSource::ClinicalTrialsGov => {
             let client = ClinicalTrialsClient::new()?;
             let study = client.get(nct_id, sections).await?;
-            let mut trial = transform::trial::from_ctgov_study(&study);
+            let mut trial = {
+                let _span =
+                    crate::profiling::profile_span!("transform", step = "trial::from_ctgov_study");
+                transform::trial::from_ctgov_study(&study)
+            };
             trial.source = Some("ClinicalTrials.gov".into());
 
             if section_flags.include_eligibility {
@@ -1875,7 +1883,11 @@ pub async fn get(
         TrialSource::NciCts => {
             let client = NciCtsClient::new()?;
             let resp = client.get(nct_id).await?;
-            let mut trial = transform::trial::from_nci_trial(&resp);
+            let mut trial = {
+                let _span =
+                    crate::profiling::profile_span!("transform", step = "trial::from_nci_trial");
+                transform::trial::from_nci_trial(&resp)
+            };
             trial.source = Some("NCI CTS".into());
 
             if section_flags.include_eligibility {
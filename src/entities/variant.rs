@@ -2,10 +2,11 @@ use regex::Regex;
 use serde::{Deserialize, Serialize};
 use std::sync::OnceLock;
 use std::time::Duration;
-use tracing::warn;
+use tracing::{Instrument, warn};
 
 use crate::entities::SearchPage;
 use crate::error::BioMcpError;
+use crate::profiling::profile_span;
 use crate::sources::alphagenome::AlphaGenomeClient;
 use crate::sources::cbioportal::CBioPortalClient;
 use crate::sources::civic::{CivicClient, CivicContext, CivicEvidenceItem};
@@ -1991,7 +1992,9 @@ pub async fn get(id: &str, sections: &[String]) -> Result<Variant, BioMcpError>
         return Ok(variant);
     }
 
-    let mut variant = get_base(id).await?;
+    let mut variant = get_base(id)
+        .instrument(profile_span!("section", section = "base"))
+        .await?;
 
     if !section_flags.include_clinvar {
         strip_clinvar_details(&mut variant);
@@ -2023,16 +2026,24 @@ pub async fn get(id: &str, sections: &[String]) -> Result<Variant, BioMcpError>
         variant.supporting_pmids = None;
     }
     if section_flags.include_prediction {
-        add_prediction(&mut variant).await?;
+        add_prediction(&mut variant)
+            .instrument(profile_span!("section", section = "prediction"))
+            .await?;
     }
     if section_flags.include_cbioportal {
-        add_cbioportal(&mut variant).await;
+        add_cbioportal(&mut variant)
+            .instrument(profile_span!("section", section = "cbioportal"))
+            .await;
     }
     if section_flags.include_civic {
-        add_civic(&mut variant).await;
+        add_civic(&mut variant)
+            .instrument(profile_span!("section", section = "civic"))
+            .await;
     }
     if section_flags.include_gwas {
-        add_gwas_section(&mut variant, id).await?;
+        add_gwas_section(&mut variant, id)
+            .instrument(profile_span!("section", section = "gwas"))
+            .await?;
     }
 
     Ok(variant)
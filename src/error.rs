@@ -8,7 +8,7 @@ pub enum BioMcpError {
     Http(#[from] reqwest::Error),
 
     #[error("HTTP middleware error: {0}")]
-    HttpMiddleware(#[from] reqwest_middleware::Error),
+    HttpMiddleware(#[source] reqwest_middleware::Error),
 
     #[error("API error from {api}: {message}")]
     Api { api: String, message: String },
@@ -56,6 +56,24 @@ pub enum BioMcpError {
     Io(#[from] std::io::Error),
 }
 
+impl From<reqwest_middleware::Error> for BioMcpError {
+    fn from(err: reqwest_middleware::Error) -> Self {
+        // An open circuit breaker is a known outage, not a transport failure.
+        match crate::sources::circuit_breaker::CircuitOpen::from_middleware_error(&err) {
+            Some(open) => Self::SourceUnavailable {
+                reason: format!(
+                    "Recent requests kept failing, so BioMCP stopped calling it for now (next attempt in {}s).",
+                    open.retry_in.as_secs().max(1)
+                ),
+                source_name: open.source_name,
+                suggestion: "Retry shortly, or run `biomcp health` to check upstream status."
+                    .into(),
+            },
+            None => Self::HttpMiddleware(err),
+        }
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::BioMcpError;
@@ -100,6 +118,20 @@ mod tests {
         assert!(msg.contains("Try --source ctgov"));
     }
 
+    #[test]
+    fn open_circuit_middleware_error_maps_to_source_unavailable() {
+        let open = crate::sources::circuit_breaker::CircuitOpen {
+            source_name: "civic".to_string(),
+            retry_in: std::time::Duration::from_secs(20),
+        };
+        let err = BioMcpError::from(reqwest_middleware::Error::middleware(open));
+
+        assert!(matches!(err, BioMcpError::SourceUnavailable { .. }));
+        let msg = err.to_string();
+        assert!(msg.contains("Source unavailable: civic"));
+        assert!(msg.contains("20s"));
+    }
+
     #[test]
     fn api_error_display_includes_api_name() {
         let err = BioMcpError::Api {
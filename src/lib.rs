@@ -7,6 +7,7 @@
 pub mod cli;
 pub mod error;
 pub mod mcp;
+pub mod profiling;
 
 #[cfg_attr(not(test), allow(dead_code))]
 mod cache;
@@ -1,11 +1,17 @@
 use tracing_subscriber::EnvFilter;
+use tracing_subscriber::prelude::*;
 
 fn init_tracing() {
-    let _ = tracing_subscriber::fmt()
-        .with_env_filter(
-            EnvFilter::try_from_default_env().unwrap_or_else(|_| EnvFilter::new("warn")),
+    // The log filter applies to the formatter only, so profiling spans are collected
+    // whatever `RUST_LOG` says.
+    let env_filter = EnvFilter::try_from_default_env().unwrap_or_else(|_| EnvFilter::new("warn"));
+    let _ = tracing_subscriber::registry()
+        .with(
+            tracing_subscriber::fmt::layer()
+                .with_writer(std::io::stderr)
+                .with_filter(env_filter),
         )
-        .with_writer(std::io::stderr)
+        .with(biomcp_cli::profiling::layer())
         .try_init();
 }
 
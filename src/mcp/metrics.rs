@@ -0,0 +1,382 @@
+//! Prometheus text exposition for `serve-http`'s `GET /metrics`.
+//!
+//! Tool-call latency is recorded here by `BioMcpServer::biomcp`; upstream request, cache,
+//! coalescing, rate-limit and circuit-breaker figures are read from the process-wide counters the
+//! shared HTTP client already keeps. All values cover this server process since it started.
+
+use std::collections::BTreeMap;
+use std::fmt::Write as _;
+use std::sync::{Mutex, PoisonError};
+use std::time::Duration;
+
+use crate::sources::metrics::{Histogram, LATENCY_BUCKETS, UpstreamMetricsSnapshot};
+
+pub(crate) const CONTENT_TYPE: &str = "text/plain; version=0.0.4; charset=utf-8";
+
+// Commands whose second word names the entity and is kept in the label.
+const ENTITY_COMMANDS: &[&str] = &["batch", "get", "search", "study"];
+
+#[derive(Debug, Default, Clone)]
+struct ToolCallStats {
+    ok: u64,
+    error: u64,
+    latency: Histogram,
+}
+
+static TOOL_CALLS: Mutex<BTreeMap<String, ToolCallStats>> = Mutex::new(BTreeMap::new());
+
+/// Low-cardinality label for a tool call: `search article`, `get gene`, `health`, ...
+pub(crate) fn command_label(args: &[String]) -> String {
+    let Some(command) = args.get(1).map(|arg| arg.trim().to_ascii_lowercase()) else {
+        return "empty".to_string();
+    };
+    if !ENTITY_COMMANDS.contains(&command.as_str()) {
+        return command;
+    }
+    match args.get(2).map(|arg| arg.trim().to_ascii_lowercase()) {
+        Some(entity)
+            if !entity.is_empty()
+                && entity.len() <= 24
+                && entity.chars().all(|c| c.is_ascii_alphabetic() || c == '-') =>
+        {
+            format!("{command} {entity}")
+        }
+        _ => command,
+    }
+}
+
+/// Records one `biomcp` tool call.
+pub(crate) fn record_tool_call(command: String, ok: bool, elapsed: Duration) {
+    let mut calls = TOOL_CALLS.lock().unwrap_or_else(PoisonError::into_inner);
+    let stats = calls.entry(command).or_default();
+    if ok {
+        stats.ok += 1;
+    } else {
+        stats.error += 1;
+    }
+    stats.latency.observe(elapsed);
+}
+
+/// Everything one `/metrics` scrape reports.
+#[derive(Debug, Default)]
+struct MetricsInputs {
+    upstream: UpstreamMetricsSnapshot,
+    tool_calls: Vec<(String, ToolCallStats)>,
+    cache: crate::cache::CacheLookupStats,
+    coalescing: crate::sources::coalesce::CoalescingStats,
+    rate_limits: Vec<crate::sources::rate_limit::RateLimitSnapshot>,
+    circuits: Vec<crate::sources::circuit_breaker::CircuitSnapshot>,
+    sessions: usize,
+}
+
+/// Renders the current metrics; `sessions` is the number of live MCP sessions.
+pub(crate) fn render(sessions: usize) -> String {
+    let tool_calls = TOOL_CALLS
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner)
+        .iter()
+        .map(|(command, stats)| (command.clone(), stats.clone()))
+        .collect();
+    render_inputs(&MetricsInputs {
+        upstream: crate::sources::metrics::snapshot(),
+        tool_calls,
+        cache: crate::cache::process_lookup_stats(),
+        coalescing: crate::sources::coalesce::stats(),
+        rate_limits: crate::sources::rate_limit::global_limiter().snapshot(),
+        circuits: crate::sources::circuit_breaker::global_breakers().snapshot(),
+        sessions,
+    })
+}
+
+fn escape_label(value: &str) -> String {
+    value
+        .replace('\\', "\\\\")
+        .replace('"', "\\\"")
+        .replace('\n', "\\n")
+}
+
+fn header(out: &mut String, name: &str, kind: &str, help: &str) {
+    let _ = writeln!(out, "# HELP {name} {help}");
+    let _ = writeln!(out, "# TYPE {name} {kind}");
+}
+
+fn histogram(out: &mut String, name: &str, labels: &str, histogram: &Histogram) {
+    let sep = if labels.is_empty() { "" } else { "," };
+    for (bound, count) in LATENCY_BUCKETS.iter().zip(histogram.buckets) {
+        let _ = writeln!(out, "{name}_bucket{{{labels}{sep}le=\"{bound}\"}} {count}");
+    }
+    let _ = writeln!(
+        out,
+        "{name}_bucket{{{labels}{sep}le=\"+Inf\"}} {}",
+        histogram.count
+    );
+    let _ = writeln!(out, "{name}_sum{{{labels}}} {}", histogram.sum_secs);
+    let _ = writeln!(out, "{name}_count{{{labels}}} {}", histogram.count);
+}
+
+fn render_inputs(inputs: &MetricsInputs) -> String {
+    let mut out = String::new();
+
+    header(
+        &mut out,
+        "biomcp_upstream_requests_total",
+        "counter",
+        "Upstream HTTP attempts by source and status code (\"error\" for transport failures).",
+    );
+    for (source, status, count) in &inputs.upstream.requests {
+        let _ = writeln!(
+            out,
+            "biomcp_upstream_requests_total{{source=\"{}\",status=\"{}\"}} {count}",
+            escape_label(source),
+            escape_label(status)
+        );
+    }
+
+    header(
+        &mut out,
+        "biomcp_upstream_request_duration_seconds",
+        "histogram",
+        "Upstream HTTP attempt latency by source.",
+    );
+    for (source, latency) in &inputs.upstream.latency {
+        let labels = format!("source=\"{}\"", escape_label(source));
+        histogram(
+            &mut out,
+            "biomcp_upstream_request_duration_seconds",
+            &labels,
+            latency,
+        );
+    }
+
+    header(
+        &mut out,
+        "biomcp_rate_limit_wait_seconds",
+        "histogram",
+        "Time requests waited for a rate-limit slot, by source.",
+    );
+    for (source, wait) in &inputs.upstream.rate_limit_wait {
+        let labels = format!("source=\"{}\"", escape_label(source));
+        histogram(&mut out, "biomcp_rate_limit_wait_seconds", &labels, wait);
+    }
+
+    header(
+        &mut out,
+        "biomcp_rate_limit_effective_interval_seconds",
+        "gauge",
+        "Current adaptive request spacing per rate-limit policy.",
+    );
+    for entry in &inputs.rate_limits {
+        let _ = writeln!(
+            out,
+            "biomcp_rate_limit_effective_interval_seconds{{source=\"{}\"}} {}",
+            escape_label(entry.key),
+            entry.effective_interval.as_secs_f64()
+        );
+    }
+
+    header(
+        &mut out,
+        "biomcp_cache_lookups_total",
+        "counter",
+        "HTTP cache lookups by result.",
+    );
+    for (result, count) in [
+        ("l1_hit", inputs.cache.l1_hits),
+        ("l2_hit", inputs.cache.l2_hits),
+        ("miss", inputs.cache.misses),
+    ] {
+        let _ = writeln!(
+            out,
+            "biomcp_cache_lookups_total{{result=\"{result}\"}} {count}"
+        );
+    }
+    header(
+        &mut out,
+        "biomcp_cache_normalized_hits_total",
+        "counter",
+        "Cache hits that only cache-key normalization made possible.",
+    );
+    let _ = writeln!(
+        out,
+        "biomcp_cache_normalized_hits_total {}",
+        inputs.cache.normalized_hits
+    );
+
+    header(
+        &mut out,
+        "biomcp_coalescing_upstream_fetches_total",
+        "counter",
+        "Coalescable requests that went upstream as flight leader.",
+    );
+    let _ = writeln!(
+        out,
+        "biomcp_coalescing_upstream_fetches_total {}",
+        inputs.coalescing.upstream_fetches
+    );
+    header(
+        &mut out,
+        "biomcp_coalesced_requests_total",
+        "counter",
+        "Requests answered from another request's in-flight fetch.",
+    );
+    let _ = writeln!(
+        out,
+        "biomcp_coalesced_requests_total {}",
+        inputs.coalescing.coalesced_requests
+    );
+
+    header(
+        &mut out,
+        "biomcp_circuit_breaker_state",
+        "gauge",
+        "1 for the current breaker state of each source with recent failures.",
+    );
+    for entry in &inputs.circuits {
+        let _ = writeln!(
+            out,
+            "biomcp_circuit_breaker_state{{source=\"{}\",state=\"{}\"}} 1",
+            escape_label(&entry.source),
+            entry.state.as_str()
+        );
+    }
+    header(
+        &mut out,
+        "biomcp_circuit_breaker_consecutive_failures",
+        "gauge",
+        "Consecutive failed upstream requests per source.",
+    );
+    for entry in &inputs.circuits {
+        let _ = writeln!(
+            out,
+            "biomcp_circuit_breaker_consecutive_failures{{source=\"{}\"}} {}",
+            escape_label(&entry.source),
+            entry.consecutive_failures
+        );
+    }
+
+    header(
+        &mut out,
+        "biomcp_tool_calls_total",
+        "counter",
+        "biomcp tool calls by command and outcome.",
+    );
+    for (command, stats) in &inputs.tool_calls {
+        for (outcome, count) in [("ok", stats.ok), ("error", stats.error)] {
+            let _ = writeln!(
+                out,
+                "biomcp_tool_calls_total{{command=\"{}\",outcome=\"{outcome}\"}} {count}",
+                escape_label(command)
+            );
+        }
+    }
+    header(
+        &mut out,
+        "biomcp_tool_call_duration_seconds",
+        "histogram",
+        "biomcp tool call latency by command.",
+    );
+    for (command, stats) in &inputs.tool_calls {
+        let labels = format!("command=\"{}\"", escape_label(command));
+        histogram(
+            &mut out,
+            "biomcp_tool_call_duration_seconds",
+            &labels,
+            &stats.latency,
+        );
+    }
+
+    header(
+        &mut out,
+        "biomcp_mcp_sessions",
+        "gauge",
+        "Live MCP Streamable HTTP sessions.",
+    );
+    let _ = writeln!(out, "biomcp_mcp_sessions {}", inputs.sessions);
+
+    out
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn args(command: &str) -> Vec<String> {
+        std::iter::once("biomcp")
+            .chain(command.split_whitespace())
+            .map(str::to_string)
+            .collect()
+    }
+
+    #[test]
+    fn command_labels_keep_entity_but_not_arguments() {
+        assert_eq!(
+            command_label(&args("search article -g BRAF")),
+            "search article"
+        );
+        assert_eq!(command_label(&args("get gene BRAF")), "get gene");
+        assert_eq!(command_label(&args("health --apis-only")), "health");
+        assert_eq!(command_label(&args("get --json")), "get");
+        assert_eq!(command_label(&args("")), "empty");
+    }
+
+    #[test]
+    fn render_emits_prometheus_text_for_all_families() {
+        let mut latency = Histogram::default();
+        latency.observe(Duration::from_millis(80));
+        let mut tool = ToolCallStats {
+            ok: 2,
+            ..ToolCallStats::default()
+        };
+        tool.latency.observe(Duration::from_secs(1));
+        let inputs = MetricsInputs {
+            upstream: UpstreamMetricsSnapshot {
+                requests: vec![("civic".into(), "200".into(), 3)],
+                latency: vec![("civic".into(), latency)],
+                rate_limit_wait: Vec::new(),
+            },
+            tool_calls: vec![("get gene".into(), tool)],
+            cache: crate::cache::CacheLookupStats {
+                l1_hits: 4,
+                l2_hits: 1,
+                misses: 2,
+                normalized_hits: 1,
+            },
+            circuits: vec![crate::sources::circuit_breaker::CircuitSnapshot {
+                source: "api.monarchinitiative.org".into(),
+                state: crate::sources::circuit_breaker::CircuitState::Open,
+                consecutive_failures: 3,
+                retry_in: Some(Duration::from_secs(10)),
+            }],
+            sessions: 2,
+            ..MetricsInputs::default()
+        };
+
+        let text = render_inputs(&inputs);
+        assert!(text.contains("# TYPE biomcp_upstream_requests_total counter\n"));
+        assert!(
+            text.contains("biomcp_upstream_requests_total{source=\"civic\",status=\"200\"} 3\n")
+        );
+        assert!(text.contains(
+            "biomcp_upstream_request_duration_seconds_bucket{source=\"civic\",le=\"0.1\"} 1\n"
+        ));
+        assert!(text.contains(
+            "biomcp_upstream_request_duration_seconds_bucket{source=\"civic\",le=\"0.05\"} 0\n"
+        ));
+        assert!(
+            text.contains("biomcp_upstream_request_duration_seconds_count{source=\"civic\"} 1\n")
+        );
+        assert!(text.contains("biomcp_cache_lookups_total{result=\"l1_hit\"} 4\n"));
+        assert!(text.contains("biomcp_cache_normalized_hits_total 1\n"));
+        assert!(text.contains(
+            "biomcp_circuit_breaker_state{source=\"api.monarchinitiative.org\",state=\"open\"} 1\n"
+        ));
+        assert!(text.contains("biomcp_tool_calls_total{command=\"get gene\",outcome=\"ok\"} 2\n"));
+        assert!(text.contains("biomcp_tool_call_duration_seconds_sum{command=\"get gene\"} 1\n"));
+        assert!(text.contains("biomcp_mcp_sessions 2\n"));
+    }
+
+    #[test]
+    fn label_values_are_escaped() {
+        assert_eq!(escape_label("a\"b\\c\nd"), "a\\\"b\\\\c\\nd");
+    }
+}
@@ -1,5 +1,6 @@
 //! MCP server entrypoints for stdio and HTTP transports.
 
+mod metrics;
 mod shell;
 
 /// Runs the BioMCP MCP server over stdio.
@@ -17,7 +18,8 @@ pub async fn run_stdio() -> anyhow::Result<()> {
 /// - `POST /mcp` — Streamable HTTP JSON-RPC requests
 /// - `GET /mcp` — SSE stream managed by the Streamable HTTP session
 /// - `GET /health` — liveness probe
-/// - `GET /readyz` — readiness alias
+/// - `GET /readyz` — readiness probe; reports `degraded` while upstream circuit breakers are open
+/// - `GET /metrics` — Prometheus metrics for upstream requests, caching and tool calls
 /// - `GET /` — identity/status response
 ///
 /// # Errors
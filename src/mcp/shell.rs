@@ -1,6 +1,10 @@
 use std::future::Future;
-use std::time::Duration;
+use std::sync::Arc;
+use std::time::{Duration, Instant};
 
+use axum::extract::State;
+use axum::http::header;
+use axum::response::IntoResponse;
 use axum::{Json, Router, routing::get};
 use base64::Engine;
 use rmcp::handler::server::{router::tool::ToolRouter, wrapper::Parameters};
@@ -34,6 +38,7 @@ struct ShellCommand {
 const RESOURCE_HELP_URI: &str = "biomcp://help";
 const GENERIC_MCP_REJECTION_MESSAGE: &str = "Error: BioMCP allows read-only commands only. Allowed families are search/get/helpers/list/version/health/batch/enrich/discover/skill plus MCP-safe study commands (`study list`, `study download --list`, `study top-mutated`, `study query`, `study filter`, `study cohort`, `study survival`, `study compare`, `study co-occurrence`).";
 const CACHE_FAMILY_MCP_REJECTION_MESSAGE: &str = "Error: biomcp cache commands are CLI-only over MCP because they reveal workstation-local filesystem paths.";
+const PROFILE_OUT_MCP_REJECTION_MESSAGE: &str = "Error: --profile-out is CLI-only over MCP because it writes workstation-local files. Use --timings for an inline report.";
 
 impl BioMcpServer {
     pub fn new() -> Self {
@@ -53,7 +58,15 @@ impl Default for BioMcpServer {
     }
 }
 
+fn has_profile_out_flag(args: &[String]) -> bool {
+    args.iter()
+        .any(|arg| arg == "--profile-out" || arg.starts_with("--profile-out="))
+}
+
 fn is_allowed_mcp_command(args: &[String]) -> bool {
+    if has_profile_out_flag(args) {
+        return false;
+    }
     // args[0] is the binary name ("biomcp")
     let Some(cmd) = args.get(1).map(|s| s.trim().to_ascii_lowercase()) else {
         return false;
@@ -88,7 +101,9 @@ fn is_allowed_mcp_command(args: &[String]) -> bool {
 }
 
 fn mcp_rejection_message(args: &[String]) -> &'static str {
-    if args
+    if has_profile_out_flag(args) {
+        PROFILE_OUT_MCP_REJECTION_MESSAGE
+    } else if args
         .get(1)
         .is_some_and(|cmd| cmd.trim().eq_ignore_ascii_case("cache"))
     {
@@ -130,7 +145,12 @@ impl BioMcpServer {
             return Ok(Self::tool_error(mcp_rejection_message(&args)));
         }
 
-        match crate::cli::execute_mcp(args).await {
+        let command_label = super::metrics::command_label(&args);
+        let started = Instant::now();
+        let result = crate::cli::execute_mcp(args).await;
+        let _ = tokio::task::spawn_blocking(crate::sources::cassette::flush).await;
+        super::metrics::record_tool_call(command_label, result.is_ok(), started.elapsed());
+        match result {
             Ok(output) => {
                 let mut content = vec![Content::text(output.text)];
                 if let Some(svg) = output.svg {
@@ -247,6 +267,44 @@ async fn health_handler() -> Json<serde_json::Value> {
     Json(json!({"status": "ok"}))
 }
 
+/// Readiness stays `200`: the server still answers cached and unaffected requests while a
+/// source is down, so tripped circuit breakers are reported as `degraded` in the body.
+async fn ready_handler() -> Json<serde_json::Value> {
+    Json(readiness_payload(
+        crate::sources::circuit_breaker::global_breakers().snapshot(),
+    ))
+}
+
+fn readiness_payload(
+    snapshot: Vec<crate::sources::circuit_breaker::CircuitSnapshot>,
+) -> serde_json::Value {
+    let tripped = snapshot
+        .into_iter()
+        .filter(|entry| entry.state != crate::sources::circuit_breaker::CircuitState::Closed)
+        .map(|entry| {
+            json!({
+                "source": entry.source,
+                "state": entry.state.as_str(),
+                "consecutive_failures": entry.consecutive_failures,
+                "retry_in_secs": entry.retry_in.map(|left| left.as_secs().max(1)),
+            })
+        })
+        .collect::<Vec<_>>();
+    if tripped.is_empty() {
+        json!({"status": "ok"})
+    } else {
+        json!({"status": "degraded", "circuit_breakers": tripped})
+    }
+}
+
+async fn metrics_handler(State(sessions): State<Arc<LocalSessionManager>>) -> impl IntoResponse {
+    let live_sessions = sessions.sessions.read().await.len();
+    (
+        [(header::CONTENT_TYPE, super::metrics::CONTENT_TYPE)],
+        super::metrics::render(live_sessions),
+    )
+}
+
 async fn index_handler() -> Json<serde_json::Value> {
     Json(json!({
         "name": "biomcp",
@@ -296,10 +354,11 @@ pub async fn run_http(host: &str, port: u16) -> anyhow::Result<()> {
     let bind = std::net::SocketAddr::new(ip, port);
     let shutdown = CancellationToken::new();
 
+    let session_manager = Arc::new(LocalSessionManager::default());
     let service: StreamableHttpService<BioMcpServer, LocalSessionManager> =
         StreamableHttpService::new(
             || Ok(BioMcpServer::new()),
-            Default::default(),
+            session_manager.clone(),
             StreamableHttpServerConfig {
                 stateful_mode: true,
                 cancellation_token: shutdown.child_token(),
@@ -310,8 +369,10 @@ pub async fn run_http(host: &str, port: u16) -> anyhow::Result<()> {
     let router = Router::new()
         .nest_service("/mcp", service)
         .route("/health", get(health_handler))
-        .route("/readyz", get(health_handler))
-        .route("/", get(index_handler));
+        .route("/readyz", get(ready_handler))
+        .route("/metrics", get(metrics_handler))
+        .route("/", get(index_handler))
+        .with_state(session_manager);
     let listener = tokio::net::TcpListener::bind(bind)
         .await
         .map_err(|e| anyhow::anyhow!("Failed to bind HTTP server: {e}"))?;
@@ -320,6 +381,7 @@ pub async fn run_http(host: &str, port: u16) -> anyhow::Result<()> {
     tracing::info!("  MCP endpoint:   POST/GET http://{bind}/mcp");
     tracing::info!("  Health probe:   GET      http://{bind}/health");
     tracing::info!("  Ready probe:    GET      http://{bind}/readyz");
+    tracing::info!("  Metrics:        GET      http://{bind}/metrics");
     tracing::info!("  Status:         GET      http://{bind}/");
 
     let cancel = shutdown.clone();
@@ -343,8 +405,9 @@ mod tests {
     use axum::Json;
 
     use super::{
-        CACHE_FAMILY_MCP_REJECTION_MESSAGE, GENERIC_MCP_REJECTION_MESSAGE, index_handler,
-        is_allowed_mcp_command, mcp_rejection_message,
+        CACHE_FAMILY_MCP_REJECTION_MESSAGE, GENERIC_MCP_REJECTION_MESSAGE,
+        PROFILE_OUT_MCP_REJECTION_MESSAGE, index_handler, is_allowed_mcp_command,
+        mcp_rejection_message, readiness_payload,
     };
 
     #[test]
@@ -396,6 +459,12 @@ mod tests {
             "cache".into(),
             "stats".into()
         ]));
+        assert!(!is_allowed_mcp_command(&[
+            "biomcp".into(),
+            "benchmark".into(),
+            "run".into(),
+            "--quick".into()
+        ]));
         assert!(is_allowed_mcp_command(&[
             "biomcp".into(),
             "study".into(),
@@ -521,6 +590,24 @@ mod tests {
         );
     }
 
+    #[test]
+    fn profile_out_is_rejected_over_mcp() {
+        for flag in ["--profile-out", "--profile-out=trace.json"] {
+            let args = vec![
+                "biomcp".into(),
+                "get".into(),
+                "gene".into(),
+                "BRAF".into(),
+                flag.into(),
+            ];
+            assert!(!is_allowed_mcp_command(&args));
+            assert_eq!(
+                mcp_rejection_message(&args),
+                PROFILE_OUT_MCP_REJECTION_MESSAGE
+            );
+        }
+    }
+
     #[test]
     fn generic_mcp_rejection_message_stays_read_only_for_mutating_commands() {
         let args = vec!["biomcp".into(), "update".into()];
@@ -534,4 +621,39 @@ mod tests {
         assert_eq!(payload["transport"], "streamable-http");
         assert_eq!(payload["mcp"], "/mcp");
     }
+
+    #[test]
+    fn readiness_reports_tripped_circuit_breakers() {
+        use crate::sources::circuit_breaker::{CircuitSnapshot, CircuitState};
+
+        let closed = CircuitSnapshot {
+            source: "kegg".into(),
+            state: CircuitState::Closed,
+            consecutive_failures: 1,
+            retry_in: None,
+        };
+        assert_eq!(
+            readiness_payload(vec![closed.clone()]),
+            serde_json::json!({"status": "ok"})
+        );
+
+        let open = CircuitSnapshot {
+            source: "civic".into(),
+            state: CircuitState::Open,
+            consecutive_failures: 3,
+            retry_in: Some(std::time::Duration::from_secs(25)),
+        };
+        assert_eq!(
+            readiness_payload(vec![open, closed]),
+            serde_json::json!({
+                "status": "degraded",
+                "circuit_breakers": [{
+                    "source": "civic",
+                    "state": "open",
+                    "consecutive_failures": 3,
+                    "retry_in_secs": 25,
+                }],
+            })
+        );
+    }
 }
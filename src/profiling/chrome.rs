@@ -0,0 +1,261 @@
+//! `--profile-out`: one collection as a Chrome trace-event file, for Perfetto or
+//! `chrome://tracing`.
+//!
+//! Spans have no thread of their own under tokio, so each one is placed on a synthetic lane: a
+//! span stays on its parent's lane while nothing else overlaps it there, and concurrent siblings
+//! get lanes of their own. Sequential work therefore reads as one stacked lane, and fan-out as
+//! parallel lanes.
+
+use std::collections::HashMap;
+use std::io;
+use std::path::Path;
+use std::time::Duration;
+
+use serde_json::{Value, json};
+
+use super::SpanRecord;
+
+// Fields that name a span in the timeline, in preference order.
+const LABEL_FIELDS: [&str; 6] = ["section", "source", "step", "template", "api", "task"];
+const PID: u64 = 1;
+
+fn micros(duration: Duration) -> u64 {
+    u64::try_from(duration.as_micros()).unwrap_or(u64::MAX)
+}
+
+fn label(span: &SpanRecord) -> String {
+    LABEL_FIELDS
+        .iter()
+        .find_map(|field| span.fields.get(field))
+        .map(|value| format!("{} {value}", span.name))
+        .unwrap_or_else(|| span.name.to_string())
+}
+
+fn is_ancestor(parents: &HashMap<u64, Option<u64>>, ancestor: u64, mut id: u64) -> bool {
+    while let Some(Some(parent)) = parents.get(&id) {
+        if *parent == ancestor {
+            return true;
+        }
+        id = *parent;
+    }
+    false
+}
+
+/// Lane index per span id.
+fn assign_lanes(spans: &[SpanRecord]) -> HashMap<u64, usize> {
+    let parents = spans
+        .iter()
+        .map(|span| (span.id, span.parent))
+        .collect::<HashMap<_, _>>();
+    let mut order = spans.iter().collect::<Vec<_>>();
+    order.sort_by(|a, b| a.start.cmp(&b.start).then(b.elapsed.cmp(&a.elapsed)));
+
+    let mut lanes: Vec<Vec<(Duration, Duration, u64)>> = Vec::new();
+    let mut assigned = HashMap::with_capacity(spans.len());
+    for span in order {
+        let start = span.start;
+        let end = span.start + span.elapsed;
+        let fits = |lane: &Vec<(Duration, Duration, u64)>| {
+            lane.iter().all(|&(other_start, other_end, other)| {
+                other_end <= start || end <= other_start || is_ancestor(&parents, other, span.id)
+            })
+        };
+        let preferred = span
+            .parent
+            .and_then(|parent| assigned.get(&parent).copied());
+        let lane = preferred
+            .filter(|&lane| fits(&lanes[lane]))
+            .or_else(|| lanes.iter().position(|lane| fits(lane)))
+            .unwrap_or_else(|| {
+                lanes.push(Vec::new());
+                lanes.len() - 1
+            });
+        lanes[lane].push((start, end, span.id));
+        assigned.insert(span.id, lane);
+    }
+    assigned
+}
+
+/// Upstream cache hits and misses under each span, including its own.
+fn cache_counts(spans: &[SpanRecord]) -> HashMap<u64, (u64, u64)> {
+    let parents = spans
+        .iter()
+        .map(|span| (span.id, span.parent))
+        .collect::<HashMap<_, _>>();
+    let mut counts: HashMap<u64, (u64, u64)> = HashMap::new();
+    for span in spans.iter().filter(|span| span.name == "upstream") {
+        let hit = match span.fields.get("cache").map(String::as_str) {
+            Some("hit") => true,
+            Some("miss") => false,
+            _ => continue,
+        };
+        let mut id = Some(span.id);
+        while let Some(current) = id {
+            let entry = counts.entry(current).or_default();
+            if hit {
+                entry.0 += 1;
+            } else {
+                entry.1 += 1;
+            }
+            id = parents.get(&current).copied().flatten();
+        }
+    }
+    counts
+}
+
+fn trace(spans: &[SpanRecord]) -> Value {
+    let lanes = assign_lanes(spans);
+    let cache = cache_counts(spans);
+    let mut events = spans
+        .iter()
+        .map(|span| {
+            let mut args = span
+                .fields
+                .iter()
+                .map(|(key, value)| ((*key).to_string(), Value::from(value.as_str())))
+                .collect::<serde_json::Map<_, _>>();
+            if span.name != "upstream"
+                && let Some((hits, misses)) = cache.get(&span.id)
+            {
+                args.insert("cache_hits".to_string(), json!(hits));
+                args.insert("cache_misses".to_string(), json!(misses));
+            }
+            json!({
+                "name": label(span),
+                "cat": span.name,
+                "ph": "X",
+                "ts": micros(span.start),
+                "dur": micros(span.elapsed),
+                "pid": PID,
+                "tid": lanes.get(&span.id).copied().unwrap_or_default() + 1,
+                "args": args,
+            })
+        })
+        .collect::<Vec<_>>();
+    events.sort_by_key(|event| event["ts"].as_u64());
+
+    let lane_count = lanes.values().copied().max().map_or(0, |max| max + 1);
+    events.push(json!({
+        "name": "process_name",
+        "ph": "M",
+        "pid": PID,
+        "args": {"name": "biomcp"},
+    }));
+    events.extend((0..lane_count).map(|lane| {
+        let name = if lane == 0 {
+            "main".to_string()
+        } else {
+            format!("concurrent {lane}")
+        };
+        json!({
+            "name": "thread_name",
+            "ph": "M",
+            "pid": PID,
+            "tid": lane + 1,
+            "args": {"name": name},
+        })
+    }));
+
+    json!({
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+    })
+}
+
+/// Writes `spans` to `path` as a Chrome trace-event JSON file.
+pub(crate) fn write_trace(path: &Path, spans: &[SpanRecord]) -> io::Result<()> {
+    let bytes = serde_json::to_vec(&trace(spans)).map_err(io::Error::other)?;
+    std::fs::write(path, bytes)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn span(
+        id: u64,
+        parent: Option<u64>,
+        name: &'static str,
+        (start, ms): (u64, u64),
+        fields: &[(&'static str, &str)],
+    ) -> SpanRecord {
+        SpanRecord {
+            id,
+            parent,
+            name,
+            fields: fields
+                .iter()
+                .map(|(key, value)| (*key, value.to_string()))
+                .collect(),
+            start: Duration::from_millis(start),
+            elapsed: Duration::from_millis(ms),
+        }
+    }
+
+    // Two concurrent sections, then a render after both finish.
+    fn sample_spans() -> Vec<SpanRecord> {
+        vec![
+            span(0, None, "command", (0, 100), &[]),
+            span(1, Some(0), "section", (1, 60), &[("section", "genes")]),
+            span(
+                2,
+                Some(1),
+                "upstream",
+                (2, 50),
+                &[("source", "mygene"), ("cache", "miss")],
+            ),
+            span(3, Some(0), "section", (1, 40), &[("section", "trials")]),
+            span(
+                4,
+                Some(3),
+                "upstream",
+                (2, 30),
+                &[("source", "ctgov"), ("cache", "hit")],
+            ),
+            span(
+                5,
+                Some(0),
+                "render",
+                (70, 5),
+                &[("template", "search_all.md.j2")],
+            ),
+        ]
+    }
+
+    #[test]
+    fn concurrent_siblings_get_their_own_lanes_and_sequential_work_stays_stacked() {
+        let lanes = assign_lanes(&sample_spans());
+
+        assert_eq!(lanes[&0], 0);
+        assert_eq!(lanes[&1], 0);
+        assert_eq!(lanes[&2], 0);
+        assert_eq!(lanes[&3], 1);
+        assert_eq!(lanes[&4], 1);
+        assert_eq!(lanes[&5], 0);
+    }
+
+    #[test]
+    fn trace_labels_spans_and_rolls_cache_status_up_to_ancestors() {
+        let trace = trace(&sample_spans());
+        let events = trace["traceEvents"].as_array().expect("events");
+        let event = |name: &str| {
+            events
+                .iter()
+                .find(|event| event["name"] == name)
+                .unwrap_or_else(|| panic!("{name} event"))
+        };
+
+        assert_eq!(event("section genes")["tid"], 1);
+        assert_eq!(event("section trials")["tid"], 2);
+        assert_eq!(event("section trials")["dur"], 40_000);
+        assert_eq!(event("upstream mygene")["args"]["cache"], "miss");
+        assert_eq!(event("command")["args"]["cache_hits"], 1);
+        assert_eq!(event("command")["args"]["cache_misses"], 1);
+        assert_eq!(event("section trials")["args"]["cache_hits"], 1);
+        assert!(
+            events
+                .iter()
+                .any(|event| event["ph"] == "M" && event["args"]["name"] == "concurrent 1")
+        );
+    }
+}
@@ -0,0 +1,309 @@
+//! Opt-in profiling on top of the `tracing` setup.
+//!
+//! Hot paths open spans under [`TARGET`] with [`profile_span!`]:
+//!
+//! - `upstream`: one request through the shared HTTP client
+//! - `rate_limit`: a wait for a rate-limit slot
+//! - `http`: one attempt on the wire
+//! - `cache`: an HTTP cache read or write
+//! - `deserialize`: JSON decoding
+//! - `transform`: an entity transform
+//! - `render`: a template render
+//! - `section`: an entity or `search all` section, or an article federation leg
+//! - `blocking`: work moved to the blocking pool
+//!
+//! The binaries install [`layer`] next to the log formatter. It records spans only under a
+//! collection root opened by [`collect`]. Every other span is disabled, so a normal run pays only
+//! for the disabled-span check. [`timings`] summarizes a collection for `--timings`, and
+//! [`chrome`] writes it as a trace-event file for `--profile-out`.
+
+pub(crate) mod chrome;
+pub(crate) mod timings;
+
+use std::collections::{BTreeMap, HashMap};
+use std::fmt;
+use std::future::Future;
+use std::sync::atomic::{AtomicU64, AtomicUsize, Ordering};
+use std::sync::{Arc, Mutex, MutexGuard, PoisonError};
+use std::time::{Duration, Instant};
+
+use tracing::field::{Field, Visit};
+use tracing::span::{Attributes, Id, Record};
+use tracing::subscriber::Interest;
+use tracing::{Instrument, Subscriber};
+use tracing_subscriber::Layer;
+use tracing_subscriber::filter::{LevelFilter, dynamic_filter_fn};
+use tracing_subscriber::layer::Context;
+use tracing_subscriber::registry::LookupSpan;
+
+/// `tracing` target shared by every profiling span.
+pub const TARGET: &str = "biomcp::profile";
+
+/// Opens an info-level span under the profiling [`TARGET`]. Fields are only evaluated while a
+/// collection is active.
+macro_rules! profile_span {
+    ($name:expr $(, $($fields:tt)*)?) => {
+        ::tracing::info_span!(target: $crate::profiling::TARGET, $name $(, $($fields)*)?)
+    };
+}
+pub(crate) use profile_span;
+
+/// A `section` span for one leg of a fan-out, or a disabled span when the leg is skipped, so
+/// skipped sections leave nothing in the trace.
+pub(crate) fn section_span(enabled: bool, section: &str) -> tracing::Span {
+    if enabled {
+        profile_span!("section", section)
+    } else {
+        tracing::Span::none()
+    }
+}
+
+// Collections in flight; spans are disabled outright while this is zero.
+static ACTIVE_COLLECTIONS: AtomicUsize = AtomicUsize::new(0);
+static NEXT_COLLECTION: AtomicU64 = AtomicU64::new(1);
+// Collectors waiting for their root span to be created, keyed by the root's `collection` field.
+static PENDING_ROOTS: Mutex<Option<HashMap<u64, Arc<Collector>>>> = Mutex::new(None);
+
+fn pending_roots() -> MutexGuard<'static, Option<HashMap<u64, Arc<Collector>>>> {
+    PENDING_ROOTS.lock().unwrap_or_else(PoisonError::into_inner)
+}
+
+/// One closed span under a collection root.
+#[derive(Debug, Clone)]
+pub(crate) struct SpanRecord {
+    /// Unique within the collection; the root is `0`.
+    pub id: u64,
+    pub parent: Option<u64>,
+    pub name: &'static str,
+    pub fields: BTreeMap<&'static str, String>,
+    /// Offset from the start of the collection.
+    pub start: Duration,
+    pub elapsed: Duration,
+}
+
+#[derive(Debug)]
+struct Collector {
+    started: Instant,
+    next_span: AtomicU64,
+    spans: Mutex<Vec<SpanRecord>>,
+}
+
+impl Collector {
+    fn new() -> Self {
+        Self {
+            started: Instant::now(),
+            next_span: AtomicU64::new(0),
+            spans: Mutex::new(Vec::new()),
+        }
+    }
+
+    fn push(&self, record: SpanRecord) {
+        self.spans
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .push(record);
+    }
+
+    fn take(&self) -> Vec<SpanRecord> {
+        std::mem::take(&mut *self.spans.lock().unwrap_or_else(PoisonError::into_inner))
+    }
+}
+
+struct ActiveCollection;
+
+impl ActiveCollection {
+    fn start() -> Self {
+        ACTIVE_COLLECTIONS.fetch_add(1, Ordering::AcqRel);
+        Self
+    }
+}
+
+impl Drop for ActiveCollection {
+    fn drop(&mut self) {
+        ACTIVE_COLLECTIONS.fetch_sub(1, Ordering::AcqRel);
+    }
+}
+
+/// Runs `fut` under a collection root. Returns its output, every profiling span that closed
+/// inside it, and the wall-clock time.
+pub(crate) async fn collect<F: Future>(fut: F) -> (F::Output, Vec<SpanRecord>, Duration) {
+    let _active = ActiveCollection::start();
+    let collector = Arc::new(Collector::new());
+    let collection = NEXT_COLLECTION.fetch_add(1, Ordering::Relaxed);
+    pending_roots()
+        .get_or_insert_with(HashMap::new)
+        .insert(collection, Arc::clone(&collector));
+    let root = profile_span!("command", collection);
+    if let Some(pending) = pending_roots().as_mut() {
+        pending.remove(&collection);
+    }
+
+    let output = fut.instrument(root).await;
+    let elapsed = collector.started.elapsed();
+    (output, collector.take(), elapsed)
+}
+
+#[derive(Debug, Default)]
+struct FieldValues {
+    collection: Option<u64>,
+    values: BTreeMap<&'static str, String>,
+}
+
+impl Visit for FieldValues {
+    fn record_u64(&mut self, field: &Field, value: u64) {
+        if field.name() == "collection" {
+            self.collection = Some(value);
+        } else {
+            self.values.insert(field.name(), value.to_string());
+        }
+    }
+
+    fn record_str(&mut self, field: &Field, value: &str) {
+        self.values.insert(field.name(), value.to_string());
+    }
+
+    fn record_debug(&mut self, field: &Field, value: &dyn fmt::Debug) {
+        self.values.insert(field.name(), format!("{value:?}"));
+    }
+}
+
+struct Opened {
+    at: Instant,
+    id: u64,
+    parent: Option<u64>,
+}
+
+/// Attaches spans to the collection of their nearest collecting ancestor and records them on
+/// close.
+struct ProfileLayer;
+
+impl<S> Layer<S> for ProfileLayer
+where
+    S: Subscriber + for<'a> LookupSpan<'a>,
+{
+    fn on_new_span(&self, attrs: &Attributes<'_>, id: &Id, ctx: Context<'_, S>) {
+        let Some(span) = ctx.span(id) else {
+            return;
+        };
+        let mut fields = FieldValues::default();
+        attrs.record(&mut fields);
+        let (collector, parent) = match fields.collection.take() {
+            Some(collection) => (
+                pending_roots()
+                    .as_ref()
+                    .and_then(|pending| pending.get(&collection).cloned()),
+                None,
+            ),
+            None => match span.parent() {
+                Some(parent) => {
+                    let extensions = parent.extensions();
+                    (
+                        extensions.get::<Arc<Collector>>().cloned(),
+                        extensions.get::<Opened>().map(|opened| opened.id),
+                    )
+                }
+                None => (None, None),
+            },
+        };
+        let Some(collector) = collector else {
+            return;
+        };
+        let opened = Opened {
+            at: Instant::now(),
+            id: collector.next_span.fetch_add(1, Ordering::Relaxed),
+            parent,
+        };
+        let mut extensions = span.extensions_mut();
+        extensions.insert(collector);
+        extensions.insert(fields);
+        extensions.insert(opened);
+    }
+
+    fn on_record(&self, id: &Id, values: &Record<'_>, ctx: Context<'_, S>) {
+        let Some(span) = ctx.span(id) else {
+            return;
+        };
+        if let Some(fields) = span.extensions_mut().get_mut::<FieldValues>() {
+            values.record(fields);
+        }
+    }
+
+    fn on_close(&self, id: Id, ctx: Context<'_, S>) {
+        let Some(span) = ctx.span(&id) else {
+            return;
+        };
+        let mut extensions = span.extensions_mut();
+        let (Some(collector), Some(opened)) = (
+            extensions.remove::<Arc<Collector>>(),
+            extensions.remove::<Opened>(),
+        ) else {
+            return;
+        };
+        let fields = extensions
+            .remove::<FieldValues>()
+            .map(|fields| fields.values)
+            .unwrap_or_default();
+        collector.push(SpanRecord {
+            id: opened.id,
+            parent: opened.parent,
+            name: span.name(),
+            fields,
+            start: opened.at.saturating_duration_since(collector.started),
+            elapsed: opened.at.elapsed(),
+        });
+    }
+}
+
+/// The profiling layer, for installation next to the binaries' log formatter.
+pub fn layer<S>() -> impl Layer<S>
+where
+    S: Subscriber + for<'a> LookupSpan<'a>,
+{
+    let filter = dynamic_filter_fn(|metadata, _| {
+        metadata.target() == TARGET && ACTIVE_COLLECTIONS.load(Ordering::Acquire) > 0
+    })
+    .with_max_level_hint(LevelFilter::INFO)
+    .with_callsite(|metadata| {
+        if metadata.target() == TARGET {
+            Interest::sometimes()
+        } else {
+            Interest::never()
+        }
+    });
+    ProfileLayer.with_filter(filter)
+}
+
+#[cfg(test)]
+mod tests {
+    use tracing::instrument::WithSubscriber;
+    use tracing_subscriber::layer::SubscriberExt;
+
+    use super::*;
+
+    #[tokio::test]
+    async fn collect_records_nested_spans_with_their_fields() {
+        let subscriber = tracing_subscriber::registry().with(layer());
+        let ((), spans, _) = collect(async {
+            let upstream = profile_span!("upstream", status = tracing::field::Empty);
+            {
+                let _decode = profile_span!("deserialize", api = "mygene");
+            }
+            upstream.record("status", 200_u64);
+        })
+        .with_subscriber(subscriber)
+        .await;
+
+        let names = spans.iter().map(|span| span.name).collect::<Vec<_>>();
+        assert_eq!(names, vec!["deserialize", "upstream", "command"]);
+        assert_eq!(
+            spans[0].fields.get("api").map(String::as_str),
+            Some("mygene")
+        );
+        assert_eq!(
+            spans[1].fields.get("status").map(String::as_str),
+            Some("200")
+        );
+        assert_eq!((spans[2].id, spans[2].parent), (0, None));
+        assert!(spans[..2].iter().all(|span| span.parent == Some(0)));
+    }
+}
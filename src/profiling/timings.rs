@@ -0,0 +1,278 @@
+//! `--timings`: phase durations, section wall times and upstream calls for one command.
+
+use std::collections::BTreeMap;
+use std::time::Duration;
+
+use serde::Serialize;
+
+use super::SpanRecord;
+
+// Report order. `upstream` covers whole requests, so the phases inside it are not additive.
+const PHASES: [&str; 7] = [
+    "upstream",
+    "rate_limit",
+    "http",
+    "cache",
+    "deserialize",
+    "transform",
+    "render",
+];
+const URL_DISPLAY_MAX_CHARS: usize = 72;
+
+#[derive(Debug, Clone, Serialize, PartialEq)]
+pub(crate) struct PhaseTiming {
+    pub phase: &'static str,
+    pub calls: usize,
+    pub ms: f64,
+}
+
+/// Wall time of one entity section or fan-out leg. Sections run concurrently, so these overlap.
+#[derive(Debug, Clone, Serialize, PartialEq)]
+pub(crate) struct SectionTime {
+    pub section: String,
+    pub ms: f64,
+}
+
+#[derive(Debug, Clone, Serialize, PartialEq)]
+pub(crate) struct UpstreamCall {
+    pub source: String,
+    pub url: String,
+    pub cache: String,
+    pub status: String,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub bytes: Option<u64>,
+    pub ms: f64,
+}
+
+/// Where one command spent its time. Phase totals add up concurrent work, so they can exceed
+/// `total_ms` for fan-out commands.
+#[derive(Debug, Clone, Serialize, PartialEq)]
+pub(crate) struct TimingReport {
+    pub total_ms: f64,
+    pub phases: Vec<PhaseTiming>,
+    #[serde(skip_serializing_if = "Vec::is_empty")]
+    pub sections: Vec<SectionTime>,
+    pub upstream: Vec<UpstreamCall>,
+}
+
+fn millis(duration: Duration) -> f64 {
+    (duration.as_secs_f64() * 10_000.0).round() / 10.0
+}
+
+fn field(span: &SpanRecord, name: &str) -> String {
+    span.fields
+        .get(name)
+        .cloned()
+        .unwrap_or_else(|| "-".to_string())
+}
+
+impl TimingReport {
+    pub(crate) fn from_spans(spans: &[SpanRecord], total: Duration) -> Self {
+        let mut phases: BTreeMap<&str, (usize, Duration)> = BTreeMap::new();
+        for span in spans {
+            let entry = phases.entry(span.name).or_default();
+            entry.0 += 1;
+            entry.1 += span.elapsed;
+        }
+        let phases = PHASES
+            .iter()
+            .filter_map(|&phase| {
+                phases.get(phase).map(|(calls, elapsed)| PhaseTiming {
+                    phase,
+                    calls: *calls,
+                    ms: millis(*elapsed),
+                })
+            })
+            .collect();
+
+        let sections = spans
+            .iter()
+            .filter(|span| span.name == "section")
+            .map(|span| SectionTime {
+                section: field(span, "section"),
+                ms: millis(span.elapsed),
+            })
+            .collect();
+
+        let upstream = spans
+            .iter()
+            .filter(|span| span.name == "upstream")
+            .map(|span| UpstreamCall {
+                source: field(span, "source"),
+                url: field(span, "url"),
+                cache: field(span, "cache"),
+                status: field(span, "status"),
+                bytes: span
+                    .fields
+                    .get("bytes")
+                    .and_then(|bytes| bytes.parse().ok()),
+                ms: millis(span.elapsed),
+            })
+            .collect();
+
+        Self {
+            total_ms: millis(total),
+            phases,
+            sections,
+            upstream,
+        }
+    }
+
+    pub(crate) fn to_markdown(&self) -> String {
+        let mut out = format!("## Timings\n\nTotal: {} ms\n", self.total_ms);
+        if !self.phases.is_empty() {
+            out.push_str("\n| Phase | Calls | ms |\n|---|---|---|\n");
+            for phase in &self.phases {
+                out.push_str(&format!(
+                    "| {} | {} | {} |\n",
+                    phase.phase, phase.calls, phase.ms
+                ));
+            }
+        }
+        if !self.sections.is_empty() {
+            out.push_str("\n| Section | ms |\n|---|---|\n");
+            for section in &self.sections {
+                out.push_str(&format!("| {} | {} |\n", section.section, section.ms));
+            }
+        }
+        if !self.upstream.is_empty() {
+            out.push_str(
+                "\n| Upstream | Source | Cache | Status | Bytes | ms |\n|---|---|---|---|---|---|\n",
+            );
+            for call in &self.upstream {
+                let bytes = call
+                    .bytes
+                    .map(|bytes| bytes.to_string())
+                    .unwrap_or_else(|| "-".to_string());
+                out.push_str(&format!(
+                    "| {} | {} | {} | {} | {bytes} | {} |\n",
+                    display_url(&call.url),
+                    call.source,
+                    call.cache,
+                    call.status,
+                    call.ms
+                ));
+            }
+        }
+        out
+    }
+
+    /// Adds the report to command output: as `_timings` on a JSON object, otherwise as a
+    /// markdown section after the text.
+    pub(crate) fn attach_to(&self, text: &str) -> String {
+        if let Ok(serde_json::Value::Object(mut object)) = serde_json::from_str(text)
+            && let Ok(report) = serde_json::to_value(self)
+        {
+            object.insert("_timings".to_string(), report);
+            if let Ok(json) = serde_json::to_string_pretty(&object) {
+                return json;
+            }
+        }
+        let mut out = text.trim_end().to_string();
+        out.push_str("\n\n");
+        out.push_str(&self.to_markdown());
+        out
+    }
+}
+
+fn display_url(url: &str) -> String {
+    if url.chars().count() <= URL_DISPLAY_MAX_CHARS {
+        return url.to_string();
+    }
+    let mut short = url.chars().take(URL_DISPLAY_MAX_CHARS).collect::<String>();
+    short.push('…');
+    short
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn span(name: &'static str, ms: u64, fields: &[(&'static str, &str)]) -> SpanRecord {
+        SpanRecord {
+            id: 0,
+            parent: None,
+            name,
+            fields: fields
+                .iter()
+                .map(|(key, value)| (*key, value.to_string()))
+                .collect(),
+            start: Duration::ZERO,
+            elapsed: Duration::from_millis(ms),
+        }
+    }
+
+    fn sample_report() -> TimingReport {
+        let spans = vec![
+            span("rate_limit", 40, &[]),
+            span("http", 110, &[]),
+            span(
+                "upstream",
+                160,
+                &[
+                    ("source", "mychem"),
+                    ("url", "https://mychem.info/v1/query"),
+                    ("cache", "miss"),
+                    ("status", "200"),
+                    ("bytes", "5120"),
+                ],
+            ),
+            span("deserialize", 3, &[("api", "mychem")]),
+            span("section", 170, &[("section", "targets")]),
+            span("render", 2, &[("template", "drug.md.j2")]),
+            span("render", 1, &[("template", "drug.md.j2")]),
+            span("command", 180, &[]),
+        ];
+        TimingReport::from_spans(&spans, Duration::from_millis(180))
+    }
+
+    #[test]
+    fn report_sums_phases_in_order_and_lists_upstream_calls() {
+        let report = sample_report();
+
+        let phases = report
+            .phases
+            .iter()
+            .map(|phase| (phase.phase, phase.calls, phase.ms))
+            .collect::<Vec<_>>();
+        assert_eq!(
+            phases,
+            vec![
+                ("upstream", 1, 160.0),
+                ("rate_limit", 1, 40.0),
+                ("http", 1, 110.0),
+                ("deserialize", 1, 3.0),
+                ("render", 2, 3.0),
+            ]
+        );
+        assert_eq!(
+            report.sections,
+            vec![SectionTime {
+                section: "targets".into(),
+                ms: 170.0
+            }]
+        );
+        assert!(report.to_markdown().contains("| targets | 170 |"));
+        assert_eq!(report.upstream.len(), 1);
+        assert_eq!(report.upstream[0].cache, "miss");
+        assert_eq!(report.upstream[0].bytes, Some(5120));
+        assert!(
+            report
+                .to_markdown()
+                .contains("| https://mychem.info/v1/query | mychem | miss | 200 | 5120 | 160 |")
+        );
+    }
+
+    #[test]
+    fn attach_adds_timings_field_to_json_objects_and_appends_to_text() {
+        let report = sample_report();
+
+        let json = report.attach_to(r#"{"name": "imatinib"}"#);
+        let value: serde_json::Value = serde_json::from_str(&json).expect("valid json");
+        assert_eq!(value["name"], "imatinib");
+        assert_eq!(value["_timings"]["total_ms"], 180.0);
+
+        let text = report.attach_to("# imatinib\n");
+        assert!(text.starts_with("# imatinib\n\n## Timings\n\nTotal: 180 ms\n"));
+    }
+}
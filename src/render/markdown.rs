@@ -2,7 +2,7 @@ use std::collections::HashSet;
 use std::fmt::Write as _;
 use std::sync::OnceLock;
 
-use minijinja::{Environment, context};
+use minijinja::{Environment, Template, context};
 
 use crate::cli::debug_plan::DebugPlan;
 use crate::cli::search_all::SearchAllResults;
@@ -186,6 +186,20 @@ fn with_pagination_footer(mut body: String, pagination_footer: &str) -> String {
     body
 }
 
+/// A loaded template whose renders are timed as the `render` profiling phase.
+struct TimedTemplate(Template<'static, 'static>);
+
+impl TimedTemplate {
+    fn render<S: serde::Serialize>(&self, ctx: S) -> Result<String, minijinja::Error> {
+        let _span = crate::profiling::profile_span!("render", template = self.0.name());
+        self.0.render(ctx)
+    }
+}
+
+fn template(name: &str) -> Result<TimedTemplate, BioMcpError> {
+    Ok(TimedTemplate(env()?.get_template(name)?))
+}
+
 fn env() -> Result<&'static Environment<'static>, BioMcpError> {
     if let Some(env) = ENV.get() {
         return Ok(env);
@@ -1844,7 +1858,7 @@ pub(crate) fn related_device_event(event: &DeviceEvent) -> Vec<String> {
 }
 
 pub fn gene_markdown(gene: &Gene, requested_sections: &[String]) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("gene.md.j2")?;
+    let tmpl = template("gene.md.j2")?;
     let section_only = is_section_only_requested(requested_sections);
     let include_all = has_all_section(requested_sections);
     let requested = requested_section_names(requested_sections);
@@ -1912,7 +1926,7 @@ pub fn gene_search_markdown_with_footer(
     results: &[GeneSearchResult],
     pagination_footer: &str,
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("gene_search.md.j2")?;
+    let tmpl = template("gene_search.md.j2")?;
     let body = tmpl.render(context! {
         query => query,
         count => results.len(),
@@ -1926,7 +1940,7 @@ pub fn article_markdown(
     article: &Article,
     requested_sections: &[String],
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("article.md.j2")?;
+    let tmpl = template("article.md.j2")?;
     let section_only = is_section_only_requested(requested_sections);
     let include_all = has_all_section(requested_sections);
     let requested = requested_section_names(requested_sections);
@@ -2036,7 +2050,7 @@ pub fn article_entities_markdown(
         mutations.truncate(limit);
     }
 
-    let tmpl = env()?.get_template("article_entities.md.j2")?;
+    let tmpl = template("article_entities.md.j2")?;
     Ok(tmpl.render(context! {
         pmid => pmid,
         genes => genes,
@@ -2290,7 +2304,7 @@ pub fn article_search_markdown_with_footer_and_context(
         })
         .collect::<Vec<_>>();
 
-    let tmpl = env()?.get_template("article_search.md.j2")?;
+    let tmpl = template("article_search.md.j2")?;
     let body = tmpl.render(context! {
         query => query,
         count => results.len(),
@@ -2348,7 +2362,7 @@ pub fn disease_markdown(
         disease.name.as_str()
     };
 
-    let tmpl = env()?.get_template("disease.md.j2")?;
+    let tmpl = template("disease.md.j2")?;
     let top_gene_score_labels = disease_top_gene_score_labels(disease);
     let gene_association_rows = disease_gene_association_rows(disease);
     let phenotype_rows = disease_phenotype_rows(disease);
@@ -2411,7 +2425,7 @@ pub fn disease_search_markdown_with_footer(
     fallback_used: bool,
     pagination_footer: &str,
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("disease_search.md.j2")?;
+    let tmpl = template("disease_search.md.j2")?;
     let discover_hint = discover_try_line(raw_query, "resolve abbreviations and synonyms");
     let body = tmpl.render(context! {
         query => query_summary,
@@ -2425,7 +2439,7 @@ pub fn disease_search_markdown_with_footer(
 }
 
 pub fn pgx_markdown(pgx: &Pgx, requested_sections: &[String]) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("pgx.md.j2")?;
+    let tmpl = template("pgx.md.j2")?;
     let section_only = is_section_only_requested(requested_sections);
     let include_all = has_all_section(requested_sections);
     let requested = requested_section_names(requested_sections);
@@ -2475,7 +2489,7 @@ pub fn pgx_search_markdown_with_footer(
     results: &[PgxSearchResult],
     pagination_footer: &str,
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("pgx_search.md.j2")?;
+    let tmpl = template("pgx_search.md.j2")?;
     let body = tmpl.render(context! {
         query => query,
         count => results.len(),
@@ -2486,7 +2500,7 @@ pub fn pgx_search_markdown_with_footer(
 }
 
 pub fn trial_markdown(trial: &Trial, requested_sections: &[String]) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("trial.md.j2")?;
+    let tmpl = template("trial.md.j2")?;
     let section_only = is_section_only_requested(requested_sections);
     let include_all = has_all_section(requested_sections);
     let requested = requested_section_names(requested_sections);
@@ -2554,7 +2568,7 @@ pub fn trial_search_markdown_with_footer(
     show_zero_result_nickname_hint: bool,
     nickname_query: Option<&str>,
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("trial_search.md.j2")?;
+    let tmpl = template("trial_search.md.j2")?;
     let body = tmpl.render(context! {
         query => query,
         count => results.len(),
@@ -2571,7 +2585,7 @@ pub fn variant_markdown(
     variant: &Variant,
     requested_sections: &[String],
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("variant.md.j2")?;
+    let tmpl = template("variant.md.j2")?;
     let section_only = is_section_only_requested(requested_sections);
     let include_all = has_all_section(requested_sections);
     let requested = requested_section_names(requested_sections);
@@ -2704,7 +2718,7 @@ pub fn variant_search_markdown_with_footer(
     results: &[VariantSearchResult],
     pagination_footer: &str,
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("variant_search.md.j2")?;
+    let tmpl = template("variant_search.md.j2")?;
     let body = tmpl.render(context! {
         query => query,
         count => results.len(),
@@ -2727,7 +2741,7 @@ pub fn phenotype_search_markdown_with_footer(
     results: &[PhenotypeSearchResult],
     pagination_footer: &str,
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("phenotype_search.md.j2")?;
+    let tmpl = template("phenotype_search.md.j2")?;
     let body = tmpl.render(context! {
         query => query,
         count => results.len(),
@@ -2750,7 +2764,7 @@ pub fn gwas_search_markdown_with_footer(
     results: &[VariantGwasAssociation],
     pagination_footer: &str,
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("gwas_search.md.j2")?;
+    let tmpl = template("gwas_search.md.j2")?;
     let body = tmpl.render(context! {
         query => query,
         count => results.len(),
@@ -3283,7 +3297,7 @@ pub fn drug_markdown_with_region(
     region: DrugRegion,
     raw_label: bool,
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("drug.md.j2")?;
+    let tmpl = template("drug.md.j2")?;
     let section_only = is_section_only_requested(requested_sections);
     let include_all = has_all_section(requested_sections);
     let requested = requested_section_names(requested_sections);
@@ -3368,7 +3382,7 @@ pub fn drug_search_markdown_with_footer(
     total_count: Option<usize>,
     pagination_footer: &str,
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("drug_search.md.j2")?;
+    let tmpl = template("drug_search.md.j2")?;
     let count = total_count.unwrap_or(results.len());
     let discover_hint = discover_try_line(query, "resolve drug trial codes and aliases");
     let body = tmpl.render(context! {
@@ -3560,7 +3574,7 @@ pub fn pathway_markdown(
     pathway: &Pathway,
     requested_sections: &[String],
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("pathway.md.j2")?;
+    let tmpl = template("pathway.md.j2")?;
     let section_only = is_section_only_requested(requested_sections);
     let include_all = has_all_section(requested_sections);
     let requested = requested_section_names(requested_sections);
@@ -3609,7 +3623,7 @@ pub fn pathway_search_markdown_with_footer(
     total: Option<usize>,
     pagination_footer: &str,
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("pathway_search.md.j2")?;
+    let tmpl = template("pathway_search.md.j2")?;
     let body = tmpl.render(context! {
         query => query,
         count => results.len(),
@@ -3624,7 +3638,7 @@ pub fn protein_markdown(
     protein: &Protein,
     requested_sections: &[String],
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("protein.md.j2")?;
+    let tmpl = template("protein.md.j2")?;
     let section_only = is_section_only_requested(requested_sections);
     let include_all = has_all_section(requested_sections);
     let requested = requested_section_names(requested_sections);
@@ -3679,7 +3693,7 @@ pub fn protein_search_markdown_with_footer(
     results: &[ProteinSearchResult],
     pagination_footer: &str,
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("protein_search.md.j2")?;
+    let tmpl = template("protein_search.md.j2")?;
     let body = tmpl.render(context! {
         query => query,
         count => results.len(),
@@ -3693,7 +3707,7 @@ pub fn adverse_event_markdown(
     event: &AdverseEvent,
     requested_sections: &[String],
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("adverse_event.md.j2")?;
+    let tmpl = template("adverse_event.md.j2")?;
     let section_only = is_section_only_requested(requested_sections);
     let parsed = crate::entities::adverse_event::parse_sections(requested_sections)?;
     let show_reactions_section = !section_only || parsed.include_reactions;
@@ -3749,7 +3763,7 @@ pub fn adverse_event_search_markdown_with_footer(
     summary: &AdverseEventSearchSummary,
     pagination_footer: &str,
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("adverse_event_search.md.j2")?;
+    let tmpl = template("adverse_event_search.md.j2")?;
     let body = tmpl.render(context! {
         query => query,
         count => results.len(),
@@ -3782,7 +3796,7 @@ pub fn adverse_event_count_markdown(
 }
 
 pub fn device_event_markdown(event: &DeviceEvent) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("device_event.md.j2")?;
+    let tmpl = template("device_event.md.j2")?;
     let body = tmpl.render(context! {
         report_id => &event.report_id,
         report_number => &event.report_number,
@@ -3812,7 +3826,7 @@ pub fn device_event_search_markdown_with_footer(
     results: &[DeviceEventSearchResult],
     pagination_footer: &str,
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("device_event_search.md.j2")?;
+    let tmpl = template("device_event_search.md.j2")?;
     let body = tmpl.render(context! {
         query => query,
         count => results.len(),
@@ -3835,7 +3849,7 @@ pub fn recall_search_markdown_with_footer(
     results: &[RecallSearchResult],
     pagination_footer: &str,
 ) -> Result<String, BioMcpError> {
-    let tmpl = env()?.get_template("recall_search.md.j2")?;
+    let tmpl = template("recall_search.md.j2")?;
     let body = tmpl.render(context! {
         query => query,
         count => results.len(),
@@ -4269,7 +4283,7 @@ pub fn search_all_markdown(
         rows: Vec<Vec<String>>,
     }
 
-    let tmpl = env()?.get_template("search_all.md.j2")?;
+    let tmpl = template("search_all.md.j2")?;
     let sections = results
         .sections
         .iter()
@@ -4329,7 +4343,7 @@ pub fn render_discover(result: &DiscoverResult) -> Result<String, BioMcpError> {
         concepts: Vec<DiscoverConceptView>,
     }
 
-    let tmpl = env()?.get_template("discover.md.j2")?;
+    let tmpl = template("discover.md.j2")?;
     let groups = [
         DiscoverType::Gene,
         DiscoverType::Drug,
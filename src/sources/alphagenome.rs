@@ -1,10 +1,12 @@
 use std::io::Cursor;
 use std::time::Duration;
 
-use tokio_stream::StreamExt;
+use prost::Message;
+use tokio_stream::{Stream, StreamExt};
 
 use crate::entities::variant::VariantPrediction;
 use crate::error::BioMcpError;
+use crate::sources::cassette::{self, CassetteMode};
 
 const ALPHAGENOME_API: &str = "alphagenome";
 const ALPHAGENOME_BASE_ENV: &str = "BIOMCP_ALPHAGENOME_BASE";
@@ -58,10 +60,17 @@ impl AlphaGenomeClient {
             .connect_timeout(Duration::from_secs(10))
             .timeout(Duration::from_secs(60));
 
-        let channel = endpoint.connect().await.map_err(|err| BioMcpError::Api {
-            api: ALPHAGENOME_API.to_string(),
-            message: format!("connect failed: {err:?}"),
-        })?;
+        // A replayed run never sends anything, so it must not dial out either.
+        let replaying =
+            cassette::active()?.is_some_and(|cassette| cassette.mode() == CassetteMode::Replay);
+        let channel = if replaying {
+            endpoint.connect_lazy()
+        } else {
+            endpoint.connect().await.map_err(|err| BioMcpError::Api {
+                api: ALPHAGENOME_API.to_string(),
+                message: format!("connect failed: {err:?}"),
+            })?
+        };
 
         Ok(Self { channel, api_key })
     }
@@ -73,10 +82,6 @@ impl AlphaGenomeClient {
         reference: &str,
         alternate: &str,
     ) -> Result<VariantPrediction, BioMcpError> {
-        let mut client = alphagenome_proto::dna_model_service_client::DnaModelServiceClient::new(
-            self.channel.clone(),
-        );
-
         let interval = make_interval(chromosome, position);
         let variant = alphagenome_proto::Variant {
             chromosome: chromosome.to_string(),
@@ -93,6 +98,58 @@ impl AlphaGenomeClient {
             model_version: String::new(),
         };
 
+        let values = match cassette::active()? {
+            None => read_outputs(&mut self.open_score_variant(request).await?).await?,
+            Some(cassette) => {
+                let key =
+                    cassette::grpc_key(ALPHAGENOME_API, "ScoreVariant", &request.encode_to_vec());
+                let messages = match cassette.mode() {
+                    CassetteMode::Replay => {
+                        decode_messages(&cassette.replay_messages(&key).map_err(|miss| {
+                            BioMcpError::Api {
+                                api: ALPHAGENOME_API.to_string(),
+                                message: miss.to_string(),
+                            }
+                        })?)?
+                    }
+                    CassetteMode::Record => {
+                        let mut responses = self.open_score_variant(request).await?;
+                        let mut messages = Vec::new();
+                        while let Some(resp) = responses.next().await {
+                            messages.push(resp.map_err(stream_error)?);
+                        }
+                        let encoded = messages
+                            .iter()
+                            .map(Message::encode_to_vec)
+                            .collect::<Vec<_>>();
+                        cassette.record_messages(key, &encoded);
+                        messages
+                    }
+                };
+                read_outputs(&mut tokio_stream::iter(messages.into_iter().map(Ok))).await?
+            }
+        };
+
+        // Map outputs by scorer order.
+        let expression = values.first();
+        let splice = values.get(1);
+        let chromatin = values.get(2);
+
+        Ok(VariantPrediction {
+            expression_lfc: expression.and_then(|s| s.best_value),
+            splice_score: splice.and_then(|s| s.best_value),
+            chromatin_score: chromatin.and_then(|s| s.best_value),
+            top_gene: expression.and_then(|s| s.best_gene.clone()),
+        })
+    }
+
+    async fn open_score_variant(
+        &self,
+        request: alphagenome_proto::ScoreVariantRequest,
+    ) -> Result<tonic::Streaming<alphagenome_proto::ScoreVariantResponse>, BioMcpError> {
+        let mut client = alphagenome_proto::dna_model_service_client::DnaModelServiceClient::new(
+            self.channel.clone(),
+        );
         let stream = tokio_stream::iter(vec![request]);
         let mut req = tonic::Request::new(stream);
         req.metadata_mut().insert(
@@ -102,66 +159,81 @@ impl AlphaGenomeClient {
                 .map_err(|_| BioMcpError::InvalidArgument("Invalid ALPHAGENOME_API_KEY".into()))?,
         );
 
-        let mut responses = client
+        Ok(client
             .score_variant(req)
             .await
             .map_err(|err| BioMcpError::Api {
                 api: ALPHAGENOME_API.to_string(),
                 message: format!("rpc ScoreVariant failed: {err}"),
             })?
-            .into_inner();
-
-        let mut values: Vec<TensorSummary> = Vec::new();
-
-        while let Some(resp) = responses.next().await {
-            let resp = resp.map_err(|err| BioMcpError::Api {
-                api: ALPHAGENOME_API.to_string(),
-                message: format!("rpc stream error: {err}"),
-            })?;
+            .into_inner())
+    }
+}
 
-            match resp.payload {
-                Some(alphagenome_proto::score_variant_response::Payload::Output(out)) => {
-                    let tensor = out
-                        .variant_data
-                        .as_ref()
-                        .and_then(|v| v.values.as_ref())
-                        .ok_or_else(|| BioMcpError::Api {
-                            api: ALPHAGENOME_API.to_string(),
-                            message: "Missing ScoreVariantOutput tensor".into(),
-                        })?
-                        .clone();
+fn stream_error(err: tonic::Status) -> BioMcpError {
+    BioMcpError::Api {
+        api: ALPHAGENOME_API.to_string(),
+        message: format!("rpc stream error: {err}"),
+    }
+}
 
-                    let chunks = read_tensor_chunks(&mut responses, &tensor).await?;
-                    let summary = summarize_tensor(&tensor, &chunks, out.variant_data.as_ref())?;
-                    values.push(summary);
-                }
-                Some(alphagenome_proto::score_variant_response::Payload::TensorChunk(_)) => {
-                    return Err(BioMcpError::Api {
-                        api: ALPHAGENOME_API.to_string(),
-                        message: "Received tensor chunk before output".into(),
-                    });
+fn decode_messages(
+    messages: &[Vec<u8>],
+) -> Result<Vec<alphagenome_proto::ScoreVariantResponse>, BioMcpError> {
+    messages
+        .iter()
+        .map(|bytes| {
+            alphagenome_proto::ScoreVariantResponse::decode(bytes.as_slice()).map_err(|err| {
+                BioMcpError::Api {
+                    api: ALPHAGENOME_API.to_string(),
+                    message: format!("invalid cassette message: {err}"),
                 }
-                None => {
-                    return Err(BioMcpError::Api {
+            })
+        })
+        .collect()
+}
+
+/// Summarizes each `Output` message of a ScoreVariant response stream, in stream order.
+async fn read_outputs<S>(responses: &mut S) -> Result<Vec<TensorSummary>, BioMcpError>
+where
+    S: Stream<Item = Result<alphagenome_proto::ScoreVariantResponse, tonic::Status>> + Unpin,
+{
+    let mut values: Vec<TensorSummary> = Vec::new();
+
+    while let Some(resp) = responses.next().await {
+        let resp = resp.map_err(stream_error)?;
+
+        match resp.payload {
+            Some(alphagenome_proto::score_variant_response::Payload::Output(out)) => {
+                let tensor = out
+                    .variant_data
+                    .as_ref()
+                    .and_then(|v| v.values.as_ref())
+                    .ok_or_else(|| BioMcpError::Api {
                         api: ALPHAGENOME_API.to_string(),
-                        message: "Empty AlphaGenome response".into(),
-                    });
-                }
+                        message: "Missing ScoreVariantOutput tensor".into(),
+                    })?
+                    .clone();
+
+                let chunks = read_tensor_chunks(responses, &tensor).await?;
+                let summary = summarize_tensor(&tensor, &chunks, out.variant_data.as_ref())?;
+                values.push(summary);
+            }
+            Some(alphagenome_proto::score_variant_response::Payload::TensorChunk(_)) => {
+                return Err(BioMcpError::Api {
+                    api: ALPHAGENOME_API.to_string(),
+                    message: "Received tensor chunk before output".into(),
+                });
+            }
+            None => {
+                return Err(BioMcpError::Api {
+                    api: ALPHAGENOME_API.to_string(),
+                    message: "Empty AlphaGenome response".into(),
+                });
             }
         }
-
-        // Map outputs by scorer order.
-        let expression = values.first();
-        let splice = values.get(1);
-        let chromatin = values.get(2);
-
-        Ok(VariantPrediction {
-            expression_lfc: expression.and_then(|s| s.best_value),
-            splice_score: splice.and_then(|s| s.best_value),
-            chromatin_score: chromatin.and_then(|s| s.best_value),
-            top_gene: expression.and_then(|s| s.best_gene.clone()),
-        })
     }
+    Ok(values)
 }
 
 #[derive(Debug, Clone)]
@@ -219,10 +291,13 @@ fn make_interval(chr: &str, pos_1based: i64) -> alphagenome_proto::Interval {
     }
 }
 
-async fn read_tensor_chunks(
-    responses: &mut tonic::Streaming<alphagenome_proto::ScoreVariantResponse>,
+async fn read_tensor_chunks<S>(
+    responses: &mut S,
     tensor: &alphagenome_proto::Tensor,
-) -> Result<Vec<alphagenome_proto::TensorChunk>, BioMcpError> {
+) -> Result<Vec<alphagenome_proto::TensorChunk>, BioMcpError>
+where
+    S: Stream<Item = Result<alphagenome_proto::ScoreVariantResponse, tonic::Status>> + Unpin,
+{
     match tensor.payload {
         Some(alphagenome_proto::tensor::Payload::Array(ref arr)) => Ok(vec![arr.clone()]),
         Some(alphagenome_proto::tensor::Payload::ChunkCount(n)) => {
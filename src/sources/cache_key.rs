@@ -0,0 +1,412 @@
+//! Normalized cache keys for semantically identical upstream requests.
+//!
+//! `CacheKeyMiddleware` runs first in the shared client. It derives a canonical key from each
+//! request and carries it to the HTTP cache and coalescing layers in an internal header, which
+//! `StripCacheKeyMiddleware` removes before the request leaves the process. The key:
+//!
+//! - sorts query parameters,
+//! - drops credential and caller-identification parameters (`api_key`, `email`, ...), so keyed
+//!   and keyless runs share entries,
+//! - trims and case-folds parameters a source declares case-insensitive with
+//!   `fold_case_params`,
+//! - canonicalizes JSON POST bodies (GraphQL) by sorting object keys and collapsing query
+//!   whitespace.
+//!
+//! The upstream request itself is never rewritten.
+
+use std::collections::BTreeMap;
+
+use http::Extensions;
+use reqwest::Url;
+use reqwest::header::{CONTENT_TYPE, HeaderName};
+use reqwest_middleware::{Middleware, Next, RequestBuilder};
+use sha2::{Digest, Sha256};
+
+pub(crate) const CACHE_KEY_HEADER: HeaderName = HeaderName::from_static("x-biomcp-cache-key");
+// Status header the HTTP cache layer adds to responses it served from storage.
+const CACHE_STATUS_HEADER: &str = "x-cache";
+
+const CREDENTIAL_PARAMS: &[&str] = &[
+    "access_token",
+    "api_key",
+    "apikey",
+    "email",
+    "token",
+    "tool",
+];
+
+/// Request extension naming query parameters whose values the upstream treats
+/// case-insensitively (and ignores surrounding whitespace in).
+#[derive(Debug, Clone, Copy)]
+pub(crate) struct CaseInsensitiveParams(pub(crate) &'static [&'static str]);
+
+/// Declares `params` case-insensitive for cache-key purposes.
+pub(crate) fn fold_case_params(
+    req: RequestBuilder,
+    params: &'static [&'static str],
+) -> RequestBuilder {
+    req.with_extension(CaseInsensitiveParams(params))
+}
+
+fn is_credential_param(name: &str) -> bool {
+    CREDENTIAL_PARAMS
+        .iter()
+        .any(|param| name.eq_ignore_ascii_case(param))
+}
+
+fn rebuild_url(url: &Url, pairs: Vec<(String, String)>) -> String {
+    let mut rebuilt = url.clone();
+    rebuilt.set_fragment(None);
+    if pairs.is_empty() {
+        rebuilt.set_query(None);
+    } else {
+        rebuilt.query_pairs_mut().clear().extend_pairs(pairs);
+    }
+    rebuilt.into()
+}
+
+/// Returns `(normalized, baseline)`: the canonical URL, and the same URL re-encoded without
+/// sorting, stripping, or folding, so callers can tell whether normalization changed anything.
+fn normalize_url(url: &Url, folded: &[&str]) -> (String, String) {
+    let original = url
+        .query_pairs()
+        .map(|(name, value)| (name.into_owned(), value.into_owned()))
+        .collect::<Vec<_>>();
+    let mut pairs = original
+        .iter()
+        .filter(|(name, _)| !is_credential_param(name))
+        .map(|(name, value)| {
+            let value = if folded.contains(&name.as_str()) {
+                value.trim().to_lowercase()
+            } else {
+                value.clone()
+            };
+            (name.clone(), value)
+        })
+        .collect::<Vec<_>>();
+    pairs.sort();
+    (rebuild_url(url, pairs), rebuild_url(url, original))
+}
+
+/// Collapses whitespace runs outside string literals, so reformatted GraphQL documents match.
+fn collapse_query_whitespace(query: &str) -> String {
+    let mut out = String::with_capacity(query.len());
+    let mut in_string = false;
+    let mut escaped = false;
+    let mut pending_space = false;
+    for ch in query.chars() {
+        if in_string {
+            out.push(ch);
+            match (escaped, ch) {
+                (true, _) => escaped = false,
+                (false, '\\') => escaped = true,
+                (false, '"') => in_string = false,
+                _ => {}
+            }
+            continue;
+        }
+        if ch.is_whitespace() || ch == ',' {
+            pending_space = true;
+            continue;
+        }
+        if pending_space && !out.is_empty() {
+            out.push(' ');
+        }
+        pending_space = false;
+        if ch == '"' {
+            in_string = true;
+        }
+        out.push(ch);
+    }
+    out
+}
+
+fn canonical_json(value: serde_json::Value) -> serde_json::Value {
+    match value {
+        serde_json::Value::Object(map) => serde_json::Value::Object(
+            map.into_iter()
+                .map(|(key, value)| {
+                    let value = match (key.as_str(), value) {
+                        ("query", serde_json::Value::String(query)) => {
+                            serde_json::Value::String(collapse_query_whitespace(&query))
+                        }
+                        (_, value) => canonical_json(value),
+                    };
+                    (key, value)
+                })
+                .collect::<BTreeMap<_, _>>()
+                .into_iter()
+                .collect(),
+        ),
+        serde_json::Value::Array(items) => {
+            serde_json::Value::Array(items.into_iter().map(canonical_json).collect())
+        }
+        other => other,
+    }
+}
+
+fn canonical_body_digest(body: &[u8]) -> Option<String> {
+    let value = serde_json::from_slice::<serde_json::Value>(body).ok()?;
+    let canonical = serde_json::to_vec(&canonical_json(value)).ok()?;
+    let digest = Sha256::digest(&canonical);
+    Some(format!("{digest:x}"))
+}
+
+fn is_json_request(req: &reqwest::Request) -> bool {
+    req.headers()
+        .get(CONTENT_TYPE)
+        .and_then(|value| value.to_str().ok())
+        .is_none_or(|value| value.contains("json"))
+}
+
+struct NormalizedKey {
+    key: String,
+    // Whether sorting, stripping or folding changed the URL part of the key.
+    changed: bool,
+}
+
+/// Returns the normalized key for `req`, or `None` when it should keep its raw key.
+fn normalized_key(req: &reqwest::Request, extensions: &Extensions) -> Option<NormalizedKey> {
+    let folded = extensions
+        .get::<CaseInsensitiveParams>()
+        .map_or(&[][..], |params| params.0);
+    let (url, baseline) = normalize_url(req.url(), folded);
+    if *req.method() == reqwest::Method::GET {
+        return Some(NormalizedKey {
+            changed: url != baseline,
+            key: format!("GET:{url}"),
+        });
+    }
+    if *req.method() == reqwest::Method::POST && is_json_request(req) {
+        let body = req.body()?.as_bytes()?;
+        let digest = canonical_body_digest(body)?;
+        return Some(NormalizedKey {
+            changed: url != baseline,
+            key: format!("POST:{url}#{digest}"),
+        });
+    }
+    None
+}
+
+/// Cache key function for the HTTP cache layer: the normalized key when one was attached,
+/// otherwise the layer's default `METHOD:uri` key.
+pub(crate) fn http_cache_key(parts: &http::request::Parts) -> String {
+    parts
+        .headers
+        .get(CACHE_KEY_HEADER)
+        .and_then(|value| value.to_str().ok())
+        .map(str::to_string)
+        .unwrap_or_else(|| format!("{}:{}", parts.method, parts.uri))
+}
+
+/// Attaches an exchange key for a streaming multipart POST to `url` carrying the form `fields`.
+///
+/// A streaming body cannot be read back, so `exchange_key` would otherwise see only the URL.
+/// `retry_send` removes the header before the request goes upstream.
+pub(crate) fn key_multipart_form(
+    req: reqwest::RequestBuilder,
+    url: &str,
+    fields: &[(&str, &str)],
+) -> reqwest::RequestBuilder {
+    let Ok(parsed) = Url::parse(url) else {
+        return req;
+    };
+    let (url, _) = normalize_url(&parsed, &[]);
+    let mut digest = Sha256::new();
+    for (name, value) in fields {
+        // NUL-separated, so field boundaries cannot be shifted to collide.
+        digest.update(name.as_bytes());
+        digest.update([0]);
+        digest.update(value.as_bytes());
+        digest.update([0]);
+    }
+    req.header(
+        CACHE_KEY_HEADER,
+        format!("POST:{url}#{:x}", digest.finalize()),
+    )
+}
+
+/// Identifies `req` outside the HTTP cache: the normalized or form-derived key when one is
+/// attached, otherwise the method and credential-free URL plus a digest of an in-memory body.
+pub(crate) fn exchange_key(req: &reqwest::Request) -> String {
+    if let Some(key) = req
+        .headers()
+        .get(CACHE_KEY_HEADER)
+        .and_then(|value| value.to_str().ok())
+    {
+        return key.to_string();
+    }
+    let (url, _) = normalize_url(req.url(), &[]);
+    match req.body().and_then(|body| body.as_bytes()) {
+        Some(body) if !body.is_empty() => {
+            format!("{}:{url}#{:x}", req.method(), Sha256::digest(body))
+        }
+        _ => format!("{}:{url}", req.method()),
+    }
+}
+
+/// Attaches the normalized cache key and attributes cache hits that only normalization made.
+#[derive(Debug, Default)]
+pub(crate) struct CacheKeyMiddleware;
+
+#[async_trait::async_trait]
+impl Middleware for CacheKeyMiddleware {
+    async fn handle(
+        &self,
+        mut req: reqwest::Request,
+        extensions: &mut Extensions,
+        next: Next<'_>,
+    ) -> reqwest_middleware::Result<reqwest::Response> {
+        let Some(NormalizedKey { key, changed }) = normalized_key(&req, extensions) else {
+            return next.run(req, extensions).await;
+        };
+        let Ok(value) = key.parse() else {
+            return next.run(req, extensions).await;
+        };
+        req.headers_mut().insert(CACHE_KEY_HEADER, value);
+
+        let response = next.run(req, extensions).await?;
+        if changed
+            && response
+                .headers()
+                .get(CACHE_STATUS_HEADER)
+                .is_some_and(|value| value.as_bytes().eq_ignore_ascii_case(b"hit"))
+        {
+            crate::cache::record_normalized_hit();
+        }
+        Ok(response)
+    }
+}
+
+/// Removes the internal cache-key header before a request goes upstream.
+#[derive(Debug, Default)]
+pub(crate) struct StripCacheKeyMiddleware;
+
+#[async_trait::async_trait]
+impl Middleware for StripCacheKeyMiddleware {
+    async fn handle(
+        &self,
+        mut req: reqwest::Request,
+        extensions: &mut Extensions,
+        next: Next<'_>,
+    ) -> reqwest_middleware::Result<reqwest::Response> {
+        req.headers_mut().remove(CACHE_KEY_HEADER);
+        next.run(req, extensions).await
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn get(url: &str) -> reqwest::Request {
+        reqwest::Request::new(reqwest::Method::GET, Url::parse(url).unwrap())
+    }
+
+    fn post(url: &str, body: &str) -> reqwest::Request {
+        let mut req = reqwest::Request::new(reqwest::Method::POST, Url::parse(url).unwrap());
+        *req.body_mut() = Some(body.to_string().into());
+        req
+    }
+
+    #[test]
+    fn query_order_and_credentials_do_not_change_key() {
+        let plain = get("https://eutils.ncbi.nlm.nih.gov/x?db=pubmed&id=1");
+        let keyed =
+            get("https://eutils.ncbi.nlm.nih.gov/x?id=1&api_key=secret&db=pubmed&tool=biomcp");
+        let extensions = Extensions::new();
+        let plain = normalized_key(&plain, &extensions).unwrap();
+        let keyed = normalized_key(&keyed, &extensions).unwrap();
+        assert_eq!(
+            plain.key,
+            "GET:https://eutils.ncbi.nlm.nih.gov/x?db=pubmed&id=1"
+        );
+        assert!(!plain.changed);
+        assert_eq!(keyed.key, plain.key);
+        assert!(keyed.changed);
+    }
+
+    #[test]
+    fn declared_params_are_trimmed_and_case_folded() {
+        let mut extensions = Extensions::new();
+        extensions.insert(CaseInsensitiveParams(&["q"]));
+        let upper = get("https://mygene.info/v3/query?q=symbol:%22BRAF%22&species=human");
+        let lower = get("https://mygene.info/v3/query?species=human&q=%20symbol:%22braf%22");
+        let key = |req, extensions| normalized_key(req, extensions).map(|key| key.key);
+        assert_eq!(key(&upper, &extensions), key(&lower, &extensions));
+        // Undeclared parameters keep their case.
+        assert_ne!(
+            key(&upper, &Extensions::new()),
+            key(&lower, &Extensions::new())
+        );
+    }
+
+    #[test]
+    fn graphql_bodies_are_canonicalized() {
+        let a = post(
+            "https://api.platform.opentargets.org/api/v4/graphql",
+            r#"{"query":"query T($id: String!) {\n  target(ensemblId: $id) { approvedSymbol }\n}","variables":{"id":"ENSG00000157764"}}"#,
+        );
+        let b = post(
+            "https://api.platform.opentargets.org/api/v4/graphql",
+            r#"{"variables":{"id":"ENSG00000157764"},"query":"query T($id: String!) { target(ensemblId: $id) { approvedSymbol } }"}"#,
+        );
+        let c = post(
+            "https://api.platform.opentargets.org/api/v4/graphql",
+            r#"{"variables":{"id":"ENSG00000141510"},"query":"query T($id: String!) { target(ensemblId: $id) { approvedSymbol } }"}"#,
+        );
+        let extensions = Extensions::new();
+        let key = |req| normalized_key(req, &extensions).map(|key| key.key);
+        let a = key(&a).expect("json post key");
+        assert_eq!(key(&b), Some(a.clone()));
+        assert_ne!(key(&c), Some(a));
+    }
+
+    #[test]
+    fn multipart_exchange_key_covers_form_fields() {
+        let client = reqwest::Client::new();
+        let add_list = |url: &str, genes: &str| {
+            let form = reqwest::multipart::Form::new()
+                .text("list", genes.to_string())
+                .text("description", "biomcp-cli");
+            let req = client.post(url).multipart(form);
+            key_multipart_form(req, url, &[("list", genes), ("description", "biomcp-cli")])
+                .build()
+                .expect("multipart request")
+        };
+
+        let braf = add_list(
+            "https://maayanlab.cloud/Enrichr/addList?api_key=secret",
+            "BRAF",
+        );
+        assert!(braf.body().and_then(|body| body.as_bytes()).is_none());
+        let key = exchange_key(&braf);
+        assert!(key.starts_with("POST:https://maayanlab.cloud/Enrichr/addList#"));
+        assert_eq!(
+            key,
+            exchange_key(&add_list("https://maayanlab.cloud/Enrichr/addList", "BRAF"))
+        );
+        assert_ne!(
+            key,
+            exchange_key(&add_list("https://maayanlab.cloud/Enrichr/addList", "KRAS"))
+        );
+
+        let mut keyed = get("https://mygene.info/v3/query?q=BRAF");
+        keyed.headers_mut().insert(
+            CACHE_KEY_HEADER,
+            "GET:https://mygene.info/v3/query?q=braf".parse().unwrap(),
+        );
+        assert_eq!(
+            exchange_key(&keyed),
+            "GET:https://mygene.info/v3/query?q=braf"
+        );
+    }
+
+    #[test]
+    fn whitespace_inside_graphql_strings_is_preserved() {
+        assert_eq!(
+            collapse_query_whitespace("{ search(q: \"a  b\") {\n  id\n} }"),
+            "{ search(q: \"a  b\") { id } }"
+        );
+    }
+}
@@ -0,0 +1,492 @@
+//! Per-source HTTP cache policy and the stale-while-revalidate cache mode.
+//!
+//! `[cache.sources.<key>]` tables in `cache.toml` are matched against request URLs by URL prefix
+//! or `RateLimitPolicy` key. `SourceMaxStaleMiddleware` and `SourceTtlMiddleware` wrap the HTTP
+//! cache layer to apply each source's max-stale and TTL. With `BIOMCP_CACHE_MODE=swr`,
+//! `StaleWhileRevalidateMiddleware` answers a stale cached GET immediately, as long as the entry
+//! is younger than the source's staleness ceiling, and refreshes the entry in the background.
+//! Neither layer serves a negative answer (see `negative_cache`) past its TTL.
+
+use std::collections::{BTreeMap, HashSet};
+use std::sync::{Arc, Mutex, PoisonError};
+use std::time::{Duration, SystemTime};
+
+use http::Extensions;
+use http_cache::HttpResponse;
+use http_cache_reqwest::CacheMode;
+use reqwest::header::{
+    AUTHORIZATION, CACHE_CONTROL, EXPIRES, HeaderMap, HeaderName, HeaderValue, PRAGMA, WARNING,
+};
+use reqwest::{Method, StatusCode, Url};
+use reqwest_middleware::{ClientWithMiddleware, Middleware, Next};
+use tracing::{debug, warn};
+
+use crate::cache::{CacheSourcePolicy, SizeAwareCacheManager};
+use crate::error::BioMcpError;
+
+const DEFAULT_SOURCE_KEY: &str = "default";
+// Matches the client-wide `max-stale=86400` request default.
+const DEFAULT_STALE_CEILING: Duration = Duration::from_secs(86_400);
+
+/// Resolved `[cache.sources.*]` tables.
+#[derive(Debug, Clone, Default)]
+pub(crate) struct SourceCachePolicies {
+    default: CacheSourcePolicy,
+    by_key: BTreeMap<String, CacheSourcePolicy>,
+    // URL-prefix tables, longest prefix first.
+    by_prefix: Vec<(String, CacheSourcePolicy)>,
+}
+
+impl SourceCachePolicies {
+    pub(crate) fn new(tables: BTreeMap<String, CacheSourcePolicy>) -> Self {
+        let mut policies = Self::default();
+        for (key, policy) in tables {
+            if key == DEFAULT_SOURCE_KEY {
+                policies.default = policy;
+            } else if key.starts_with("http://") || key.starts_with("https://") {
+                policies.by_prefix.push((key, policy));
+            } else {
+                policies.by_key.insert(key, policy);
+            }
+        }
+        policies
+            .by_prefix
+            .sort_by(|(a, _), (b, _)| b.len().cmp(&a.len()));
+        policies
+    }
+
+    pub(crate) fn from_config() -> Self {
+        let tables = crate::cache::resolve_cache_source_policies().unwrap_or_else(|err| {
+            warn!("Ignoring cache.toml source cache policies: {err}");
+            BTreeMap::new()
+        });
+        Self::new(tables)
+    }
+
+    /// Policy for `url`: the longest matching URL prefix, else the table named after the
+    /// request's rate-limit policy key, layered over `default`.
+    pub(crate) fn for_url(&self, url: &Url, policy_key: Option<&str>) -> CacheSourcePolicy {
+        let full = url.as_str();
+        let specific = self
+            .by_prefix
+            .iter()
+            .find(|(prefix, _)| full.starts_with(prefix.as_str()))
+            .map(|(_, policy)| *policy)
+            .or_else(|| policy_key.and_then(|key| self.by_key.get(key).copied()));
+        match specific {
+            Some(policy) => self.default.merged_with(policy),
+            None => self.default,
+        }
+    }
+
+    /// `for_url` with the policy key the global rate limiter assigns to `url`.
+    pub(crate) fn for_request_url(&self, url: &Url) -> CacheSourcePolicy {
+        self.for_url(url, super::rate_limit::global_limiter().policy_key(url))
+    }
+
+    pub(crate) fn stale_ceiling(&self, url: &Url, policy_key: Option<&str>) -> Duration {
+        self.for_url(url, policy_key)
+            .stale_ceiling_secs
+            .map(Duration::from_secs)
+            .unwrap_or(DEFAULT_STALE_CEILING)
+    }
+}
+
+/// Applies each source's `max_stale_secs` to GET requests before the HTTP cache layer sees them.
+///
+/// The client-wide `max-stale=86400` default header is only merged in when the request is sent
+/// upstream, so the cache layer never sees it; sources without a configured value keep the
+/// cache's normal freshness checks. Negative answers keep their short TTL: when the stored entry
+/// is one, no max-stale is added.
+pub(crate) struct SourceMaxStaleMiddleware {
+    manager: SizeAwareCacheManager,
+    policies: Arc<SourceCachePolicies>,
+}
+
+impl SourceMaxStaleMiddleware {
+    pub(crate) fn new(manager: SizeAwareCacheManager, policies: Arc<SourceCachePolicies>) -> Self {
+        Self { manager, policies }
+    }
+
+    async fn cached_negative(&self, req: &reqwest::Request) -> bool {
+        matches!(
+            self.manager.peek(&cache_key(req)).await,
+            Ok(Some((cached, _))) if super::negative_cache::is_negative_entry(&cached)
+        )
+    }
+}
+
+#[async_trait::async_trait]
+impl Middleware for SourceMaxStaleMiddleware {
+    async fn handle(
+        &self,
+        mut req: reqwest::Request,
+        extensions: &mut Extensions,
+        next: Next<'_>,
+    ) -> reqwest_middleware::Result<reqwest::Response> {
+        if *req.method() == Method::GET
+            && !req.headers().contains_key(CACHE_CONTROL)
+            && let Some(max_stale) = self.policies.for_request_url(req.url()).max_stale_secs
+            && !self.cached_negative(&req).await
+            && let Ok(value) = HeaderValue::from_str(&format!("max-stale={max_stale}"))
+        {
+            req.headers_mut().insert(CACHE_CONTROL, value);
+        }
+        next.run(req, extensions).await
+    }
+}
+
+/// Stamps each source's `ttl_secs` onto successful GET responses on their way into the cache.
+///
+/// Sits just inside the HTTP cache layer, so the stored policy uses the configured lifetime in
+/// place of whatever `Cache-Control`/`Expires` the upstream sent (often none at all).
+pub(crate) struct SourceTtlMiddleware {
+    policies: Arc<SourceCachePolicies>,
+}
+
+impl SourceTtlMiddleware {
+    pub(crate) fn new(policies: Arc<SourceCachePolicies>) -> Self {
+        Self { policies }
+    }
+}
+
+#[async_trait::async_trait]
+impl Middleware for SourceTtlMiddleware {
+    async fn handle(
+        &self,
+        req: reqwest::Request,
+        extensions: &mut Extensions,
+        next: Next<'_>,
+    ) -> reqwest_middleware::Result<reqwest::Response> {
+        let ttl = (*req.method() == Method::GET)
+            .then(|| self.policies.for_request_url(req.url()).ttl_secs)
+            .flatten();
+        let mut response = next.run(req, extensions).await?;
+        if let Some(ttl) = ttl
+            && response.status().is_success()
+        {
+            apply_ttl(response.headers_mut(), ttl);
+        }
+        Ok(response)
+    }
+}
+
+fn apply_ttl(headers: &mut HeaderMap, ttl_secs: u64) {
+    // `no-store` and `private` still win: a TTL must not make an uncacheable response cacheable.
+    let uncacheable = headers.get_all(CACHE_CONTROL).iter().any(|value| {
+        value.to_str().is_ok_and(|value| {
+            let value = value.to_ascii_lowercase();
+            value.contains("no-store") || value.contains("private")
+        })
+    });
+    if uncacheable {
+        return;
+    }
+    headers.remove(EXPIRES);
+    headers.remove(PRAGMA);
+    if let Ok(value) = HeaderValue::from_str(&format!("max-age={ttl_secs}")) {
+        headers.insert(CACHE_CONTROL, value);
+    }
+}
+
+type RefreshClientFn = fn() -> Result<ClientWithMiddleware, BioMcpError>;
+
+/// Serves stale cache entries immediately and refreshes them off the request path.
+///
+/// Sits in front of the HTTP cache layer. Fresh entries, misses, and entries older than the
+/// source's staleness ceiling take the normal cache path; past the ceiling the cache layer is
+/// told to revalidate rather than honour the blanket `max-stale` request header.
+pub(crate) struct StaleWhileRevalidateMiddleware {
+    manager: SizeAwareCacheManager,
+    policies: Arc<SourceCachePolicies>,
+    // Client that sends background refreshes; it runs the full stack including this layer.
+    refresh_client: RefreshClientFn,
+    refreshing: Arc<Mutex<HashSet<String>>>,
+}
+
+impl StaleWhileRevalidateMiddleware {
+    pub(crate) fn new(
+        manager: SizeAwareCacheManager,
+        policies: Arc<SourceCachePolicies>,
+        refresh_client: RefreshClientFn,
+    ) -> Self {
+        Self {
+            manager,
+            policies,
+            refresh_client,
+            refreshing: Arc::new(Mutex::new(HashSet::new())),
+        }
+    }
+
+    fn spawn_refresh(&self, cache_key: String, req: &reqwest::Request, extensions: &Extensions) {
+        let Some(refresh) = req.try_clone() else {
+            return;
+        };
+        if !self
+            .refreshing
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .insert(cache_key.clone())
+        {
+            return;
+        }
+
+        let refreshing = Arc::clone(&self.refreshing);
+        let refresh_client = self.refresh_client;
+        let mut extensions = refresh_extensions(extensions);
+        tokio::spawn(async move {
+            let result = match refresh_client() {
+                Ok(client) => client
+                    .execute_with_extensions(refresh, &mut extensions)
+                    .await
+                    .map(|response| response.status())
+                    .map_err(|err| err.to_string()),
+                Err(err) => Err(err.to_string()),
+            };
+            match result {
+                Ok(status) if !status.is_success() => {
+                    debug!(cache_key, %status, "stale-while-revalidate refresh was not stored");
+                }
+                Ok(_) => {}
+                Err(err) => debug!(cache_key, "stale-while-revalidate refresh failed: {err}"),
+            }
+            refreshing
+                .lock()
+                .unwrap_or_else(PoisonError::into_inner)
+                .remove(&cache_key);
+        });
+    }
+}
+
+/// The original request's extensions with `CacheMode::Reload`, which goes upstream, stores the
+/// response and bypasses this layer. Carrying the rest keeps the refresh on the same cache key
+/// (`CaseInsensitiveParams`) and source (`SourceApi`) as the request it refreshes.
+fn refresh_extensions(extensions: &Extensions) -> Extensions {
+    let mut refresh = extensions.clone();
+    refresh.insert(CacheMode::Reload);
+    refresh
+}
+
+/// Only plain cacheable GETs qualify: `--no-cache`, authenticated requests, and other explicit
+/// cache modes all arrive with a `CacheMode` extension.
+fn is_revalidatable(req: &reqwest::Request, extensions: &Extensions) -> bool {
+    *req.method() == Method::GET
+        && extensions.get::<CacheMode>().is_none()
+        && !req.headers().contains_key(AUTHORIZATION)
+}
+
+/// The key the HTTP cache layer will use: the normalized key when one is attached.
+fn cache_key(req: &reqwest::Request) -> String {
+    req.headers()
+        .get(super::cache_key::CACHE_KEY_HEADER)
+        .and_then(|value| value.to_str().ok())
+        .map(str::to_string)
+        .unwrap_or_else(|| format!("{}:{}", req.method(), req.url()))
+}
+
+fn stale_response(cached: HttpResponse) -> Option<reqwest::Response> {
+    let status = StatusCode::from_u16(cached.status).ok()?;
+    let mut headers = cached
+        .headers
+        .iter()
+        .filter_map(|(name, value)| {
+            Some((
+                HeaderName::from_bytes(name.as_bytes()).ok()?,
+                HeaderValue::from_str(value).ok()?,
+            ))
+        })
+        .collect::<HeaderMap>();
+    headers.insert(
+        WARNING,
+        HeaderValue::from_static("110 - \"Response is Stale\""),
+    );
+
+    let mut response = http::Response::new(cached.body);
+    *response.status_mut() = status;
+    *response.headers_mut() = headers;
+    Some(reqwest::Response::from(response))
+}
+
+#[async_trait::async_trait]
+impl Middleware for StaleWhileRevalidateMiddleware {
+    async fn handle(
+        &self,
+        req: reqwest::Request,
+        extensions: &mut Extensions,
+        next: Next<'_>,
+    ) -> reqwest_middleware::Result<reqwest::Response> {
+        if !is_revalidatable(&req, extensions) {
+            return next.run(req, extensions).await;
+        }
+
+        let key = cache_key(&req);
+        let cached = match self.manager.peek(&key).await {
+            Ok(cached) => cached,
+            Err(err) => {
+                debug!(cache_key = %key, "stale-while-revalidate lookup failed: {err}");
+                None
+            }
+        };
+        let Some((cached, policy)) = cached else {
+            return next.run(req, extensions).await;
+        };
+        // Negative answers keep their short TTL: once stale they go back upstream.
+        if super::negative_cache::is_negative_entry(&cached) {
+            return next.run(req, extensions).await;
+        }
+
+        let now = SystemTime::now();
+        if !policy.is_stale(now) {
+            return next.run(req, extensions).await;
+        }
+        let policy_key = super::rate_limit::global_limiter().policy_key(req.url());
+        if policy.age(now) > self.policies.stale_ceiling(req.url(), policy_key) {
+            extensions.insert(CacheMode::NoCache);
+            return next.run(req, extensions).await;
+        }
+        let Some(response) = stale_response(cached) else {
+            return next.run(req, extensions).await;
+        };
+
+        self.spawn_refresh(key, &req, extensions);
+        Ok(response)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::collections::BTreeMap;
+    use std::time::Duration;
+
+    use reqwest::Url;
+
+    use reqwest::header::{CACHE_CONTROL, EXPIRES, HeaderMap, HeaderValue};
+
+    use super::{
+        DEFAULT_STALE_CEILING, SourceCachePolicies, apply_ttl, cache_key, is_revalidatable,
+        refresh_extensions,
+    };
+    use crate::cache::CacheSourcePolicy;
+    use http::Extensions;
+    use http_cache_reqwest::CacheMode;
+
+    fn ceiling(secs: u64) -> CacheSourcePolicy {
+        CacheSourcePolicy {
+            stale_ceiling_secs: Some(secs),
+            ..CacheSourcePolicy::default()
+        }
+    }
+
+    #[test]
+    fn stale_ceiling_prefers_url_prefix_then_policy_key_then_default() {
+        let policies = SourceCachePolicies::new(BTreeMap::from([
+            ("default".to_string(), ceiling(600)),
+            ("kegg".to_string(), ceiling(604_800)),
+            ("https://clinicaltrials.gov/api".to_string(), ceiling(60)),
+            (
+                "https://clinicaltrials.gov/api/v2".to_string(),
+                ceiling(3_600),
+            ),
+        ]));
+
+        let trials = Url::parse("https://clinicaltrials.gov/api/v2/studies?x=1").unwrap();
+        assert_eq!(
+            policies.stale_ceiling(&trials, None),
+            Duration::from_secs(3_600)
+        );
+        let kegg = Url::parse("https://rest.kegg.jp/get/hsa00010").unwrap();
+        assert_eq!(
+            policies.stale_ceiling(&kegg, Some("kegg")),
+            Duration::from_secs(604_800)
+        );
+        let other = Url::parse("https://mygene.info/v3/query").unwrap();
+        assert_eq!(
+            policies.stale_ceiling(&other, None),
+            Duration::from_secs(600)
+        );
+    }
+
+    #[test]
+    fn stale_ceiling_defaults_to_max_stale_window() {
+        let policies = SourceCachePolicies::default();
+        let url = Url::parse("https://mygene.info/v3/gene/673").unwrap();
+        assert_eq!(policies.stale_ceiling(&url, None), DEFAULT_STALE_CEILING);
+    }
+
+    #[test]
+    fn only_plain_gets_are_revalidated_in_background() {
+        let url = Url::parse("https://mygene.info/v3/gene/673").unwrap();
+        let get = reqwest::Request::new(reqwest::Method::GET, url.clone());
+        assert!(is_revalidatable(&get, &Extensions::new()));
+        assert_eq!(cache_key(&get), "GET:https://mygene.info/v3/gene/673");
+
+        let mut no_cache = Extensions::new();
+        no_cache.insert(CacheMode::NoStore);
+        assert!(!is_revalidatable(&get, &no_cache));
+
+        let post = reqwest::Request::new(reqwest::Method::POST, url);
+        assert!(!is_revalidatable(&post, &Extensions::new()));
+    }
+
+    #[test]
+    fn refresh_keeps_request_extensions_and_forces_reload() {
+        use crate::sources::SourceApi;
+        use crate::sources::cache_key::CaseInsensitiveParams;
+
+        let mut extensions = Extensions::new();
+        extensions.insert(CaseInsensitiveParams(&["q"]));
+        extensions.insert(SourceApi("mygene"));
+        let refresh = refresh_extensions(&extensions);
+        assert!(matches!(
+            refresh.get::<CacheMode>(),
+            Some(CacheMode::Reload)
+        ));
+        assert_eq!(refresh.get::<SourceApi>(), Some(&SourceApi("mygene")));
+        assert!(refresh.get::<CaseInsensitiveParams>().is_some());
+        assert!(extensions.get::<CacheMode>().is_none());
+    }
+
+    #[test]
+    fn source_ttl_replaces_upstream_freshness_headers() {
+        let mut headers = HeaderMap::new();
+        headers.insert(CACHE_CONTROL, HeaderValue::from_static("no-cache"));
+        headers.insert(EXPIRES, HeaderValue::from_static("0"));
+        apply_ttl(&mut headers, 1_209_600);
+        assert_eq!(headers.get(CACHE_CONTROL).unwrap(), "max-age=1209600");
+        assert!(headers.get(EXPIRES).is_none());
+
+        let mut private = HeaderMap::new();
+        private.insert(
+            CACHE_CONTROL,
+            HeaderValue::from_static("private, max-age=60"),
+        );
+        apply_ttl(&mut private, 600);
+        assert_eq!(private.get(CACHE_CONTROL).unwrap(), "private, max-age=60");
+    }
+
+    #[test]
+    fn source_policy_layers_specific_fields_over_default() {
+        let policies = SourceCachePolicies::new(BTreeMap::from([
+            (
+                "default".to_string(),
+                CacheSourcePolicy {
+                    ttl_secs: Some(3_600),
+                    max_stale_secs: Some(86_400),
+                    stale_ceiling_secs: None,
+                    negative_ttl_secs: None,
+                },
+            ),
+            (
+                "https://clinicaltrials.gov/api/v2".to_string(),
+                CacheSourcePolicy {
+                    ttl_secs: Some(300),
+                    ..CacheSourcePolicy::default()
+                },
+            ),
+        ]));
+        let url = Url::parse("https://clinicaltrials.gov/api/v2/studies").unwrap();
+        let policy = policies.for_url(&url, None);
+        assert_eq!(policy.ttl_secs, Some(300));
+        assert_eq!(policy.max_stale_secs, Some(86_400));
+    }
+}
@@ -0,0 +1,575 @@
+//! Record/replay of upstream exchanges for hermetic runs.
+//!
+//! `BIOMCP_CASSETTE=record:<path>` captures every exchange the source clients see:
+//!
+//! - HTTP through the shared middleware stack, recorded above the cache so cache hits are
+//!   captured too and the cassette does not depend on the state of the cache
+//! - streaming requests sent with `retry_send` (multipart uploads)
+//! - the AlphaGenome gRPC response stream
+//!
+//! The cassette is written as zstd-compressed JSON when the command finishes. With
+//! `replay:<path>`, every request is answered from the cassette and any request without a
+//! recording fails, so a replayed run never touches the network or the HTTP cache.
+//!
+//! Exchanges are keyed like the HTTP cache: method, credential-free normalized URL, and a body
+//! digest when the body is in memory. Streamed multipart uploads carry a digest of their form
+//! fields instead (`cache_key::key_multipart_form`). Repeated requests for one key replay in recorded order, and
+//! the last recording repeats after that. Failed exchanges (transport errors) are not recorded.
+
+use std::collections::HashMap;
+use std::io;
+use std::path::{Path, PathBuf};
+use std::sync::{Arc, Mutex, MutexGuard, OnceLock, PoisonError};
+
+use base64::Engine;
+use base64::engine::general_purpose::STANDARD as BASE64;
+use http::Extensions;
+use reqwest::StatusCode;
+use reqwest::header::{HeaderMap, HeaderName, HeaderValue};
+use reqwest_middleware::{Middleware, Next};
+use serde::{Deserialize, Serialize};
+use sha2::{Digest, Sha256};
+use tracing::warn;
+
+use crate::error::BioMcpError;
+
+const CASSETTE_ENV: &str = "BIOMCP_CASSETTE";
+const CASSETTE_FORMAT: &str = "biomcp-cassette";
+const CASSETTE_VERSION: u32 = 1;
+const ZSTD_LEVEL: i32 = 3;
+// Replayed responses report this cache status, so `--timings` shows where they came from.
+const REPLAY_CACHE_STATUS: HeaderValue = HeaderValue::from_static("REPLAY");
+const CACHE_STATUS_HEADER: HeaderName = HeaderName::from_static("x-cache");
+// Response headers that describe the original connection or the local cache, not the answer.
+const SKIPPED_HEADERS: [&str; 6] = [
+    "connection",
+    "content-length",
+    "set-cookie",
+    "transfer-encoding",
+    "x-cache",
+    "x-cache-lookup",
+];
+
+static ACTIVE: OnceLock<Result<Option<Arc<Cassette>>, String>> = OnceLock::new();
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub(crate) enum CassetteMode {
+    Record,
+    Replay,
+}
+
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
+#[serde(tag = "kind", rename_all = "snake_case")]
+enum Recording {
+    Http {
+        status: u16,
+        headers: Vec<(String, String)>,
+        /// Base64 of the decoded body.
+        body: String,
+    },
+    Grpc {
+        /// Base64 of each encoded response message, in stream order.
+        messages: Vec<String>,
+    },
+}
+
+#[derive(Debug, Clone, Serialize, Deserialize)]
+struct Exchange {
+    key: String,
+    #[serde(flatten)]
+    recording: Recording,
+}
+
+#[derive(Debug, Serialize, Deserialize)]
+struct CassetteFile {
+    format: String,
+    version: u32,
+    exchanges: Vec<Exchange>,
+}
+
+#[derive(Debug, Default)]
+struct Tape {
+    // Record mode: every exchange in arrival order.
+    recorded: Vec<Exchange>,
+    unsaved: bool,
+    // Replay mode: recordings per key, and how many of them have been served.
+    replay: HashMap<String, (Vec<Recording>, usize)>,
+}
+
+/// A replayed request with no recording in the cassette.
+#[derive(Debug, thiserror::Error)]
+#[error("no recording for {key} in cassette {} (BIOMCP_CASSETTE replay)", .path.display())]
+pub(crate) struct CassetteMiss {
+    key: String,
+    path: PathBuf,
+}
+
+#[derive(Debug)]
+pub(crate) struct Cassette {
+    mode: CassetteMode,
+    path: PathBuf,
+    tape: Mutex<Tape>,
+}
+
+impl Cassette {
+    /// An empty cassette that [`Cassette::save`] writes to `path`.
+    pub(crate) fn recording(path: &Path) -> Self {
+        Self {
+            mode: CassetteMode::Record,
+            path: path.to_path_buf(),
+            tape: Mutex::new(Tape::default()),
+        }
+    }
+
+    /// Loads a cassette written by a recording run.
+    pub(crate) fn load(path: &Path) -> Result<Self, BioMcpError> {
+        let invalid = |reason: String| {
+            BioMcpError::InvalidArgument(format!(
+                "{CASSETTE_ENV}: cannot replay {}: {reason}",
+                path.display()
+            ))
+        };
+        let compressed = std::fs::read(path).map_err(|err| invalid(err.to_string()))?;
+        let raw = zstd::stream::decode_all(compressed.as_slice())
+            .map_err(|err| invalid(format!("not a zstd cassette ({err})")))?;
+        let file: CassetteFile = serde_json::from_slice(&raw)
+            .map_err(|err| invalid(format!("malformed cassette ({err})")))?;
+        if file.format != CASSETTE_FORMAT || file.version != CASSETTE_VERSION {
+            return Err(invalid(format!(
+                "unsupported cassette {} v{} (expected {CASSETTE_FORMAT} v{CASSETTE_VERSION})",
+                file.format, file.version
+            )));
+        }
+
+        let mut replay: HashMap<String, (Vec<Recording>, usize)> = HashMap::new();
+        for exchange in file.exchanges {
+            replay
+                .entry(exchange.key)
+                .or_default()
+                .0
+                .push(exchange.recording);
+        }
+        Ok(Self {
+            mode: CassetteMode::Replay,
+            path: path.to_path_buf(),
+            tape: Mutex::new(Tape {
+                replay,
+                ..Tape::default()
+            }),
+        })
+    }
+
+    pub(crate) fn mode(&self) -> CassetteMode {
+        self.mode
+    }
+
+    fn tape(&self) -> MutexGuard<'_, Tape> {
+        self.tape.lock().unwrap_or_else(PoisonError::into_inner)
+    }
+
+    fn push(&self, key: String, recording: Recording) {
+        let mut tape = self.tape();
+        tape.recorded.push(Exchange { key, recording });
+        tape.unsaved = true;
+    }
+
+    fn next_recording(&self, key: &str) -> Result<Recording, CassetteMiss> {
+        let mut tape = self.tape();
+        let Some((recordings, served)) = tape.replay.get_mut(key) else {
+            return Err(CassetteMiss {
+                key: key.to_string(),
+                path: self.path.clone(),
+            });
+        };
+        let index = (*served).min(recordings.len() - 1);
+        *served += 1;
+        Ok(recordings[index].clone())
+    }
+
+    /// Buffers `response`, records it under `key`, and returns an equivalent response.
+    pub(crate) async fn record_response(
+        &self,
+        key: String,
+        response: reqwest::Response,
+    ) -> Result<reqwest::Response, reqwest::Error> {
+        let status = response.status();
+        let original_headers = response.headers().clone();
+        let headers = original_headers
+            .iter()
+            .filter(|(name, _)| !SKIPPED_HEADERS.contains(&name.as_str()))
+            .filter_map(|(name, value)| {
+                Some((name.as_str().to_string(), value.to_str().ok()?.to_string()))
+            })
+            .collect::<Vec<_>>();
+        let body = response.bytes().await?.to_vec();
+        self.push(
+            key,
+            Recording::Http {
+                status: status.as_u16(),
+                headers: headers.clone(),
+                body: BASE64.encode(&body),
+            },
+        );
+        Ok(http_response(status, original_headers, body))
+    }
+
+    /// The next recorded response for `key`.
+    pub(crate) fn replay_response(&self, key: &str) -> Result<reqwest::Response, CassetteMiss> {
+        let miss = || CassetteMiss {
+            key: key.to_string(),
+            path: self.path.clone(),
+        };
+        let Recording::Http {
+            status,
+            headers,
+            body,
+        } = self.next_recording(key)?
+        else {
+            return Err(miss());
+        };
+        let status = StatusCode::from_u16(status).map_err(|_| miss())?;
+        let body = BASE64.decode(body).map_err(|_| miss())?;
+        let mut headers = header_map(&headers);
+        headers.insert(CACHE_STATUS_HEADER, REPLAY_CACHE_STATUS);
+        Ok(http_response(status, headers, body))
+    }
+
+    /// Records the encoded messages of one gRPC response stream under `key`.
+    pub(crate) fn record_messages(&self, key: String, messages: &[Vec<u8>]) {
+        let messages = messages
+            .iter()
+            .map(|message| BASE64.encode(message))
+            .collect();
+        self.push(key, Recording::Grpc { messages });
+    }
+
+    /// The encoded messages of the next recorded gRPC response stream for `key`.
+    pub(crate) fn replay_messages(&self, key: &str) -> Result<Vec<Vec<u8>>, CassetteMiss> {
+        let miss = || CassetteMiss {
+            key: key.to_string(),
+            path: self.path.clone(),
+        };
+        let Recording::Grpc { messages } = self.next_recording(key)? else {
+            return Err(miss());
+        };
+        messages
+            .iter()
+            .map(|message| BASE64.decode(message).map_err(|_| miss()))
+            .collect()
+    }
+
+    /// Writes recorded exchanges to the cassette file. Replay cassettes and cassettes without new
+    /// exchanges are left alone.
+    pub(crate) fn save(&self) -> io::Result<()> {
+        let mut tape = self.tape();
+        if self.mode != CassetteMode::Record || !tape.unsaved {
+            return Ok(());
+        }
+        let file = CassetteFile {
+            format: CASSETTE_FORMAT.to_string(),
+            version: CASSETTE_VERSION,
+            exchanges: tape.recorded.clone(),
+        };
+        let raw = serde_json::to_vec(&file).map_err(io::Error::other)?;
+        let compressed = zstd::bulk::compress(&raw, ZSTD_LEVEL)?;
+        if let Some(parent) = self.path.parent().filter(|p| !p.as_os_str().is_empty()) {
+            std::fs::create_dir_all(parent)?;
+        }
+        let partial = self.path.with_extension("partial");
+        std::fs::write(&partial, compressed)?;
+        std::fs::rename(&partial, &self.path)?;
+        tape.unsaved = false;
+        Ok(())
+    }
+}
+
+fn header_map(headers: &[(String, String)]) -> HeaderMap {
+    let mut map = HeaderMap::with_capacity(headers.len() + 1);
+    for (name, value) in headers {
+        if let (Ok(name), Ok(value)) = (
+            HeaderName::from_bytes(name.as_bytes()),
+            HeaderValue::from_str(value),
+        ) {
+            map.append(name, value);
+        }
+    }
+    map
+}
+
+fn http_response(status: StatusCode, headers: HeaderMap, body: Vec<u8>) -> reqwest::Response {
+    let mut response = http::Response::new(body);
+    *response.status_mut() = status;
+    *response.headers_mut() = headers;
+    reqwest::Response::from(response)
+}
+
+/// Cassette key for one gRPC call: the API, the method, and a digest of the encoded request.
+pub(crate) fn grpc_key(api: &str, method: &str, request: &[u8]) -> String {
+    format!("GRPC:{api}/{method}#{:x}", Sha256::digest(request))
+}
+
+fn parse_spec(value: &str) -> Result<Option<(CassetteMode, PathBuf)>, String> {
+    let value = value.trim();
+    if value.is_empty() {
+        return Ok(None);
+    }
+    let (mode, path) = match value.split_once(':') {
+        Some(("record", path)) => (CassetteMode::Record, path.trim()),
+        Some(("replay", path)) => (CassetteMode::Replay, path.trim()),
+        _ => {
+            return Err(format!(
+                "{CASSETTE_ENV} must be record:<path> or replay:<path>, got {value:?}"
+            ));
+        }
+    };
+    if path.is_empty() {
+        return Err(format!(
+            "{CASSETTE_ENV} needs a cassette path after {value:?}"
+        ));
+    }
+    Ok(Some((mode, PathBuf::from(path))))
+}
+
+fn from_env_value(value: Option<&str>) -> Result<Option<Arc<Cassette>>, BioMcpError> {
+    let Some((mode, path)) =
+        parse_spec(value.unwrap_or_default()).map_err(BioMcpError::InvalidArgument)?
+    else {
+        return Ok(None);
+    };
+    let cassette = match mode {
+        CassetteMode::Record => Cassette::recording(&path),
+        CassetteMode::Replay => Cassette::load(&path)?,
+    };
+    Ok(Some(Arc::new(cassette)))
+}
+
+/// The cassette named by `BIOMCP_CASSETTE`, if any. A malformed value or an unreadable replay
+/// cassette is an error, never a silent fallback to the network.
+pub(crate) fn active() -> Result<Option<Arc<Cassette>>, BioMcpError> {
+    ACTIVE
+        .get_or_init(|| {
+            from_env_value(std::env::var(CASSETTE_ENV).ok().as_deref())
+                .map_err(|err| err.to_string())
+        })
+        .clone()
+        .map_err(BioMcpError::InvalidArgument)
+}
+
+/// Writes the recording cassette, if one is active. Failures are logged and retried on the next
+/// flush.
+pub(crate) fn flush() {
+    let Some(Ok(Some(cassette))) = ACTIVE.get() else {
+        return;
+    };
+    if let Err(err) = cassette.save() {
+        warn!(
+            cassette = %cassette.path.display(),
+            "failed to write {CASSETTE_ENV} cassette: {err}"
+        );
+    }
+}
+
+/// Records or replays every request through the shared client.
+///
+/// Sits just inside `CacheKeyMiddleware`, so keys are the normalized cache keys, and above the
+/// cache, so replay never reads or writes cache entries.
+#[derive(Debug)]
+pub(crate) struct CassetteMiddleware(Arc<Cassette>);
+
+impl CassetteMiddleware {
+    pub(crate) fn new(cassette: Arc<Cassette>) -> Self {
+        Self(cassette)
+    }
+}
+
+#[async_trait::async_trait]
+impl Middleware for CassetteMiddleware {
+    async fn handle(
+        &self,
+        req: reqwest::Request,
+        extensions: &mut Extensions,
+        next: Next<'_>,
+    ) -> reqwest_middleware::Result<reqwest::Response> {
+        let key = super::cache_key::exchange_key(&req);
+        match self.0.mode() {
+            CassetteMode::Replay => self
+                .0
+                .replay_response(&key)
+                .map_err(reqwest_middleware::Error::middleware),
+            CassetteMode::Record => {
+                let response = next.run(req, extensions).await?;
+                Ok(self.0.record_response(key, response).await?)
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::time::{SystemTime, UNIX_EPOCH};
+
+    use reqwest_middleware::ClientBuilder;
+    use wiremock::matchers::{method, path};
+    use wiremock::{Mock, MockServer, ResponseTemplate};
+
+    use super::*;
+    use crate::sources::cache_key::CacheKeyMiddleware;
+
+    struct TempDirGuard {
+        path: PathBuf,
+    }
+
+    impl TempDirGuard {
+        fn new(label: &str) -> Self {
+            let suffix = SystemTime::now()
+                .duration_since(UNIX_EPOCH)
+                .unwrap_or_default()
+                .as_nanos();
+            let path = std::env::temp_dir().join(format!(
+                "biomcp-cassette-{label}-{}-{suffix}",
+                std::process::id()
+            ));
+            std::fs::create_dir_all(&path).expect("create temp dir");
+            Self { path }
+        }
+    }
+
+    impl Drop for TempDirGuard {
+        fn drop(&mut self) {
+            let _ = std::fs::remove_dir_all(&self.path);
+        }
+    }
+
+    #[test]
+    fn parse_spec_accepts_record_and_replay_only() {
+        assert_eq!(parse_spec(""), Ok(None));
+        assert_eq!(
+            parse_spec("record:/tmp/run.cassette"),
+            Ok(Some((
+                CassetteMode::Record,
+                PathBuf::from("/tmp/run.cassette")
+            )))
+        );
+        assert_eq!(
+            parse_spec(" replay:runs/braf.cassette "),
+            Ok(Some((
+                CassetteMode::Replay,
+                PathBuf::from("runs/braf.cassette")
+            )))
+        );
+        assert!(parse_spec("playback:x").is_err());
+        assert!(parse_spec("replay:").is_err());
+    }
+
+    #[tokio::test]
+    async fn recorded_exchanges_replay_in_order_and_unknown_keys_fail() {
+        let dir = TempDirGuard::new("round-trip");
+        let path = dir.path.join("run.cassette");
+
+        let recorder = Cassette::recording(&path);
+        for body in ["first", "second"] {
+            let response = http_response(
+                StatusCode::OK,
+                header_map(&[
+                    ("content-type".into(), "text/plain".into()),
+                    ("x-cache".into(), "HIT".into()),
+                ]),
+                body.as_bytes().to_vec(),
+            );
+            recorder
+                .record_response("GET:https://example.org/a".into(), response)
+                .await
+                .expect("record response");
+        }
+        recorder.record_messages(
+            "GRPC:alphagenome/ScoreVariant#00".into(),
+            &[vec![1, 2], vec![3]],
+        );
+        recorder.save().expect("save cassette");
+
+        let replay = Cassette::load(&path).expect("load cassette");
+        let mut bodies = Vec::new();
+        for _ in 0..3 {
+            let response = replay
+                .replay_response("GET:https://example.org/a")
+                .expect("recorded key");
+            assert_eq!(response.headers()["x-cache"], "REPLAY");
+            assert_eq!(response.headers()["content-type"], "text/plain");
+            bodies.push(response.text().await.expect("body"));
+        }
+        assert_eq!(bodies, vec!["first", "second", "second"]);
+        assert_eq!(
+            replay
+                .replay_messages("GRPC:alphagenome/ScoreVariant#00")
+                .expect("recorded stream"),
+            vec![vec![1, 2], vec![3]]
+        );
+
+        let err = replay
+            .replay_response("GET:https://example.org/b")
+            .expect_err("unrecorded key should fail");
+        assert!(err.to_string().contains("GET:https://example.org/b"));
+    }
+
+    #[test]
+    fn load_rejects_other_cassette_versions() {
+        let dir = TempDirGuard::new("version");
+        let path = dir.path.join("old.cassette");
+        let raw = serde_json::to_vec(&serde_json::json!({
+            "format": CASSETTE_FORMAT,
+            "version": CASSETTE_VERSION + 1,
+            "exchanges": [],
+        }))
+        .expect("json");
+        std::fs::write(&path, zstd::bulk::compress(&raw, ZSTD_LEVEL).expect("zstd"))
+            .expect("write cassette");
+
+        let err = Cassette::load(&path).expect_err("future version should be rejected");
+        assert!(err.to_string().contains("unsupported cassette"), "{err}");
+    }
+
+    #[tokio::test]
+    async fn middleware_replays_a_recorded_run_without_the_upstream() {
+        let dir = TempDirGuard::new("middleware");
+        let cassette_path = dir.path.join("run.cassette");
+        let server = MockServer::start().await;
+        Mock::given(method("GET"))
+            .and(path("/v3/query"))
+            .respond_with(ResponseTemplate::new(200).set_body_string(r#"{"hits":[]}"#))
+            .expect(1)
+            .mount(&server)
+            .await;
+
+        let recorder = Arc::new(Cassette::recording(&cassette_path));
+        let client = ClientBuilder::new(reqwest::Client::new())
+            .with(CacheKeyMiddleware)
+            .with(CassetteMiddleware::new(recorder.clone()))
+            .build();
+        let url = format!("{}/v3/query?q=BRAF&api_key=secret", server.uri());
+        let recorded = client.get(&url).send().await.expect("live request");
+        assert_eq!(recorded.text().await.expect("body"), r#"{"hits":[]}"#);
+        recorder.save().expect("save cassette");
+        drop(server);
+
+        let client = ClientBuilder::new(reqwest::Client::new())
+            .with(CacheKeyMiddleware)
+            .with(CassetteMiddleware::new(Arc::new(
+                Cassette::load(&cassette_path).expect("load cassette"),
+            )))
+            .build();
+        // Credentials are not part of the key, so a different key still replays.
+        let replayed = client
+            .get(url.replace("secret", "other"))
+            .send()
+            .await
+            .expect("replayed request");
+        assert_eq!(replayed.text().await.expect("body"), r#"{"hits":[]}"#);
+
+        let err = client
+            .get(url.replace("BRAF", "KRAS"))
+            .send()
+            .await
+            .expect_err("unrecorded request should fail");
+        assert!(err.to_string().contains("no recording"), "{err}");
+    }
+}
@@ -72,7 +72,10 @@ impl CBioPortalClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp =
+            crate::sources::apply_cache_mode(crate::sources::tag_source(req, CBIOPORTAL_API))
+                .send()
+                .await?;
         let status = resp.status();
         let bytes = crate::sources::read_limited_body(resp, CBIOPORTAL_API).await?;
         if !status.is_success() {
@@ -82,10 +85,7 @@ impl CBioPortalClient {
                 message: format!("HTTP {status}: {excerpt}"),
             });
         }
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: CBIOPORTAL_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(CBIOPORTAL_API, &bytes)
     }
 
     async fn post_json<T: serde::de::DeserializeOwned, B: Serialize>(
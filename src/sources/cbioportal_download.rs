@@ -53,7 +53,9 @@ impl CBioPortalDownloadClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, DATAHUB_API))
+            .send()
+            .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let body = crate::sources::read_limited_body(resp, DATAHUB_API).await?;
@@ -64,10 +66,7 @@ impl CBioPortalDownloadClient {
             });
         }
         crate::sources::ensure_json_content_type(DATAHUB_API, content_type.as_ref(), &body)?;
-        serde_json::from_slice(&body).map_err(|source| BioMcpError::ApiJson {
-            api: DATAHUB_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(DATAHUB_API, &body)
     }
 
     async fn download_to_path(
@@ -75,7 +74,10 @@ impl CBioPortalDownloadClient {
         req: reqwest_middleware::RequestBuilder,
         dest: &Path,
     ) -> Result<(), BioMcpError> {
-        let mut resp = crate::sources::apply_cache_mode(req).send().await?;
+        let mut resp =
+            crate::sources::apply_cache_mode(crate::sources::tag_source(req, DATAHUB_API))
+                .send()
+                .await?;
         let status = resp.status();
         if !status.is_success() {
             let body = crate::sources::read_limited_body(resp, DATAHUB_API).await?;
@@ -163,7 +165,7 @@ fn datahub_client(
         builder = builder.timeout(timeout);
     }
     let client = builder.build().map_err(BioMcpError::HttpClientInit)?;
-    Ok(reqwest_middleware::ClientBuilder::new(client).build())
+    Ok(crate::sources::with_cassette(reqwest_middleware::ClientBuilder::new(client))?.build())
 }
 
 fn unique_temp_path(parent: &Path, prefix: &str) -> Result<PathBuf, BioMcpError> {
@@ -0,0 +1,421 @@
+//! Per-source circuit breaker for upstream outages.
+//!
+//! `CircuitBreakerMiddleware` sits just outside the retry layer. After `FAILURE_THRESHOLD`
+//! consecutive failed requests to one source (transport errors or `5xx` once retries are spent),
+//! the source's circuit opens and later requests fail at once with
+//! `BioMcpError::SourceUnavailable` instead of waiting through retries and client timeouts.
+//! Once `OPEN_COOLDOWN` has passed, a single probe request is let through (half-open): success
+//! closes the circuit, failure opens it for another cooldown.
+//!
+//! Breakers are keyed per service by the `SourceApi` name each client tags its requests with, so
+//! services sharing a host (the EBI APIs on www.ebi.ac.uk) fail independently. Untagged requests
+//! fall back to the rate-limit policy key, then the URL host. Cache hits are answered above this
+//! layer and keep working while a circuit is open.
+
+use std::collections::HashMap;
+use std::sync::{Arc, Mutex, OnceLock, PoisonError};
+use std::time::{Duration, Instant};
+
+use http::Extensions;
+use reqwest_middleware::{Middleware, Next};
+use tracing::warn;
+
+const FAILURE_THRESHOLD: u32 = 3;
+const OPEN_COOLDOWN: Duration = Duration::from_secs(30);
+
+/// Returned by the middleware while a source's circuit is open.
+#[derive(Debug, Clone, PartialEq, Eq, thiserror::Error)]
+#[error("circuit breaker open for {source_name}; retry in {}s", .retry_in.as_secs().max(1))]
+pub(crate) struct CircuitOpen {
+    pub(crate) source_name: String,
+    pub(crate) retry_in: Duration,
+}
+
+impl CircuitOpen {
+    /// Finds a circuit rejection in a middleware error, including one an outer layer wrapped in
+    /// its own middleware error.
+    pub(crate) fn from_middleware_error(err: &reqwest_middleware::Error) -> Option<Self> {
+        let reqwest_middleware::Error::Middleware(source) = err else {
+            return None;
+        };
+        // `reqwest_middleware::Error` is transparent, so its `source()` skips the error it wraps;
+        // nested middleware errors are searched explicitly, as in `classify_error`.
+        source.chain().find_map(|cause| {
+            cause.downcast_ref::<Self>().cloned().or_else(|| {
+                cause
+                    .downcast_ref::<reqwest_middleware::Error>()
+                    .and_then(Self::from_middleware_error)
+            })
+        })
+    }
+}
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub(crate) enum CircuitState {
+    Closed,
+    Open,
+    HalfOpen,
+}
+
+impl CircuitState {
+    pub(crate) fn as_str(self) -> &'static str {
+        match self {
+            Self::Closed => "closed",
+            Self::Open => "open",
+            Self::HalfOpen => "half-open",
+        }
+    }
+}
+
+/// Point-in-time view of one source's breaker.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub(crate) struct CircuitSnapshot {
+    pub source: String,
+    pub state: CircuitState,
+    pub consecutive_failures: u32,
+    /// Time left before the next probe is allowed; `None` unless the circuit is open.
+    pub retry_in: Option<Duration>,
+}
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum Outcome {
+    Success,
+    Failure,
+    // Neither proves nor disproves that the source is up (client-side or throttling errors).
+    Neutral,
+}
+
+#[derive(Debug, Default)]
+struct Breaker {
+    consecutive_failures: u32,
+    opened_at: Option<Instant>,
+    probing: bool,
+}
+
+#[derive(Debug)]
+pub(crate) struct CircuitBreakers {
+    threshold: u32,
+    cooldown: Duration,
+    // Only sources with recent failures have an entry; a success removes it.
+    breakers: Mutex<HashMap<String, Breaker>>,
+}
+
+impl CircuitBreakers {
+    pub(crate) fn new(threshold: u32, cooldown: Duration) -> Self {
+        Self {
+            threshold: threshold.max(1),
+            cooldown,
+            breakers: Mutex::new(HashMap::new()),
+        }
+    }
+
+    /// Lets a request through, returning whether it is the half-open probe, or rejects it.
+    fn admit(&self, key: &str, now: Instant) -> Result<bool, CircuitOpen> {
+        let mut breakers = self.breakers.lock().unwrap_or_else(PoisonError::into_inner);
+        let Some(breaker) = breakers.get_mut(key) else {
+            return Ok(false);
+        };
+        let Some(opened_at) = breaker.opened_at else {
+            return Ok(false);
+        };
+        let elapsed = now.saturating_duration_since(opened_at);
+        if elapsed < self.cooldown || breaker.probing {
+            return Err(CircuitOpen {
+                source_name: key.to_string(),
+                retry_in: self.cooldown.saturating_sub(elapsed),
+            });
+        }
+        breaker.probing = true;
+        Ok(true)
+    }
+
+    fn record(&self, key: &str, outcome: Outcome, probe: bool, now: Instant) {
+        let mut breakers = self.breakers.lock().unwrap_or_else(PoisonError::into_inner);
+        match outcome {
+            Outcome::Success => {
+                if breakers.remove(key).is_some_and(|b| b.opened_at.is_some()) {
+                    warn!(source = %key, "upstream recovered; circuit closed");
+                }
+            }
+            Outcome::Failure => {
+                let breaker = breakers.entry(key.to_string()).or_default();
+                breaker.consecutive_failures = breaker.consecutive_failures.saturating_add(1);
+                breaker.probing = false;
+                if probe || breaker.consecutive_failures >= self.threshold {
+                    if breaker.opened_at.is_none() {
+                        warn!(
+                            source = %key,
+                            failures = breaker.consecutive_failures,
+                            "upstream failing; circuit opened"
+                        );
+                    }
+                    breaker.opened_at = Some(now);
+                }
+            }
+            Outcome::Neutral if probe => {
+                if let Some(breaker) = breakers.get_mut(key) {
+                    breaker.probing = false;
+                }
+            }
+            Outcome::Neutral => {}
+        }
+    }
+
+    /// Reports every source with recent failures, sorted by source key.
+    pub(crate) fn snapshot(&self) -> Vec<CircuitSnapshot> {
+        let now = Instant::now();
+        let breakers = self.breakers.lock().unwrap_or_else(PoisonError::into_inner);
+        let mut out = breakers
+            .iter()
+            .map(|(key, breaker)| {
+                let (state, retry_in) = match breaker.opened_at {
+                    None => (CircuitState::Closed, None),
+                    Some(at) => {
+                        let elapsed = now.saturating_duration_since(at);
+                        if breaker.probing || elapsed >= self.cooldown {
+                            (CircuitState::HalfOpen, None)
+                        } else {
+                            (CircuitState::Open, Some(self.cooldown - elapsed))
+                        }
+                    }
+                };
+                CircuitSnapshot {
+                    source: key.clone(),
+                    state,
+                    consecutive_failures: breaker.consecutive_failures,
+                    retry_in,
+                }
+            })
+            .collect::<Vec<_>>();
+        out.sort_by(|a, b| a.source.cmp(&b.source));
+        out
+    }
+}
+
+/// Releases the half-open probe slot if the request is dropped before it completes.
+struct ProbeGuard<'a> {
+    breakers: &'a CircuitBreakers,
+    key: &'a str,
+    armed: bool,
+}
+
+impl Drop for ProbeGuard<'_> {
+    fn drop(&mut self) {
+        if self.armed {
+            self.breakers
+                .record(self.key, Outcome::Neutral, true, Instant::now());
+        }
+    }
+}
+
+fn classify_error(err: &reqwest_middleware::Error) -> Outcome {
+    match err {
+        reqwest_middleware::Error::Reqwest(err) => classify_reqwest_error(err),
+        // Retries wrap the last transport error; other middleware errors are not outages.
+        reqwest_middleware::Error::Middleware(source) => source
+            .chain()
+            .find_map(|cause| {
+                cause
+                    .downcast_ref::<reqwest_middleware::Error>()
+                    .map(classify_error)
+                    .or_else(|| {
+                        cause
+                            .downcast_ref::<reqwest::Error>()
+                            .map(classify_reqwest_error)
+                    })
+            })
+            .unwrap_or(Outcome::Neutral),
+    }
+}
+
+fn classify_reqwest_error(err: &reqwest::Error) -> Outcome {
+    if err.is_timeout() || err.is_connect() || err.is_request() {
+        Outcome::Failure
+    } else {
+        Outcome::Neutral
+    }
+}
+
+fn classify(result: &reqwest_middleware::Result<reqwest::Response>) -> Outcome {
+    match result {
+        Ok(response) if response.status().is_server_error() => Outcome::Failure,
+        Ok(_) => Outcome::Success,
+        Err(err) => classify_error(err),
+    }
+}
+
+static GLOBAL_CIRCUIT_BREAKERS: OnceLock<Arc<CircuitBreakers>> = OnceLock::new();
+
+pub(crate) fn global_breakers() -> Arc<CircuitBreakers> {
+    GLOBAL_CIRCUIT_BREAKERS
+        .get_or_init(|| Arc::new(CircuitBreakers::new(FAILURE_THRESHOLD, OPEN_COOLDOWN)))
+        .clone()
+}
+
+#[derive(Clone, Debug)]
+pub(crate) struct CircuitBreakerMiddleware {
+    breakers: Arc<CircuitBreakers>,
+}
+
+impl CircuitBreakerMiddleware {
+    pub(crate) fn new() -> Self {
+        Self {
+            breakers: global_breakers(),
+        }
+    }
+}
+
+#[async_trait::async_trait]
+impl Middleware for CircuitBreakerMiddleware {
+    async fn handle(
+        &self,
+        req: reqwest::Request,
+        extensions: &mut Extensions,
+        next: Next<'_>,
+    ) -> reqwest_middleware::Result<reqwest::Response> {
+        let key = super::rate_limit::source_label(req.url(), extensions);
+        let probe = self
+            .breakers
+            .admit(&key, Instant::now())
+            .map_err(reqwest_middleware::Error::middleware)?;
+        let mut guard = ProbeGuard {
+            breakers: &self.breakers,
+            key: &key,
+            armed: probe,
+        };
+        let result = next.run(req, extensions).await;
+        guard.armed = false;
+        self.breakers
+            .record(&key, classify(&result), probe, Instant::now());
+        result
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn circuit_opens_after_consecutive_failures_and_fails_fast() {
+        let breakers = CircuitBreakers::new(3, Duration::from_secs(30));
+        let now = Instant::now();
+        for _ in 0..2 {
+            assert_eq!(breakers.admit("civic", now), Ok(false));
+            breakers.record("civic", Outcome::Failure, false, now);
+        }
+        assert_eq!(breakers.snapshot()[0].state, CircuitState::Closed);
+
+        breakers.record("civic", Outcome::Failure, false, now);
+        let open = breakers
+            .admit("civic", now + Duration::from_secs(10))
+            .expect_err("open circuit rejects");
+        assert_eq!(open.source_name, "civic");
+        assert_eq!(open.retry_in, Duration::from_secs(20));
+        // Other sources are unaffected.
+        assert_eq!(breakers.admit("kegg", now), Ok(false));
+    }
+
+    #[test]
+    fn half_open_allows_one_probe_and_its_outcome_decides() {
+        let breakers = CircuitBreakers::new(1, Duration::from_secs(30));
+        let now = Instant::now();
+        breakers.record("api.monarchinitiative.org", Outcome::Failure, false, now);
+
+        let later = now + Duration::from_secs(31);
+        assert_eq!(breakers.admit("api.monarchinitiative.org", later), Ok(true));
+        assert!(breakers.admit("api.monarchinitiative.org", later).is_err());
+        assert_eq!(breakers.snapshot()[0].state, CircuitState::HalfOpen);
+
+        // A failed probe re-opens for a full cooldown.
+        breakers.record("api.monarchinitiative.org", Outcome::Failure, true, later);
+        assert!(
+            breakers
+                .admit("api.monarchinitiative.org", later + Duration::from_secs(29))
+                .is_err()
+        );
+
+        let retry = later + Duration::from_secs(30);
+        assert_eq!(breakers.admit("api.monarchinitiative.org", retry), Ok(true));
+        breakers.record("api.monarchinitiative.org", Outcome::Success, true, retry);
+        assert!(breakers.snapshot().is_empty());
+        assert_eq!(
+            breakers.admit("api.monarchinitiative.org", retry),
+            Ok(false)
+        );
+    }
+
+    #[test]
+    fn neutral_outcomes_release_the_probe_without_closing() {
+        let breakers = CircuitBreakers::new(1, Duration::from_secs(5));
+        let now = Instant::now();
+        breakers.record("disgenet", Outcome::Failure, false, now);
+        let later = now + Duration::from_secs(6);
+        assert_eq!(breakers.admit("disgenet", later), Ok(true));
+        breakers.record("disgenet", Outcome::Neutral, true, later);
+        assert_eq!(breakers.admit("disgenet", later), Ok(true));
+    }
+
+    #[test]
+    fn circuit_open_is_found_through_wrapping_middleware_errors() {
+        let open = CircuitOpen {
+            source_name: "civic".into(),
+            retry_in: Duration::from_secs(12),
+        };
+        let direct = reqwest_middleware::Error::middleware(open.clone());
+        assert_eq!(
+            CircuitOpen::from_middleware_error(&direct),
+            Some(open.clone())
+        );
+
+        let nested = reqwest_middleware::Error::middleware(direct);
+        assert_eq!(
+            CircuitOpen::from_middleware_error(&nested),
+            Some(open.clone())
+        );
+
+        let with_context = reqwest_middleware::Error::Middleware(
+            anyhow::Error::new(open.clone()).context("cache"),
+        );
+        assert_eq!(
+            CircuitOpen::from_middleware_error(&with_context),
+            Some(open.clone())
+        );
+
+        let message_only =
+            reqwest_middleware::Error::Middleware(anyhow::anyhow!("cache layer: {}", open));
+        assert_eq!(CircuitOpen::from_middleware_error(&message_only), None);
+    }
+
+    #[tokio::test]
+    async fn services_sharing_a_host_trip_their_own_breakers() {
+        use wiremock::matchers::path;
+        use wiremock::{Mock, MockServer, ResponseTemplate};
+
+        let server = MockServer::start().await;
+        Mock::given(path("/gwas"))
+            .respond_with(ResponseTemplate::new(503))
+            .mount(&server)
+            .await;
+        Mock::given(path("/europepmc"))
+            .respond_with(ResponseTemplate::new(200))
+            .mount(&server)
+            .await;
+        let breakers = Arc::new(CircuitBreakers::new(1, Duration::from_secs(30)));
+        let client = reqwest_middleware::ClientBuilder::new(reqwest::Client::new())
+            .with(CircuitBreakerMiddleware {
+                breakers: Arc::clone(&breakers),
+            })
+            .build();
+        let get = |api: &'static str| {
+            crate::sources::tag_source(client.get(format!("{}/{api}", server.uri())), api).send()
+        };
+
+        assert_eq!(get("gwas").await.expect("503 response").status(), 503);
+        let err = get("gwas").await.expect_err("gwas circuit is open");
+        assert_eq!(
+            CircuitOpen::from_middleware_error(&err).map(|open| open.source_name),
+            Some("gwas".to_string())
+        );
+        assert_eq!(get("europepmc").await.expect("europepmc").status(), 200);
+    }
+}
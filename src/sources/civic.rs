@@ -116,9 +116,10 @@ impl CivicClient {
         req: reqwest_middleware::RequestBuilder,
         body: &B,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req.json(body))
-            .send()
-            .await?;
+        let resp =
+            crate::sources::apply_cache_mode(crate::sources::tag_source(req.json(body), CIVIC_API))
+                .send()
+                .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, CIVIC_API).await?;
@@ -132,10 +133,7 @@ impl CivicClient {
         }
 
         crate::sources::ensure_json_content_type(CIVIC_API, content_type.as_ref(), &bytes)?;
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: CIVIC_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(CIVIC_API, &bytes)
     }
 
     pub async fn by_molecular_profile(
@@ -48,7 +48,9 @@ impl ClinGenClient {
         req: reqwest_middleware::RequestBuilder,
         api: &str,
     ) -> Result<String, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, CLINGEN_API))
+            .send()
+            .await?;
         let status = resp.status();
         let bytes = crate::sources::read_limited_body(resp, api).await?;
 
@@ -68,7 +70,9 @@ impl ClinGenClient {
         req: reqwest_middleware::RequestBuilder,
         api: &str,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, CLINGEN_API))
+            .send()
+            .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, api).await?;
@@ -90,10 +94,7 @@ impl ClinGenClient {
             crate::sources::ensure_json_content_type(api, content_type.as_ref(), &bytes)?;
         }
 
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: api.to_string(),
-            source,
-        })
+        crate::sources::decode_json(api, &bytes)
     }
 
     pub async fn gene_validity(
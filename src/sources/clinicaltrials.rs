@@ -149,7 +149,9 @@ impl ClinicalTrialsClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, CTGOV_API))
+            .send()
+            .await?;
         let status = resp.status();
         let bytes = crate::sources::read_limited_body(resp, CTGOV_API).await?;
         if !status.is_success() {
@@ -159,10 +161,7 @@ impl ClinicalTrialsClient {
                 message: format!("HTTP {status}: {excerpt}"),
             });
         }
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: CTGOV_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(CTGOV_API, &bytes)
     }
 
     pub async fn search(
@@ -252,7 +251,9 @@ impl ClinicalTrialsClient {
         let fields = build_get_fields(sections);
 
         let req = self.client.get(&url).query(&[("fields", fields.as_str())]);
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, CTGOV_API))
+            .send()
+            .await?;
 
         if resp.status() == reqwest::StatusCode::NOT_FOUND {
             return Err(BioMcpError::NotFound {
@@ -272,10 +273,7 @@ impl ClinicalTrialsClient {
             });
         }
 
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: CTGOV_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(CTGOV_API, &bytes)
     }
 }
 
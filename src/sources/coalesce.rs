@@ -0,0 +1,353 @@
+//! Singleflight coalescing for identical concurrent upstream requests.
+//!
+//! Sits between the HTTP cache and the retry/rate-limit layers: when several tasks miss the cache
+//! for the same request at once, only the first (the leader) goes upstream and every concurrent
+//! duplicate receives a copy of the leader's buffered response. A leader nobody joined streams
+//! its response unbuffered.
+
+use std::collections::HashMap;
+use std::hash::{DefaultHasher, Hash, Hasher};
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{Arc, Mutex, PoisonError};
+
+use http::Extensions;
+use reqwest::header::{CONTENT_LENGTH, HeaderMap};
+use reqwest::{Method, StatusCode, Version};
+use reqwest_middleware::{Middleware, Next};
+use tokio::sync::watch;
+
+// Larger responses are handed to the leader unbuffered and duplicates fetch on their own.
+const MAX_COALESCED_BODY_BYTES: u64 = 32 * 1024 * 1024;
+
+static UPSTREAM_FETCHES: AtomicU64 = AtomicU64::new(0);
+static COALESCED_REQUESTS: AtomicU64 = AtomicU64::new(0);
+
+/// Process-wide coalescing counters.
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+pub(crate) struct CoalescingStats {
+    /// Coalescable requests that went upstream as a flight leader.
+    pub upstream_fetches: u64,
+    /// Requests answered from another request's in-flight fetch.
+    pub coalesced_requests: u64,
+}
+
+pub(crate) fn stats() -> CoalescingStats {
+    CoalescingStats {
+        upstream_fetches: UPSTREAM_FETCHES.load(Ordering::Relaxed),
+        coalesced_requests: COALESCED_REQUESTS.load(Ordering::Relaxed),
+    }
+}
+
+#[derive(Debug)]
+struct BufferedResponse {
+    status: StatusCode,
+    version: Version,
+    headers: HeaderMap,
+    body: Vec<u8>,
+}
+
+impl BufferedResponse {
+    async fn read(response: reqwest::Response) -> Result<Self, reqwest::Error> {
+        let status = response.status();
+        let version = response.version();
+        let headers = response.headers().clone();
+        let body = response.bytes().await?.to_vec();
+        Ok(Self {
+            status,
+            version,
+            headers,
+            body,
+        })
+    }
+
+    fn to_response(&self) -> reqwest::Response {
+        let mut response = http::Response::new(self.body.clone());
+        *response.status_mut() = self.status;
+        *response.version_mut() = self.version;
+        *response.headers_mut() = self.headers.clone();
+        reqwest::Response::from(response)
+    }
+}
+
+#[derive(Debug, Clone)]
+enum FlightState {
+    Pending,
+    Ready(Arc<BufferedResponse>),
+    // The leader failed or could not share its response; waiters fetch independently.
+    Abandoned,
+}
+
+/// Leader handle for one in-flight key; unregisters the key when dropped.
+struct Flight<'a> {
+    flights: &'a Mutex<HashMap<String, watch::Receiver<FlightState>>>,
+    key: String,
+    tx: watch::Sender<FlightState>,
+}
+
+impl Flight<'_> {
+    /// Whether another request has joined; the flights map holds the one other receiver.
+    fn has_waiters(&self) -> bool {
+        self.tx.receiver_count() > 1
+    }
+
+    fn finish(self, state: FlightState) {
+        let _ = self.tx.send(state);
+    }
+}
+
+impl Drop for Flight<'_> {
+    fn drop(&mut self) {
+        self.flights
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .remove(&self.key);
+    }
+}
+
+enum Role<'a> {
+    Leader(Flight<'a>),
+    Waiter(watch::Receiver<FlightState>),
+}
+
+/// Builds the coalescing key for requests that are safe to share, or `None` to pass through.
+///
+/// GET and body-carrying POST (query-style APIs such as GraphQL) are coalesced. The key is the
+/// HTTP cache key (the normalized key when one is attached, else `METHOD:url`) plus a digest of
+/// the request headers and body, so requests that differ in credentials or conditional headers
+/// never share a response.
+fn coalesce_key(req: &reqwest::Request) -> Option<String> {
+    let body = if *req.method() == Method::GET {
+        None
+    } else if *req.method() == Method::POST {
+        Some(req.body()?.as_bytes()?)
+    } else {
+        return None;
+    };
+    let normalized = req
+        .headers()
+        .get(super::cache_key::CACHE_KEY_HEADER)
+        .and_then(|value| value.to_str().ok());
+    // A normalized key already covers the canonical body; hashing raw bytes would split
+    // requests that differ only in JSON formatting.
+    let body = if normalized.is_some() { None } else { body };
+
+    let mut hasher = DefaultHasher::new();
+    let mut headers = req
+        .headers()
+        .iter()
+        .map(|(name, value)| (name.as_str(), value.as_bytes()))
+        .collect::<Vec<_>>();
+    headers.sort_unstable();
+    headers.hash(&mut hasher);
+    body.hash(&mut hasher);
+
+    let cache_key = match normalized {
+        Some(key) => key.to_string(),
+        None => format!("{}:{}", req.method(), req.url()),
+    };
+    Some(format!("{cache_key}#{:016x}", hasher.finish()))
+}
+
+fn declared_length_exceeds_limit(response: &reqwest::Response) -> bool {
+    response
+        .headers()
+        .get(CONTENT_LENGTH)
+        .and_then(|value| value.to_str().ok())
+        .and_then(|value| value.parse::<u64>().ok())
+        .is_some_and(|len| len > MAX_COALESCED_BODY_BYTES)
+}
+
+#[derive(Debug, Default)]
+pub(crate) struct CoalescingMiddleware {
+    flights: Mutex<HashMap<String, watch::Receiver<FlightState>>>,
+}
+
+impl CoalescingMiddleware {
+    pub(crate) fn new() -> Self {
+        Self::default()
+    }
+
+    fn join_or_lead(&self, key: &str) -> Role<'_> {
+        let mut flights = self.flights.lock().unwrap_or_else(PoisonError::into_inner);
+        if let Some(rx) = flights.get(key) {
+            return Role::Waiter(rx.clone());
+        }
+        let (tx, rx) = watch::channel(FlightState::Pending);
+        flights.insert(key.to_string(), rx);
+        Role::Leader(Flight {
+            flights: &self.flights,
+            key: key.to_string(),
+            tx,
+        })
+    }
+}
+
+#[async_trait::async_trait]
+impl Middleware for CoalescingMiddleware {
+    async fn handle(
+        &self,
+        req: reqwest::Request,
+        extensions: &mut Extensions,
+        next: Next<'_>,
+    ) -> reqwest_middleware::Result<reqwest::Response> {
+        let Some(key) = coalesce_key(&req) else {
+            return next.run(req, extensions).await;
+        };
+
+        match self.join_or_lead(&key) {
+            Role::Waiter(mut rx) => {
+                let shared = match rx
+                    .wait_for(|state| !matches!(state, FlightState::Pending))
+                    .await
+                {
+                    Ok(state) => match &*state {
+                        FlightState::Ready(buffered) => Some(buffered.clone()),
+                        FlightState::Pending | FlightState::Abandoned => None,
+                    },
+                    // The leader was cancelled before it finished.
+                    Err(_) => None,
+                };
+                match shared {
+                    Some(buffered) => {
+                        COALESCED_REQUESTS.fetch_add(1, Ordering::Relaxed);
+                        Ok(buffered.to_response())
+                    }
+                    None => next.run(req, extensions).await,
+                }
+            }
+            Role::Leader(flight) => {
+                UPSTREAM_FETCHES.fetch_add(1, Ordering::Relaxed);
+                let response = match next.run(req, extensions).await {
+                    Ok(response) => response,
+                    Err(err) => {
+                        flight.finish(FlightState::Abandoned);
+                        return Err(err);
+                    }
+                };
+                // A request that joins from here on fetches on its own.
+                if !flight.has_waiters() || declared_length_exceeds_limit(&response) {
+                    flight.finish(FlightState::Abandoned);
+                    return Ok(response);
+                }
+                match BufferedResponse::read(response).await {
+                    Ok(buffered) => {
+                        let buffered = Arc::new(buffered);
+                        let response = buffered.to_response();
+                        flight.finish(FlightState::Ready(buffered));
+                        Ok(response)
+                    }
+                    Err(err) => {
+                        flight.finish(FlightState::Abandoned);
+                        Err(reqwest_middleware::Error::Reqwest(err))
+                    }
+                }
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::time::Duration;
+
+    use futures::future::join_all;
+    use reqwest_middleware::ClientBuilder;
+    use wiremock::matchers::{body_string, method, path};
+    use wiremock::{Mock, MockServer, ResponseTemplate};
+
+    use super::*;
+
+    fn client() -> reqwest_middleware::ClientWithMiddleware {
+        ClientBuilder::new(reqwest::Client::new())
+            .with(CoalescingMiddleware::new())
+            .build()
+    }
+
+    #[tokio::test]
+    async fn concurrent_identical_gets_share_one_upstream_fetch() {
+        let server = MockServer::start().await;
+        Mock::given(method("GET"))
+            .and(path("/gene/BRAF"))
+            .respond_with(
+                ResponseTemplate::new(200)
+                    .set_body_string("braf")
+                    .set_delay(Duration::from_millis(200)),
+            )
+            .expect(1)
+            .mount(&server)
+            .await;
+
+        let client = client();
+        let url = format!("{}/gene/BRAF", server.uri());
+        let before = stats();
+        let bodies = join_all((0..5).map(|_| async {
+            let resp = client.get(&url).send().await.expect("send");
+            assert_eq!(resp.status(), StatusCode::OK);
+            resp.text().await.expect("body")
+        }))
+        .await;
+
+        assert!(bodies.iter().all(|body| body == "braf"));
+        assert!(stats().coalesced_requests >= before.coalesced_requests + 4);
+    }
+
+    #[tokio::test]
+    async fn lone_leader_streams_its_response_unbuffered() {
+        let server = MockServer::start().await;
+        Mock::given(method("GET"))
+            .and(path("/gene/TP53"))
+            .respond_with(ResponseTemplate::new(200).set_body_string("tp53"))
+            .expect(1)
+            .mount(&server)
+            .await;
+
+        let url = format!("{}/gene/TP53", server.uri());
+        let resp = client().get(&url).send().await.expect("send");
+        // A buffered copy is rebuilt without the request URL.
+        assert_eq!(resp.url().as_str(), url);
+        assert_eq!(resp.text().await.expect("body"), "tp53");
+    }
+
+    #[tokio::test]
+    async fn posts_with_different_bodies_are_not_coalesced() {
+        let server = MockServer::start().await;
+        for query in ["a", "b"] {
+            Mock::given(method("POST"))
+                .and(path("/graphql"))
+                .and(body_string(query))
+                .respond_with(
+                    ResponseTemplate::new(200)
+                        .set_body_string(query)
+                        .set_delay(Duration::from_millis(100)),
+                )
+                .expect(1)
+                .mount(&server)
+                .await;
+        }
+
+        let client = client();
+        let url = format!("{}/graphql", server.uri());
+        let (a, b) = tokio::join!(
+            client.post(&url).body("a").send(),
+            client.post(&url).body("b").send(),
+        );
+        assert_eq!(a.expect("a").text().await.expect("a body"), "a");
+        assert_eq!(b.expect("b").text().await.expect("b body"), "b");
+    }
+
+    #[test]
+    fn coalesce_key_skips_mutating_methods_and_separates_headers() {
+        let url = reqwest::Url::parse("https://example.org/x?q=1").unwrap();
+        let delete = reqwest::Request::new(Method::DELETE, url.clone());
+        assert_eq!(coalesce_key(&delete), None);
+
+        let plain = reqwest::Request::new(Method::GET, url.clone());
+        let mut keyed = reqwest::Request::new(Method::GET, url);
+        keyed
+            .headers_mut()
+            .insert("x-api-key", "secret".parse().unwrap());
+        let plain_key = coalesce_key(&plain).expect("get key");
+        assert!(plain_key.starts_with("GET:https://example.org/x?q=1#"));
+        assert_ne!(Some(plain_key), coalesce_key(&keyed));
+    }
+}
@@ -44,7 +44,10 @@ impl ComplexPortalClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp =
+            crate::sources::apply_cache_mode(crate::sources::tag_source(req, COMPLEXPORTAL_API))
+                .send()
+                .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, COMPLEXPORTAL_API).await?;
@@ -56,10 +59,7 @@ impl ComplexPortalClient {
             });
         }
         crate::sources::ensure_json_content_type(COMPLEXPORTAL_API, content_type.as_ref(), &bytes)?;
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: COMPLEXPORTAL_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(COMPLEXPORTAL_API, &bytes)
     }
 
     pub async fn complexes(
@@ -49,7 +49,9 @@ impl CpicClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, CPIC_API))
+            .send()
+            .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, CPIC_API).await?;
@@ -63,17 +65,16 @@ impl CpicClient {
         }
 
         crate::sources::ensure_json_content_type(CPIC_API, content_type.as_ref(), &bytes)?;
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: CPIC_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(CPIC_API, &bytes)
     }
 
     async fn get_json_with_total<T: DeserializeOwned>(
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<CpicPage<T>, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, CPIC_API))
+            .send()
+            .await?;
         let status = resp.status();
         let total = parse_content_range_total(resp.headers());
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
@@ -88,10 +89,7 @@ impl CpicClient {
         }
 
         crate::sources::ensure_json_content_type(CPIC_API, content_type.as_ref(), &bytes)?;
-        let rows = serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: CPIC_API.to_string(),
-            source,
-        })?;
+        let rows = crate::sources::decode_json(CPIC_API, &bytes)?;
         Ok(CpicPage { rows, total })
     }
 
@@ -72,9 +72,10 @@ impl DgidbClient {
         req: reqwest_middleware::RequestBuilder,
         body: &B,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req.json(body))
-            .send()
-            .await?;
+        let resp =
+            crate::sources::apply_cache_mode(crate::sources::tag_source(req.json(body), DGIDB_API))
+                .send()
+                .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, DGIDB_API).await?;
@@ -88,10 +89,7 @@ impl DgidbClient {
         }
 
         crate::sources::ensure_json_content_type(DGIDB_API, content_type.as_ref(), &bytes)?;
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: DGIDB_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(DGIDB_API, &bytes)
     }
 
     pub async fn gene_interactions(
@@ -67,9 +67,12 @@ impl DisgenetClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode_with_auth(req, true)
-            .send()
-            .await?;
+        let resp = crate::sources::apply_cache_mode_with_auth(
+            crate::sources::tag_source(req, DISGENET_API),
+            true,
+        )
+        .send()
+        .await?;
         let status = resp.status();
         let retry_after = parse_retry_after_seconds(resp.headers());
         let content_type = resp.headers().get(CONTENT_TYPE).cloned();
@@ -96,10 +99,7 @@ impl DisgenetClient {
             });
         }
 
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: DISGENET_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(DISGENET_API, &bytes)
     }
 
     pub async fn fetch_gene_associations(
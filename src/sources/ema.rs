@@ -689,10 +689,7 @@ fn touch_file(path: &Path) -> Result<(), BioMcpError> {
 }
 
 fn validate_feed_payload(feed: EmaFeed, body: &[u8]) -> Result<(), BioMcpError> {
-    let payload: Value = serde_json::from_slice(body).map_err(|source| BioMcpError::ApiJson {
-        api: EMA_API.to_string(),
-        source,
-    })?;
+    let payload: Value = crate::sources::decode_json(EMA_API, body)?;
     let Some(object) = payload.as_object() else {
         return Err(BioMcpError::Api {
             api: EMA_API.to_string(),
@@ -718,7 +715,8 @@ async fn sync_feed(root: &Path, plan: FeedSyncPlan) -> Result<(), BioMcpError> {
         ema_report_base().trim_end_matches('/'),
         plan.feed.report_name
     );
-    let mut request = client.get(url).with_extension(plan.cache_mode);
+    let mut request =
+        crate::sources::tag_source(client.get(url), EMA_API).with_extension(plan.cache_mode);
     if matches!(plan.state, FeedSyncState::Stale) {
         // `http-cache`'s `NoCache` mode performs an unconditional network fetch.
         // `Default` plus a request `Cache-Control: no-cache` forces validator-based
@@ -8,6 +8,7 @@ use crate::error::BioMcpError;
 const ENRICHR_BASE: &str = "https://maayanlab.cloud/Enrichr";
 const ENRICHR_API: &str = "enrichr";
 const ENRICHR_BASE_ENV: &str = "BIOMCP_ENRICHR_BASE";
+const ENRICHR_LIST_DESCRIPTION: &str = "biomcp-cli";
 
 #[derive(Clone)]
 pub struct EnrichrClient {
@@ -53,7 +54,9 @@ impl EnrichrClient {
         ),
         BioMcpError,
     > {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, ENRICHR_API))
+            .send()
+            .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, ENRICHR_API).await?;
@@ -74,9 +77,7 @@ impl EnrichrClient {
     where
         F: Fn() -> reqwest::RequestBuilder,
     {
-        let resp =
-            crate::sources::retry_send(ENRICHR_API, 3, || async { build_request().send().await })
-                .await?;
+        let resp = crate::sources::retry_send(ENRICHR_API, 3, build_request).await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, ENRICHR_API).await?;
@@ -113,7 +114,7 @@ impl EnrichrClient {
         }
 
         let url = self.endpoint("addList");
-        crate::sources::rate_limit::wait_for_url_str(&url).await;
+        crate::sources::rate_limit::wait_for_url_str(&url).await?;
         let request_url = url.clone();
         let list_for_retry = list.clone();
         let (status, _content_type, bytes) = self
@@ -122,17 +123,21 @@ impl EnrichrClient {
             .send_bytes_streaming(|| {
                 let form = reqwest::multipart::Form::new()
                     .text("list", list_for_retry.clone())
-                    .text("description", "biomcp-cli");
-                self.streaming_client.post(&request_url).multipart(form)
+                    .text("description", ENRICHR_LIST_DESCRIPTION);
+                // The streamed form cannot be read back, so cassettes key on its fields.
+                crate::sources::cache_key::key_multipart_form(
+                    self.streaming_client.post(&request_url).multipart(form),
+                    &request_url,
+                    &[
+                        ("list", list_for_retry.as_str()),
+                        ("description", ENRICHR_LIST_DESCRIPTION),
+                    ],
+                )
             })
             .await?;
 
         if status.is_success() {
-            let parsed: EnrichrAddListResponse =
-                serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-                    api: ENRICHR_API.to_string(),
-                    source,
-                })?;
+            let parsed: EnrichrAddListResponse = crate::sources::decode_json(ENRICHR_API, &bytes)?;
             return Ok(parsed.user_list_id);
         }
 
@@ -158,10 +163,7 @@ impl EnrichrClient {
 
         if status.is_success() {
             crate::sources::ensure_json_content_type(ENRICHR_API, content_type.as_ref(), &bytes)?;
-            return serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-                api: ENRICHR_API.to_string(),
-                source,
-            });
+            return crate::sources::decode_json(ENRICHR_API, &bytes);
         }
 
         // Enrichr occasionally returns HTTP 400 for otherwise-valid requests. Degrade
@@ -217,6 +219,12 @@ mod tests {
         let client = EnrichrClient::new_for_test(server.uri()).unwrap();
         let id = client.add_list(&["BRAF", "KRAS"]).await.unwrap();
         assert_eq!(id, 42);
+        let received = server.received_requests().await.expect("recorded requests");
+        assert!(
+            received
+                .iter()
+                .all(|req| !req.headers.contains_key("x-biomcp-cache-key"))
+        );
     }
 
     #[tokio::test]
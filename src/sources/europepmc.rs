@@ -8,6 +8,54 @@ use crate::error::BioMcpError;
 const EUROPE_PMC_BASE: &str = "https://www.ebi.ac.uk/europepmc/webservices/rest";
 const EUROPE_PMC_API: &str = "europepmc";
 const EUROPE_PMC_BASE_ENV: &str = "BIOMCP_EUROPEPMC_BASE";
+/// `cursorMark` that starts a cursor walk at the first result.
+pub const EUROPE_PMC_CURSOR_START: &str = "*";
+/// Identifiers per [`EuropePmcClient::search_by_ids`] request. An ID can match more than one
+/// record, so a full page of 100 still holds every hit.
+pub const EUROPE_PMC_ID_BATCH_MAX: usize = 50;
+const EUROPE_PMC_QUERY_MAX_CHARS: usize = 2048;
+
+/// One record identifier for [`EuropePmcClient::search_by_ids`].
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+pub enum EuropePmcId {
+    Pmid(String),
+    Pmcid(String),
+    Doi(String),
+}
+
+impl EuropePmcId {
+    fn clause(&self) -> String {
+        match self {
+            Self::Pmid(pmid) => format!("(EXT_ID:{pmid} AND SRC:MED)"),
+            Self::Pmcid(pmcid) => format!("PMCID:{pmcid}"),
+            Self::Doi(doi) => format!("DOI:\"{}\"", doi.replace('"', "")),
+        }
+    }
+}
+
+/// `OR` queries covering `ids`, each within the ID cap and the query length limit.
+fn id_batch_queries(ids: &[EuropePmcId]) -> Vec<String> {
+    let mut queries = Vec::new();
+    let mut query = String::new();
+    let mut count = 0;
+    for clause in ids.iter().map(EuropePmcId::clause) {
+        if count == EUROPE_PMC_ID_BATCH_MAX
+            || (count > 0 && query.len() + " OR ".len() + clause.len() > EUROPE_PMC_QUERY_MAX_CHARS)
+        {
+            queries.push(std::mem::take(&mut query));
+            count = 0;
+        }
+        if count > 0 {
+            query.push_str(" OR ");
+        }
+        query.push_str(&clause);
+        count += 1;
+    }
+    if count > 0 {
+        queries.push(query);
+    }
+    queries
+}
 
 #[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
 pub enum EuropePmcSort {
@@ -51,7 +99,10 @@ impl EuropePmcClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp =
+            crate::sources::apply_cache_mode(crate::sources::tag_source(req, EUROPE_PMC_API))
+                .send()
+                .await?;
         let status = resp.status();
         let bytes = crate::sources::read_limited_body(resp, EUROPE_PMC_API).await?;
         if !status.is_success() {
@@ -61,10 +112,7 @@ impl EuropePmcClient {
                 message: format!("HTTP {status}: {excerpt}"),
             });
         }
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: EUROPE_PMC_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(EUROPE_PMC_API, &bytes)
     }
 
     pub async fn search_by_doi(&self, doi: &str) -> Result<EuropePmcSearchResponse, BioMcpError> {
@@ -127,6 +175,25 @@ impl EuropePmcClient {
             .await
     }
 
+    /// Looks up many records with as few `OR` queries as the API limits allow, instead of one
+    /// search per ID. Hits come back query by query in relevance order; IDs Europe PMC does not
+    /// know are simply absent.
+    pub async fn search_by_ids(
+        &self,
+        ids: &[EuropePmcId],
+    ) -> Result<Vec<EuropePmcResult>, BioMcpError> {
+        let pages = futures::future::try_join_all(
+            id_batch_queries(ids)
+                .into_iter()
+                .map(|query| async move { self.search_query(&query, 1, 100).await }),
+        )
+        .await?;
+        Ok(pages
+            .into_iter()
+            .flat_map(|page| page.result_list.map(|v| v.result).unwrap_or_default())
+            .collect())
+    }
+
     pub async fn search_query(
         &self,
         query: &str,
@@ -143,6 +210,42 @@ impl EuropePmcClient {
         page: usize,
         page_size: usize,
         sort: EuropePmcSort,
+    ) -> Result<EuropePmcSearchResponse, BioMcpError> {
+        if page == 0 {
+            return Err(BioMcpError::InvalidArgument(
+                "Europe PMC page must be >= 1".into(),
+            ));
+        }
+        self.search(query, ("page", &page.to_string()), page_size, sort)
+            .await
+    }
+
+    /// One page of a `cursorMark` walk. Start with [`EUROPE_PMC_CURSOR_START`] and continue with
+    /// each response's `nextCursorMark`; unlike page numbers, a cursor resumes deep in the result
+    /// set without re-walking it.
+    pub async fn search_query_with_cursor(
+        &self,
+        query: &str,
+        cursor_mark: &str,
+        page_size: usize,
+        sort: EuropePmcSort,
+    ) -> Result<EuropePmcSearchResponse, BioMcpError> {
+        let cursor_mark = cursor_mark.trim();
+        if cursor_mark.is_empty() {
+            return Err(BioMcpError::InvalidArgument(
+                "Europe PMC cursor mark is required".into(),
+            ));
+        }
+        self.search(query, ("cursorMark", cursor_mark), page_size, sort)
+            .await
+    }
+
+    async fn search(
+        &self,
+        query: &str,
+        (position_param, position): (&str, &str),
+        page_size: usize,
+        sort: EuropePmcSort,
     ) -> Result<EuropePmcSearchResponse, BioMcpError> {
         let query = query.trim();
         if query.is_empty() {
@@ -155,11 +258,6 @@ impl EuropePmcClient {
                 "Query is too long for Europe PMC search".into(),
             ));
         }
-        if page == 0 {
-            return Err(BioMcpError::InvalidArgument(
-                "Europe PMC page must be >= 1".into(),
-            ));
-        }
         if page_size == 0 || page_size > 100 {
             return Err(BioMcpError::InvalidArgument(
                 "Europe PMC page size must be between 1 and 100".into(),
@@ -167,12 +265,11 @@ impl EuropePmcClient {
         }
 
         let url = self.endpoint("search");
-        let page = page.to_string();
         let page_size = page_size.to_string();
         let mut req = self.client.get(&url).query(&[
             ("query", query),
             ("format", "json"),
-            ("page", page.as_str()),
+            (position_param, position),
             ("pageSize", page_size.as_str()),
         ]);
         req = match sort {
@@ -195,9 +292,12 @@ impl EuropePmcClient {
         }
 
         let url = self.endpoint(&format!("{source}/{id}/fullTextXML"));
-        let resp = crate::sources::apply_cache_mode(self.client.get(&url))
-            .send()
-            .await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(
+            self.client.get(&url),
+            EUROPE_PMC_API,
+        ))
+        .send()
+        .await?;
         if resp.status() == reqwest::StatusCode::NOT_FOUND {
             return Ok(None);
         }
@@ -220,6 +320,9 @@ impl EuropePmcClient {
 pub struct EuropePmcSearchResponse {
     #[serde(rename = "hitCount")]
     pub hit_count: Option<u64>,
+    /// Cursor for the following page; only sent for `cursorMark` searches.
+    #[serde(rename = "nextCursorMark", default)]
+    pub next_cursor_mark: Option<String>,
     #[serde(rename = "resultList")]
     pub result_list: Option<EuropePmcResultList>,
 }
@@ -308,6 +411,97 @@ mod tests {
             .unwrap();
     }
 
+    #[test]
+    fn id_batch_queries_respect_the_id_cap_and_query_length() {
+        let pmids = (0..EUROPE_PMC_ID_BATCH_MAX + 1)
+            .map(|n| EuropePmcId::Pmid((22663000 + n).to_string()))
+            .collect::<Vec<_>>();
+        let queries = id_batch_queries(&pmids);
+        assert_eq!(queries.len(), 2);
+        assert!(queries[0].starts_with("(EXT_ID:22663000 AND SRC:MED) OR (EXT_ID:22663001"));
+        assert_eq!(queries[1], "(EXT_ID:22663050 AND SRC:MED)");
+
+        let dois = (0..EUROPE_PMC_ID_BATCH_MAX)
+            .map(|n| EuropePmcId::Doi(format!("10.1158/1078-0432.CCR-{n:04}-{}", "x".repeat(40))))
+            .collect::<Vec<_>>();
+        let queries = id_batch_queries(&dois);
+        assert!(queries.len() > 1);
+        assert!(
+            queries
+                .iter()
+                .all(|query| query.len() <= EUROPE_PMC_QUERY_MAX_CHARS)
+        );
+        assert_eq!(
+            queries
+                .iter()
+                .map(|query| query.matches("DOI:").count())
+                .sum::<usize>(),
+            EUROPE_PMC_ID_BATCH_MAX
+        );
+    }
+
+    #[tokio::test]
+    async fn search_by_ids_sends_one_or_query_per_batch() {
+        let server = MockServer::start().await;
+        Mock::given(method("GET"))
+            .and(path("/search"))
+            .and(query_param(
+                "query",
+                "(EXT_ID:22663011 AND SRC:MED) OR PMCID:PMC9984800 OR DOI:\"10.1056/NEJMoa1203421\"",
+            ))
+            .and(query_param("pageSize", "100"))
+            .respond_with(ResponseTemplate::new(200).set_body_json(serde_json::json!({
+                "hitCount": 2,
+                "resultList": {"result": [
+                    {"id": "22663011", "pmid": "22663011"},
+                    {"id": "PMC9984800", "pmcid": "PMC9984800"}
+                ]}
+            })))
+            .expect(1)
+            .mount(&server)
+            .await;
+
+        let client = EuropePmcClient::new_for_test(server.uri()).unwrap();
+        let hits = client
+            .search_by_ids(&[
+                EuropePmcId::Pmid("22663011".into()),
+                EuropePmcId::Pmcid("PMC9984800".into()),
+                EuropePmcId::Doi("10.1056/NEJMoa1203421".into()),
+            ])
+            .await
+            .unwrap();
+        assert_eq!(hits.len(), 2);
+        assert_eq!(hits[1].pmcid.as_deref(), Some("PMC9984800"));
+    }
+
+    #[tokio::test]
+    async fn search_query_with_cursor_sends_cursor_mark_and_returns_the_next_one() {
+        let server = MockServer::start().await;
+        Mock::given(method("GET"))
+            .and(path("/search"))
+            .and(query_param("query", "BRAF"))
+            .and(query_param("cursorMark", "AoIIQJ6n2Cg3OTM2NjU5OQ=="))
+            .and(query_param("pageSize", "25"))
+            .and(query_param("sort", "P_PDATE_D desc"))
+            .respond_with(ResponseTemplate::new(200).set_body_json(serde_json::json!({
+                "hitCount": 80,
+                "nextCursorMark": "AoIIQJ7kJCg3OTQ0MDI0Mg==",
+                "resultList": {"result": [{"id": "39440242"}]}
+            })))
+            .mount(&server)
+            .await;
+
+        let client = EuropePmcClient::new_for_test(server.uri()).unwrap();
+        let resp = client
+            .search_query_with_cursor("BRAF", "AoIIQJ6n2Cg3OTM2NjU5OQ==", 25, EuropePmcSort::Date)
+            .await
+            .unwrap();
+        assert_eq!(
+            resp.next_cursor_mark.as_deref(),
+            Some("AoIIQJ7kJCg3OTQ0MDI0Mg==")
+        );
+    }
+
     #[tokio::test]
     async fn search_by_pmid_rejects_non_numeric_values() {
         let client = EuropePmcClient::new_for_test("http://127.0.0.1".into()).unwrap();
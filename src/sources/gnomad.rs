@@ -93,9 +93,12 @@ impl GnomadClient {
         req: reqwest_middleware::RequestBuilder,
         body: &B,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req.json(body))
-            .send()
-            .await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(
+            req.json(body),
+            GNOMAD_API,
+        ))
+        .send()
+        .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, GNOMAD_API).await?;
@@ -109,10 +112,7 @@ impl GnomadClient {
         }
 
         crate::sources::ensure_json_content_type(GNOMAD_API, content_type.as_ref(), &bytes)?;
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: GNOMAD_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(GNOMAD_API, &bytes)
     }
 
     pub async fn gene_constraint(
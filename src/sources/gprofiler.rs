@@ -16,7 +16,7 @@ const GPROFILER_CONNECT_TIMEOUT: Duration = Duration::from_secs(10);
 const GPROFILER_RETRY_SUGGESTION: &str = "Retry shortly. If the problem persists, probe https://biit.cs.ut.ee/gprofiler/api/gost/profile/ directly.";
 
 pub struct GProfilerClient {
-    client: reqwest::Client,
+    client: reqwest_middleware::ClientWithMiddleware,
     base: Cow<'static, str>,
 }
 
@@ -51,7 +51,7 @@ impl GProfilerClient {
 
     async fn post_json<T: DeserializeOwned, B: Serialize>(
         &self,
-        req: reqwest::RequestBuilder,
+        req: reqwest_middleware::RequestBuilder,
         body: &B,
     ) -> Result<T, BioMcpError> {
         let resp = req.json(body).send().await?;
@@ -66,10 +66,7 @@ impl GProfilerClient {
             });
         }
 
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: GPROFILER_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(GPROFILER_API, &bytes)
     }
 
     pub async fn enrich_genes(
@@ -108,13 +105,16 @@ impl GProfilerClient {
     }
 }
 
-fn gprofiler_http_client(timeout: Duration) -> Result<reqwest::Client, BioMcpError> {
-    reqwest::Client::builder()
+fn gprofiler_http_client(
+    timeout: Duration,
+) -> Result<reqwest_middleware::ClientWithMiddleware, BioMcpError> {
+    let client = reqwest::Client::builder()
         .timeout(timeout)
         .connect_timeout(GPROFILER_CONNECT_TIMEOUT)
         .user_agent(concat!("biomcp-cli/", env!("CARGO_PKG_VERSION")))
         .build()
-        .map_err(BioMcpError::HttpClientInit)
+        .map_err(BioMcpError::HttpClientInit)?;
+    Ok(crate::sources::with_cassette(reqwest_middleware::ClientBuilder::new(client))?.build())
 }
 
 fn remap_gprofiler_error(err: BioMcpError) -> BioMcpError {
@@ -124,6 +124,11 @@ fn remap_gprofiler_error(err: BioMcpError) -> BioMcpError {
                 "The upstream is temporarily unavailable or too slow to respond.".to_string(),
             )
         }
+        BioMcpError::HttpMiddleware(source) if source.is_timeout() || source.is_connect() => {
+            gprofiler_source_unavailable(
+                "The upstream is temporarily unavailable or too slow to respond.".to_string(),
+            )
+        }
         BioMcpError::Api { api, message } if api == GPROFILER_API => {
             if let Some(status) = transient_status_from_api_message(&message) {
                 return gprofiler_source_unavailable(format!(
@@ -50,7 +50,9 @@ impl GtexClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, GTEX_API))
+            .send()
+            .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, GTEX_API).await?;
@@ -64,10 +66,7 @@ impl GtexClient {
         }
 
         crate::sources::ensure_json_content_type(GTEX_API, content_type.as_ref(), &bytes)?;
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: GTEX_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(GTEX_API, &bytes)
     }
 
     #[allow(dead_code)]
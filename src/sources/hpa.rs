@@ -42,9 +42,12 @@ impl HpaClient {
     pub async fn protein_data(&self, ensembl_id: &str) -> Result<GeneHpa, BioMcpError> {
         let ensembl_id = normalize_ensembl_id(ensembl_id)?;
         let url = self.endpoint(&format!("{ensembl_id}.xml"));
-        let resp = crate::sources::apply_cache_mode(self.client.get(&url))
-            .send()
-            .await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(
+            self.client.get(&url),
+            HPA_API,
+        ))
+        .send()
+        .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, HPA_API).await?;
@@ -67,7 +70,8 @@ impl HpaClient {
             message: "Response body was not valid UTF-8 XML".to_string(),
         })?;
 
-        tokio::task::spawn_blocking(move || parse_gene_hpa(&xml))
+        let span = crate::profiling::profile_span!("blocking", task = "hpa_parse");
+        tokio::task::spawn_blocking(move || span.in_scope(|| parse_gene_hpa(&xml)))
             .await
             .map_err(|err| BioMcpError::Api {
                 api: HPA_API.to_string(),
@@ -44,7 +44,9 @@ impl HpoClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, HPO_API))
+            .send()
+            .await?;
         let status = resp.status();
         let bytes = crate::sources::read_limited_body(resp, HPO_API).await?;
         if status == reqwest::StatusCode::NOT_FOUND {
@@ -61,10 +63,7 @@ impl HpoClient {
                 message: format!("HTTP {status}: {excerpt}"),
             });
         }
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: HPO_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(HPO_API, &bytes)
     }
 
     pub async fn term(&self, hpo_id: &str) -> Result<HpoTerm, BioMcpError> {
@@ -42,7 +42,9 @@ impl InterProClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, INTERPRO_API))
+            .send()
+            .await?;
         let status = resp.status();
         let bytes = crate::sources::read_limited_body(resp, INTERPRO_API).await?;
         if !status.is_success() {
@@ -52,10 +54,7 @@ impl InterProClient {
                 message: format!("HTTP {status}: {excerpt}"),
             });
         }
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: INTERPRO_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(INTERPRO_API, &bytes)
     }
 
     pub async fn domains(
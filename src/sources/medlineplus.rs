@@ -46,10 +46,13 @@ impl MedlinePlusClient {
             return Ok(Vec::new());
         }
 
-        let resp = crate::sources::apply_cache_mode(self.client.get(self.endpoint("ws/query")))
-            .query(&[("db", "healthTopics"), ("term", query), ("retmax", "3")])
-            .send()
-            .await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(
+            self.client.get(self.endpoint("ws/query")),
+            MEDLINEPLUS_API,
+        ))
+        .query(&[("db", "healthTopics"), ("term", query), ("retmax", "3")])
+        .send()
+        .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, MEDLINEPLUS_API).await?;
@@ -68,7 +71,8 @@ impl MedlinePlusClient {
             message: "Response body was not valid UTF-8 XML".to_string(),
         })?;
 
-        tokio::task::spawn_blocking(move || parse_topics(&xml))
+        let span = crate::profiling::profile_span!("blocking", task = "medlineplus_parse");
+        tokio::task::spawn_blocking(move || span.in_scope(|| parse_topics(&xml)))
             .await
             .map_err(|err| BioMcpError::Api {
                 api: MEDLINEPLUS_API.to_string(),
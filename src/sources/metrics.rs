@@ -0,0 +1,151 @@
+//! Process-wide upstream request metrics for the `serve-http` `/metrics` route.
+//!
+//! `UpstreamMetricsMiddleware` is the innermost layer of the shared client, so every attempt that
+//! actually leaves the process (retries included, cache hits and coalesced duplicates excluded)
+//! is counted by source and status and timed. `RateLimitMiddleware` reports its slot waits here.
+//! Sources are labelled like circuit breakers: the client's `SourceApi` name, else the rate-limit
+//! policy key, else the URL host.
+
+use std::collections::BTreeMap;
+use std::sync::{Mutex, PoisonError};
+use std::time::{Duration, Instant};
+
+use http::Extensions;
+use reqwest_middleware::{Middleware, Next};
+
+/// Histogram bucket upper bounds, in seconds.
+pub(crate) const LATENCY_BUCKETS: [f64; 12] = [
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+];
+
+/// Cumulative latency histogram over `LATENCY_BUCKETS`.
+#[derive(Debug, Clone, Default, PartialEq)]
+pub(crate) struct Histogram {
+    /// Observations at or below each bucket bound (cumulative, as Prometheus expects).
+    pub buckets: [u64; LATENCY_BUCKETS.len()],
+    pub count: u64,
+    pub sum_secs: f64,
+}
+
+impl Histogram {
+    pub(crate) fn observe(&mut self, elapsed: Duration) {
+        let secs = elapsed.as_secs_f64();
+        for (bucket, bound) in self.buckets.iter_mut().zip(LATENCY_BUCKETS) {
+            if secs <= bound {
+                *bucket += 1;
+            }
+        }
+        self.count += 1;
+        self.sum_secs += secs;
+    }
+}
+
+#[derive(Debug, Default)]
+struct Registry {
+    // (source, status) -> count; status is the HTTP code or "error" for transport failures.
+    requests: BTreeMap<(String, String), u64>,
+    latency: BTreeMap<String, Histogram>,
+    rate_limit_wait: BTreeMap<String, Histogram>,
+}
+
+static REGISTRY: Mutex<Registry> = Mutex::new(Registry {
+    requests: BTreeMap::new(),
+    latency: BTreeMap::new(),
+    rate_limit_wait: BTreeMap::new(),
+});
+
+fn registry() -> std::sync::MutexGuard<'static, Registry> {
+    REGISTRY.lock().unwrap_or_else(PoisonError::into_inner)
+}
+
+/// Point-in-time copy of the upstream metrics, sorted by source.
+#[derive(Debug, Clone, Default)]
+pub(crate) struct UpstreamMetricsSnapshot {
+    pub requests: Vec<(String, String, u64)>,
+    pub latency: Vec<(String, Histogram)>,
+    pub rate_limit_wait: Vec<(String, Histogram)>,
+}
+
+pub(crate) fn snapshot() -> UpstreamMetricsSnapshot {
+    let registry = registry();
+    UpstreamMetricsSnapshot {
+        requests: registry
+            .requests
+            .iter()
+            .map(|((source, status), count)| (source.clone(), status.clone(), *count))
+            .collect(),
+        latency: registry
+            .latency
+            .iter()
+            .map(|(source, histogram)| (source.clone(), histogram.clone()))
+            .collect(),
+        rate_limit_wait: registry
+            .rate_limit_wait
+            .iter()
+            .map(|(source, histogram)| (source.clone(), histogram.clone()))
+            .collect(),
+    }
+}
+
+/// Records how long a request waited for its rate-limit slot.
+pub(crate) fn record_rate_limit_wait(source: &str, wait: Duration) {
+    registry()
+        .rate_limit_wait
+        .entry(source.to_string())
+        .or_default()
+        .observe(wait);
+}
+
+fn record_request(source: String, status: String, elapsed: Duration) {
+    let mut registry = registry();
+    registry
+        .latency
+        .entry(source.clone())
+        .or_default()
+        .observe(elapsed);
+    *registry.requests.entry((source, status)).or_default() += 1;
+}
+
+#[derive(Debug, Default, Clone, Copy)]
+pub(crate) struct UpstreamMetricsMiddleware;
+
+#[async_trait::async_trait]
+impl Middleware for UpstreamMetricsMiddleware {
+    async fn handle(
+        &self,
+        req: reqwest::Request,
+        extensions: &mut Extensions,
+        next: Next<'_>,
+    ) -> reqwest_middleware::Result<reqwest::Response> {
+        let source = super::rate_limit::source_label(req.url(), extensions);
+        let started = Instant::now();
+        let attempt_span = crate::profiling::profile_span!("http");
+        let result = next.run(req, extensions).await;
+        drop(attempt_span);
+        let status = match &result {
+            Ok(response) => response.status().as_u16().to_string(),
+            Err(_) => "error".to_string(),
+        };
+        record_request(source, status, started.elapsed());
+        result
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn histogram_buckets_are_cumulative() {
+        let mut histogram = Histogram::default();
+        histogram.observe(Duration::from_millis(3));
+        histogram.observe(Duration::from_millis(200));
+        histogram.observe(Duration::from_secs(60));
+
+        assert_eq!(histogram.buckets[0], 1);
+        assert_eq!(histogram.buckets[5], 2);
+        assert_eq!(histogram.buckets[LATENCY_BUCKETS.len() - 1], 2);
+        assert_eq!(histogram.count, 3);
+        assert!((histogram.sum_secs - 60.203).abs() < 1e-9);
+    }
+}
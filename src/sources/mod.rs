@@ -4,26 +4,34 @@ use std::borrow::Cow;
 use std::future::Future;
 use std::path::Path;
 use std::sync::OnceLock;
-use std::time::Duration;
+use std::time::{Duration, SystemTime};
 
 use http::Extensions;
 use http_cache_reqwest::{Cache, CacheMode, CacheOptions, HttpCache, HttpCacheOptions};
 use reqwest::StatusCode;
 use reqwest::header::{CACHE_CONTROL, HeaderMap, HeaderValue, RETRY_AFTER};
 use reqwest_middleware::{ClientBuilder, ClientWithMiddleware, Middleware, Next, RequestBuilder};
-use reqwest_retry::{RetryTransientMiddleware, policies::ExponentialBackoff};
+use reqwest_retry::{
+    RetryDecision, RetryPolicy, RetryTransientMiddleware, policies::ExponentialBackoff,
+};
+use serde::de::DeserializeOwned;
 use tracing::warn;
 
 use crate::error::BioMcpError;
 
 pub(crate) mod alphagenome;
+pub(crate) mod cache_key;
+pub(crate) mod cache_policy;
+pub(crate) mod cassette;
 pub(crate) mod cbioportal;
 pub(crate) mod cbioportal_download;
 pub(crate) mod cbioportal_study;
 pub(crate) mod chembl;
+pub(crate) mod circuit_breaker;
 pub(crate) mod civic;
 pub(crate) mod clingen;
 pub(crate) mod clinicaltrials;
+pub(crate) mod coalesce;
 pub(crate) mod complexportal;
 pub(crate) mod cpic;
 pub(crate) mod dgidb;
@@ -40,6 +48,7 @@ pub(crate) mod hpo;
 pub(crate) mod interpro;
 pub(crate) mod kegg;
 pub(crate) mod medlineplus;
+pub(crate) mod metrics;
 pub(crate) mod monarch;
 pub(crate) mod mychem;
 pub(crate) mod mydisease;
@@ -47,6 +56,7 @@ pub(crate) mod mygene;
 pub(crate) mod myvariant;
 pub(crate) mod ncbi_idconv;
 pub(crate) mod nci_cts;
+pub(crate) mod negative_cache;
 pub(crate) mod ols4;
 pub(crate) mod oncokb;
 pub(crate) mod openfda;
@@ -62,9 +72,12 @@ pub(crate) mod semantic_scholar;
 pub(crate) mod string;
 pub(crate) mod umls;
 pub(crate) mod uniprot;
+pub(crate) mod upstream_span;
 pub(crate) mod wikipathways;
 
 const ERROR_BODY_MAX_BYTES: usize = 2048;
+// Shortest remaining budget worth starting another upstream attempt with.
+const MIN_ATTEMPT_BUDGET: Duration = Duration::from_millis(500);
 pub(crate) const DEFAULT_MAX_BODY_BYTES: usize = 8 * 1024 * 1024;
 pub(crate) const BIOTHINGS_MAX_RESULT_WINDOW: usize = 10_000;
 
@@ -74,12 +87,15 @@ static STREAMING_HTTP_CLIENT: OnceLock<reqwest::Client> = OnceLock::new();
 
 tokio::task_local! {
     static NO_CACHE: bool;
+    static DEADLINE: tokio::time::Instant;
 }
 
 fn parse_cache_mode(value: Option<&str>) -> Option<CacheMode> {
     match value {
         Some("infinite") => Some(CacheMode::ForceCache),
         Some("off") => Some(CacheMode::NoStore),
+        // Stale-while-revalidate keeps default per-request semantics behind its own layer.
+        Some("swr") | Some("stale-while-revalidate") => None,
         Some("default") | Some("") | None => None,
         Some(other) => {
             warn!("Unknown BIOMCP_CACHE_MODE={other:?}, using default");
@@ -98,6 +114,20 @@ fn env_cache_mode() -> Option<CacheMode> {
     })
 }
 
+fn is_stale_while_revalidate_mode(value: Option<&str>) -> bool {
+    matches!(value, Some("swr") | Some("stale-while-revalidate"))
+}
+
+fn env_stale_while_revalidate() -> bool {
+    static ENABLED: OnceLock<bool> = OnceLock::new();
+    *ENABLED.get_or_init(|| {
+        let mode = std::env::var("BIOMCP_CACHE_MODE")
+            .ok()
+            .map(|s| s.trim().to_ascii_lowercase());
+        is_stale_while_revalidate_mode(mode.as_deref())
+    })
+}
+
 fn resolve_cache_mode(
     no_cache: bool,
     authenticated: bool,
@@ -120,6 +150,60 @@ pub(crate) fn is_no_cache_enabled() -> bool {
     matches!(NO_CACHE.try_with(|v| *v), Ok(true))
 }
 
+/// Returned when the request deadline cannot cover another upstream attempt.
+#[derive(Debug, thiserror::Error)]
+#[error("request deadline reached; not starting another upstream attempt")]
+pub(crate) struct DeadlineExceeded;
+
+/// Runs `fut` with a deadline `timeout` from now, visible to the retry, rate-limit and paging
+/// loops underneath. A nested scope never extends an outer deadline.
+pub(crate) async fn with_deadline<R, F>(timeout: Duration, fut: F) -> R
+where
+    F: Future<Output = R>,
+{
+    let deadline = tokio::time::Instant::now() + timeout;
+    let deadline = DEADLINE
+        .try_with(|outer| (*outer).min(deadline))
+        .unwrap_or(deadline);
+    DEADLINE.scope(deadline, fut).await
+}
+
+/// How long the current task may still wait before its next attempt, or `None` without a
+/// deadline. One attempt's worth of budget (`MIN_ATTEMPT_BUDGET`) is held back.
+pub(crate) fn deadline_wait_budget() -> Option<Duration> {
+    DEADLINE
+        .try_with(|deadline| {
+            deadline
+                .saturating_duration_since(tokio::time::Instant::now())
+                .saturating_sub(MIN_ATTEMPT_BUDGET)
+        })
+        .ok()
+}
+
+/// Whether the current deadline, if any, leaves room to wait `wait` and then make an attempt.
+pub(crate) fn deadline_allows(wait: Duration) -> bool {
+    deadline_wait_budget().is_none_or(|budget| wait <= budget)
+}
+
+/// Whether another attempt (such as the next page of a paged search) can still finish in time.
+pub(crate) fn deadline_allows_attempt() -> bool {
+    DEADLINE
+        .try_with(|deadline| {
+            deadline.saturating_duration_since(tokio::time::Instant::now()) >= MIN_ATTEMPT_BUDGET
+        })
+        .unwrap_or(true)
+}
+
+/// The upstream service a request belongs to, set by each client from its `*_API` name. Several
+/// services share a host (Europe PMC, ChEMBL, GWAS and others all live on www.ebi.ac.uk), so
+/// circuit breakers and metrics key on this rather than on the URL.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub(crate) struct SourceApi(pub(crate) &'static str);
+
+pub(crate) fn tag_source(req: RequestBuilder, api: &'static str) -> RequestBuilder {
+    req.with_extension(SourceApi(api))
+}
+
 pub(crate) fn apply_cache_mode(req: RequestBuilder) -> RequestBuilder {
     let no_cache = is_no_cache_enabled();
     if let Some(mode) = resolve_cache_mode(no_cache, false, env_cache_mode()) {
@@ -176,7 +260,7 @@ pub(crate) fn append_ncbi_api_key(req: RequestBuilder, api_key: Option<&str>) ->
     req
 }
 
-fn parse_retry_after_header(headers: &HeaderMap) -> Option<Duration> {
+pub(crate) fn parse_retry_after_header(headers: &HeaderMap) -> Option<Duration> {
     // Retry-After is interpreted as integer seconds when present.
     headers
         .get(RETRY_AFTER)?
@@ -197,14 +281,45 @@ fn retry_sleep_duration(attempt: u32, retry_after_floor: Option<Duration>) -> Du
     }
 }
 
+/// Middleware retry policy that drops retries whose backoff would outlast the request deadline.
+struct DeadlineRetryPolicy<P>(P);
+
+impl<P: RetryPolicy> RetryPolicy for DeadlineRetryPolicy<P> {
+    fn should_retry(&self, request_start_time: SystemTime, n_past_retries: u32) -> RetryDecision {
+        match self.0.should_retry(request_start_time, n_past_retries) {
+            RetryDecision::Retry { execute_after } => {
+                let wait = execute_after
+                    .duration_since(SystemTime::now())
+                    .unwrap_or_default();
+                if deadline_allows(wait) {
+                    RetryDecision::Retry { execute_after }
+                } else {
+                    RetryDecision::DoNotRetry
+                }
+            }
+            RetryDecision::DoNotRetry => RetryDecision::DoNotRetry,
+        }
+    }
+}
+
 /// Returns a shared HTTP client with retry and caching middleware.
 ///
-/// - Retry: 3 attempts with exponential backoff for transient errors
+/// - Retry: 3 attempts with exponential backoff for transient errors, skipped once the
+///   `with_deadline` budget cannot cover another attempt
 /// - Retry log level: `DEBUG` — retry attempts are suppressed at the default `WARN` verbosity and
 ///   visible with `RUST_LOG=debug`
 /// - Cache: Disk-based HTTP cache under the resolved canonical cache root
 ///   (`BIOMCP_CACHE_DIR`, `cache.toml`, or XDG default)
 /// - Cache TTL: `Cache-Control: max-stale=86400` makes “no caching headers” responses usable for 24h
+/// - Per-source TTL and max-stale: `[cache.sources.<key>]` tables in `cache.toml`
+/// - Negative caching: not-found and declared empty answers are cached briefly (default 5 min)
+/// - Stale-while-revalidate (`BIOMCP_CACHE_MODE=swr`): stale entries within the per-source
+///   ceiling are answered at once and refreshed in the background
+/// - Coalescing: identical concurrent cache misses share one upstream fetch
+/// - Circuit breaker: a source that keeps failing is rejected fast with `SourceUnavailable`
+///   and probed again after a cooldown
+/// - Cassette (`BIOMCP_CASSETTE=record:<path>` or `replay:<path>`): every exchange is recorded
+///   to, or answered from, a cassette file
 #[derive(Clone, Copy)]
 enum SharedHttpClientKind {
     Default,
@@ -277,16 +392,58 @@ fn build_http_client(kind: SharedHttpClientKind) -> Result<ClientWithMiddleware,
             shared: true,
             ..CacheOptions::default()
         }),
+        // Keys come from `CacheKeyMiddleware`, so equivalent requests share one entry.
+        cache_key: Some(std::sync::Arc::new(cache_key::http_cache_key)),
         ..HttpCacheOptions::default()
     };
 
-    let builder = ClientBuilder::new(base_client).with(Cache(HttpCache {
-        mode: CacheMode::Default,
-        manager: crate::cache::SizeAwareCacheManager::new(cache_path, config),
-        options: cache_options,
-    }));
+    let manager = crate::cache::SizeAwareCacheManager::new(cache_path, config);
+    let source_policies = std::sync::Arc::new(cache_policy::SourceCachePolicies::from_config());
+    // The profiling span wraps the whole request, cache lookup and retries included.
+    let builder = ClientBuilder::new(base_client)
+        .with(cache_key::CacheKeyMiddleware)
+        .with(upstream_span::UpstreamSpanMiddleware);
+    // Above the cache, so recordings include cache hits and replay never touches the cache.
+    let builder = with_cassette(builder)?;
+    let builder = if env_stale_while_revalidate() {
+        let refresh_client: fn() -> Result<ClientWithMiddleware, BioMcpError> = match kind {
+            SharedHttpClientKind::Default => shared_client,
+            SharedHttpClientKind::SemanticScholarSharedPool => semantic_scholar_shared_pool_client,
+        };
+        builder.with(cache_policy::StaleWhileRevalidateMiddleware::new(
+            manager.clone(),
+            source_policies.clone(),
+            refresh_client,
+        ))
+    } else {
+        builder
+    };
+    // Per-source `[cache.sources.*]` max-stale applies to lookups, TTL to stored responses.
+    // Negative answers are stamped after the TTL layer so their short lifetime wins.
+    let builder = builder
+        .with(cache_policy::SourceMaxStaleMiddleware::new(
+            manager.clone(),
+            source_policies.clone(),
+        ))
+        .with(Cache(HttpCache {
+            mode: CacheMode::Default,
+            manager,
+            options: cache_options,
+        }))
+        .with(negative_cache::NegativeCacheMiddleware::new(
+            source_policies.clone(),
+        ))
+        .with(cache_policy::SourceTtlMiddleware::new(source_policies));
+    // Concurrent cache misses for the same request share one upstream fetch (and one retry and
+    // rate-limit budget) instead of each going upstream.
+    let builder = builder
+        .with(coalesce::CoalescingMiddleware::new())
+        .with(cache_key::StripCacheKeyMiddleware);
+    // Outside the retry layer, so a source that keeps failing is skipped without spending
+    // retries and timeouts on every request.
+    let builder = builder.with(circuit_breaker::CircuitBreakerMiddleware::new());
     let builder = builder.with(
-        RetryTransientMiddleware::new_with_policy(retry_policy)
+        RetryTransientMiddleware::new_with_policy(DeadlineRetryPolicy(retry_policy))
             .with_retry_log_level(tracing::Level::DEBUG),
     );
     let builder = match kind {
@@ -295,7 +452,11 @@ fn build_http_client(kind: SharedHttpClientKind) -> Result<ClientWithMiddleware,
             builder.with(SemanticScholarSharedPoolRateLimitMiddleware)
         }
     };
-    Ok(builder.with(rate_limit::RateLimitMiddleware::new()).build())
+    // Innermost, so only attempts that actually go upstream are counted and timed.
+    Ok(builder
+        .with(rate_limit::RateLimitMiddleware::new())
+        .with(metrics::UpstreamMetricsMiddleware)
+        .build())
 }
 
 pub(crate) fn shared_client() -> Result<ClientWithMiddleware, BioMcpError> {
@@ -377,26 +538,50 @@ pub(crate) fn streaming_http_client() -> Result<reqwest::Client, BioMcpError> {
     }
 }
 
+/// Adds the active `BIOMCP_CASSETTE`, if any, to `builder`. Clients built outside the shared
+/// chain go through this so replay never reaches the network.
+pub(crate) fn with_cassette(builder: ClientBuilder) -> Result<ClientBuilder, BioMcpError> {
+    Ok(match cassette::active()? {
+        Some(cassette) => builder.with(cassette::CassetteMiddleware::new(cassette)),
+        None => builder,
+    })
+}
+
 /// Retry wrapper for streaming requests that bypass middleware.
 ///
 /// `build_request` is invoked on each attempt so non-cloneable request bodies
-/// can be reconstructed safely.
-pub(crate) async fn retry_send<F, Fut>(
+/// can be reconstructed safely. An active `BIOMCP_CASSETTE` records the final response, or
+/// answers from the cassette without sending anything.
+pub(crate) async fn retry_send<F>(
     api: &str,
     max_retries: u32,
     build_request: F,
 ) -> Result<reqwest::Response, BioMcpError>
 where
-    F: Fn() -> Fut,
-    Fut: Future<Output = Result<reqwest::Response, reqwest::Error>>,
+    F: Fn() -> reqwest::RequestBuilder,
 {
+    let cassette = cassette::active()?;
+    if let Some(cassette) = cassette.as_deref()
+        && cassette.mode() == cassette::CassetteMode::Replay
+    {
+        let key = cache_key::exchange_key(&build_request().build()?);
+        return cassette
+            .replay_response(&key)
+            .map_err(|miss| BioMcpError::Api {
+                api: api.to_string(),
+                message: miss.to_string(),
+            });
+    }
+
     let total_attempts = max_retries.saturating_add(1);
+    let mut attempts_made = 0;
     let mut last_http_err: Option<reqwest::Error> = None;
     let mut last_server_status: Option<reqwest::StatusCode> = None;
 
     for attempt in 0..total_attempts {
+        attempts_made = attempt + 1;
         let mut retry_after_floor = None;
-        match build_request().await {
+        match send_streaming(build_request()).await {
             Ok(resp)
                 if resp.status().is_server_error()
                     || resp.status() == reqwest::StatusCode::TOO_MANY_REQUESTS =>
@@ -407,7 +592,13 @@ where
                 }
                 last_server_status = Some(status);
             }
-            Ok(resp) => return Ok(resp),
+            Ok(resp) => {
+                let Some(cassette) = cassette.as_deref() else {
+                    return Ok(resp);
+                };
+                let key = cache_key::exchange_key(&build_request().build()?);
+                return Ok(cassette.record_response(key, resp).await?);
+            }
             Err(err) => {
                 if err.is_timeout() || err.is_connect() {
                     last_http_err = Some(err);
@@ -418,14 +609,18 @@ where
         }
 
         if attempt + 1 < total_attempts {
-            tokio::time::sleep(retry_sleep_duration(attempt, retry_after_floor)).await;
+            let delay = retry_sleep_duration(attempt, retry_after_floor);
+            if !deadline_allows(delay) {
+                break;
+            }
+            tokio::time::sleep(delay).await;
         }
     }
 
     if let Some(status) = last_server_status {
         return Err(BioMcpError::Api {
             api: api.to_string(),
-            message: format!("HTTP {status} after {total_attempts} attempts"),
+            message: format!("HTTP {status} after {attempts_made} attempts"),
         });
     }
 
@@ -435,10 +630,18 @@ where
 
     Err(BioMcpError::Api {
         api: api.to_string(),
-        message: format!("All retry attempts exhausted after {total_attempts} attempts"),
+        message: format!("All retry attempts exhausted after {attempts_made} attempts"),
     })
 }
 
+/// Sends a streaming request without the exchange key `cache_key::key_multipart_form` attached.
+async fn send_streaming(req: reqwest::RequestBuilder) -> reqwest::Result<reqwest::Response> {
+    let (client, req) = req.build_split();
+    let mut req = req?;
+    req.headers_mut().remove(cache_key::CACHE_KEY_HEADER);
+    client.execute(req).await
+}
+
 pub(crate) fn body_excerpt(bytes: &[u8]) -> String {
     let full = String::from_utf8_lossy(bytes);
 
@@ -513,6 +716,15 @@ pub(crate) fn ensure_json_content_type(
     Ok(())
 }
 
+/// Decodes a JSON response body; timed as the `deserialize` profiling phase.
+pub(crate) fn decode_json<T: DeserializeOwned>(api: &str, bytes: &[u8]) -> Result<T, BioMcpError> {
+    let _span = crate::profiling::profile_span!("deserialize", api);
+    serde_json::from_slice(bytes).map_err(|source| BioMcpError::ApiJson {
+        api: api.to_string(),
+        source,
+    })
+}
+
 pub(crate) fn validate_biothings_result_window(
     context: &str,
     limit: usize,
@@ -551,6 +763,7 @@ pub(crate) async fn read_limited_body_with_limit(
         body.extend_from_slice(&chunk);
     }
 
+    upstream_span::record_body_bytes(&resp, body.len());
     Ok(body)
 }
 
@@ -664,6 +877,17 @@ mod tests {
         assert!(parse_cache_mode(Some("bogus")).is_none());
     }
 
+    #[test]
+    fn stale_while_revalidate_mode_uses_default_cache_mode() {
+        assert!(parse_cache_mode(Some("swr")).is_none());
+        assert!(is_stale_while_revalidate_mode(Some("swr")));
+        assert!(is_stale_while_revalidate_mode(Some(
+            "stale-while-revalidate"
+        )));
+        assert!(!is_stale_while_revalidate_mode(Some("infinite")));
+        assert!(!is_stale_while_revalidate_mode(None));
+    }
+
     #[test]
     fn resolve_cache_mode_prioritizes_no_cache_over_env() {
         assert!(matches!(
@@ -794,23 +1018,9 @@ mod tests {
         let client = reqwest::Client::new();
         let url = format!("{}/retry", server.uri());
         let attempts = Arc::new(AtomicUsize::new(0));
-        let resp = retry_send("test-api", 2, {
-            let client = client.clone();
-            let url = url.clone();
-            let attempts = attempts.clone();
-            move || {
-                let client = client.clone();
-                let url = url.clone();
-                let attempts = attempts.clone();
-                async move {
-                    let attempt = attempts.fetch_add(1, Ordering::SeqCst);
-                    client
-                        .get(&url)
-                        .query(&[("attempt", attempt.to_string())])
-                        .send()
-                        .await
-                }
-            }
+        let resp = retry_send("test-api", 2, || {
+            let attempt = attempts.fetch_add(1, Ordering::SeqCst);
+            client.get(&url).query(&[("attempt", attempt.to_string())])
         })
         .await
         .expect("retry_send should retry on 429");
@@ -819,6 +1029,44 @@ mod tests {
         assert_eq!(attempts.load(Ordering::SeqCst), 2);
     }
 
+    #[tokio::test]
+    async fn retry_send_stops_when_backoff_outlasts_deadline() {
+        let server = MockServer::start().await;
+        Mock::given(method("GET"))
+            .and(path("/slow-retry"))
+            .respond_with(ResponseTemplate::new(429).insert_header("retry-after", "5"))
+            .expect(1)
+            .mount(&server)
+            .await;
+
+        let client = reqwest::Client::new();
+        let url = format!("{}/slow-retry", server.uri());
+        let started = std::time::Instant::now();
+        let err = with_deadline(
+            Duration::from_secs(2),
+            retry_send("test-api", 3, || client.get(&url)),
+        )
+        .await
+        .expect_err("429 without budget for the Retry-After wait should fail");
+
+        assert!(err.to_string().contains("after 1 attempts"), "{err}");
+        assert!(started.elapsed() < Duration::from_secs(2));
+    }
+
+    #[tokio::test]
+    async fn nested_deadline_never_extends_outer_budget() {
+        with_deadline(Duration::from_secs(1), async {
+            assert!(deadline_allows(Duration::from_millis(100)));
+            with_deadline(Duration::from_secs(60), async {
+                assert!(!deadline_allows(Duration::from_secs(5)));
+                assert!(deadline_allows_attempt());
+            })
+            .await;
+        })
+        .await;
+        assert!(deadline_allows(Duration::from_secs(3600)));
+    }
+
     #[test]
     fn http_cache_dir_default_root_uses_xdg_cache_home_biomcp_http() {
         let _lock = env_lock();
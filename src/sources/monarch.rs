@@ -44,7 +44,9 @@ impl MonarchClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, MONARCH_API))
+            .send()
+            .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, MONARCH_API).await?;
@@ -59,10 +61,7 @@ impl MonarchClient {
 
         crate::sources::ensure_json_content_type(MONARCH_API, content_type.as_ref(), &bytes)?;
 
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: MONARCH_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(MONARCH_API, &bytes)
     }
 
     pub async fn disease_gene_associations(
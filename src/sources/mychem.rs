@@ -82,7 +82,9 @@ impl MyChemClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, MYCHEM_API))
+            .send()
+            .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, MYCHEM_API).await?;
@@ -94,10 +96,7 @@ impl MyChemClient {
             });
         }
         crate::sources::ensure_json_content_type(MYCHEM_API, content_type.as_ref(), &bytes)?;
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: MYCHEM_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(MYCHEM_API, &bytes)
     }
 
     pub async fn query_with_fields(
@@ -66,7 +66,9 @@ impl MyDiseaseClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, MYDISEASE_API))
+            .send()
+            .await?;
         let status = resp.status();
         let bytes = crate::sources::read_limited_body(resp, MYDISEASE_API).await?;
         if !status.is_success() {
@@ -76,10 +78,7 @@ impl MyDiseaseClient {
                 message: format!("HTTP {status}: {excerpt}"),
             });
         }
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: MYDISEASE_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(MYDISEASE_API, &bytes)
     }
 
     #[allow(clippy::too_many_arguments)]
@@ -214,10 +213,11 @@ impl MyDiseaseClient {
         }
 
         let url = self.endpoint(&format!("disease/{id}"));
-        let resp = self
+        let req = self
             .client
             .get(&url)
-            .query(&[("fields", MYDISEASE_GET_FIELDS)])
+            .query(&[("fields", MYDISEASE_GET_FIELDS)]);
+        let resp = crate::sources::tag_source(req, MYDISEASE_API)
             .send()
             .await?;
 
@@ -239,10 +239,7 @@ impl MyDiseaseClient {
             });
         }
 
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: MYDISEASE_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(MYDISEASE_API, &bytes)
     }
 }
 
@@ -67,7 +67,9 @@ impl MyGeneClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, MYGENE_API))
+            .send()
+            .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, MYGENE_API).await?;
@@ -79,10 +81,7 @@ impl MyGeneClient {
             });
         }
         crate::sources::ensure_json_content_type(MYGENE_API, content_type.as_ref(), &bytes)?;
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: MYGENE_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(MYGENE_API, &bytes)
     }
 
     /// Search genes by query
@@ -147,13 +146,19 @@ impl MyGeneClient {
         };
 
         let q = format!("symbol:\"{}\"", Self::escape_query_value(symbol));
+        let req = self.client.get(&query_url).query(&[
+            ("q", q.as_str()),
+            ("species", "human"),
+            ("fields", fields),
+            ("size", "1"),
+        ]);
+        // MyGene matches symbols case-insensitively, so `braf` and `BRAF` share a cache entry.
+        let req = crate::sources::cache_key::fold_case_params(req, &["q"]);
+        // An exact-symbol miss is a stable answer; cache it briefly so retried typos stay local.
         let query_resp: MyGeneGetQueryResponse = self
-            .get_json(self.client.get(&query_url).query(&[
-                ("q", q.as_str()),
-                ("species", "human"),
-                ("fields", fields),
-                ("size", "1"),
-            ]))
+            .get_json(crate::sources::negative_cache::cache_empty_result_at(
+                req, "/hits",
+            ))
             .await?;
 
         query_resp
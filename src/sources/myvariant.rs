@@ -303,7 +303,9 @@ impl MyVariantClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, MYVARIANT_API))
+            .send()
+            .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, MYVARIANT_API).await?;
@@ -315,10 +317,7 @@ impl MyVariantClient {
             });
         }
         crate::sources::ensure_json_content_type(MYVARIANT_API, content_type.as_ref(), &bytes)?;
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: MYVARIANT_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(MYVARIANT_API, &bytes)
     }
 
     pub async fn query_with_fields(
@@ -46,9 +46,12 @@ impl NcbiIdConverterClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode_with_auth(req, self.api_key.is_some())
-            .send()
-            .await?;
+        let resp = crate::sources::apply_cache_mode_with_auth(
+            crate::sources::tag_source(req, NCBI_IDCONV_API),
+            self.api_key.is_some(),
+        )
+        .send()
+        .await?;
         let status = resp.status();
         let bytes = crate::sources::read_limited_body(resp, NCBI_IDCONV_API).await?;
         if !status.is_success() {
@@ -58,10 +61,7 @@ impl NcbiIdConverterClient {
                 message: format!("HTTP {status}: {excerpt}"),
             });
         }
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: NCBI_IDCONV_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(NCBI_IDCONV_API, &bytes)
     }
 
     async fn lookup(&self, idtype: &str, id: &str) -> Result<NcbiIdConvResponse, BioMcpError> {
@@ -92,9 +92,12 @@ impl NciCtsClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode_with_auth(req, true)
-            .send()
-            .await?;
+        let resp = crate::sources::apply_cache_mode_with_auth(
+            crate::sources::tag_source(req, NCI_CTS_API),
+            true,
+        )
+        .send()
+        .await?;
         let status = resp.status();
         let bytes = crate::sources::read_limited_body(resp, NCI_CTS_API).await?;
         if !status.is_success() {
@@ -104,10 +107,7 @@ impl NciCtsClient {
                 message: format!("HTTP {status}: {excerpt}"),
             });
         }
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: NCI_CTS_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(NCI_CTS_API, &bytes)
     }
 
     pub async fn search(&self, params: &NciSearchParams) -> Result<NciSearchResponse, BioMcpError> {
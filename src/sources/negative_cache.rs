@@ -0,0 +1,194 @@
+//! Short-lived caching of not-found and empty-result upstream answers.
+//!
+//! `NegativeCacheMiddleware` sits just inside the HTTP cache layer. It gives `404`/`410` GET
+//! responses, and `200` responses whose declared hit list is empty, a short `max-age` so the
+//! cache layer stores them, and tags them with `x-biomcp-negative` so a negative entry is never
+//! mistaken for positive data. The max-stale and stale-while-revalidate layers read that marker
+//! so a negative entry is never served past its TTL. `--no-cache` requests skip the cache layer
+//! and never see them.
+
+use std::sync::Arc;
+
+use http::Extensions;
+use http_cache::HttpResponse;
+use reqwest::header::{CACHE_CONTROL, CONTENT_LENGTH, EXPIRES, HeaderName, HeaderValue, PRAGMA};
+use reqwest::{Method, StatusCode};
+use reqwest_middleware::{Middleware, Next, RequestBuilder};
+
+use super::cache_policy::SourceCachePolicies;
+
+const NEGATIVE_MARKER_HEADER: HeaderName = HeaderName::from_static("x-biomcp-negative");
+const DEFAULT_NEGATIVE_TTL_SECS: u64 = 300;
+// Empty answers are tiny; larger bodies are passed through without inspection.
+const MAX_INSPECTED_BODY_BYTES: u64 = 64 * 1024;
+
+/// Request extension declaring where a source's JSON answer keeps its hit list.
+///
+/// A successful response whose value at `pointer` (an RFC 6901 JSON pointer) is an empty array
+/// or a zero count is cached as a negative answer; a missing value is not. Only endpoints whose
+/// empty answer really means "no such entity" should declare this.
+#[derive(Debug, Clone, Copy)]
+pub(crate) struct EmptyResultAt(pub(crate) &'static str);
+
+/// Marks `req` so an empty hit list at `pointer` is cached as a negative answer.
+pub(crate) fn cache_empty_result_at(req: RequestBuilder, pointer: &'static str) -> RequestBuilder {
+    req.with_extension(EmptyResultAt(pointer))
+}
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum NegativeKind {
+    NotFound,
+    Empty,
+}
+
+impl NegativeKind {
+    fn marker(self) -> HeaderValue {
+        match self {
+            Self::NotFound => HeaderValue::from_static("not-found"),
+            Self::Empty => HeaderValue::from_static("empty"),
+        }
+    }
+}
+
+/// Whether a stored cache entry is a negative answer written by this layer.
+pub(crate) fn is_negative_entry(cached: &HttpResponse) -> bool {
+    cached
+        .headers
+        .iter()
+        .any(|(name, _)| name.eq_ignore_ascii_case(NEGATIVE_MARKER_HEADER.as_str()))
+}
+
+fn is_empty_result(body: &[u8], pointer: &str) -> bool {
+    let Ok(value) = serde_json::from_slice::<serde_json::Value>(body) else {
+        return false;
+    };
+    match value.pointer(pointer) {
+        Some(serde_json::Value::Array(items)) => items.is_empty(),
+        Some(serde_json::Value::Number(count)) => count.as_u64() == Some(0),
+        _ => false,
+    }
+}
+
+fn mark_negative(headers: &mut http::HeaderMap, kind: NegativeKind, ttl_secs: u64) {
+    headers.remove(EXPIRES);
+    headers.remove(PRAGMA);
+    if let Ok(value) = HeaderValue::from_str(&format!("max-age={ttl_secs}")) {
+        headers.insert(CACHE_CONTROL, value);
+    }
+    headers.insert(NEGATIVE_MARKER_HEADER, kind.marker());
+}
+
+fn declared_length(response: &reqwest::Response) -> Option<u64> {
+    response
+        .headers()
+        .get(CONTENT_LENGTH)
+        .and_then(|value| value.to_str().ok())
+        .and_then(|value| value.parse().ok())
+}
+
+pub(crate) struct NegativeCacheMiddleware {
+    policies: Arc<SourceCachePolicies>,
+}
+
+impl NegativeCacheMiddleware {
+    pub(crate) fn new(policies: Arc<SourceCachePolicies>) -> Self {
+        Self { policies }
+    }
+}
+
+#[async_trait::async_trait]
+impl Middleware for NegativeCacheMiddleware {
+    async fn handle(
+        &self,
+        req: reqwest::Request,
+        extensions: &mut Extensions,
+        next: Next<'_>,
+    ) -> reqwest_middleware::Result<reqwest::Response> {
+        if *req.method() != Method::GET {
+            return next.run(req, extensions).await;
+        }
+        let ttl_secs = self
+            .policies
+            .for_request_url(req.url())
+            .negative_ttl_secs
+            .unwrap_or(DEFAULT_NEGATIVE_TTL_SECS);
+        if ttl_secs == 0 {
+            return next.run(req, extensions).await;
+        }
+        let empty_at = extensions.get::<EmptyResultAt>().copied();
+
+        let mut response = next.run(req, extensions).await?;
+        let status = response.status();
+        if status == StatusCode::NOT_FOUND || status == StatusCode::GONE {
+            mark_negative(response.headers_mut(), NegativeKind::NotFound, ttl_secs);
+            return Ok(response);
+        }
+        let Some(EmptyResultAt(pointer)) = empty_at else {
+            return Ok(response);
+        };
+        if !status.is_success()
+            || declared_length(&response).is_some_and(|len| len > MAX_INSPECTED_BODY_BYTES)
+        {
+            return Ok(response);
+        }
+
+        let version = response.version();
+        let mut headers = response.headers().clone();
+        let body = response.bytes().await?;
+        if is_empty_result(&body, pointer) {
+            mark_negative(&mut headers, NegativeKind::Empty, ttl_secs);
+        }
+        let mut rebuilt = http::Response::new(body);
+        *rebuilt.status_mut() = status;
+        *rebuilt.version_mut() = version;
+        *rebuilt.headers_mut() = headers;
+        Ok(reqwest::Response::from(rebuilt))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn empty_hit_lists_are_detected_at_declared_pointer() {
+        assert!(is_empty_result(br#"{"total":0,"hits":[]}"#, "/hits"));
+        assert!(is_empty_result(br#"{"PubTator3":[]}"#, "/PubTator3"));
+        assert!(is_empty_result(br#"{"total":0,"hits":[]}"#, "/total"));
+        assert!(!is_empty_result(br#"{"took":3}"#, "/hits"));
+        assert!(!is_empty_result(br#"{"hits":null}"#, "/hits"));
+        assert!(!is_empty_result(
+            br#"{"total":1,"hits":[{"symbol":"BRAF"}]}"#,
+            "/hits"
+        ));
+        assert!(!is_empty_result(br#"[]"#, "/hits"));
+        assert!(!is_empty_result(b"not json", "/hits"));
+    }
+
+    #[test]
+    fn stored_negative_entries_are_recognized_by_marker() {
+        let mut cached = HttpResponse {
+            body: b"{}".to_vec(),
+            headers: std::collections::HashMap::new(),
+            status: 404,
+            url: reqwest::Url::parse("https://mygene.info/v3/gene/0").expect("url"),
+            version: http_cache::HttpVersion::Http11,
+        };
+        assert!(!is_negative_entry(&cached));
+        cached
+            .headers
+            .insert("x-biomcp-negative".into(), "not-found".into());
+        assert!(is_negative_entry(&cached));
+    }
+
+    #[test]
+    fn negative_answers_get_short_ttl_and_marker() {
+        let mut headers = http::HeaderMap::new();
+        headers.insert(CACHE_CONTROL, HeaderValue::from_static("no-cache"));
+        headers.insert(EXPIRES, HeaderValue::from_static("0"));
+        mark_negative(&mut headers, NegativeKind::NotFound, 120);
+        assert_eq!(headers.get(CACHE_CONTROL).unwrap(), "max-age=120");
+        assert_eq!(headers.get("x-biomcp-negative").unwrap(), "not-found");
+        assert!(headers.get(EXPIRES).is_none());
+    }
+}
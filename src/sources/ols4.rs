@@ -44,15 +44,18 @@ impl OlsClient {
             return Ok(Vec::new());
         }
 
-        let resp = crate::sources::apply_cache_mode(self.client.get(self.endpoint("api/search")))
-            .query(&[
-                ("q", query),
-                ("rows", "10"),
-                ("groupField", "iri"),
-                ("ontology", OLS4_ONTOLOGIES),
-            ])
-            .send()
-            .await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(
+            self.client.get(self.endpoint("api/search")),
+            OLS4_API,
+        ))
+        .query(&[
+            ("q", query),
+            ("rows", "10"),
+            ("groupField", "iri"),
+            ("ontology", OLS4_ONTOLOGIES),
+        ])
+        .send()
+        .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, OLS4_API).await?;
@@ -65,11 +68,7 @@ impl OlsClient {
         }
 
         crate::sources::ensure_json_content_type(OLS4_API, content_type.as_ref(), &bytes)?;
-        let response: OlsSearchEnvelope =
-            serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-                api: OLS4_API.to_string(),
-                source,
-            })?;
+        let response: OlsSearchEnvelope = crate::sources::decode_json(OLS4_API, &bytes)?;
         Ok(response.response.docs)
     }
 }
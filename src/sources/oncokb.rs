@@ -70,9 +70,12 @@ impl OncoKBClient {
         req: reqwest_middleware::RequestBuilder,
         authenticated: bool,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode_with_auth(req, authenticated)
-            .send()
-            .await?;
+        let resp = crate::sources::apply_cache_mode_with_auth(
+            crate::sources::tag_source(req, ONCOKB_API),
+            authenticated,
+        )
+        .send()
+        .await?;
         let status = resp.status();
         let bytes = crate::sources::read_limited_body(resp, ONCOKB_API).await?;
         if !status.is_success() {
@@ -82,10 +85,7 @@ impl OncoKBClient {
                 message: format!("HTTP {status}: {excerpt}"),
             });
         }
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: ONCOKB_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(ONCOKB_API, &bytes)
     }
 
     pub async fn annotate_by_protein_change(
@@ -54,9 +54,12 @@ impl OpenFdaClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<Option<T>, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode_with_auth(req, self.api_key.is_some())
-            .send()
-            .await?;
+        let resp = crate::sources::apply_cache_mode_with_auth(
+            crate::sources::tag_source(req, OPENFDA_API),
+            self.api_key.is_some(),
+        )
+        .send()
+        .await?;
         let status = resp.status();
         let bytes = crate::sources::read_limited_body(resp, OPENFDA_API).await?;
 
@@ -156,9 +159,12 @@ impl OpenFdaClient {
             if let Some(key) = self.api_key.as_deref() {
                 req = req.query(&[("api_key", key)]);
             }
-            let resp = crate::sources::apply_cache_mode_with_auth(req, self.api_key.is_some())
-                .send()
-                .await?;
+            let resp = crate::sources::apply_cache_mode_with_auth(
+                crate::sources::tag_source(req, OPENFDA_API),
+                self.api_key.is_some(),
+            )
+            .send()
+            .await?;
             let status = resp.status();
             let bytes = crate::sources::read_limited_body(resp, OPENFDA_API).await?;
 
@@ -173,11 +179,7 @@ impl OpenFdaClient {
                 });
             }
 
-            let value: serde_json::Value =
-                serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-                    api: OPENFDA_API.to_string(),
-                    source,
-                })?;
+            let value: serde_json::Value = crate::sources::decode_json(OPENFDA_API, &bytes)?;
 
             if let Some(error) = value.get("error").and_then(serde_json::Value::as_object) {
                 let code = error
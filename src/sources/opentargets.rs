@@ -49,9 +49,12 @@ impl OpenTargetsClient {
         req: reqwest_middleware::RequestBuilder,
         body: &B,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req.json(body))
-            .send()
-            .await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(
+            req.json(body),
+            OPENTARGETS_API,
+        ))
+        .send()
+        .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, OPENTARGETS_API).await?;
@@ -65,10 +68,7 @@ impl OpenTargetsClient {
         }
 
         crate::sources::ensure_json_content_type(OPENTARGETS_API, content_type.as_ref(), &bytes)?;
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: OPENTARGETS_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(OPENTARGETS_API, &bytes)
     }
 
     pub async fn drug_sections(
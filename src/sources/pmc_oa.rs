@@ -50,9 +50,12 @@ impl PmcOaClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<String, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode_with_auth(req, self.api_key.is_some())
-            .send()
-            .await?;
+        let resp = crate::sources::apply_cache_mode_with_auth(
+            crate::sources::tag_source(req, PMC_OA_API),
+            self.api_key.is_some(),
+        )
+        .send()
+        .await?;
         let status = resp.status();
         let bytes = crate::sources::read_limited_body(resp, PMC_OA_API).await?;
         if !status.is_success() {
@@ -115,9 +118,12 @@ impl PmcOaClient {
             return Ok(None);
         };
 
-        let resp = crate::sources::apply_cache_mode(self.client.get(&tgz_url))
-            .send()
-            .await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(
+            self.client.get(&tgz_url),
+            PMC_OA_API,
+        ))
+        .send()
+        .await?;
         let status = resp.status();
         let bytes =
             crate::sources::read_limited_body_with_limit(resp, PMC_OA_API, MAX_TGZ_BYTES).await?;
@@ -130,7 +136,8 @@ impl PmcOaClient {
         }
 
         let bytes = bytes.to_vec();
-        let xml = tokio::task::spawn_blocking(move || extract_first_nxml(&bytes))
+        let span = crate::profiling::profile_span!("blocking", task = "pmc_oa_extract");
+        let xml = tokio::task::spawn_blocking(move || span.in_scope(|| extract_first_nxml(&bytes)))
             .await
             .map_err(|err| BioMcpError::Api {
                 api: PMC_OA_API.to_string(),
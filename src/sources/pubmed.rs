@@ -118,9 +118,12 @@ impl PubMedClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode_with_auth(req, self.api_key.is_some())
-            .send()
-            .await?;
+        let resp = crate::sources::apply_cache_mode_with_auth(
+            crate::sources::tag_source(req, PUBMED_EUTILS_API),
+            self.api_key.is_some(),
+        )
+        .send()
+        .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, PUBMED_EUTILS_API).await?;
@@ -132,10 +135,7 @@ impl PubMedClient {
             });
         }
         crate::sources::ensure_json_content_type(PUBMED_EUTILS_API, content_type.as_ref(), &bytes)?;
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: PUBMED_EUTILS_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(PUBMED_EUTILS_API, &bytes)
     }
 
     pub async fn esearch(
@@ -8,6 +8,8 @@ use crate::error::BioMcpError;
 const PUBTATOR_BASE: &str = "https://www.ncbi.nlm.nih.gov/research/pubtator3-api";
 const PUBTATOR_API: &str = "pubtator3";
 const PUBTATOR_BASE_ENV: &str = "BIOMCP_PUBTATOR_BASE";
+/// PMIDs per `publications/export/biocjson` request.
+pub const PUBTATOR_EXPORT_MAX_PMIDS: usize = 100;
 
 #[derive(Clone)]
 pub struct PubTatorClient {
@@ -59,9 +61,12 @@ impl PubTatorClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode_with_auth(req, self.api_key.is_some())
-            .send()
-            .await?;
+        let resp = crate::sources::apply_cache_mode_with_auth(
+            crate::sources::tag_source(req, PUBTATOR_API),
+            self.api_key.is_some(),
+        )
+        .send()
+        .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body(resp, PUBTATOR_API).await?;
@@ -73,17 +78,34 @@ impl PubTatorClient {
             });
         }
         crate::sources::ensure_json_content_type(PUBTATOR_API, content_type.as_ref(), &bytes)?;
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: PUBTATOR_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(PUBTATOR_API, &bytes)
     }
 
     pub async fn export_biocjson(&self, pmid: u32) -> Result<PubTatorExportResponse, BioMcpError> {
+        self.export_biocjson_batch(&[pmid]).await
+    }
+
+    /// Exports up to [`PUBTATOR_EXPORT_MAX_PMIDS`] documents in one request. PMIDs PubTator has
+    /// not indexed yet are missing from the response rather than failing it.
+    pub async fn export_biocjson_batch(
+        &self,
+        pmids: &[u32],
+    ) -> Result<PubTatorExportResponse, BioMcpError> {
+        if pmids.is_empty() || pmids.len() > PUBTATOR_EXPORT_MAX_PMIDS {
+            return Err(BioMcpError::InvalidArgument(format!(
+                "PubTator export requires 1-{PUBTATOR_EXPORT_MAX_PMIDS} PMIDs"
+            )));
+        }
         let url = self.endpoint("publications/export/biocjson");
-        let pmids = pmid.to_string();
+        let pmids = pmids
+            .iter()
+            .map(u32::to_string)
+            .collect::<Vec<_>>()
+            .join(",");
         let req = self.client.get(&url).query(&[("pmids", pmids.as_str())]);
         let req = crate::sources::append_ncbi_api_key(req, self.api_key.as_deref());
+        // Not-yet-indexed PMIDs answer with an empty export; keep that only briefly.
+        let req = crate::sources::negative_cache::cache_empty_result_at(req, "/PubTator3");
         self.get_json(req).await
     }
 
@@ -307,6 +329,34 @@ mod tests {
         assert_eq!(resp.documents[0].pmid, Some(22663011));
     }
 
+    #[tokio::test]
+    async fn export_biocjson_batch_joins_pmids_and_enforces_the_request_cap() {
+        let server = MockServer::start().await;
+        Mock::given(method("GET"))
+            .and(path("/publications/export/biocjson"))
+            .and(query_param("pmids", "22663011,24200969"))
+            .respond_with(ResponseTemplate::new(200).set_body_json(serde_json::json!({
+                "PubTator3": [
+                    {"pmid": 22663011, "passages": []},
+                    {"pmid": 24200969, "passages": []}
+                ]
+            })))
+            .expect(1)
+            .mount(&server)
+            .await;
+
+        let client = PubTatorClient::new_for_test(server.uri(), None).unwrap();
+        let resp = client
+            .export_biocjson_batch(&[22663011, 24200969])
+            .await
+            .unwrap();
+        assert_eq!(resp.documents.len(), 2);
+
+        let too_many = vec![1; PUBTATOR_EXPORT_MAX_PMIDS + 1];
+        let err = client.export_biocjson_batch(&too_many).await.unwrap_err();
+        assert!(matches!(err, BioMcpError::InvalidArgument(_)));
+    }
+
     #[tokio::test]
     async fn export_biocjson_surfaces_http_error_context() {
         let server = MockServer::start().await;
@@ -42,7 +42,9 @@ impl QuickGoClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, QUICKGO_API))
+            .send()
+            .await?;
         let status = resp.status();
         let bytes = crate::sources::read_limited_body(resp, QUICKGO_API).await?;
         if !status.is_success() {
@@ -52,10 +54,7 @@ impl QuickGoClient {
                 message: format!("HTTP {status}: {excerpt}"),
             });
         }
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: QUICKGO_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(QUICKGO_API, &bytes)
     }
 
     pub async fn annotations(
@@ -1,26 +1,414 @@
 use std::borrow::Cow;
-use std::collections::HashMap;
-use std::sync::{Arc, OnceLock};
-use std::time::Duration;
+use std::collections::{BTreeMap, HashMap};
+use std::fs::OpenOptions;
+use std::hash::{DefaultHasher, Hash, Hasher};
+use std::io::{Read, Seek, SeekFrom, Write};
+use std::path::{Path, PathBuf};
+use std::pin::Pin;
+use std::sync::{Arc, Mutex, OnceLock, PoisonError};
+use std::task::{Context, Poll};
+use std::time::{Duration, SystemTime, UNIX_EPOCH};
 
+use fs2::FileExt;
 use http::Extensions;
-use reqwest::Url;
+use reqwest::{ResponseBuilderExt, Url};
 use reqwest_middleware::{Middleware, Next};
-use tokio::sync::Mutex;
-use tokio::time::{Instant, sleep_until};
+use tokio::sync::{OwnedSemaphorePermit, Semaphore};
+use tokio::time::{Instant, sleep, sleep_until};
+use tracing::warn;
 
+use crate::cache::RateLimitOverride;
+use crate::sources::{DeadlineExceeded, deadline_wait_budget};
+
+const RATE_LIMIT_BACKEND_ENV: &str = "BIOMCP_RATE_LIMIT_BACKEND";
+const SHARED_SLOT_DIR: &str = "rate-limit";
+// Slot timestamps further ahead than this are treated as clock skew and reset.
+const SHARED_SLOT_MAX_LEAD: Duration = Duration::from_secs(3600);
+const RATE_LIMIT_POLICY_ENV_PREFIX: &str = "BIOMCP_RATE_LIMIT_";
+const DEFAULT_POLICY_KEY: &str = "default";
+const KEY_SHARDS: usize = 16;
+// Adaptive slowdown starts from at least this interval and never exceeds the ceiling.
+const ADAPTIVE_BACKOFF_FLOOR: Duration = Duration::from_millis(100);
+const ADAPTIVE_MAX_INTERVAL: Duration = Duration::from_secs(30);
+const ADAPTIVE_RECOVERY_STEPS: f64 = 10.0;
+
+/// Per-source request budget.
+///
+/// `min_interval` is the steady-state spacing between requests and `burst` is how many requests
+/// may go out back to back after an idle period (a token bucket refilled one token per
+/// `min_interval`). `max_in_flight` optionally caps concurrent requests to the source.
 #[derive(Clone, Debug)]
 pub(crate) struct RateLimitPolicy {
     pub key: &'static str,
     pub prefix: Cow<'static, str>,
     pub min_interval: Duration,
+    pub burst: u32,
+    pub max_in_flight: Option<usize>,
+}
+
+impl RateLimitPolicy {
+    fn apply_override(&mut self, value: RateLimitOverride) {
+        if let Some(interval_ms) = value.interval_ms {
+            self.min_interval = Duration::from_millis(interval_ms);
+        }
+        if let Some(burst) = value.burst {
+            self.burst = burst.max(1);
+        }
+        if let Some(max_in_flight) = value.max_in_flight {
+            self.max_in_flight = Some(max_in_flight.max(1));
+        }
+    }
+}
+
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+struct KeyLimits {
+    min_interval: Duration,
+    burst: u32,
+    max_in_flight: Option<usize>,
+}
+
+/// Limiter state for one policy key: a GCRA token bucket plus an optional in-flight cap.
+#[derive(Debug)]
+struct KeyState {
+    limits: KeyLimits,
+    bucket: Mutex<BucketState>,
+    in_flight: Option<Arc<Semaphore>>,
+}
+
+#[derive(Debug)]
+struct BucketState {
+    // Theoretical arrival time of the next request under the effective rate.
+    tat: Option<Instant>,
+    // Current spacing after adaptive slowdown; never below `KeyLimits::min_interval`.
+    interval: Duration,
+    // End of the latest `Retry-After` pause, kept apart from `tat` so the shared backend sees it.
+    resume_at: Option<Instant>,
+}
+
+/// Upstream signal used to adapt a key's effective rate.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub(crate) enum RateFeedback {
+    Success,
+    Throttled { retry_after: Option<Duration> },
+}
+
+impl RateFeedback {
+    /// Only `429` and `503` throttle; a `Retry-After` on any other status (for example a `301`
+    /// or a `200` from a proxy) is ignored.
+    pub(crate) fn from_response(response: &reqwest::Response) -> Self {
+        let status = response.status();
+        if status == reqwest::StatusCode::TOO_MANY_REQUESTS
+            || status == reqwest::StatusCode::SERVICE_UNAVAILABLE
+        {
+            Self::Throttled {
+                retry_after: crate::sources::parse_retry_after_header(response.headers()),
+            }
+        } else {
+            Self::Success
+        }
+    }
+}
+
+impl KeyState {
+    fn new(limits: KeyLimits) -> Self {
+        Self {
+            limits,
+            bucket: Mutex::new(BucketState {
+                tat: None,
+                interval: limits.min_interval,
+                resume_at: None,
+            }),
+            in_flight: limits.max_in_flight.map(|n| Arc::new(Semaphore::new(n))),
+        }
+    }
+
+    fn effective_interval(&self) -> Duration {
+        self.bucket
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .interval
+    }
+
+    /// Returns the end of a `Retry-After` pause that is still running at `now`.
+    fn paused_until(&self, now: Instant) -> Option<Instant> {
+        self.bucket
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .resume_at
+            .filter(|resume| *resume > now)
+    }
+
+    /// Reserves the next send time for this key. The lock is never held across an await.
+    fn reserve(&self, now: Instant) -> Instant {
+        self.reserve_within(now, None).unwrap_or(now)
+    }
+
+    /// Like `reserve`, but leaves the bucket untouched and returns `None` when the send time is
+    /// more than `max_wait` away, so a request that cannot use its slot does not consume it.
+    fn reserve_within(&self, now: Instant, max_wait: Option<Duration>) -> Option<Instant> {
+        let mut bucket = self.bucket.lock().unwrap_or_else(PoisonError::into_inner);
+        let base = bucket.tat.map_or(now, |t| t.max(now));
+        let tolerance = bucket.interval * self.limits.burst.saturating_sub(1);
+        let allowed = base.checked_sub(tolerance).map_or(now, |t| t.max(now));
+        if max_wait.is_some_and(|max| allowed.saturating_duration_since(now) > max) {
+            return None;
+        }
+        bucket.tat = Some(base + bucket.interval);
+        Some(allowed)
+    }
+
+    /// AIMD: throttling doubles the interval and honours `Retry-After` as a pause; each success
+    /// wins back a tenth of the configured rate until the policy interval is reached again.
+    fn record(&self, feedback: RateFeedback, now: Instant) {
+        let mut bucket = self.bucket.lock().unwrap_or_else(PoisonError::into_inner);
+        bucket.interval =
+            next_adaptive_interval(bucket.interval, self.limits.min_interval, feedback);
+        if let RateFeedback::Throttled {
+            retry_after: Some(pause),
+        } = feedback
+        {
+            let resume = now + pause.min(ADAPTIVE_MAX_INTERVAL);
+            bucket.tat = Some(bucket.tat.map_or(resume, |t| t.max(resume)));
+            bucket.resume_at = Some(bucket.resume_at.map_or(resume, |t| t.max(resume)));
+        }
+    }
+}
+
+fn next_adaptive_interval(current: Duration, base: Duration, feedback: RateFeedback) -> Duration {
+    match feedback {
+        RateFeedback::Throttled { .. } => current
+            .max(ADAPTIVE_BACKOFF_FLOOR)
+            .saturating_mul(2)
+            .min(ADAPTIVE_MAX_INTERVAL)
+            .max(base),
+        RateFeedback::Success if current <= base => base,
+        RateFeedback::Success => {
+            let base_rate = 1.0 / base.max(Duration::from_millis(1)).as_secs_f64();
+            let rate = 1.0 / current.as_secs_f64() + base_rate / ADAPTIVE_RECOVERY_STEPS;
+            Duration::from_secs_f64(1.0 / rate).max(base)
+        }
+    }
+}
+
+/// Point-in-time view of one policy's configured and effective request rate.
+#[derive(Clone, Debug, PartialEq)]
+pub(crate) struct RateLimitSnapshot {
+    pub key: &'static str,
+    pub configured_interval: Duration,
+    pub effective_interval: Duration,
+}
+
+/// Held while a rate-limited request is in flight; releases the source's concurrency slot on drop.
+///
+/// [`RateLimitMiddleware`] moves it into the response body, so the slot stays taken until the body
+/// has been read to the end or dropped.
+#[derive(Debug)]
+pub(crate) struct RateLimitPermit {
+    state: Arc<KeyState>,
+    in_flight: Option<OwnedSemaphorePermit>,
+}
+
+impl RateLimitPermit {
+    /// Feeds the upstream response back into the key's adaptive rate.
+    pub(crate) fn record(&self, feedback: RateFeedback) {
+        self.state.record(feedback, Instant::now());
+    }
+}
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub(crate) enum RateLimitBackend {
+    Local,
+    Shared,
+}
+
+fn parse_rate_limit_backend(value: Option<&str>) -> RateLimitBackend {
+    match value.map(|v| v.trim().to_ascii_lowercase()).as_deref() {
+        Some("shared") => RateLimitBackend::Shared,
+        Some("local") | Some("") | None => RateLimitBackend::Local,
+        Some(other) => {
+            warn!("Unknown {RATE_LIMIT_BACKEND_ENV}={other:?}, using process-local rate limiting");
+            RateLimitBackend::Local
+        }
+    }
+}
+
+/// Host-wide slot table shared by every biomcp process that uses the same cache root.
+///
+/// Each limiter key owns one small file holding the next free request slot as little-endian
+/// Unix milliseconds. A caller takes an exclusive `flock` on the file, reserves the next slot,
+/// releases the lock, and then sleeps until its slot outside the lock.
+#[derive(Debug)]
+pub(crate) struct SharedSlotTable {
+    dir: PathBuf,
+}
+
+impl SharedSlotTable {
+    pub(crate) fn open(dir: PathBuf) -> std::io::Result<Self> {
+        std::fs::create_dir_all(&dir)?;
+        Ok(Self { dir })
+    }
+
+    fn slot_path(&self, key: &str) -> PathBuf {
+        let name = key
+            .chars()
+            .map(|c| {
+                if c.is_ascii_alphanumeric() || c == '-' {
+                    c
+                } else {
+                    '_'
+                }
+            })
+            .collect::<String>();
+        self.dir.join(format!("{name}.slot"))
+    }
+
+    /// Reserves the next slot for `key` and returns how long the caller must wait for it.
+    async fn reserve(&self, key: &str, limits: KeyLimits) -> std::io::Result<Duration> {
+        let path = self.slot_path(key);
+        tokio::task::spawn_blocking(move || reserve_slot(&path, limits, SystemTime::now()))
+            .await
+            .map_err(std::io::Error::other)?
+    }
+}
+
+fn unix_millis(at: SystemTime) -> u64 {
+    u64::try_from(
+        at.duration_since(UNIX_EPOCH)
+            .unwrap_or_default()
+            .as_millis(),
+    )
+    .unwrap_or(u64::MAX)
+}
+
+/// Shared-table GCRA step: returns `(wait_ms, next_tat_ms)` for a request arriving at `now_ms`.
+fn next_slot_millis(previous_tat: Option<u64>, now_ms: u64, limits: KeyLimits) -> (u64, u64) {
+    let interval_ms = u64::try_from(limits.min_interval.as_millis()).unwrap_or(u64::MAX);
+    let max_lead_ms = u64::try_from(SHARED_SLOT_MAX_LEAD.as_millis()).unwrap_or(u64::MAX);
+    let tolerance_ms = interval_ms.saturating_mul(u64::from(limits.burst.saturating_sub(1)));
+    let base = match previous_tat {
+        Some(tat) if tat <= now_ms.saturating_add(max_lead_ms) => tat.max(now_ms),
+        _ => now_ms,
+    };
+    let allowed = base.saturating_sub(tolerance_ms).max(now_ms);
+    (allowed - now_ms, base.saturating_add(interval_ms))
+}
+
+fn reserve_slot(path: &Path, limits: KeyLimits, now: SystemTime) -> std::io::Result<Duration> {
+    let mut file = OpenOptions::new()
+        .read(true)
+        .write(true)
+        .create(true)
+        .truncate(false)
+        .open(path)?;
+    file.lock_exclusive()?;
+    let result = advance_slot(&mut file, limits, now);
+    let _ = FileExt::unlock(&file);
+    result
+}
+
+fn advance_slot(
+    file: &mut std::fs::File,
+    limits: KeyLimits,
+    now: SystemTime,
+) -> std::io::Result<Duration> {
+    let mut buf = [0_u8; 8];
+    let previous = match file.read_exact(&mut buf) {
+        Ok(()) => Some(u64::from_le_bytes(buf)),
+        Err(err) if err.kind() == std::io::ErrorKind::UnexpectedEof => None,
+        Err(err) => return Err(err),
+    };
+    let (wait_ms, next_tat) = next_slot_millis(previous, unix_millis(now), limits);
+    file.seek(SeekFrom::Start(0))?;
+    file.write_all(&next_tat.to_le_bytes())?;
+    Ok(Duration::from_millis(wait_ms))
+}
+
+fn shared_slot_table_from_env() -> Option<SharedSlotTable> {
+    let backend = parse_rate_limit_backend(std::env::var(RATE_LIMIT_BACKEND_ENV).ok().as_deref());
+    if backend != RateLimitBackend::Shared {
+        return None;
+    }
+    let dir = match crate::cache::resolve_cache_config() {
+        Ok(config) => config.cache_root.join(SHARED_SLOT_DIR),
+        Err(err) => {
+            warn!("Shared rate limiter unavailable; using process-local limits: {err}");
+            return None;
+        }
+    };
+    match SharedSlotTable::open(dir) {
+        Ok(table) => Some(table),
+        Err(err) => {
+            warn!("Shared rate limiter unavailable; using process-local limits: {err}");
+            None
+        }
+    }
+}
+
+fn parse_policy_override_env(value: &str) -> Result<RateLimitOverride, String> {
+    let mut out = RateLimitOverride::default();
+    for part in value.split(',').map(str::trim).filter(|v| !v.is_empty()) {
+        let (name, raw) = part
+            .split_once('=')
+            .ok_or_else(|| format!("expected name=value, got {part:?}"))?;
+        let raw = raw.trim();
+        let invalid = || format!("{} must be a positive integer, got {raw:?}", name.trim());
+        match name.trim() {
+            "interval_ms" => out.interval_ms = Some(raw.parse().map_err(|_| invalid())?),
+            "burst" => {
+                out.burst = Some(raw.parse().ok().filter(|v| *v > 0).ok_or_else(invalid)?);
+            }
+            "max_in_flight" => {
+                out.max_in_flight = Some(raw.parse().ok().filter(|v| *v > 0).ok_or_else(invalid)?);
+            }
+            other => return Err(format!("unknown field {other:?}")),
+        }
+    }
+    Ok(out)
+}
+
+fn policy_override_env_name(key: &str) -> String {
+    format!(
+        "{RATE_LIMIT_POLICY_ENV_PREFIX}{}",
+        key.to_ascii_uppercase().replace('-', "_")
+    )
+}
+
+/// Resolves the override for one policy key: `cache.toml` first, then the per-key env var.
+fn resolve_policy_override(
+    key: &str,
+    file_overrides: &BTreeMap<String, RateLimitOverride>,
+) -> Option<RateLimitOverride> {
+    let from_file = file_overrides.get(key).copied();
+    let env_name = policy_override_env_name(key);
+    let from_env = std::env::var(&env_name)
+        .ok()
+        .filter(|v| !v.trim().is_empty())
+        .and_then(|raw| match parse_policy_override_env(&raw) {
+            Ok(value) => Some(value),
+            Err(err) => {
+                warn!("Ignoring invalid {env_name}: {err}");
+                None
+            }
+        });
+    match (from_file, from_env) {
+        (Some(file), Some(env)) => Some(file.merged_with(env)),
+        (file, env) => file.or(env),
+    }
+}
+
+fn shard_index(key: &str) -> usize {
+    let mut hasher = DefaultHasher::new();
+    key.hash(&mut hasher);
+    (hasher.finish() % KEY_SHARDS as u64) as usize
 }
 
 #[derive(Debug)]
 pub(crate) struct RateLimiter {
     policies: Vec<RateLimitPolicy>,
-    default_min_interval: Duration,
-    last_seen: Mutex<HashMap<String, Instant>>,
+    default_limits: KeyLimits,
+    // Key state is sharded by key hash so requests to unrelated hosts never share a lock.
+    shards: Vec<Mutex<HashMap<String, Arc<KeyState>>>>,
+    shared: Option<SharedSlotTable>,
 }
 
 impl RateLimiter {
@@ -28,7 +416,7 @@ impl RateLimiter {
         // NCBI_API_KEY enables the higher PubTator request budget (10 req/sec).
         let has_ncbi_api_key = crate::sources::ncbi_api_key().is_some();
         let has_s2_api_key = crate::sources::s2_api_key().is_some();
-        let policies = vec![
+        let mut policies = vec![
             policy(
                 "pubtator",
                 "BIOMCP_PUBTATOR_BASE",
@@ -90,27 +478,80 @@ impl RateLimiter {
                 Duration::from_millis(334),
             ),
         ];
-        Self::new(policies, Duration::from_millis(100))
+        let file_overrides = crate::cache::resolve_rate_limit_overrides().unwrap_or_else(|err| {
+            warn!("Ignoring cache.toml rate limit overrides: {err}");
+            BTreeMap::new()
+        });
+        for policy in &mut policies {
+            if let Some(value) = resolve_policy_override(policy.key, &file_overrides) {
+                policy.apply_override(value);
+            }
+        }
+        let mut limiter = Self::new(policies, Duration::from_millis(100));
+        if let Some(value) = resolve_policy_override(DEFAULT_POLICY_KEY, &file_overrides) {
+            if let Some(interval_ms) = value.interval_ms {
+                limiter.default_limits.min_interval = Duration::from_millis(interval_ms);
+            }
+            if let Some(burst) = value.burst {
+                limiter.default_limits.burst = burst.max(1);
+            }
+            limiter.default_limits.max_in_flight = value.max_in_flight;
+        }
+        limiter.shared = shared_slot_table_from_env();
+        limiter
     }
 
     pub(crate) fn new(policies: Vec<RateLimitPolicy>, default_min_interval: Duration) -> Self {
         Self {
             policies,
-            default_min_interval,
-            last_seen: Mutex::new(HashMap::new()),
+            default_limits: KeyLimits {
+                min_interval: default_min_interval,
+                burst: 1,
+                max_in_flight: None,
+            },
+            shards: (0..KEY_SHARDS)
+                .map(|_| Mutex::new(HashMap::new()))
+                .collect(),
+            shared: None,
         }
     }
 
-    fn resolve_key_and_interval(&self, url: &Url) -> (String, Duration) {
-        let full = url.as_str();
+    pub(crate) fn with_shared_slots(mut self, table: SharedSlotTable) -> Self {
+        self.shared = Some(table);
+        self
+    }
 
-        if let Some(policy) = self
-            .policies
+    pub(crate) fn backend(&self) -> RateLimitBackend {
+        if self.shared.is_some() {
+            RateLimitBackend::Shared
+        } else {
+            RateLimitBackend::Local
+        }
+    }
+
+    fn matching_policy(&self, url: &Url) -> Option<&RateLimitPolicy> {
+        let full = url.as_str();
+        self.policies
             .iter()
             .filter(|p| full.starts_with(p.prefix.as_ref()))
             .max_by_key(|p| p.prefix.len())
-        {
-            return (format!("policy:{}", policy.key), policy.min_interval);
+    }
+
+    /// Returns the key of the policy (longest matching prefix) that governs `url`, if any.
+    pub(crate) fn policy_key(&self, url: &Url) -> Option<&'static str> {
+        self.matching_policy(url).map(|policy| policy.key)
+    }
+
+    fn resolve_key_and_limits(&self, url: &Url) -> (String, KeyLimits) {
+        if let Some(policy) = self.matching_policy(url) {
+            return (
+                format!("policy:{}", policy.key),
+                KeyLimits {
+                    min_interval: policy.min_interval,
+                    burst: policy.burst.max(1),
+                    max_in_flight: policy.max_in_flight,
+                },
+            );
         }
 
         let origin = format!(
@@ -118,33 +559,116 @@ impl RateLimiter {
             url.scheme(),
             url.host_str().unwrap_or("unknown-host")
         );
-        (format!("default:{origin}"), self.default_min_interval)
+        (format!("default:{origin}"), self.default_limits)
+    }
+
+    fn key_state(&self, key: &str, limits: KeyLimits) -> Arc<KeyState> {
+        let mut map = self.shards[shard_index(key)]
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner);
+        map.entry(key.to_string())
+            .or_insert_with(|| Arc::new(KeyState::new(limits)))
+            .clone()
     }
 
-    pub(crate) async fn wait_for_url(&self, url: &Url) {
-        let (key, min_interval) = self.resolve_key_and_interval(url);
-        loop {
-            let now = Instant::now();
-            let mut map = self.last_seen.lock().await;
-            let wait_until = map.get(&key).map(|last| *last + min_interval);
+    /// Waits for the URL's source to have both a free concurrency slot and a rate token.
+    ///
+    /// The returned permit holds the concurrency slot; drop it once the response body is read. Under
+    /// a `with_deadline` scope, gives up with `DeadlineExceeded` instead of waiting past the point
+    /// where the request could still finish.
+    pub(crate) async fn acquire(&self, url: &Url) -> Result<RateLimitPermit, DeadlineExceeded> {
+        let (key, limits) = self.resolve_key_and_limits(url);
+        let state = self.key_state(&key, limits);
+        // Take the in-flight slot first so queued requests do not burn rate tokens while waiting.
+        let in_flight = match &state.in_flight {
+            Some(semaphore) => {
+                let slot = semaphore.clone().acquire_owned();
+                match deadline_wait_budget() {
+                    Some(budget) => tokio::time::timeout(budget, slot)
+                        .await
+                        .map_err(|_| DeadlineExceeded)?
+                        .ok(),
+                    None => slot.await.ok(),
+                }
+            }
+            None => None,
+        };
+        self.wait_for_token(&key, &state).await?;
+        Ok(RateLimitPermit { state, in_flight })
+    }
+
+    pub(crate) async fn wait_for_url(&self, url: &Url) -> Result<(), DeadlineExceeded> {
+        let (key, limits) = self.resolve_key_and_limits(url);
+        let state = self.key_state(&key, limits);
+        self.wait_for_token(&key, &state).await
+    }
 
-            match wait_until {
-                Some(target) if target > now => {
-                    drop(map);
-                    sleep_until(target).await;
+    async fn wait_for_token(&self, key: &str, state: &KeyState) -> Result<(), DeadlineExceeded> {
+        let mut budget = deadline_wait_budget();
+        if let Some(shared) = &self.shared {
+            // Sit out this process's `Retry-After` pause before taking a slot in the shared table.
+            if let Some(resume) = state.paused_until(Instant::now()) {
+                if budget
+                    .is_some_and(|budget| resume.saturating_duration_since(Instant::now()) > budget)
+                {
+                    return Err(DeadlineExceeded);
                 }
-                _ => {
-                    map.insert(key, now);
-                    return;
+                sleep_until(resume).await;
+                budget = deadline_wait_budget();
+            }
+            let limits = KeyLimits {
+                min_interval: state.effective_interval(),
+                ..state.limits
+            };
+            match shared.reserve(key, limits).await {
+                // The shared slot is already taken at this point; it is only skipped, not freed.
+                Ok(delay) if budget.is_some_and(|budget| delay > budget) => {
+                    return Err(DeadlineExceeded);
+                }
+                Ok(delay) => {
+                    if !delay.is_zero() {
+                        sleep(delay).await;
+                    }
+                    return Ok(());
                 }
+                Err(err) => warn!(
+                    key = %key,
+                    "Shared rate limiter slot unavailable; using process-local limits: {err}"
+                ),
             }
         }
+        let now = Instant::now();
+        let allowed = state.reserve_within(now, budget).ok_or(DeadlineExceeded)?;
+        if allowed > now {
+            sleep_until(allowed).await;
+        }
+        Ok(())
+    }
+
+    /// Reports each named policy's configured and current effective interval.
+    pub(crate) fn snapshot(&self) -> Vec<RateLimitSnapshot> {
+        self.policies
+            .iter()
+            .map(|policy| {
+                let key = format!("policy:{}", policy.key);
+                let effective_interval = self.shards[shard_index(&key)]
+                    .lock()
+                    .unwrap_or_else(PoisonError::into_inner)
+                    .get(&key)
+                    .map_or(policy.min_interval, |state| state.effective_interval());
+                RateLimitSnapshot {
+                    key: policy.key,
+                    configured_interval: policy.min_interval,
+                    effective_interval,
+                }
+            })
+            .collect()
     }
 
     #[cfg(test)]
     fn resolve_key_for_str(&self, raw: &str) -> Option<String> {
         let url = Url::parse(raw).ok()?;
-        Some(self.resolve_key_and_interval(&url).0)
+        Some(self.resolve_key_and_limits(&url).0)
     }
 }
 
@@ -182,6 +706,8 @@ fn policy(
         key,
         prefix: crate::sources::env_base(default_prefix, env_var),
         min_interval,
+        burst: 1,
+        max_in_flight: None,
     }
 }
 
@@ -214,15 +740,98 @@ impl Middleware for RateLimitMiddleware {
         extensions: &mut Extensions,
         next: Next<'_>,
     ) -> reqwest_middleware::Result<reqwest::Response> {
-        self.limiter.wait_for_url(req.url()).await;
-        next.run(req, extensions).await
+        let waiting_since = Instant::now();
+        let wait_span = crate::profiling::profile_span!("rate_limit");
+        let permit = self
+            .limiter
+            .acquire(req.url())
+            .await
+            .map_err(reqwest_middleware::Error::middleware)?;
+        drop(wait_span);
+        crate::sources::metrics::record_rate_limit_wait(
+            &source_label(req.url(), extensions),
+            waiting_since.elapsed(),
+        );
+        let response = next.run(req, extensions).await?;
+        permit.record(RateFeedback::from_response(&response));
+        Ok(hold_until_body_read(response, permit))
+    }
+}
+
+/// Moves `permit` into the response body so a capped source's concurrency slot is released only
+/// once the body has been read to the end or dropped, not as soon as the headers arrive.
+fn hold_until_body_read(response: reqwest::Response, permit: RateLimitPermit) -> reqwest::Response {
+    if permit.in_flight.is_none() {
+        return response;
+    }
+    let url = response.url().clone();
+    let (mut parts, body) = http::Response::<reqwest::Body>::from(response).into_parts();
+    // The `http` conversion drops the response URL; carry it over so `Response::url` still works.
+    let (url_parts, ()) = http::Response::builder()
+        .url(url)
+        .body(())
+        .unwrap_or_default()
+        .into_parts();
+    parts.extensions.extend(url_parts.extensions);
+    let body = reqwest::Body::wrap(PermitBody {
+        inner: body,
+        permit: Some(permit),
+    });
+    reqwest::Response::from(http::Response::from_parts(parts, body))
+}
+
+/// Response body that owns a [`RateLimitPermit`] until the last frame has been read.
+struct PermitBody {
+    inner: reqwest::Body,
+    permit: Option<RateLimitPermit>,
+}
+
+impl http_body::Body for PermitBody {
+    type Data = <reqwest::Body as http_body::Body>::Data;
+    type Error = reqwest::Error;
+
+    fn poll_frame(
+        self: Pin<&mut Self>,
+        cx: &mut Context<'_>,
+    ) -> Poll<Option<Result<http_body::Frame<Self::Data>, Self::Error>>> {
+        let this = self.get_mut();
+        let frame = http_body::Body::poll_frame(Pin::new(&mut this.inner), cx);
+        if matches!(frame, Poll::Ready(None) | Poll::Ready(Some(Err(_)))) {
+            this.permit = None;
+        }
+        frame
+    }
+
+    fn is_end_stream(&self) -> bool {
+        http_body::Body::is_end_stream(&self.inner)
+    }
+
+    fn size_hint(&self) -> http_body::SizeHint {
+        http_body::Body::size_hint(&self.inner)
     }
 }
 
-pub(crate) async fn wait_for_url_str(raw: &str) {
+/// Per-service label shared by circuit breakers and metrics: the client's [`SourceApi`] name, else
+/// the rate-limit policy key for `url`, else its host.
+///
+/// [`SourceApi`]: crate::sources::SourceApi
+pub(crate) fn source_label(url: &Url, extensions: &Extensions) -> String {
+    if let Some(api) = extensions.get::<crate::sources::SourceApi>() {
+        return api.0.to_string();
+    }
+    global_limiter()
+        .policy_key(url)
+        .map(str::to_string)
+        .unwrap_or_else(|| url.host_str().unwrap_or("unknown-host").to_string())
+}
+
+pub(crate) async fn wait_for_url_str(raw: &str) -> Result<(), crate::error::BioMcpError> {
     if let Ok(url) = Url::parse(raw) {
-        global_limiter().wait_for_url(&url).await;
+        global_limiter().wait_for_url(&url).await.map_err(|err| {
+            crate::error::BioMcpError::HttpMiddleware(reqwest_middleware::Error::middleware(err))
+        })?;
     }
+    Ok(())
 }
 
 #[cfg(test)]
@@ -268,6 +877,16 @@ mod tests {
             key,
             prefix: Cow::Owned(prefix.to_string()),
             min_interval: Duration::from_millis(ms),
+            burst: 1,
+            max_in_flight: None,
+        }
+    }
+
+    fn limits(ms: u64, burst: u32) -> KeyLimits {
+        KeyLimits {
+            min_interval: Duration::from_millis(ms),
+            burst,
+            max_in_flight: None,
         }
     }
 
@@ -280,8 +899,8 @@ mod tests {
 
         let url = Url::parse("https://api.example.org/strict/resource").unwrap();
         let start = Instant::now();
-        limiter.wait_for_url(&url).await;
-        limiter.wait_for_url(&url).await;
+        limiter.wait_for_url(&url).await.expect("no deadline");
+        limiter.wait_for_url(&url).await.expect("no deadline");
 
         assert!(
             start.elapsed() >= Duration::from_millis(100),
@@ -289,6 +908,30 @@ mod tests {
         );
     }
 
+    #[tokio::test]
+    async fn rate_limit_gives_up_without_consuming_slot_past_deadline() {
+        let limiter = RateLimiter::new(
+            vec![test_policy("slow", "https://api.example.org/slow", 2_000)],
+            Duration::from_millis(1),
+        );
+        let url = Url::parse("https://api.example.org/slow/resource").unwrap();
+        limiter
+            .wait_for_url(&url)
+            .await
+            .expect("first slot is free");
+
+        let start = Instant::now();
+        let result =
+            crate::sources::with_deadline(Duration::from_secs(1), limiter.wait_for_url(&url)).await;
+        assert!(result.is_err(), "slot 2s away cannot fit a 1s deadline");
+        assert!(start.elapsed() < Duration::from_millis(100));
+
+        // The refused request did not push the next slot further out.
+        let state = limiter.key_state("policy:slow", limiter.resolve_key_and_limits(&url).1);
+        let next = state.reserve(Instant::now());
+        assert!(next <= start + Duration::from_millis(2_000));
+    }
+
     #[tokio::test]
     async fn rate_limit_keeps_same_host_prefixes_independent() {
         let limiter = RateLimiter::new(
@@ -303,8 +946,8 @@ mod tests {
         let url_b = Url::parse("https://www.ebi.ac.uk/chembl/api/data/molecule").unwrap();
 
         let start = Instant::now();
-        limiter.wait_for_url(&url_a).await;
-        limiter.wait_for_url(&url_b).await;
+        limiter.wait_for_url(&url_a).await.expect("no deadline");
+        limiter.wait_for_url(&url_b).await.expect("no deadline");
 
         assert!(
             start.elapsed() < Duration::from_millis(80),
@@ -318,8 +961,8 @@ mod tests {
         let url = Url::parse("https://unknown.example.org/path").unwrap();
 
         let start = Instant::now();
-        limiter.wait_for_url(&url).await;
-        limiter.wait_for_url(&url).await;
+        limiter.wait_for_url(&url).await.expect("no deadline");
+        limiter.wait_for_url(&url).await.expect("no deadline");
 
         assert!(
             start.elapsed() >= Duration::from_millis(65),
@@ -327,6 +970,213 @@ mod tests {
         );
     }
 
+    #[tokio::test]
+    async fn rate_limit_allows_burst_before_throttling() {
+        let mut policy = test_policy("bursty", "https://api.example.org/bursty", 120);
+        policy.burst = 3;
+        let limiter = RateLimiter::new(vec![policy], Duration::from_millis(1));
+        let url = Url::parse("https://api.example.org/bursty/resource").unwrap();
+
+        let start = Instant::now();
+        for _ in 0..3 {
+            limiter.wait_for_url(&url).await.expect("no deadline");
+        }
+        assert!(
+            start.elapsed() < Duration::from_millis(80),
+            "burst capacity should admit back-to-back requests"
+        );
+
+        limiter.wait_for_url(&url).await.expect("no deadline");
+        assert!(
+            start.elapsed() >= Duration::from_millis(100),
+            "request past the burst should wait for a refill"
+        );
+    }
+
+    #[tokio::test]
+    async fn rate_limit_caps_requests_in_flight() {
+        let mut policy = test_policy("capped", "https://api.example.org/capped", 0);
+        policy.burst = 10;
+        policy.max_in_flight = Some(1);
+        let limiter = RateLimiter::new(vec![policy], Duration::from_millis(1));
+        let url = Url::parse("https://api.example.org/capped/resource").unwrap();
+
+        let first = limiter.acquire(&url).await.expect("no deadline");
+        let blocked = tokio::time::timeout(Duration::from_millis(50), limiter.acquire(&url)).await;
+        assert!(blocked.is_err(), "second request should wait for the first");
+
+        drop(first);
+        let second = tokio::time::timeout(Duration::from_millis(50), limiter.acquire(&url)).await;
+        assert!(
+            second.is_ok(),
+            "released slot should admit the next request"
+        );
+    }
+
+    #[tokio::test]
+    async fn response_body_holds_in_flight_slot_until_read() {
+        let mut policy = test_policy("capped", "https://api.example.org/capped", 0);
+        policy.burst = 10;
+        policy.max_in_flight = Some(1);
+        let limiter = RateLimiter::new(vec![policy], Duration::from_millis(1));
+        let url = Url::parse("https://api.example.org/capped/resource").unwrap();
+
+        let permit = limiter.acquire(&url).await.expect("no deadline");
+        let response = http::Response::builder()
+            .url(url.clone())
+            .body("payload")
+            .expect("response");
+        let response = hold_until_body_read(reqwest::Response::from(response), permit);
+        assert_eq!(response.url(), &url);
+        let blocked = tokio::time::timeout(Duration::from_millis(50), limiter.acquire(&url)).await;
+        assert!(blocked.is_err(), "unread body should keep the slot");
+
+        assert_eq!(response.bytes().await.expect("body").as_ref(), b"payload");
+        let next = tokio::time::timeout(Duration::from_millis(50), limiter.acquire(&url)).await;
+        assert!(next.is_ok(), "reading the body should release the slot");
+    }
+
+    #[test]
+    fn feedback_throttles_only_on_429_and_503() {
+        let feedback = |status: u16, retry_after: Option<&str>| {
+            let mut response = http::Response::builder().status(status);
+            if let Some(value) = retry_after {
+                response = response.header(reqwest::header::RETRY_AFTER, value);
+            }
+            RateFeedback::from_response(&reqwest::Response::from(
+                response.body(Vec::new()).expect("response"),
+            ))
+        };
+
+        assert_eq!(
+            feedback(429, Some("7")),
+            RateFeedback::Throttled {
+                retry_after: Some(Duration::from_secs(7))
+            }
+        );
+        assert_eq!(
+            feedback(503, None),
+            RateFeedback::Throttled { retry_after: None }
+        );
+        assert_eq!(feedback(200, Some("7")), RateFeedback::Success);
+        assert_eq!(feedback(301, Some("7")), RateFeedback::Success);
+        assert_eq!(feedback(500, Some("7")), RateFeedback::Success);
+    }
+
+    #[test]
+    fn adaptive_interval_backs_off_multiplicatively() {
+        let base = Duration::from_millis(334);
+        let throttled = RateFeedback::Throttled { retry_after: None };
+        assert_eq!(
+            next_adaptive_interval(base, base, throttled),
+            Duration::from_millis(668)
+        );
+        assert_eq!(
+            next_adaptive_interval(Duration::ZERO, Duration::ZERO, throttled),
+            ADAPTIVE_BACKOFF_FLOOR * 2
+        );
+        assert_eq!(
+            next_adaptive_interval(ADAPTIVE_MAX_INTERVAL, base, throttled),
+            ADAPTIVE_MAX_INTERVAL
+        );
+    }
+
+    #[test]
+    fn adaptive_interval_recovers_additively_to_configured_rate() {
+        let base = Duration::from_millis(100);
+        // 10 req/s configured, slowed to 2.5 req/s; each success adds 1 req/s.
+        let first = next_adaptive_interval(Duration::from_millis(400), base, RateFeedback::Success);
+        assert_eq!(first.as_millis(), 285);
+
+        let mut current = first;
+        for _ in 0..20 {
+            current = next_adaptive_interval(current, base, RateFeedback::Success);
+        }
+        assert_eq!(current, base);
+    }
+
+    #[tokio::test]
+    async fn throttle_feedback_slows_key_and_honours_retry_after() {
+        let limiter = RateLimiter::new(
+            vec![test_policy(
+                "adaptive",
+                "https://api.example.org/adaptive",
+                50,
+            )],
+            Duration::from_millis(1),
+        );
+        let url = Url::parse("https://api.example.org/adaptive/resource").unwrap();
+
+        let permit = limiter.acquire(&url).await.expect("no deadline");
+        permit.record(RateFeedback::Throttled {
+            retry_after: Some(Duration::from_millis(150)),
+        });
+        drop(permit);
+
+        let snapshot = limiter.snapshot();
+        assert_eq!(snapshot[0].configured_interval, Duration::from_millis(50));
+        assert_eq!(snapshot[0].effective_interval, Duration::from_millis(200));
+
+        let start = Instant::now();
+        limiter.wait_for_url(&url).await.expect("no deadline");
+        assert!(
+            start.elapsed() >= Duration::from_millis(120),
+            "Retry-After should pause the key"
+        );
+    }
+
+    #[test]
+    fn key_state_is_reused_across_lookups() {
+        let limiter = RateLimiter::new(Vec::new(), Duration::from_millis(1));
+        let a = limiter.key_state("default:https://a.example.org", limits(1, 1));
+        let b = limiter.key_state("default:https://a.example.org", limits(1, 1));
+        assert!(Arc::ptr_eq(&a, &b));
+        assert!(shard_index("default:https://a.example.org") < KEY_SHARDS);
+    }
+
+    #[test]
+    fn parse_policy_override_env_reads_known_fields() {
+        let value = parse_policy_override_env("interval_ms=250, burst=4,max_in_flight=2")
+            .expect("valid override");
+        assert_eq!(
+            value,
+            RateLimitOverride {
+                interval_ms: Some(250),
+                burst: Some(4),
+                max_in_flight: Some(2),
+            }
+        );
+        assert!(parse_policy_override_env("burst=0").is_err());
+        assert!(parse_policy_override_env("rate=5").is_err());
+        assert!(parse_policy_override_env("interval_ms").is_err());
+    }
+
+    #[test]
+    fn policy_override_env_layers_over_file_values() {
+        let _lock = env_lock();
+        let _env = set_env_var("BIOMCP_RATE_LIMIT_PUBTATOR", Some("burst=5"));
+        let mut file = BTreeMap::new();
+        file.insert(
+            "pubtator".to_string(),
+            RateLimitOverride {
+                interval_ms: Some(500),
+                burst: Some(2),
+                max_in_flight: None,
+            },
+        );
+
+        let mut policy = test_policy("pubtator", "https://example.org/pubtator", 334);
+        policy.apply_override(resolve_policy_override("pubtator", &file).expect("override"));
+
+        assert_eq!(policy.min_interval, Duration::from_millis(500));
+        assert_eq!(policy.burst, 5);
+        assert_eq!(policy.max_in_flight, None);
+        assert_eq!(
+            policy_override_env_name("semantic-scholar"),
+            "BIOMCP_RATE_LIMIT_SEMANTIC_SCHOLAR"
+        );
+    }
+
     #[test]
     fn rate_limit_uses_longest_matching_prefix() {
         let limiter = RateLimiter::new(
@@ -343,6 +1193,133 @@ mod tests {
         assert_eq!(key, "policy:long");
     }
 
+    struct TempDirGuard {
+        path: PathBuf,
+    }
+
+    impl TempDirGuard {
+        fn new(label: &str) -> Self {
+            let suffix = SystemTime::now()
+                .duration_since(UNIX_EPOCH)
+                .unwrap_or_default()
+                .as_nanos();
+            let path = std::env::temp_dir().join(format!(
+                "biomcp-rate-limit-test-{label}-{}-{suffix}",
+                std::process::id()
+            ));
+            std::fs::create_dir_all(&path).expect("create temp dir");
+            Self { path }
+        }
+    }
+
+    impl Drop for TempDirGuard {
+        fn drop(&mut self) {
+            let _ = std::fs::remove_dir_all(&self.path);
+        }
+    }
+
+    #[test]
+    fn parse_rate_limit_backend_defaults_to_local() {
+        assert_eq!(parse_rate_limit_backend(None), RateLimitBackend::Local);
+        assert_eq!(parse_rate_limit_backend(Some("")), RateLimitBackend::Local);
+        assert_eq!(
+            parse_rate_limit_backend(Some("bogus")),
+            RateLimitBackend::Local
+        );
+        assert_eq!(
+            parse_rate_limit_backend(Some(" Shared ")),
+            RateLimitBackend::Shared
+        );
+    }
+
+    #[test]
+    fn next_slot_millis_spaces_reservations_by_interval() {
+        let interval = limits(334, 1);
+        assert_eq!(next_slot_millis(None, 1_000, interval), (0, 1_334));
+        assert_eq!(next_slot_millis(Some(1_234), 1_000, interval), (234, 1_568));
+        assert_eq!(next_slot_millis(Some(100), 1_000, interval), (0, 1_334));
+    }
+
+    #[test]
+    fn next_slot_millis_admits_burst_without_waiting() {
+        let bursty = limits(100, 3);
+        assert_eq!(next_slot_millis(Some(1_200), 1_000, bursty), (0, 1_300));
+        assert_eq!(next_slot_millis(Some(1_300), 1_000, bursty), (100, 1_400));
+    }
+
+    #[test]
+    fn next_slot_millis_resets_slots_far_in_the_future() {
+        let now = 10_000;
+        let skewed = now + SHARED_SLOT_MAX_LEAD.as_millis() as u64 + 1;
+        assert_eq!(
+            next_slot_millis(Some(skewed), now, limits(100, 1)),
+            (0, now + 100)
+        );
+    }
+
+    #[test]
+    fn reserve_slot_hands_out_consecutive_slots_across_handles() {
+        let dir = TempDirGuard::new("reserve-slot");
+        let table = SharedSlotTable::open(dir.path.clone()).expect("open slot table");
+        let path = table.slot_path("policy:pubtator");
+        let now = SystemTime::now();
+        let interval = limits(334, 1);
+
+        let first = reserve_slot(&path, interval, now).expect("first reservation");
+        let second = reserve_slot(&path, interval, now).expect("second reservation");
+        let third = reserve_slot(&path, interval, now).expect("third reservation");
+
+        assert_eq!(first, Duration::ZERO);
+        assert_eq!(second, interval.min_interval);
+        assert_eq!(third, interval.min_interval * 2);
+        assert!(path.ends_with("policy_pubtator.slot"));
+    }
+
+    #[tokio::test]
+    async fn shared_limiters_throttle_each_other() {
+        let dir = TempDirGuard::new("shared-limiters");
+        let policies = vec![test_policy("strict", "https://api.example.org/strict", 120)];
+        let a = RateLimiter::new(policies.clone(), Duration::from_millis(1))
+            .with_shared_slots(SharedSlotTable::open(dir.path.clone()).expect("open a"));
+        let b = RateLimiter::new(policies, Duration::from_millis(1))
+            .with_shared_slots(SharedSlotTable::open(dir.path.clone()).expect("open b"));
+        assert_eq!(a.backend(), RateLimitBackend::Shared);
+
+        let url = Url::parse("https://api.example.org/strict/resource").unwrap();
+        let start = Instant::now();
+        a.wait_for_url(&url).await.expect("no deadline");
+        b.wait_for_url(&url).await.expect("no deadline");
+
+        assert!(
+            start.elapsed() >= Duration::from_millis(100),
+            "separate limiters sharing one slot table should throttle each other"
+        );
+    }
+
+    #[tokio::test]
+    async fn shared_limiter_honours_local_retry_after_pause() {
+        let dir = TempDirGuard::new("shared-retry-after");
+        let limiter = RateLimiter::new(
+            vec![test_policy("paused", "https://api.example.org/paused", 10)],
+            Duration::from_millis(1),
+        )
+        .with_shared_slots(SharedSlotTable::open(dir.path.clone()).expect("open"));
+        let url = Url::parse("https://api.example.org/paused/resource").unwrap();
+
+        let permit = limiter.acquire(&url).await.expect("no deadline");
+        permit.record(RateFeedback::Throttled {
+            retry_after: Some(Duration::from_millis(150)),
+        });
+        drop(permit);
+
+        let start = Instant::now();
+        limiter.wait_for_url(&url).await.expect("no deadline");
+        assert!(
+            start.elapsed() >= Duration::from_millis(120),
+            "Retry-After should pause the key before the shared slot is taken"
+        );
+    }
+
     #[test]
     fn pubtator_interval_uses_key_aware_values() {
         assert_eq!(pubtator_min_interval(false), Duration::from_millis(334));
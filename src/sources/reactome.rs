@@ -43,7 +43,9 @@ impl ReactomeClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, REACTOME_API))
+            .send()
+            .await?;
         let status = resp.status();
         let bytes = crate::sources::read_limited_body(resp, REACTOME_API).await?;
         if !status.is_success() {
@@ -53,10 +55,7 @@ impl ReactomeClient {
                 message: format!("HTTP {status}: {excerpt}"),
             });
         }
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: REACTOME_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(REACTOME_API, &bytes)
     }
 
     pub async fn search_pathways(
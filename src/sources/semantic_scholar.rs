@@ -100,9 +100,12 @@ impl SemanticScholarClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = match crate::sources::apply_cache_mode_with_auth(req, self.api_key.is_some())
-            .send()
-            .await
+        let resp = match crate::sources::apply_cache_mode_with_auth(
+            crate::sources::tag_source(req, SEMANTIC_SCHOLAR_API),
+            self.api_key.is_some(),
+        )
+        .send()
+        .await
         {
             Ok(resp) => resp,
             Err(err) if crate::sources::is_semantic_scholar_shared_pool_rate_limit_error(&err) => {
@@ -132,10 +135,7 @@ impl SemanticScholarClient {
                 message: format!("HTTP {status}: {excerpt}"),
             });
         }
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: SEMANTIC_SCHOLAR_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(SEMANTIC_SCHOLAR_API, &bytes)
     }
 
     fn maybe_with_auth(
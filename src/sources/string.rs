@@ -42,7 +42,9 @@ impl StringClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp = crate::sources::apply_cache_mode(crate::sources::tag_source(req, STRING_API))
+            .send()
+            .await?;
         let status = resp.status();
         let bytes = crate::sources::read_limited_body(resp, STRING_API).await?;
         if !status.is_success() {
@@ -52,10 +54,7 @@ impl StringClient {
                 message: format!("HTTP {status}: {excerpt}"),
             });
         }
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: STRING_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(STRING_API, &bytes)
     }
 
     pub async fn interactions(
@@ -58,13 +58,16 @@ impl UmlsClient {
         }
 
         let resp = crate::sources::apply_cache_mode_with_auth(
-            self.client
-                .get(self.endpoint("rest/search/current"))
-                .query(&[
-                    ("string", query),
-                    ("pageSize", "5"),
-                    ("apiKey", self.api_key.as_str()),
-                ]),
+            crate::sources::tag_source(
+                self.client
+                    .get(self.endpoint("rest/search/current"))
+                    .query(&[
+                        ("string", query),
+                        ("pageSize", "5"),
+                        ("apiKey", self.api_key.as_str()),
+                    ]),
+                UMLS_API,
+            ),
             true,
         )
         .send()
@@ -80,11 +83,7 @@ impl UmlsClient {
         }
         crate::sources::ensure_json_content_type(UMLS_API, content_type.as_ref(), &bytes)?;
 
-        let search: UmlsSearchEnvelope =
-            serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-                api: UMLS_API.to_string(),
-                source,
-            })?;
+        let search: UmlsSearchEnvelope = crate::sources::decode_json(UMLS_API, &bytes)?;
 
         let tasks = search
             .result
@@ -113,13 +112,16 @@ impl UmlsClient {
 
     async fn fetch_atoms(&self, cui: &str) -> Result<Vec<UmlsXref>, BioMcpError> {
         let resp = crate::sources::apply_cache_mode_with_auth(
-            self.client
-                .get(self.endpoint(&format!("rest/content/current/CUI/{cui}/atoms")))
-                .query(&[
-                    ("apiKey", self.api_key.as_str()),
-                    ("pageSize", UMLS_ATOM_PAGE_SIZE),
-                    ("language", "ENG"),
-                ]),
+            crate::sources::tag_source(
+                self.client
+                    .get(self.endpoint(&format!("rest/content/current/CUI/{cui}/atoms")))
+                    .query(&[
+                        ("apiKey", self.api_key.as_str()),
+                        ("pageSize", UMLS_ATOM_PAGE_SIZE),
+                        ("language", "ENG"),
+                    ]),
+                UMLS_API,
+            ),
             true,
         )
         .send()
@@ -135,11 +137,7 @@ impl UmlsClient {
         }
         crate::sources::ensure_json_content_type(UMLS_API, content_type.as_ref(), &bytes)?;
 
-        let atoms: UmlsAtomsEnvelope =
-            serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-                api: UMLS_API.to_string(),
-                source,
-            })?;
+        let atoms: UmlsAtomsEnvelope = crate::sources::decode_json(UMLS_API, &bytes)?;
 
         let mut out = Vec::new();
         let mut seen = std::collections::HashSet::new();
@@ -54,9 +54,7 @@ impl UniProtClient {
         T: DeserializeOwned,
         F: Fn() -> reqwest::RequestBuilder,
     {
-        let resp =
-            crate::sources::retry_send(UNIPROT_API, 3, || async { build_request().send().await })
-                .await?;
+        let resp = crate::sources::retry_send(UNIPROT_API, 3, build_request).await?;
         let status = resp.status();
         let bytes = crate::sources::read_limited_body(resp, UNIPROT_API).await?;
         let mut payload = bytes.to_vec();
@@ -96,7 +94,7 @@ impl UniProtClient {
         }
 
         let url = self.endpoint(&format!("uniprotkb/{accession}.json"));
-        crate::sources::rate_limit::wait_for_url_str(&url).await;
+        crate::sources::rate_limit::wait_for_url_str(&url).await?;
         self.get_json(|| self.client.get(&url).header(ACCEPT, "application/json"))
             .await
     }
@@ -118,13 +116,13 @@ impl UniProtClient {
         let url = self.endpoint("uniprotkb/search");
         let size = limit.clamp(1, 25).to_string();
         let offset = offset.to_string();
-        crate::sources::rate_limit::wait_for_url_str(&url).await;
+        crate::sources::rate_limit::wait_for_url_str(&url).await?;
         let token = normalize_next_page_token(next_page)?;
         let token_for_request = token.clone();
-        let resp = crate::sources::retry_send(UNIPROT_API, 3, || async {
+        let resp = crate::sources::retry_send(UNIPROT_API, 3, || {
             if let Some(token) = token_for_request.as_deref() {
                 if token.starts_with("http://") || token.starts_with("https://") {
-                    return self.client.get(token).header(ACCEPT, "application/json").send().await;
+                    return self.client.get(token).header(ACCEPT, "application/json");
                 }
 
                 return self
@@ -140,9 +138,7 @@ impl UniProtClient {
                             "fields",
                             "accession,id,protein_name,gene_names,organism_name,length,cc_function,xref_pdb,xref_alphafolddb",
                         ),
-                    ])
-                    .send()
-                    .await;
+                    ]);
             }
 
             self.client
@@ -158,8 +154,6 @@ impl UniProtClient {
                         "accession,id,protein_name,gene_names,organism_name,length,cc_function,xref_pdb,xref_alphafolddb",
                     ),
                 ])
-                .send()
-                .await
         })
         .await?;
         let status = resp.status();
@@ -0,0 +1,134 @@
+//! Profiling span for each request through the shared client.
+//!
+//! `UpstreamSpanMiddleware` runs outside the cache, so its `upstream` span covers cache lookups,
+//! rate-limit waits, and every retry. The span handle rides along in the response extensions.
+//! That keeps it open until the caller has read the body, and `read_limited_body` records the
+//! body size on it.
+
+use http::Extensions;
+use reqwest::Url;
+use reqwest::header::CONTENT_LENGTH;
+use reqwest_middleware::{Middleware, Next};
+use tracing::Instrument;
+use tracing::field::Empty;
+
+use crate::profiling::profile_span;
+
+// Status header the HTTP cache layer adds to responses it answered or looked up.
+const CACHE_STATUS_HEADER: &str = "x-cache";
+
+#[derive(Debug, Clone)]
+struct UpstreamSpan(tracing::Span);
+
+fn url_prefix(url: &Url) -> String {
+    let mut prefix = url.clone();
+    prefix.set_query(None);
+    prefix.set_fragment(None);
+    prefix.into()
+}
+
+/// Records the size of a response body read by the caller on its `upstream` span.
+pub(crate) fn record_body_bytes(resp: &reqwest::Response, bytes: usize) {
+    if let Some(UpstreamSpan(span)) = resp.extensions().get::<UpstreamSpan>() {
+        span.record("bytes", bytes as u64);
+    }
+}
+
+#[derive(Debug, Default, Clone, Copy)]
+pub(crate) struct UpstreamSpanMiddleware;
+
+#[async_trait::async_trait]
+impl Middleware for UpstreamSpanMiddleware {
+    async fn handle(
+        &self,
+        req: reqwest::Request,
+        extensions: &mut Extensions,
+        next: Next<'_>,
+    ) -> reqwest_middleware::Result<reqwest::Response> {
+        let span = profile_span!(
+            "upstream",
+            source = %super::rate_limit::source_label(req.url(), extensions),
+            url = %url_prefix(req.url()),
+            cache = Empty,
+            status = Empty,
+            bytes = Empty
+        );
+        if span.is_disabled() {
+            return next.run(req, extensions).await;
+        }
+
+        let mut response = next.run(req, extensions).instrument(span.clone()).await?;
+        let cache = response
+            .headers()
+            .get(CACHE_STATUS_HEADER)
+            .and_then(|value| value.to_str().ok())
+            .map(str::to_ascii_lowercase)
+            .unwrap_or_else(|| "bypass".to_string());
+        span.record("cache", cache.as_str());
+        span.record("status", response.status().as_u16());
+        if let Some(length) = response
+            .headers()
+            .get(CONTENT_LENGTH)
+            .and_then(|value| value.to_str().ok())
+            .and_then(|value| value.parse::<u64>().ok())
+        {
+            span.record("bytes", length);
+        }
+        response.extensions_mut().insert(UpstreamSpan(span));
+        Ok(response)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use tracing::instrument::WithSubscriber;
+    use tracing_subscriber::layer::SubscriberExt;
+    use wiremock::matchers::{method, path};
+    use wiremock::{Mock, MockServer, ResponseTemplate};
+
+    use super::*;
+
+    #[tokio::test]
+    async fn upstream_span_records_status_cache_and_body_bytes() {
+        let server = MockServer::start().await;
+        Mock::given(method("GET"))
+            .and(path("/v1/query"))
+            .respond_with(ResponseTemplate::new(200).set_body_string(r#"{"hits":[]}"#))
+            .mount(&server)
+            .await;
+        let client = reqwest_middleware::ClientBuilder::new(reqwest::Client::new())
+            .with(UpstreamSpanMiddleware)
+            .build();
+        let url = format!("{}/v1/query?q=imatinib", server.uri());
+
+        let subscriber = tracing_subscriber::registry().with(crate::profiling::layer());
+        let ((), spans, _) = crate::profiling::collect(async {
+            let resp = client.get(&url).send().await.expect("send");
+            let body = crate::sources::read_limited_body(resp, "test")
+                .await
+                .expect("body");
+            assert_eq!(body.len(), 11);
+        })
+        .with_subscriber(subscriber)
+        .await;
+
+        let upstream = spans
+            .iter()
+            .find(|span| span.name == "upstream")
+            .expect("upstream span");
+        let field = |name: &str| upstream.fields.get(name).map(String::as_str);
+        assert_eq!(field("status"), Some("200"));
+        assert_eq!(field("cache"), Some("bypass"));
+        assert_eq!(field("bytes"), Some("11"));
+        assert_eq!(
+            field("url").map(str::to_string),
+            Some(format!("{}/v1/query", server.uri()))
+        );
+    }
+
+    #[test]
+    fn url_prefix_drops_query_and_fragment() {
+        let url = Url::parse("https://mychem.info/v1/query?q=imatinib&size=10#top").expect("url");
+        assert_eq!(url_prefix(&url), "https://mychem.info/v1/query");
+    }
+}
@@ -44,7 +44,10 @@ impl WikiPathwaysClient {
         &self,
         req: reqwest_middleware::RequestBuilder,
     ) -> Result<T, BioMcpError> {
-        let resp = crate::sources::apply_cache_mode(req).send().await?;
+        let resp =
+            crate::sources::apply_cache_mode(crate::sources::tag_source(req, WIKIPATHWAYS_API))
+                .send()
+                .await?;
         let status = resp.status();
         let content_type = resp.headers().get(reqwest::header::CONTENT_TYPE).cloned();
         let bytes = crate::sources::read_limited_body_with_limit(
@@ -61,10 +64,7 @@ impl WikiPathwaysClient {
             });
         }
         crate::sources::ensure_json_content_type(WIKIPATHWAYS_API, content_type.as_ref(), &bytes)?;
-        serde_json::from_slice(&bytes).map_err(|source| BioMcpError::ApiJson {
-            api: WIKIPATHWAYS_API.to_string(),
-            source,
-        })
+        crate::sources::decode_json(WIKIPATHWAYS_API, &bytes)
     }
 
     pub async fn search_pathways(
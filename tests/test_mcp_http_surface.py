@@ -84,6 +84,18 @@ def test_http_routes_advertise_streamable_http_surface(http_server: str) -> None
     assert ready_payload == {"status": "ok"}
 
 
+def test_metrics_route_serves_prometheus_text(http_server: str) -> None:
+    with urllib.request.urlopen(f"{http_server}/metrics", timeout=2) as response:
+        body = response.read().decode("utf-8")
+        content_type = response.headers.get_content_type()
+
+    assert content_type == "text/plain"
+    assert "# TYPE biomcp_upstream_requests_total counter" in body
+    assert "# TYPE biomcp_tool_call_duration_seconds histogram" in body
+    assert 'biomcp_cache_lookups_total{result="miss"}' in body
+    assert "biomcp_mcp_sessions 0" in body
+
+
 def test_serve_http_help_matches_runtime_surface() -> None:
     binary = _require_release_binary()
     result = subprocess.run(